@@ -4,6 +4,7 @@ from django.contrib.auth.models import AbstractUser
 from .managers import UserManager
 from courses.models.course import Course
 from courses.models.enrollment import Enrollment
+from courses.models.instructor import Instructor
 from institutions.models.institution import Institution
 
 # TODO: Add many to many relationship with courses using instructor
@@ -77,5 +78,9 @@ class User(AbstractUser):
 
         return Enrollment.objects.filter(user_id=self, course_id=course).exists()
 
+    # Method to check if user is an instructor of a course with given id
+    def is_instructor(self, course_id):
+        return Instructor.objects.filter(user_id=self, course_id=course_id).exists()
+
     def __str__(self):
         return self.get_full_name()
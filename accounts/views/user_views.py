@@ -109,7 +109,7 @@ def get_user_materials(request, user_id: int, module_id: int) -> JsonResponse:
     try:
         user: User = User.objects.get(id=user_id)
         materials: list[Material] = list(
-            user.materials.filter(module_id=module_id).order_by("order")
+            user.materials.filter(module_id=module_id).order_by("rank")
         )
 
         if not materials:
@@ -158,7 +158,7 @@ def get_user_modules_progress(request, course_id: int, user_id: int):
 
     try:
         course: Course = Course.objects.get(id=course_id)
-        course_modules = Module.objects.filter(course_id=course.id).order_by("order")
+        course_modules = Module.objects.filter(course_id=course.id).order_by("rank")
 
         module_progress = Module_progress.objects.filter(
             user_id=user_id, module_id__in=course_modules
@@ -6,3 +6,4 @@ poetry install
 
 python manage.py collectstatic --no-input
 python manage.py makemigrations
+python manage.py createcachetable
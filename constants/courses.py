@@ -0,0 +1,9 @@
+"""courses constants"""
+
+# Content cache
+CONTENT_CACHE_SECONDS = 600  # Entries are read again at least this often
+CONTENT_CACHE_STATS_FLUSH = 100  # Lookups counted in a process before sharing them
+
+# Order keys
+ORDER_KEY_GAP = 1 << 20  # Rank distance between consecutive items once spread
+ORDER_KEY_MIN_GAP = 1 << 10  # Items closer than this are spread in the background
@@ -1,5 +1,56 @@
 """ioc constants"""
 
 URL_JUDGE = "http://3.21.114.121:5000/judge/end"
+URL_JUDGE_BATCH = "http://3.21.114.121:5000/judge/batch"
 URL_PROBLEM = "http://3.21.114.121:5000/problem"
 LIST_IOC = ["input", "output", "points", "max_time", "max_memory"]
+
+# Judge queue
+JUDGE_TASK_MAX_ATTEMPTS = 3  # Times a task is retried before it is marked failed
+JUDGE_TASK_LEASE_SECONDS = 300  # A running task older than this is reclaimed
+JUDGE_TASK_RETRY_DELAY_SECONDS = 10  # Base delay before retrying a failed task
+JUDGE_WORKER_POLL_SECONDS = 1.0  # Idle wait between polls of an empty queue
+JUDGE_REJUDGE_MAX_RUNNING = 2  # Rejudge tasks judged at once, across workers
+JUDGE_FAIR_SHARE_SECONDS = 1.0  # Fair-share delay per task a user has queued
+JUDGE_METRICS_WINDOW_SECONDS = 3600  # Finished tasks counted in wait metrics
+JUDGE_BATCH_SIZE = 1  # Submissions sent per judge call (1 disables batching)
+JUDGE_BATCH_WINDOW_SECONDS = 0.05  # Wait for a batch to fill before sending it
+
+# Problem sync
+PROBLEM_SYNC_MAX_ATTEMPTS = 5  # Failed uploads before the sync is marked failed
+PROBLEM_SYNC_RETRY_DELAY_SECONDS = 10  # Base delay before retrying an upload
+PROBLEM_SYNC_MAX_RETRY_DELAY_SECONDS = 600  # A failed sync is retried this often
+
+# Contest scoreboards
+SCOREBOARD_CACHE_SECONDS = 300  # Cached scoreboards are rebuilt at least this often
+
+# Leaderboards
+LEADERBOARD_PAGE_SIZE = 50  # Users per page when the request does not say
+LEADERBOARD_MAX_PAGE_SIZE = 200  # Most users a page can ask for
+
+# Submission history
+SUBMISSION_PAGE_SIZE = 20  # Submissions per page when the request does not say
+SUBMISSION_MAX_PAGE_SIZE = 100  # Most submissions a page can ask for
+
+# Similarity index
+SIMILARITY_SHINGLE_SIZE = 5  # Consecutive tokens hashed together
+SIMILARITY_BANDS = 32  # LSH bands of a signature
+SIMILARITY_BAND_ROWS = 4  # Minimums per band, the signature has bands * rows
+SIMILARITY_THRESHOLD = 0.8  # Least estimated similarity reported by default
+
+# Submission rate limits
+SUBMISSION_USER_BURST = 10  # Submissions a user can send at once
+SUBMISSION_USER_PER_MINUTE = 4.0  # Submissions a user gets back per minute
+SUBMISSION_MATERIAL_BURST = 300  # Submissions to a material at once, all users
+SUBMISSION_MATERIAL_PER_MINUTE = 150.0  # Submissions a material gets back per minute
+RATE_LIMIT_LOCK_SECONDS = 1  # Longest wait for the lock of a bucket
+
+# Archive
+ARCHIVE_AFTER_DAYS = 365  # Age of the submissions moved to the archive
+ARCHIVE_BATCH_SIZE = 1000  # Submissions moved per transaction
+
+# Submission status streams
+SUBMISSION_EVENTS_QUEUE_SIZE = 100  # Events kept for a stream not reading them
+SUBMISSION_STREAM_HEARTBEAT_SECONDS = 15  # Comment sent to keep idle streams open
+SUBMISSION_STREAM_MAX_SECONDS = 300  # Streams end after this, clients reconnect
+SUBMISSION_STREAM_RETRY_MS = 3000  # Reconnection delay advised to the clients
@@ -1,5 +1,10 @@
 from django.apps import AppConfig
 
+
 class CoursesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'courses'
\ No newline at end of file
+    name = 'courses'
+
+    def ready(self):
+        """Method that connects the signal receivers of the app."""
+        from . import signals  # noqa: F401
@@ -0,0 +1,371 @@
+"""Read-through cache of the course content served by the detail views.
+
+Course content changes a few times a week and is read all the time, so the
+course, module and material views keep what they serve in a cache. Every
+entry is stored with the content version of its course, a counter in the
+shared cache that is bumped whenever anything of the course is saved or
+deleted (see ``courses.signals``). An entry is only served while the version
+of its course is still the one it was stored with: a bump invalidates every
+entry of the course at once, in every process, without finding them. The
+version is read before the content is loaded, so content loaded before a
+change is never stored under the version of the change; when the course is
+only known once loaded, a global epoch bumped along with every version takes
+its place.
+
+The entries live in a pluggable backend, ``CONTENT_CACHE_BACKEND``: the
+default ``LRUBackend`` keeps them in the memory of the process up to
+``CONTENT_CACHE_MAX_ENTRIES``, evicting the least recently used first, and
+``SharedBackend`` keeps them in the shared cache. Hits and misses are
+counted by every process and added to shared counters, shown by the
+``content_cache_stats`` command.
+
+The views serve the cached JSON body with a strong ETag (its hash) and the
+time the course last changed as Last-Modified, so a client revalidating
+content it already has gets a 304 without anything being serialized, nor
+read from the database while the entry is cached. The counters of a
+material (likes, comments) change with every reaction, so saving only them
+does not bump the version: they are read on every request and merged into
+the cached content instead.
+"""
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.utils.module_loading import import_string
+
+from constants.courses import CONTENT_CACHE_SECONDS, CONTENT_CACHE_STATS_FLUSH
+from ..models.material import Material
+
+STAT_NAMES = ("hits", "misses")
+# Columns of Material read on every request instead of being cached
+MATERIAL_COUNTERS = ("likes", "dislikes", "total_comments")
+
+
+def version_key(course_id: int) -> str:
+    return f"courses:content:version:{course_id}"
+
+
+def changed_key(course_id: int) -> str:
+    return f"courses:content:changed:{course_id}"
+
+
+def stat_key(name: str) -> str:
+    return f"courses:content:stats:{name}"
+
+
+EPOCH_KEY = "courses:content:epoch"
+
+
+def content_version(course_id: int) -> int:
+    """Current content version of a course"""
+    version = cache.get(version_key(course_id))
+    if version is None:
+        # Versions start from the clock, so a course whose version was
+        # evicted never goes back to a version entries were stored with
+        cache.add(version_key(course_id), time.time_ns(), None)
+        version = cache.get(version_key(course_id))
+    return version
+
+
+def content_epoch() -> int:
+    """Counter bumped along with the content version of every course"""
+    cache.add(EPOCH_KEY, time.time_ns(), None)
+    return cache.get(EPOCH_KEY)
+
+
+def last_changed(course_id: int) -> int:
+    """Time the content of a course last changed, as far as the cache knows,
+    in whole seconds
+
+    Courses not changed since their version was created take that time.
+    """
+    cache.add(changed_key(course_id), math.ceil(time.time()), None)
+    return cache.get(changed_key(course_id))
+
+
+def bump_version(course_id: int) -> None:
+    # The epoch first: a reader seeing the new version sees the new epoch
+    for key in (EPOCH_KEY, version_key(course_id)):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), None)
+    # Whole seconds, as in Last-Modified, and always later than the previous
+    # change: content revalidated by date is never kept across a change
+    changed = cache.get(changed_key(course_id), 0)
+    cache.set(changed_key(course_id), math.ceil(max(time.time(), changed + 1)), None)
+
+
+def material_course(material_id: int) -> int | None:
+    """Course of a material, None if it was deleted along with its course"""
+    return (
+        Material.objects.filter(id=material_id)
+        .values_list("module_id__course_id", flat=True)
+        .first()
+    )
+
+
+def content_changed(course_id: int | None) -> None:
+    """Invalidate the cached content of a course
+
+    The version is bumped right away, for the rest of the transaction, and
+    again once it commits, so an entry read by another process before the
+    commit is not served after it.
+    """
+    if course_id is None:
+        return
+    bump_version(course_id)
+    transaction.on_commit(lambda: bump_version(course_id))
+
+
+class LRUBackend:
+    """Entries in the memory of the process, the least recently used evicted
+    past ``max_entries``
+
+    Args:
+        max_entries (int): most entries kept
+        timeout (int): seconds an entry is kept
+    """
+
+    def __init__(self, max_entries: int, timeout: int):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.timeout, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+class SharedBackend:
+    """Entries in the shared cache, which bounds and evicts them itself"""
+
+    prefix = "courses:content:entry:"
+
+    def __init__(self, max_entries: int, timeout: int):
+        self.timeout = timeout
+
+    def get(self, key: str) -> Any:
+        return cache.get(self.prefix + key)
+
+    def set(self, key: str, value: Any) -> None:
+        cache.set(self.prefix + key, value, self.timeout)
+
+    def delete(self, key: str) -> None:
+        cache.delete(self.prefix + key)
+
+    def clear(self) -> None:
+        """Entries expire or go stale by themselves, the rest of the cache
+        is not cleared for them"""
+
+    def stats(self) -> dict:
+        return {}
+
+
+class ContentCache:
+    """Course content, read through a backend and checked against the
+    content version of its course
+
+    Args:
+        backend: where the entries are kept, see ``LRUBackend``
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.pending = dict.fromkeys(STAT_NAMES, 0)
+        self.lock = threading.Lock()
+
+    def read(self, kind: str, key, load: Callable[[], tuple[int, Any]]) -> Any:
+        """Cached content, loaded and stored if missing or stale
+
+        Args:
+            kind (str): kind of content, "course", "module", "material"...
+            key: what identifies the content among those of its kind
+            load: function reading the content from the database, returning
+                the id of its course and the content
+
+        Returns:
+            the content, as returned by ``load``; exceptions of ``load`` are
+            raised and nothing is stored
+        """
+        entry_key = f"{kind}:{key}"
+        entry = self.backend.get(entry_key)
+        course_id = version = None
+        if entry is not None:
+            course_id, stored_version, data = entry
+            # Read before loading, so a bump during the load is not missed
+            version = content_version(course_id)
+            if stored_version == version:
+                self.count("hits")
+                return data
+        epoch = content_epoch()
+
+        self.count("misses")
+        loaded_course_id, data = load()
+        if loaded_course_id != course_id:
+            # Not cached yet, or moved to another course: its version was not
+            # read before loading, the content is only stored if nothing
+            # changed meanwhile
+            version = content_version(loaded_course_id)
+            if content_epoch() != epoch:
+                return data
+        self.backend.set(entry_key, (loaded_course_id, version, data))
+        return data
+
+    def forget(self, kind: str, key) -> None:
+        self.backend.delete(f"{kind}:{key}")
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.pending[name] += 1
+            if sum(self.pending.values()) < CONTENT_CACHE_STATS_FLUSH:
+                return
+            pending = self.pending
+            self.pending = dict.fromkeys(STAT_NAMES, 0)
+        self.flush_stats(pending)
+
+    def flush_stats(self, pending: dict | None = None) -> None:
+        """Add the lookups counted by this process to the shared counters"""
+        if pending is None:
+            with self.lock:
+                pending = self.pending
+                self.pending = dict.fromkeys(STAT_NAMES, 0)
+        for name, value in pending.items():
+            if not value:
+                continue
+            cache.add(stat_key(name), 0, None)
+            try:
+                cache.incr(stat_key(name), value)
+            except ValueError:
+                cache.set(stat_key(name), value, None)
+
+    def stats(self) -> dict:
+        """Hits, misses and hit rate of every process, and the entries of
+        the backend of this one"""
+        self.flush_stats()
+        counters = cache.get_many([stat_key(name) for name in STAT_NAMES])
+        hits = counters.get(stat_key("hits"), 0)
+        misses = counters.get(stat_key("misses"), 0)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            **self.backend.stats(),
+        }
+
+    def reset_stats(self) -> None:
+        with self.lock:
+            self.pending = dict.fromkeys(STAT_NAMES, 0)
+        cache.delete_many([stat_key(name) for name in STAT_NAMES])
+
+
+_content_cache: ContentCache | None = None
+_content_cache_lock = threading.Lock()
+
+
+def get_content_cache() -> ContentCache:
+    """Content cache of the process, with the configured backend"""
+    global _content_cache
+    with _content_cache_lock:
+        if _content_cache is None:
+            backend = import_string(settings.CONTENT_CACHE_BACKEND)
+            _content_cache = ContentCache(
+                backend(settings.CONTENT_CACHE_MAX_ENTRIES, CONTENT_CACHE_SECONDS)
+            )
+        return _content_cache
+
+
+def cached_response(
+    request,
+    kind: str,
+    key,
+    load: Callable[[], tuple[int, Any]],
+    live: Callable[[], dict] | None = None,
+) -> HttpResponse:
+    """JSON response of content read through the content cache
+
+    The content is cached as its JSON body, with its ETag and Last-Modified;
+    a request revalidating the current content gets a 304 without body.
+
+    Args:
+        request: http request
+        kind, key, load: the content, see ``ContentCache.read``
+        live: fields read on every request and merged into the content, the
+            ETag then covers them and Last-Modified is not checked
+
+    Returns:
+        HttpResponse: the content, or a 304; exceptions of ``load`` and
+        ``live`` are raised
+    """
+
+    def render():
+        course_id, data = load()
+        body = json.dumps(data, cls=DjangoJSONEncoder).encode()
+        return course_id, {
+            "body": body,
+            "etag": f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            "last_modified": last_changed(course_id),
+        }
+
+    content = get_content_cache().read(kind, key, render)
+    body, etag = content["body"], content["etag"]
+    last_modified = content["last_modified"]
+    if live is not None:
+        body = json.dumps(
+            {**json.loads(body), **live()}, cls=DjangoJSONEncoder
+        ).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        last_modified = None  # The live fields change without the course
+
+    response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(content["last_modified"])
+    response["Cache-Control"] = "no-cache"  # Always revalidate with the ETag
+    return get_conditional_response(
+        request, etag=etag, last_modified=last_modified, response=response
+    )
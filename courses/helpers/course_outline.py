@@ -0,0 +1,46 @@
+from django.db.models import Prefetch
+from django.db.models.functions import Length
+
+from ..models.course import Course
+from ..models.instructor import Instructor
+from ..models.material import Material
+from ..models.module import Module
+
+
+def load_course_outline(alias: str) -> Course:
+    """Get a course with everything its outline shows, in four queries
+    whatever its size: the course with its institution, its instructors with
+    their users, its modules, and its materials with their type-specific rows.
+
+    Args:
+        alias (str): course alias
+
+    Returns:
+        Course: the course, with its instructors, modules and materials
+        prefetched, modules and materials in order
+
+    Raises:
+        Course.DoesNotExist: there is no course with that alias
+    """
+    materials = (
+        Material.objects.select_related(
+            "materialiocode", "materialhtml", "materialvideo", "materialpdf"
+        )
+        # The HTML content can be large, only its length is shown
+        .defer("materialhtml__content")
+        .annotate(html_length=Length("materialhtml__content"))
+        .order_by("rank")
+    )
+    modules = Module.objects.order_by("rank").prefetch_related(
+        Prefetch("material_set", queryset=materials)
+    )
+    return (
+        Course.objects.select_related("institution")
+        .prefetch_related(
+            Prefetch(
+                "instructor_set", queryset=Instructor.objects.select_related("user_id")
+            ),
+            Prefetch("module_set", queryset=modules),
+        )
+        .get(alias=alias)
+    )
@@ -0,0 +1,211 @@
+"""Order keys of the modules of a course and the materials of a module.
+
+Items are ordered by a sparse ``rank``, unique among their siblings. A new
+item is appended ``ORDER_KEY_GAP`` after the last one, and an item inserted
+or moved between two others takes a rank between theirs, so it is the only
+row written. The API keeps showing dense positions, 0 to n - 1, as
+``order``: ``PositionManager`` annotates them, counting the siblings ranked
+before every item through the (parent, rank) index.
+
+When two neighbours are left without room between them, their siblings are
+spread again, in one statement. The ``rebalance_order_keys`` command does
+it in the background for the items whose neighbours got close, so the
+writes of the API seldom have to.
+"""
+import bisect
+
+from django.db import models
+from django.db.models import Count, F, Max, OuterRef, Subquery, Window
+from django.db.models.functions import Coalesce, Lag
+
+from constants.courses import ORDER_KEY_GAP, ORDER_KEY_MIN_GAP
+
+
+class PositionManager(models.Manager):
+    """Manager annotating every item with its position among the items
+    sharing its ``position_parent``"""
+
+    def get_queryset(self):
+        parent = self.model.position_parent
+        ahead = (
+            self.model._base_manager.filter(
+                **{parent: OuterRef(parent), "rank__lt": OuterRef("rank")}
+            )
+            .order_by()
+            .values(parent)
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        return super().get_queryset().annotate(order=Coalesce(Subquery(ahead), 0))
+
+
+class Positioned:
+    """Mixin of the models ordered by ``rank`` among the items sharing their
+    ``position_parent``
+
+    ``order`` is the position of the item. It can be given to a new item to
+    insert it there; it is appended when it has none, or one past the end.
+    """
+
+    position_parent: str
+    _position = None
+
+    @property
+    def order(self) -> int:
+        """Position among the siblings, from 0"""
+        if self._position is None and self.rank is not None:
+            self._position = self.siblings().filter(rank__lt=self.rank).count()
+        return self._position
+
+    @order.setter
+    def order(self, position: int) -> None:
+        self._position = position
+
+    def siblings(self) -> models.QuerySet:
+        parent = self.position_parent
+        return type(self)._base_manager.filter(
+            **{parent: getattr(self, f"{parent}_id")}
+        )
+
+    def place(self) -> None:
+        """Give a new item the rank of its position, with its parent locked
+        until the transaction ends, so concurrent inserts take turns"""
+        parent = self.position_parent
+        lock_parent(type(self), parent, getattr(self, f"{parent}_id"))
+        self.rank = insert_rank(self.siblings(), self._position)
+
+
+def lock_parent(model: type[models.Model], parent: str, parent_id: int) -> None:
+    """Lock the course or module of some items until the transaction ends"""
+    related = model._meta.get_field(parent).related_model
+    list(related._base_manager.select_for_update().filter(pk=parent_id).values("pk"))
+
+
+def spread(low: int | None, high: int | None, count: int) -> list[int] | None:
+    """Ranks of ``count`` items placed in order between two ranks
+
+    Args:
+        low (int | None): rank of the item before them, None if they are first
+        high (int | None): rank of the item after them, None if they are last
+
+    Returns:
+        list[int] | None: the ranks, None if there is no room for them
+    """
+    if low is None and high is None:
+        return [ORDER_KEY_GAP * (index + 1) for index in range(count)]
+    if low is None:
+        return [high - ORDER_KEY_GAP * (count - index) for index in range(count)]
+    if high is None:
+        return [low + ORDER_KEY_GAP * (index + 1) for index in range(count)]
+    step = (high - low) // (count + 1)
+    if step < 1:
+        return None
+    return [low + step * (index + 1) for index in range(count)]
+
+
+def rebalance(siblings: models.QuerySet) -> None:
+    """Spread the ranks of some siblings evenly, keeping their order"""
+    items = list(siblings.order_by("rank").only("id", "rank"))
+    for index, item in enumerate(items):
+        item.rank = ORDER_KEY_GAP * (index + 1)
+    siblings.model._base_manager.bulk_update(items, ["rank"])
+
+
+def crowded_parents(model: type[models.Model], parent: str) -> list[int]:
+    """Courses or modules with items closer than ``ORDER_KEY_MIN_GAP`` to the
+    item before them"""
+    gap = F("rank") - Window(Lag("rank"), partition_by=F(parent), order_by="rank")
+    return list(
+        model._base_manager.annotate(gap=gap)
+        .filter(gap__lt=ORDER_KEY_MIN_GAP)
+        .values_list(parent, flat=True)
+        .distinct()
+    )
+
+
+def insert_rank(siblings: models.QuerySet, position: int | None) -> int:
+    """Rank of a new item inserted at a position among its siblings
+
+    Args:
+        siblings (QuerySet): the items it is inserted among
+        position (int | None): where it goes, after the last item if None or
+            past the end
+
+    Returns:
+        int: a rank no other sibling has
+    """
+    ranks = siblings.order_by("rank").values_list("rank", flat=True)
+    low = high = None
+    if position is not None and position <= 0:
+        high = ranks.first()
+    elif position is not None:
+        around = list(ranks[position - 1 : position + 1])
+        if around:
+            low, high = around[0], (around[1] if len(around) > 1 else None)
+    if low is None and high is None and position != 0:
+        low = siblings.aggregate(last=Max("rank"))["last"]
+
+    rank = spread(low, high, 1)
+    if rank is None:
+        rebalance(siblings)
+        return insert_rank(siblings, position)
+    return rank[0]
+
+
+def increasing_run(values: list[int]) -> set[int]:
+    """Indexes of a longest increasing subsequence of ``values``"""
+    tails: list[int] = []  # Last value of the best run of every length
+    tail_indexes: list[int] = []
+    previous = [-1] * len(values)
+    for index, value in enumerate(values):
+        length = bisect.bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_indexes.append(index)
+        else:
+            tails[length] = value
+            tail_indexes[length] = index
+        previous[index] = tail_indexes[length - 1] if length else -1
+
+    run = set()
+    index = tail_indexes[-1] if tail_indexes else -1
+    while index != -1:
+        run.add(index)
+        index = previous[index]
+    return run
+
+
+def reorder(items: list, ordered: list) -> list:
+    """New ranks of the items that have to move so they follow a new order
+
+    The items keeping their relative order, as many as possible, keep their
+    ranks; the others take ranks between them. Moving one item rewrites one
+    rank.
+
+    Args:
+        items (list): the items, in their current order
+        ordered (list): the same items, in the new order
+
+    Returns:
+        list: the items whose rank changed
+    """
+    current = {item.id: index for index, item in enumerate(items)}
+    kept = increasing_run([current[item.id] for item in ordered])
+
+    moved, pending, low = [], [], None
+    for index, item in enumerate(ordered + [None]):
+        if item is not None and index not in kept:
+            pending.append(item)
+            continue
+        high = item.rank if item is not None else None
+        ranks = spread(low, high, len(pending)) if pending else []
+        if ranks is None:
+            # No room left: spread every item again, in the new order
+            for position, item in enumerate(ordered):
+                item.rank = ORDER_KEY_GAP * (position + 1)
+            return list(ordered)
+        for pending_item, rank in zip(pending, ranks):
+            pending_item.rank = rank
+        moved += pending
+        pending, low = [], high
+    return moved
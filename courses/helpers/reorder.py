@@ -0,0 +1,43 @@
+"""Reordering of the modules of a course and the materials of a module.
+
+Only the items that leave their place get a new rank (see ``order_keys``),
+written by one UPDATE inside one transaction: the rank constraints are
+checked once per statement (``DEFERRABLE INITIALLY IMMEDIATE``), not once
+per row. Deleting an item leaves the ranks of the others as they are, their
+positions close the gap by themselves. As the UPDATE skips the signals, the
+cached content of the course is invalidated here.
+"""
+from django.db import transaction
+from django.db.models import QuerySet
+
+from .content_cache import content_changed
+from .order_keys import reorder
+
+
+def apply_order(items: QuerySet, orders: dict[int, int], course_id: int) -> list:
+    """Move the items to their new positions
+
+    Args:
+        items (QuerySet): modules of a course or materials of a module
+        orders (dict[int, int]): new position of every item, by id
+        course_id (int): course of the items
+
+    Returns:
+        list: the items, with their new order
+
+    Raises:
+        ValueError: the orders are not exactly those of the items
+    """
+    with transaction.atomic():
+        items = list(items.select_for_update().order_by("rank"))
+        if {item.id for item in items} != set(orders):
+            raise ValueError("The orders are not those of the items")
+        ordered = sorted(items, key=lambda item: orders[item.id])
+        moved = reorder(items, ordered)
+        if moved:
+            items[0]._meta.model._base_manager.bulk_update(moved, ["rank"])
+        content_changed(course_id)
+
+    for position, item in enumerate(ordered):
+        item.order = position
+    return items
@@ -0,0 +1,23 @@
+"""Command that shows the counters of the course content cache"""
+import json
+
+from django.core.management.base import BaseCommand
+
+from courses.helpers.content_cache import get_content_cache
+
+
+class Command(BaseCommand):
+    help = "Show the hit/miss counters of the course content cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the hit/miss counters after showing them",
+        )
+
+    def handle(self, *args, **options):
+        cache = get_content_cache()
+        self.stdout.write(json.dumps(cache.stats(), indent=2))
+        if options["reset"]:
+            cache.reset_stats()
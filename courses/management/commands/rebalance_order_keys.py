@@ -0,0 +1,25 @@
+"""Command that spreads the order keys of the items left without room"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from courses.helpers.order_keys import crowded_parents, lock_parent, rebalance
+from courses.models.material import Material
+from courses.models.module import Module
+
+
+class Command(BaseCommand):
+    help = (
+        "Spread again the ranks of the modules and materials whose neighbours "
+        "got too close, so inserts and moves keep writing a single row."
+    )
+
+    def handle(self, *args, **options):
+        for model, parent in ((Module, "course_id"), (Material, "module_id")):
+            parent_ids = crowded_parents(model, parent)
+            for parent_id in parent_ids:
+                with transaction.atomic():
+                    lock_parent(model, parent, parent_id)
+                    rebalance(model._base_manager.filter(**{parent: parent_id}))
+            self.stdout.write(
+                f"{model.__name__}: spread the ranks of {len(parent_ids)} parents"
+            )
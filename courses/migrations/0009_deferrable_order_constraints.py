@@ -0,0 +1,37 @@
+# Generated by Django 4.2.4 on 2026-10-18 20:38
+
+from django.db import migrations, models
+import django.db.models.constraints
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0008_materialpdf"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="material",
+            name="unique_order_module",
+        ),
+        migrations.RemoveConstraint(
+            model_name="module",
+            name="unique_order_course",
+        ),
+        migrations.AddConstraint(
+            model_name="material",
+            constraint=models.UniqueConstraint(
+                deferrable=django.db.models.constraints.Deferrable["IMMEDIATE"],
+                fields=("order", "module_id"),
+                name="unique_order_module",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="module",
+            constraint=models.UniqueConstraint(
+                deferrable=django.db.models.constraints.Deferrable["IMMEDIATE"],
+                fields=("order", "course_id"),
+                name="unique_order_course",
+            ),
+        ),
+    ]
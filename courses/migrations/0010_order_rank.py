@@ -0,0 +1,99 @@
+from django.db import migrations, models
+from django.db.models import F
+import django.db.models.constraints
+
+# ORDER_KEY_GAP when the ranks were introduced
+GAP = 1 << 20
+
+
+def ranks_from_orders(apps, schema_editor):
+    for name in ("Module", "Material"):
+        model = apps.get_model("courses", name)
+        model.objects.update(rank=(F("order") + 1) * GAP)
+
+
+def orders_from_ranks(apps, schema_editor):
+    """Dense positions among the siblings, in the order of their ranks"""
+    for name, parent in (("Module", "course_id"), ("Material", "module_id")):
+        model = apps.get_model("courses", name)
+        items = list(model.objects.order_by(parent, "rank").only("id", parent))
+        position, previous = 0, None
+        for item in items:
+            current = getattr(item, f"{parent}_id")
+            position = position + 1 if current == previous else 0
+            item.order, previous = position, current
+        model.objects.bulk_update(items, ["order"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0009_deferrable_order_constraints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="material",
+            name="rank",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="module",
+            name="rank",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(ranks_from_orders, migrations.RunPython.noop),
+        migrations.RemoveConstraint(
+            model_name="material",
+            name="unique_order_module",
+        ),
+        migrations.RemoveConstraint(
+            model_name="module",
+            name="unique_order_course",
+        ),
+        # Nullable first, so going back adds it empty, then fills it
+        migrations.AlterField(
+            model_name="material",
+            name="order",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="module",
+            name="order",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(migrations.RunPython.noop, orders_from_ranks),
+        migrations.RemoveField(
+            model_name="material",
+            name="order",
+        ),
+        migrations.RemoveField(
+            model_name="module",
+            name="order",
+        ),
+        migrations.AlterField(
+            model_name="material",
+            name="rank",
+            field=models.BigIntegerField(blank=True),
+        ),
+        migrations.AlterField(
+            model_name="module",
+            name="rank",
+            field=models.BigIntegerField(blank=True),
+        ),
+        migrations.AddConstraint(
+            model_name="material",
+            constraint=models.UniqueConstraint(
+                deferrable=django.db.models.constraints.Deferrable["IMMEDIATE"],
+                fields=("module_id", "rank"),
+                name="unique_rank_module",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="module",
+            constraint=models.UniqueConstraint(
+                deferrable=django.db.models.constraints.Deferrable["IMMEDIATE"],
+                fields=("course_id", "rank"),
+                name="unique_rank_course",
+            ),
+        ),
+    ]
@@ -1,9 +1,10 @@
-from django.db import models
+from django.db import models, transaction
 
+from ..helpers.order_keys import PositionManager, Positioned
 from .module import Module
 
 
-class Material(models.Model):
+class Material(Positioned, models.Model):
     id = models.BigAutoField(
         auto_created=True,
         primary_key=True,
@@ -15,7 +16,8 @@ class Material(models.Model):
     name = models.CharField(max_length=100, blank=False)
     material_type = models.CharField(max_length=3, blank=False)
     is_extra = models.BooleanField(default=False, blank=False)
-    order = models.IntegerField(blank=True)
+    # Sparse key of its order, see helpers.order_keys
+    rank = models.BigIntegerField(blank=True)
     likes = models.IntegerField(default=0)
     dislikes = models.IntegerField(default=0)
     total_comments = models.IntegerField(default=0)
@@ -27,27 +29,28 @@ class Material(models.Model):
         through_fields=("material_id", "user_id"),
     )
 
+    objects = PositionManager()
+    position_parent = "module_id"
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
-                # There's only one material in that order for that module
-                fields=["order", "module_id"],
-                name="unique_order_module",
+                # There's only one material at that rank in that module
+                fields=["module_id", "rank"],
+                name="unique_rank_module",
+                # Checked once per statement, so a reorder is one UPDATE
+                deferrable=models.Deferrable.IMMEDIATE,
             ),
         ]
 
     def save(self, *args, **kwargs):
-        if self.order is None:
-            # In material creation, automatically assign the next possible order
-            try:
-                self.order = (
-                    Material.objects.filter(module_id=self.module_id).aggregate(
-                        models.Max("order")
-                    )["order__max"]
-                    + 1
-                )
-            except Exception:
-                self.order = 0
+        if self.rank is None:
+            # In material creation, take the place of its order, or the last one
+            with transaction.atomic():
+                self.place()
+                super().save(*args, **kwargs)
+            self.order = None
+            return
 
         super().save(*args, **kwargs)
 
@@ -1,9 +1,10 @@
-from django.db import models
+from django.db import models, transaction
 
+from ..helpers.order_keys import PositionManager, Positioned
 from .course import Course
 
 
-class Module(models.Model):
+class Module(Positioned, models.Model):
     id = models.BigAutoField(
         auto_created=True,
         primary_key=True,
@@ -13,7 +14,8 @@ class Module(models.Model):
     )
     course_id = models.ForeignKey(Course, on_delete=models.CASCADE, blank=False)
     name = models.CharField(max_length=100, blank=False)
-    order = models.IntegerField(blank=True)
+    # Sparse key of its order, see helpers.order_keys
+    rank = models.BigIntegerField(blank=True)
     module_total_materials = models.IntegerField(default=0)
     module_instructional_materials = models.IntegerField(default=0)
     module_assessment_materials = models.IntegerField(default=0)
@@ -23,12 +25,17 @@ class Module(models.Model):
         "self", on_delete=models.CASCADE, null=True, blank=True
     )
 
+    objects = PositionManager()
+    position_parent = "course_id"
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
-                # There's only one module in that order for that course
-                fields=["order", "course_id"],
-                name="unique_order_course",
+                # There's only one module at that rank in that course
+                fields=["course_id", "rank"],
+                name="unique_rank_course",
+                # Checked once per statement, so a reorder is one UPDATE
+                deferrable=models.Deferrable.IMMEDIATE,
             ),
             models.UniqueConstraint(
                 # There's only one module with that name for that course
@@ -38,17 +45,13 @@ class Module(models.Model):
         ]
 
     def save(self, *args, **kwargs):
-        if self.order is None:
-            # In module creation, automatically assign the next possible order
-            try:
-                self.order = (
-                    Module.objects.filter(course_id=self.course_id).aggregate(
-                        models.Max("order")
-                    )["order__max"]
-                    + 1
-                )
-            except Exception:
-                self.order = 0
+        if self.rank is None:
+            # In module creation, take the place of its order, or the last one
+            with transaction.atomic():
+                self.place()
+                super().save(*args, **kwargs)
+            self.order = None
+            return
 
         super().save(*args, **kwargs)
 
@@ -109,6 +109,18 @@ get_course_schema = AutoSchema(
     ]
 )
 
+get_course_outline_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "alias",
+            required=True,
+            location="path",
+            type="string",
+            schema=coreschema.String(description="Course alias"),
+        )
+    ]
+)
+
 update_course_schema = AutoSchema(
     manual_fields=[
         coreapi.Field(
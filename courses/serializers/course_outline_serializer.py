@@ -0,0 +1,109 @@
+from rest_framework import serializers
+
+from institutions.serializers.institution_serializer import InstitutionSerializer
+from ..models.course import Course
+from ..models.instructor import Instructor
+from ..models.material import Material
+from ..models.module import Module
+
+
+def material_payload(material: Material) -> dict | None:
+    """Summary of the type-specific data of a material, None if it has none.
+    The related rows are expected to be loaded (see helpers.course_outline)."""
+    match material.material_type:
+        case "IOC" if hasattr(material, "materialiocode"):
+            io_code = material.materialiocode
+            return {
+                "max_time": io_code.max_time,
+                "max_memory": io_code.max_memory,
+                "max_points": io_code.max_points,
+                "is_exam": io_code.is_exam,
+            }
+        case "HTM" if hasattr(material, "materialhtml"):
+            return {"length": material.html_length}
+        case "VID" if hasattr(material, "materialvideo"):
+            video = material.materialvideo
+            return {
+                "length": video.length,
+                "source": video.source,
+                "external_id": video.external_id,
+            }
+        case "PDF" if hasattr(material, "materialpdf"):
+            return {
+                "url": material.materialpdf.url,
+                "pages": material.materialpdf.pages,
+            }
+    return None
+
+
+class MaterialOutlineSerializer(serializers.ModelSerializer):
+    payload = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Material
+        fields = [
+            "id",
+            "name",
+            "material_type",
+            "is_extra",
+            "order",
+            "likes",
+            "dislikes",
+            "total_comments",
+            "payload",
+        ]
+
+    def get_payload(self, material: Material) -> dict | None:
+        return material_payload(material)
+
+
+class ModuleOutlineSerializer(serializers.ModelSerializer):
+    materials = MaterialOutlineSerializer(source="material_set", many=True)
+
+    class Meta:
+        model = Module
+        fields = [
+            "id",
+            "name",
+            "order",
+            "module_total_materials",
+            "module_instructional_materials",
+            "module_assessment_materials",
+            "module_extra_materials",
+            "materials",
+        ]
+
+
+class InstructorOutlineSerializer(serializers.ModelSerializer):
+    first_name = serializers.CharField(source="user_id.first_name")
+    last_name = serializers.CharField(source="user_id.last_name")
+
+    class Meta:
+        model = Instructor
+        fields = ["id", "user_id", "instructor_type", "first_name", "last_name"]
+
+
+class CourseOutlineSerializer(serializers.ModelSerializer):
+    institution = InstitutionSerializer()
+    instructors = InstructorOutlineSerializer(source="instructor_set", many=True)
+    modules = ModuleOutlineSerializer(source="module_set", many=True)
+
+    class Meta:
+        model = Course
+        fields = [
+            "id",
+            "name",
+            "alias",
+            "description",
+            "course_instructional_materials",
+            "course_assessment_materials",
+            "course_extra_materials",
+            "min_assessment_progress",
+            "average_stars",
+            "appraisals",
+            "comments",
+            "parent_course",
+            "institution",
+            "instructors",
+            "modules",
+        ]
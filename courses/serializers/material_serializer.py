@@ -6,21 +6,27 @@ from courses.utils import (
 
 
 class MaterialSerializer(serializers.ModelSerializer):
+    # Position in the module, from 0 to the number of materials (the last
+    # one); the materials from there on move one place back
+    order = serializers.IntegerField(required=False, min_value=0)
+
     class Meta:
         model = Material
-        fields = "__all__"
+        exclude = ["rank"]
 
     def validate(self, data):
         """
-        Verify if unique tuple module_id and order is duplicated.
+        Verify the order is a position of the module.
         """
         module_id = data.get("module_id")
         order = data.get("order")
 
-        if Material.objects.filter(module_id=module_id, order=order).exists():
-            raise serializers.ValidationError(
-                {"order": "This order in this module is already in use"}
-            )
+        if order is not None:
+            last = Material._base_manager.filter(module_id=module_id).count()
+            if order > last:
+                raise serializers.ValidationError(
+                    {"order": f"The order must be between 0 and {last}"}
+                )
 
         if data.get("material_type") != data.get("material_type").upper():
             raise serializers.ValidationError(
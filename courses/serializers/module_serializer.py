@@ -5,13 +5,17 @@ from ..models.module import Module
 
 
 class ModuleSerializer(serializers.ModelSerializer):
+    # Position in the course, from 0 to the number of modules (the last one);
+    # the modules from there on move one place back
+    order = serializers.IntegerField(required=False, min_value=0)
+
     class Meta:
         model = Module
-        fields = "__all__"
+        exclude = ["rank"]
 
     def validate(self, data):
         """
-        Verify if unique tuple course_id and order is duplicated,
+        Verify the order is a position of the course,
         Verify course_id and name, verify if course exists.
         """
 
@@ -19,10 +23,12 @@ class ModuleSerializer(serializers.ModelSerializer):
         name = data.get("name")
         order = data.get("order")
 
-        if Module.objects.filter(course_id=alias, order=order).exists():
-            raise serializers.ValidationError(
-                "This order in this course is already in use"
-            )
+        if order is not None:
+            last = Module._base_manager.filter(course_id=alias).count()
+            if order > last:
+                raise serializers.ValidationError(
+                    f"The order must be between 0 and {last}"
+                )
 
         if Module.objects.filter(course_id=alias, name=name).exists():
             raise serializers.ValidationError(
@@ -0,0 +1,70 @@
+"""Signal receivers of the courses app"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from institutions.models.institution import Institution
+from .helpers.content_cache import (
+    MATERIAL_COUNTERS,
+    content_changed,
+    get_content_cache,
+    material_course,
+)
+from .models.course import Course
+from .models.enrollment import Enrollment
+from .models.instructor import Instructor
+from .models.material import Material
+from .models.material_html import MaterialHTML
+from .models.material_pdf import MaterialPDF
+from .models.material_video import MaterialVideo
+from .models.module import Module
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def course_changed(sender, instance: Course, **kwargs) -> None:
+    content_changed(instance.id)
+    # A new course may take the alias of a deleted one
+    get_content_cache().forget("course", instance.alias)
+
+
+@receiver(post_save, sender=Module)
+@receiver(post_delete, sender=Module)
+@receiver(post_save, sender=Instructor)
+@receiver(post_delete, sender=Instructor)
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def course_part_changed(sender, instance, **kwargs) -> None:
+    content_changed(instance.course_id_id)
+
+
+@receiver(post_save, sender=Material)
+@receiver(post_delete, sender=Material)
+def material_changed(sender, instance: Material, **kwargs) -> None:
+    # The counters are not cached (see content_cache.MATERIAL_COUNTERS)
+    update_fields = kwargs.get("update_fields")
+    if update_fields and update_fields <= set(MATERIAL_COUNTERS):
+        return
+    content_changed(
+        Module.objects.filter(id=instance.module_id_id)
+        .values_list("course_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=MaterialHTML)
+@receiver(post_delete, sender=MaterialHTML)
+@receiver(post_save, sender=MaterialPDF)
+@receiver(post_delete, sender=MaterialPDF)
+@receiver(post_save, sender=MaterialVideo)
+@receiver(post_delete, sender=MaterialVideo)
+def material_content_changed(sender, instance, **kwargs) -> None:
+    content_changed(material_course(instance.material_id_id))
+
+
+@receiver(post_save, sender=Institution)
+def institution_changed(sender, instance: Institution, **kwargs) -> None:
+    """The courses are served with their institution"""
+    for course_id in Course.objects.filter(institution=instance).values_list(
+        "id", flat=True
+    ):
+        content_changed(course_id)
@@ -31,6 +31,8 @@ from .material_video_tests import (
     DeleteMaterialVideoTestCase,
 )
 from .enrollment_tests import AppraiseCourseTestCase
+from .course_outline_tests import CourseOutlineTestCase
+from .content_cache_tests import ContentCacheTestCase
 
 _ = [
     CreateCourseTestCase,
@@ -66,3 +68,5 @@ _ = [
 ]
 
 _ = [AppraiseCourseTestCase]
+_ = [CourseOutlineTestCase]
+_ = [ContentCacheTestCase]
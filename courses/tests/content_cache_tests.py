@@ -0,0 +1,228 @@
+import json
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils.http import parse_http_date
+from rest_framework.test import APIClient
+
+from accounts.models.user import User
+from institutions.models.institution import Institution
+from ioc.models.material_io_code import MaterialIoCode
+from ..helpers.content_cache import (
+    LRUBackend,
+    bump_version,
+    get_content_cache,
+    last_changed,
+)
+from ..models.course import Course
+from ..models.instructor import Instructor
+from ..models.material import Material
+from ..models.material_html import MaterialHTML
+from ..models.module import Module
+
+
+class ContentCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        get_content_cache().backend.clear()
+        get_content_cache().reset_stats()
+        self.client = APIClient()
+        self.user = User.objects.create(
+            email="test@example.com",
+            password="testpassword",
+            first_name="Test",
+            last_name="User",
+        )
+        self.client.force_authenticate(self.user)
+        self.institution = Institution.objects.create(
+            name="Institucion de Test",
+            alias="IT",
+            description="Institucion de Test",
+            url="https://www.instituciontest.com",
+        )
+        self.course = self.create_course("test")
+        self.module = Module.objects.create(
+            course_id=self.course, name="Module", order=0
+        )
+        self.material = Material.objects.create(
+            module_id=self.module, name="Reading", material_type="HTM", order=0
+        )
+        self.material_html = MaterialHTML.objects.create(
+            material_id=self.material, content="# Title"
+        )
+
+    def create_course(self, alias: str) -> Course:
+        return Course.objects.create(
+            institution=self.institution, name=f"Course {alias}", alias=alias
+        )
+
+    def html(self):
+        return self.client.get(f"/material/html/{self.material.id}/")
+
+    def test_hit_reads_nothing(self):
+        response = self.client.get(f"/module/{self.module.id}/")
+        self.html()
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(f"/module/{self.module.id}/")
+            html = self.html()
+
+        self.assertEqual(cached.json(), response.json())
+        self.assertEqual(html.json()["content"], "# Title")
+
+    def test_save_invalidates_the_course(self):
+        self.html()
+        self.client.get(f"/module/{self.module.id}/")
+
+        self.material_html.content = "# New title"
+        self.material_html.save()
+        self.assertEqual(self.html().json()["content"], "# New title")
+
+        # Every entry of the course went stale, not only the saved one
+        with self.assertNumQueries(1):
+            self.client.get(f"/module/{self.module.id}/")
+
+    def test_counters_are_not_cached(self):
+        """A like does not invalidate the course, yet is served at once."""
+        url = f"/material/{self.material.id}/"
+        etag = self.client.get(url)["ETag"]
+        self.client.get(f"/module/{self.module.id}/")
+
+        self.material.likes += 1
+        self.material.save(update_fields=["likes"])
+
+        with self.assertNumQueries(0):
+            self.client.get(f"/module/{self.module.id}/")
+        with self.assertNumQueries(1):
+            response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["likes"], 1)
+        self.assertEqual(
+            self.client.get(
+                url, headers={"if-none-match": response["ETag"]}
+            ).status_code,
+            304,
+        )
+
+    def test_other_courses_stay_cached(self):
+        self.html()
+        other = self.create_course("other")
+        Module.objects.create(course_id=other, name="Module", order=0)
+
+        with self.assertNumQueries(0):
+            self.html()
+
+    def test_change_during_first_load(self):
+        """Content loaded before a change is not stored under its version."""
+        content_cache = get_content_cache()
+
+        def load():
+            bump_version(self.course.id)  # A write commits while loading
+            return self.course.id, "old"
+
+        self.assertEqual(content_cache.read("test", 1, load), "old")
+        fresh = content_cache.read("test", 1, lambda: (self.course.id, "new"))
+        self.assertEqual(fresh, "new")
+
+    def test_course_and_instructors(self):
+        response = self.client.get("/course/test/")
+        self.assertEqual(response.json()["instructors"], [])
+
+        Instructor.objects.create(
+            user_id=self.user, course_id=self.course, instructor_type="T"
+        )
+        response = self.client.get("/course/test/")
+        self.assertEqual(len(response.json()["instructors"]), 1)
+
+    def test_alias_of_a_deleted_course(self):
+        first_id = self.client.get("/course/test/").json()["id"]
+
+        self.course.delete()
+        self.assertEqual(self.client.get("/course/test/").status_code, 404)
+        course = self.create_course("test")
+
+        response = self.client.get("/course/test/")
+        self.assertNotEqual(first_id, course.id)
+        self.assertEqual(response.json()["id"], course.id)
+
+    def test_io_code_material(self):
+        material = Material.objects.create(
+            module_id=self.module, name="Problem", material_type="IOC", order=1
+        )
+        material_io_code = MaterialIoCode.objects.create(
+            material_id=material, max_time=1000, max_memory=1000, max_points=10
+        )
+        self.client.get(f"/material/iocode/{material.id}/")
+
+        material_io_code.max_points = 20
+        material_io_code.save()
+        response = self.client.get(f"/material/iocode/{material.id}/")
+        self.assertEqual(response.json()["max_points"], 20)
+
+    def test_not_modified(self):
+        response = self.html()
+        etag = response["ETag"]
+
+        with self.assertNumQueries(0):
+            not_modified = self.client.get(
+                f"/material/html/{self.material.id}/", headers={"if-none-match": etag}
+            )
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b"")
+
+        self.material_html.content = "# New title"
+        self.material_html.save()
+        response = self.client.get(
+            f"/material/html/{self.material.id}/", headers={"if-none-match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_if_modified_since(self):
+        last_modified = self.html()["Last-Modified"]
+
+        response = self.client.get(
+            f"/material/html/{self.material.id}/",
+            headers={"if-modified-since": last_modified},
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_changes_in_the_same_second(self):
+        """Every change moves Last-Modified, even within one second."""
+        last_modified = self.html()["Last-Modified"]
+
+        self.material_html.content = "# New title"
+        self.material_html.save()
+
+        response = self.client.get(
+            f"/material/html/{self.material.id}/",
+            headers={"if-modified-since": last_modified},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(last_changed(self.course.id), parse_http_date(last_modified))
+
+    def test_lru_eviction(self):
+        backend = LRUBackend(max_entries=2, timeout=60)
+        backend.set("a", 1)
+        backend.set("b", 2)
+        backend.get("a")
+        backend.set("c", 3)
+
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual((backend.get("a"), backend.get("c")), (1, 3))
+        self.assertEqual(backend.stats()["evictions"], 1)
+
+    def test_stats(self):
+        self.html()
+        self.html()
+        self.html()
+
+        output = StringIO()
+        call_command("content_cache_stats", "--reset", stdout=output)
+        stats = json.loads(output.getvalue())
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertEqual(stats["hit_rate"], 0.6667)
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(get_content_cache().stats()["hits"], 0)
@@ -0,0 +1,114 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models.user import User
+from institutions.models.institution import Institution
+from ioc.models.material_io_code import MaterialIoCode
+from ..models.course import Course
+from ..models.instructor import Instructor
+from ..models.material import Material
+from ..models.material_html import MaterialHTML
+from ..models.material_pdf import MaterialPDF
+from ..models.material_video import MaterialVideo
+from ..models.module import Module
+
+
+class CourseOutlineTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create(
+            email="test@example.com",
+            password="testpassword",
+            first_name="Test",
+            last_name="User",
+        )
+        self.client.force_authenticate(self.user)
+        institution = Institution.objects.create(
+            name="Institucion de Test",
+            alias="IT",
+            description="Institucion de Test",
+            url="https://www.instituciontest.com",
+        )
+        self.course = Course.objects.create(
+            institution=institution, name="Test Course", alias="test"
+        )
+        Instructor.objects.create(
+            user_id=self.user, course_id=self.course, instructor_type="T"
+        )
+
+    def add_module(self, order: int) -> Module:
+        """Add a module with one material of every type, in reverse order,
+        each inserted before the ones added so far"""
+        module = Module.objects.create(
+            course_id=self.course, name=f"Module {order}", order=order
+        )
+        materials = {
+            material_type: Material.objects.create(
+                module_id=module,
+                name=f"{material_type} {order}",
+                material_type=material_type,
+                order=0,
+            )
+            for material_type in reversed(["HTM", "VID", "PDF", "IOC"])
+        }
+        MaterialHTML.objects.create(material_id=materials["HTM"], content="# Title")
+        MaterialVideo.objects.create(
+            material_id=materials["VID"], length=60, source="Y", external_id="abc"
+        )
+        MaterialPDF.objects.create(
+            material_id=materials["PDF"], url="https://example.com/a.pdf", pages=3
+        )
+        MaterialIoCode.objects.create(
+            material_id=materials["IOC"], max_time=1000, max_memory=256, max_points=10
+        )
+        return module
+
+    def outline(self):
+        return self.client.get(f"/course/{self.course.alias}/outline/")
+
+    def test_outline(self):
+        self.add_module(1)
+        self.add_module(0)
+
+        response = self.outline()
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["institution"]["alias"], "IT")
+        self.assertEqual(data["instructors"][0]["first_name"], "Test")
+        self.assertEqual([module["order"] for module in data["modules"]], [0, 1])
+
+        materials = data["modules"][0]["materials"]
+        self.assertEqual(
+            [material["material_type"] for material in materials],
+            ["HTM", "VID", "PDF", "IOC"],
+        )
+        self.assertEqual(
+            [material["payload"] for material in materials],
+            [
+                {"length": 7},
+                {"length": 60, "source": "Y", "external_id": "abc"},
+                {"url": "https://example.com/a.pdf", "pages": 3},
+                {
+                    "max_time": 1000,
+                    "max_memory": 256,
+                    "max_points": 10,
+                    "is_exam": False,
+                },
+            ],
+        )
+
+    def test_fixed_number_of_queries(self):
+        """The queries do not grow with the modules and materials"""
+        self.add_module(0)
+        with self.assertNumQueries(4):
+            self.outline()
+
+        for order in range(1, 6):
+            self.add_module(order)
+        with self.assertNumQueries(4):
+            response = self.outline()
+        self.assertEqual(len(response.json()["modules"]), 6)
+
+    def test_outline_not_found(self):
+        response = self.client.get("/course/missing/outline/")
+        self.assertEqual(response.status_code, 404)
@@ -164,6 +164,29 @@ class CreateMaterialTestCase(TestCase):
         self.assertEqual(response.status_code, 201)
         self.assertEqual(MaterialVideo.objects.count(), 1)
 
+    def test_create_in_the_middle(self):
+        for name in ("First", "Last"):
+            Material.objects.create(
+                module_id=self.module, name=name, material_type="HTM"
+            )
+
+        response = self.client.post(
+            "/material/create/", {**self.material_data, "order": 1}, format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["order"], 1)
+        self.assertEqual(
+            list(Material.objects.order_by("order").values_list("name", flat=True)),
+            ["First", "Image to reply", "Last"],
+        )
+
+    def test_create_past_the_end(self):
+        response = self.client.post(
+            "/material/create/", {**self.material_data, "order": 1}, format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Material.objects.count(), 0)
+
 
 class GetMaterialTestCase(TestCase):
     def setUp(self):
@@ -265,6 +288,16 @@ class UpdateMaterialTestCase(TestCase):
             {"message": "You can not change the order of a material through this url"},
         )
 
+    def test_update_material_rank(self):
+        response = self.client.patch(
+            f"/material/update/{self.material.id}/", {"rank": 1}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            loads(response.content),
+            {"message": "You can not change the order of a material through this url"},
+        )
+
     def test_update_material_order_incorrect(self):
         response = self.client.patch(
             f"/material/update/{self.material.id}/",
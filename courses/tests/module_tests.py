@@ -1,9 +1,13 @@
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
+from io import StringIO
 from json import loads
 
+from constants.courses import ORDER_KEY_GAP
+from ..helpers.reorder import apply_order
 from ..models.course import Course
 from ..models.module import Module
 from ..models.material import Material
@@ -73,6 +77,29 @@ class CreateModuleTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(Module.objects.count(), 0)
 
+    def test_create_module_in_the_middle(self):
+        for name in ("First", "Last"):
+            Module.objects.create(course_id=self.course, name=name)
+
+        response = self.client.post(
+            path=self.url,
+            data={**self.module_data_correct, "order": 1},
+            format=self.format,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            list(Module.objects.order_by("order").values_list("name", flat=True)),
+            ["First", "Test Module #", "Last"],
+        )
+
+        response = self.client.post(
+            path=self.url,
+            data={"course_id": self.course.id, "name": "Far", "order": 4},
+            format=self.format,
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 class GetModuleTestCase(TestCase):
     def setUp(self) -> None:
@@ -198,6 +225,20 @@ class UpdateModuleTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(Module.objects.get().name, "Test Module #")
 
+    def test_update_module_rank(self):
+        for data in ({"name": "Moved", "rank": 1}, {"name": "Moved", "order": 0}):
+            response = self.client.patch(
+                path=reverse(
+                    viewname=self.view_name,
+                    args=[self.module.id],
+                    current_app=self.current_app,
+                ),
+                data=data,
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Module.objects.get().name, "Test Module #")
+
 
 class DeleteModuleTestCase(TestCase):
     def setUp(self) -> None:
@@ -251,6 +292,23 @@ class DeleteModuleTestCase(TestCase):
         self.assertEqual(Module.objects.get().name, "Test Module #")
         self.assertEqual(Module.objects.count(), 1)
 
+    def test_delete_module_moves_the_next_back(self):
+        for number in range(1, 4):
+            Module.objects.create(course_id=self.course, name=f"Module {number}")
+        module = Module.objects.get(name="Module 1")
+
+        response = self.client.delete(
+            path=reverse(
+                viewname=self.view_name, args=[module.id], current_app=self.current_app
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(Module.objects.order_by("order").values_list("name", "order")),
+            [("Test Module #", 0), ("Module 2", 1), ("Module 3", 2)],
+        )
+
 
 class GetMaterialByModuleTestCase(TestCase):
     def setUp(self):
@@ -376,6 +434,143 @@ class UpdateMaterialOrderTestCase(TestCase):
             format="json",
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(Material.objects.order_by("order").values_list("id", flat=True)),
+            [self.material_2.id, self.material_1.id],
+        )
+
+    def test_update_order_unknown_material(self):
+        response = self.client.patch(
+            f"/module/{self.module.id}/materials/update_order/",
+            {str(self.material_1.id): 0, "0": 1},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Material.objects.get(id=self.material_1.id).order, 0)
+
+    def add_materials(self, count: int) -> None:
+        Material.objects.bulk_create(
+            Material(
+                module_id=self.module,
+                name=f"Test material {order}",
+                material_type="htm",
+                rank=ORDER_KEY_GAP * (order + 1),
+            )
+            for order in range(2, count)
+        )
+
+    def ranks(self) -> dict[int, int]:
+        return dict(
+            Material.objects.filter(module_id=self.module).values_list("id", "rank")
+        )
+
+    def test_reverse_order_in_one_statement(self):
+        self.add_materials(200)
+        ids = list(
+            Material.objects.filter(module_id=self.module)
+            .order_by("order")
+            .values_list("id", flat=True)
+        )
+
+        # The savepoint, the locking read and the UPDATE, and the release
+        with self.assertNumQueries(4):
+            apply_order(
+                Material.objects.filter(module_id=self.module),
+                {material_id: 199 - order for order, material_id in enumerate(ids)},
+                self.course.id,
+            )
+
+        self.assertEqual(
+            list(
+                Material.objects.filter(module_id=self.module)
+                .order_by("order")
+                .values_list("id", flat=True)
+            ),
+            ids[::-1],
+        )
+
+    def test_move_writes_one_row(self):
+        self.add_materials(10)
+        ids = list(
+            Material.objects.filter(module_id=self.module)
+            .order_by("order")
+            .values_list("id", flat=True)
+        )
+        ranks = self.ranks()
+
+        new_ids = ids[:2] + [ids[7]] + ids[2:7] + ids[8:]
+        response = self.client.patch(
+            f"/module/{self.module.id}/materials/update_order/",
+            {str(material_id): order for order, material_id in enumerate(new_ids)},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        changed = [key for key, rank in self.ranks().items() if ranks[key] != rank]
+        self.assertEqual(changed, [ids[7]])
+        self.assertEqual(
+            list(
+                Material.objects.filter(module_id=self.module)
+                .order_by("order")
+                .values_list("id", "order")
+            ),
+            [(material_id, order) for order, material_id in enumerate(new_ids)],
+        )
+
+    def test_insert_writes_one_row(self):
+        ranks = self.ranks()
+
+        material = Material.objects.create(
+            module_id=self.module, name="Inserted", material_type="htm", order=1
+        )
+
+        new_ranks = self.ranks()
+        del new_ranks[material.id]
+        self.assertEqual(new_ranks, ranks)
+        self.assertEqual(
+            list(
+                Material.objects.filter(module_id=self.module)
+                .order_by("order")
+                .values_list("id", flat=True)
+            ),
+            [self.material_1.id, material.id, self.material_2.id],
+        )
+        self.assertEqual(material.order, 1)
+
+    def test_insert_without_room(self):
+        """The siblings are spread again when there is no rank left between them"""
+        Material.objects.filter(id=self.material_2.id).update(
+            rank=self.ranks()[self.material_1.id] + 1
+        )
+
+        material = Material.objects.create(
+            module_id=self.module, name="Inserted", material_type="htm", order=1
+        )
+
+        self.assertEqual(
+            list(
+                Material.objects.filter(module_id=self.module)
+                .order_by("rank")
+                .values_list("id", "rank")
+            ),
+            [
+                (self.material_1.id, ORDER_KEY_GAP),
+                (material.id, ORDER_KEY_GAP + ORDER_KEY_GAP // 2),
+                (self.material_2.id, 2 * ORDER_KEY_GAP),
+            ],
+        )
+
+    def test_rebalance_order_keys(self):
+        Material.objects.filter(id=self.material_2.id).update(
+            rank=self.ranks()[self.material_1.id] + 1
+        )
+
+        call_command("rebalance_order_keys", stdout=StringIO())
+
+        self.assertEqual(
+            self.ranks(),
+            {self.material_1.id: ORDER_KEY_GAP, self.material_2.id: 2 * ORDER_KEY_GAP},
+        )
 
 # TODO : CreateMaterialTestCase
 
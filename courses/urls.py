@@ -21,6 +21,11 @@ course_urls = [
     path(
         "course/delete/<str:alias>/", course_views.delete_course, name="delete_course"
     ),
+    path(
+        "course/<str:alias>/outline/",
+        course_views.get_course_outline,
+        name="get_course_outline",
+    ),
     path(
         "course/<str:alias>/modules/",
         course_views.get_modules_by_course,
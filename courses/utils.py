@@ -2,38 +2,21 @@
 from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
 
-from constants.ioc import URL_PROBLEM
-import json
-import requests
 from courses.models import Material
 from courses.serializers.material_html_serializer import MaterialHTMLSerializer
 from courses.serializers.material_pdf_serializer import MaterialPDFSerializer
 from courses.serializers.material_video_serializer import MaterialVideoSerializer
 from ioc.serializers.material_io_code_serializer import MaterialIoCodeSerializer
-from ioc.serializers.case_serializer import CaseSerializer
-
-
-def judge(data):
-    """Method that creates the problem on the judge files."""
-
-    headers = {"Content-Type": "application/json"}
-    response = requests.post(URL_PROBLEM, data=json.dumps(data), headers=headers)
-    return response.json(), response.status_code
+from ioc.helpers.case_store import create_cases
 
 
 def creation_case(data):
-    """Method that creates the cases on the judge files."""
-    for case in range(len(data["input"])):
-        case_serializer = CaseSerializer(
-            data={
-                "input": data["input"][case],
-                "output": data["output"][case],
-                "id_case": case,
-                "material_io_code_id": data["material_io_code_id"],
-            }
-        )
-        if case_serializer.is_valid():
-            case_serializer.save()
+    """Method that creates the cases of the problem in one bulk insert.
+
+    The cases are uploaded to the judge in the background (see
+    ioc.helpers.problem_sync).
+    """
+    create_cases(data["material_io_code_id"], data["input"], data["output"])
 
 
 def validate_and_create_specific_material_type(
@@ -71,8 +54,6 @@ def validate_and_create_specific_material_type(
     specific_instance = specific_serializer.save()
 
     if material_type == "IOC":
-        validation_data["problem_id"] = str(material.id)
-        judge(validation_data)
         validation_data["material_io_code_id"] = specific_instance.id
         creation_case(validation_data)
 
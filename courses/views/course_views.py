@@ -1,5 +1,4 @@
-from django.db import models
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from rest_framework.decorators import api_view, permission_classes, schema
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -8,8 +7,12 @@ from ..models.course import Course
 from ..models.module import Module
 from ..models.instructor import Instructor
 from institutions.models.institution import Institution
+from ..helpers.course_outline import load_course_outline
+from ..helpers.content_cache import cached_response
+from ..helpers.reorder import apply_order
 from ..schemas import course_schemas as schemas
 from ..serializers.course_serializer import CourseSerializer
+from ..serializers.course_outline_serializer import CourseOutlineSerializer
 from ..serializers.module_serializer import ModuleSerializer
 from ..serializers.instructor_serializer import InstructorSerializer
 from institutions.serializers.institution_serializer import InstitutionSerializer
@@ -44,7 +47,7 @@ def create_course(request) -> JsonResponse:
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 @schema(schemas.get_course_schema)
-def get_course(request, alias: str) -> JsonResponse:
+def get_course(request, alias: str) -> HttpResponse:
     """
     View to get a course
 
@@ -57,26 +60,58 @@ def get_course(request, alias: str) -> JsonResponse:
         with all course, institution, and instructors information
     """
 
-    try:
+    def load():
         course = Course.objects.get(alias=alias)
+        institution_id = course.institution_id
+        institution = Institution.objects.get(id=institution_id)
+        instructors = Instructor.objects.filter(course_id=course.id)
+
+        course_serializer = CourseSerializer(course)
+        institution_serializer = InstitutionSerializer(institution)
+        instructor_serializer = InstructorSerializer(instructors, many=True)
+
+        data = course_serializer.data
+        data["institution"] = institution_serializer.data
+        data["instructors"] = instructor_serializer.data
+        return course.id, data
+
+    try:
+        return cached_response(request, "course", alias, load)
     except Course.DoesNotExist:
         return JsonResponse(
             {"error": "Course not found"}, status=status.HTTP_404_NOT_FOUND
         )
 
-    institution_id = course.institution_id
-    institution = Institution.objects.get(id=institution_id)
-    instructors = Instructor.objects.filter(course_id=course.id)
 
-    course_serializer = CourseSerializer(course)
-    institution_serializer = InstitutionSerializer(institution)
-    instructor_serializer = InstructorSerializer(instructors, many=True)
-    
-    data = course_serializer.data
-    data["institution"] = institution_serializer.data
-    data["instructors"] = instructor_serializer.data
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.get_course_outline_schema)
+def get_course_outline(request, alias: str) -> JsonResponse:
+    """
+    View to get everything a course page shows at once
 
-    return JsonResponse(data, safe=False, status=status.HTTP_200_OK)
+    Args:
+        request: http request
+        alias (str): course alias
+
+    Returns:
+        response (JsonResponse): HTTP response in JSON format with the
+        course, its institution and instructors, and its modules in order,
+        each with its materials in order and a summary of their
+        type-specific data. The number of queries does not depend on the
+        size of the course.
+    """
+
+    try:
+        course = load_course_outline(alias)
+    except Course.DoesNotExist:
+        return JsonResponse(
+            {"error": "Course not found"}, status=status.HTTP_404_NOT_FOUND
+        )
+
+    serializer = CourseOutlineSerializer(course)
+
+    return JsonResponse(serializer.data, safe=False, status=status.HTTP_200_OK)
 
 
 @api_view(["PATCH"])
@@ -165,7 +200,7 @@ def get_modules_by_course(request, alias: str) -> JsonResponse:
             status=status.HTTP_404_NOT_FOUND,
         )
 
-    modules_by_course = Module.objects.filter(course_id=course.id).order_by("order")
+    modules_by_course = Module.objects.filter(course_id=course.id).order_by("rank")
 
     if not modules_by_course:
         return JsonResponse(
@@ -252,31 +287,21 @@ def update_module_order(request, alias: str) -> JsonResponse:
     orders: list = list(request.data.values())
     orders.sort()
     correct_orders: list = [n for n in range(len(orders))]
-    max_order = Module.objects.filter(course_id=course.id).aggregate(
-        models.Max("order")
-    )["order__max"]
-
-    if max_order is None:
-        max_order = 0
-    else:
-        max_order += 1
 
-    if orders != correct_orders:
+    try:
+        if orders != correct_orders:
+            raise ValueError("The orders are not consecutive")
+        modules = apply_order(
+            Module.objects.filter(course_id=course.id),
+            {int(module_id): order for module_id, order in request.data.items()},
+            course.id,
+        )
+    except ValueError:
         return JsonResponse(
             {"message": "This modules order is not valid"},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    modules = Module.objects.filter(course_id=course.id)
-
-    for module in modules:
-        module.order += max_order
-        module.save()
-
-    for module in modules:
-        module.order = request.data[str(module.id)]
-        module.save()
-
     modules = ModuleSerializer(modules, many=True)
 
     return JsonResponse(modules.data, safe=False, status=status.HTTP_200_OK)
@@ -1,10 +1,11 @@
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from rest_framework.decorators import api_view, permission_classes, schema
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
 from ..models.material import Material
 from ..models.material_html import MaterialHTML
+from ..helpers.content_cache import cached_response
 from ..schemas import material_html_schemas as schemas
 from ..serializers.material_html_serializer import MaterialHTMLSerializer
 
@@ -39,7 +40,7 @@ def create_material_html(request) -> JsonResponse:
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 @schema(schemas.get_material_html_schema)
-def get_material_html(request, material_id: int) -> JsonResponse:
+def get_material_html(request, material_id: int) -> HttpResponse:
     """
     Get material HTML content by its material ID
 
@@ -51,14 +52,14 @@ def get_material_html(request, material_id: int) -> JsonResponse:
         Json response with the HTML content of the material
     """
 
-    try:
-        material = Material.objects.get(id=material_id)
+    def load():
+        material = Material.objects.select_related("module_id").get(id=material_id)
         material_html = MaterialHTML.objects.get(material_id=material.id)
         material_content = MaterialHTMLSerializer(material_html)
+        return material.module_id.course_id_id, material_content.data
 
-        return JsonResponse(
-            material_content.data, safe=False, status=status.HTTP_200_OK
-        )
+    try:
+        return cached_response(request, "material_html", material_id, load)
     except Material.DoesNotExist:
         return JsonResponse(
             {"message": "There is not a material with that id"},
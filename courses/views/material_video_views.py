@@ -1,10 +1,11 @@
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from rest_framework.decorators import api_view, permission_classes, schema
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from pytube import YouTube
 from ..schemas import material_video_schemas as schemas
 from ..models.material_video import MaterialVideo
+from ..helpers.content_cache import cached_response
 
 # from ..schemas import material_video_schemas as schemas
 from ..serializers.material_video_serializer import (
@@ -40,7 +41,7 @@ def create_material_video(request) -> JsonResponse:
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 @schema(schemas.get_material_video_schema)
-def get_material_video(request, material_id: int) -> JsonResponse:
+def get_material_video(request, material_id: int) -> HttpResponse:
     """
     Get material by its id
 
@@ -53,10 +54,15 @@ def get_material_video(request, material_id: int) -> JsonResponse:
         the request is Authenticated, else throws 401 Unauthorized status
     """
 
+    def load():
+        materialVideo = MaterialVideo.objects.select_related(
+            "material_id__module_id"
+        ).get(material_id=material_id)
+        course_id = materialVideo.material_id.module_id.course_id_id
+        return course_id, MaterialGetVideoSerializer(materialVideo).data
+
     try:
-        materialVideo = MaterialVideo.objects.get(material_id=material_id)
-        materialVideo = MaterialGetVideoSerializer(materialVideo)
-        return JsonResponse(materialVideo.data, safe=False, status=status.HTTP_200_OK)
+        return cached_response(request, "material_video", material_id, load)
     except MaterialVideo.DoesNotExist:
         return JsonResponse(
             {"message": "There is not a video material with that id"},
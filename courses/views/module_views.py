@@ -1,11 +1,12 @@
-from django.db import models
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from rest_framework.decorators import api_view, permission_classes, schema
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
 from ..models.module import Module
 from ..models.material import Material
+from ..helpers.content_cache import cached_response
+from ..helpers.reorder import apply_order
 from ..schemas import module_schemas as schemas
 from ..serializers.module_serializer import ModuleSerializer
 from ..serializers.material_serializer import MaterialSerializer
@@ -42,7 +43,7 @@ def create_module(request) -> JsonResponse:
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 @schema(schemas.get_module_schema)
-def get_module_by_id(request, module_id: int) -> JsonResponse:
+def get_module_by_id(request, module_id: int) -> HttpResponse:
     """
     Get module by its id
 
@@ -57,10 +58,12 @@ def get_module_by_id(request, module_id: int) -> JsonResponse:
         status or 404 if module does not exist
     """
 
-    try:
+    def load():
         module = Module.objects.get(id=module_id)
-        module = ModuleSerializer(module)
-        return JsonResponse(module.data, safe=False, status=status.HTTP_200_OK)
+        return module.course_id_id, ModuleSerializer(module).data
+
+    try:
+        return cached_response(request, "module", module_id, load)
     except Module.DoesNotExist:
         return JsonResponse(
             {"message": "There is not a module with that id"},
@@ -92,6 +95,13 @@ def update_module(request, module_id: int) -> JsonResponse:
             status=status.HTTP_404_NOT_FOUND,
         )
 
+    # The rank is the order too (see helpers.order_keys)
+    if "order" in request.data or "rank" in request.data:
+        return JsonResponse(
+            {"message": "You can not change the order of a module through this url"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
     if "name" in request.data:
         module.name = request.data["name"]
     else:
@@ -122,16 +132,6 @@ def delete_module(request, module_id: int) -> JsonResponse:
 
     try:
         module = Module.objects.get(pk=module_id)
-        modules_ahead = Module.objects.filter(
-            course_id=module.course_id, order__gt=module.order
-        ).order_by("order")
-        module.order = -module.order if module.order > 0 else -1
-        module.save()
-
-        for module_ahead in modules_ahead:
-            module_ahead.order -= 1
-            module_ahead.save()
-
         module.delete()
 
         return JsonResponse(
@@ -167,7 +167,7 @@ def get_materials_by_module(request, module_id: int) -> JsonResponse:
             status=status.HTTP_404_NOT_FOUND,
         )
 
-    materials_by_module = Material.objects.filter(module_id=module_id).order_by("order")
+    materials_by_module = Material.objects.filter(module_id=module_id).order_by("rank")
 
     if not materials_by_module:
         return JsonResponse(
@@ -244,7 +244,7 @@ def update_material_order(request, module_id: int) -> JsonResponse:
     """
 
     try:
-        Module.objects.get(id=module_id)
+        module = Module.objects.get(id=module_id)
     except Module.DoesNotExist:
         return JsonResponse(
             {"message": "There is not a module with that id"},
@@ -254,29 +254,21 @@ def update_material_order(request, module_id: int) -> JsonResponse:
     orders: list = list(request.data.values())
     orders.sort()
     correct_orders: list = [n for n in range(len(orders))]
-    max_order = (
-        Material.objects.filter(module_id=module_id).aggregate(models.Max("order"))[
-            "order__max"
-        ]
-        + 1
-    )
-
-    if orders != correct_orders:
+
+    try:
+        if orders != correct_orders:
+            raise ValueError("The orders are not consecutive")
+        materials = apply_order(
+            Material.objects.filter(module_id=module_id),
+            {int(material_id): order for material_id, order in request.data.items()},
+            module.course_id_id,
+        )
+    except ValueError:
         return JsonResponse(
             {"message": "This materials order is not valid"},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    materials = Material.objects.filter(module_id=module_id)
-
-    for material in materials:
-        material.order += max_order
-        material.save()
-
-    for material in materials:
-        material.order = request.data[str(material.id)]
-        material.save()
-
     materials = MaterialSerializer(materials, many=True)
 
     return JsonResponse(materials.data, safe=False, status=status.HTTP_200_OK)
@@ -1,11 +1,31 @@
 from .io_code_submission_admin import IoCodeSubmissionAdmin
 from .material_io_code_admin import MaterialIoCodeAdmin
 from .case_admin import CaseAdmin
+from .case_blob_admin import CaseBlobAdmin
 from .io_code_submission_summary_admin import IoCodeSubmissionSummaryAdmin
+from .io_code_course_summary_admin import IoCodeCourseSummaryAdmin
+from .judge_task_admin import JudgeTaskAdmin
+from .verdict_memo_admin import VerdictMemoAdmin
+from .rejudge_admin import RejudgeAdmin
+from .problem_sync_admin import ProblemSyncAdmin
+from .contest_admin import ContestAdmin
+from .contest_score_admin import ContestScoreAdmin
+from .similarity_signature_admin import SimilaritySignatureAdmin
+from .archived_submission_admin import ArchivedSubmissionAdmin
 
 _ = [
     IoCodeSubmissionAdmin,
     CaseAdmin,
+    CaseBlobAdmin,
     IoCodeSubmissionSummaryAdmin,
+    IoCodeCourseSummaryAdmin,
     MaterialIoCodeAdmin,
+    JudgeTaskAdmin,
+    VerdictMemoAdmin,
+    RejudgeAdmin,
+    ProblemSyncAdmin,
+    ContestAdmin,
+    ContestScoreAdmin,
+    SimilaritySignatureAdmin,
+    ArchivedSubmissionAdmin,
 ]
@@ -0,0 +1,21 @@
+"""Module with the admin class for the ArchivedSubmission model"""
+from django.contrib import admin
+
+from ..models.archived_submission import ArchivedSubmission
+
+
+class ArchivedSubmissionAdmin(admin.ModelAdmin):
+    """Class that defines the admin interface for the ArchivedSubmission model"""
+
+    list_display = (
+        "submission_id",
+        "material",
+        "user",
+        "submission_date",
+        "response_char",
+        "archived_at",
+    )
+    exclude = ("code", "case_results")
+
+
+admin.site.register(ArchivedSubmission, ArchivedSubmissionAdmin)
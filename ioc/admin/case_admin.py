@@ -8,7 +8,7 @@ from ..models.case import Case
 class CaseAdmin(admin.ModelAdmin):
     """Class that defines the admin interface for the Case model"""
 
-    list_display = ("input", "output", "material_io_code_id", "id_case")
+    list_display = ("input_blob", "output_blob", "material_io_code_id", "id_case")
 
 
 admin.site.register(Case, CaseAdmin)
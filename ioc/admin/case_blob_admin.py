@@ -0,0 +1,15 @@
+"""Module with the admin class for the CaseBlob model"""
+from django.contrib import admin
+
+from ..models.case_blob import CaseBlob
+
+
+class CaseBlobAdmin(admin.ModelAdmin):
+    """Class that defines the admin interface for the CaseBlob model"""
+
+    list_display = ("digest", "size", "created_at")
+    search_fields = ("digest",)
+    exclude = ("data",)
+
+
+admin.site.register(CaseBlob, CaseBlobAdmin)
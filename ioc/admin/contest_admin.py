@@ -0,0 +1,14 @@
+"""Module with the admin class for the Contest model"""
+from django.contrib import admin
+
+from ..models.contest import Contest
+
+
+class ContestAdmin(admin.ModelAdmin):
+    """Class that defines the admin interface for the Contest model"""
+
+    list_display = ("id", "name", "course", "start_at", "end_at", "freeze_at")
+    filter_horizontal = ("materials",)
+
+
+admin.site.register(Contest, ContestAdmin)
@@ -0,0 +1,14 @@
+"""Module with the admin class for the ContestScore model"""
+from django.contrib import admin
+
+from ..models.contest_score import ContestScore
+
+
+class ContestScoreAdmin(admin.ModelAdmin):
+    """Class that defines the admin interface for the ContestScore model"""
+
+    list_display = ("id", "contest", "user", "updated_at")
+    list_filter = ("contest",)
+
+
+admin.site.register(ContestScore, ContestScoreAdmin)
@@ -0,0 +1,17 @@
+from django.contrib import admin
+
+from ..models.io_code_course_summary import IoCodeCourseSummary
+
+
+class IoCodeCourseSummaryAdmin(admin.ModelAdmin):
+    list_display = (
+        "course",
+        "user",
+        "points",
+        "solved",
+        "total_execution_time",
+        "total_execution_memory",
+    )
+
+
+admin.site.register(IoCodeCourseSummary, IoCodeCourseSummaryAdmin)
@@ -0,0 +1,23 @@
+"""Module with the admin class for the JudgeTask model"""
+from django.contrib import admin
+
+from ..models.judge_task import JudgeTask
+
+
+class JudgeTaskAdmin(admin.ModelAdmin):
+    """Class that defines the admin interface for the JudgeTask model"""
+
+    list_display = (
+        "id",
+        "submission",
+        "status",
+        "priority",
+        "attempts",
+        "created_at",
+        "claimed_by",
+        "finished_at",
+    )
+    list_filter = ("status", "priority")
+
+
+admin.site.register(JudgeTask, JudgeTaskAdmin)
@@ -12,6 +12,7 @@ class MaterialIoCodeAdmin(admin.ModelAdmin):
         "max_points",
         "min_points",
         "points_penalty",
+        "is_exam",
     )
     list_filter = ("material_id", "id")
     search_fields = ("material_id", "id")
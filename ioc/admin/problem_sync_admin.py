@@ -0,0 +1,22 @@
+"""Module with the admin class for the ProblemSync model"""
+from django.contrib import admin
+
+from ..models.problem_sync import ProblemSync
+
+
+class ProblemSyncAdmin(admin.ModelAdmin):
+    """Class that defines the admin interface for the ProblemSync model"""
+
+    list_display = (
+        "id",
+        "material_io_code",
+        "status",
+        "attempts",
+        "requested_at",
+        "synced_at",
+        "last_error",
+    )
+    list_filter = ("status",)
+
+
+admin.site.register(ProblemSync, ProblemSyncAdmin)
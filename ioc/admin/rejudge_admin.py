@@ -0,0 +1,14 @@
+"""Module with the admin class for the Rejudge model"""
+from django.contrib import admin
+
+from ..models.rejudge import Rejudge
+
+
+class RejudgeAdmin(admin.ModelAdmin):
+    """Class that defines the admin interface for the Rejudge model"""
+
+    list_display = ("id", "material", "status", "total", "created_at", "finished_at")
+    list_filter = ("status",)
+
+
+admin.site.register(Rejudge, RejudgeAdmin)
@@ -0,0 +1,14 @@
+"""Module with the admin class for the SimilaritySignature model"""
+from django.contrib import admin
+
+from ..models.similarity_signature import SimilaritySignature
+
+
+class SimilaritySignatureAdmin(admin.ModelAdmin):
+    """Class that defines the admin interface for the SimilaritySignature model"""
+
+    list_display = ("submission", "material", "user")
+    exclude = ("signature",)
+
+
+admin.site.register(SimilaritySignature, SimilaritySignatureAdmin)
@@ -0,0 +1,22 @@
+"""Module with the admin class for the VerdictMemo model"""
+from django.contrib import admin
+
+from ..models.verdict_memo import VerdictMemo
+
+
+class VerdictMemoAdmin(admin.ModelAdmin):
+    """Class that defines the admin interface for the VerdictMemo model"""
+
+    list_display = (
+        "id",
+        "material",
+        "language",
+        "code_hash",
+        "cases_version",
+        "response_char",
+        "created_at",
+    )
+    list_filter = ("language", "response_char")
+
+
+admin.site.register(VerdictMemo, VerdictMemoAdmin)
@@ -7,3 +7,7 @@ class IocConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "ioc"
+
+    def ready(self):
+        """Method that connects the signal receivers of the app."""
+        from . import signals  # noqa: F401
@@ -0,0 +1,82 @@
+"""Archive of the old submissions.
+
+Submissions older than ``ARCHIVE_AFTER_DAYS`` are moved, with their per-case
+results, from the IoCodeSubmission table to the ArchivedSubmission table,
+with their code compressed, so the table read by the judge only holds the
+recent semesters. Moving a batch is one transaction: its submissions are
+copied and deleted together.
+
+Nothing built from the submissions changes: the submission summaries stay
+as they are and are rebuilt from both tables (see ``submission_summary``),
+so are the contest scores (see ``scoreboard``), the history pages read both
+(see ``submission_history``) and an archived submission is still returned
+by its id (see ``get_submission``). Only judged submissions whose judge task
+finished are archived; they leave the similarity index, which is for recent
+work.
+"""
+import zlib
+from datetime import datetime
+
+from django.db import transaction
+
+from ..models.archived_submission import ArchivedSubmission
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.judge_task import JudgeTask
+
+
+def archive_batch(before: datetime, batch_size: int) -> int:
+    """Move a batch of the judged submissions sent before a date
+
+    Returns:
+        int: number of submissions archived, 0 once there are no more
+    """
+    with transaction.atomic():
+        submissions = list(
+            IoCodeSubmission.objects.filter(
+                submission_date__lt=before, response_char__isnull=False
+            )
+            .exclude(judge_task__status__in=(JudgeTask.PENDING, JudgeTask.RUNNING))
+            .order_by("submission_id")
+            .select_for_update(skip_locked=True, of=("self",))[:batch_size]
+        )
+        if not submissions:
+            return 0
+
+        ArchivedSubmission.objects.bulk_create(
+            ArchivedSubmission(
+                submission_id=submission.submission_id,
+                material_id=submission.material_id_id,
+                user_id=submission.user_id_id,
+                submission_date=submission.submission_date,
+                code=zlib.compress(submission.code.encode()),
+                response_char=submission.response_char,
+                execution_time=submission.execution_time,
+                execution_memory=submission.execution_memory,
+                completion_rate=submission.completion_rate,
+                case_results=submission.case_results,
+                language=submission.language,
+            )
+            for submission in submissions
+        )
+        IoCodeSubmission.objects.filter(
+            submission_id__in=[submission.submission_id for submission in submissions]
+        ).delete()
+    return len(submissions)
+
+
+def get_submission(submission_id: int) -> IoCodeSubmission:
+    """Submission with an id, read from the archive if it was archived
+
+    Raises:
+        IoCodeSubmission.DoesNotExist: there is no submission with that id
+    """
+    try:
+        return IoCodeSubmission.objects.get(submission_id=submission_id)
+    except IoCodeSubmission.DoesNotExist:
+        try:
+            archived = ArchivedSubmission.objects.get(submission_id=submission_id)
+        except ArchivedSubmission.DoesNotExist:
+            raise IoCodeSubmission.DoesNotExist(
+                f"There is no submission {submission_id}"
+            ) from None
+        return archived.to_submission()
@@ -0,0 +1,142 @@
+"""On-disk cache of the compiled programs of the local judge.
+
+Artifacts are stored under the hash of their language and normalized source,
+so a resubmission of the same program skips the compiler. The cache is shared
+by the processes of the judge pool: files are written atomically, the least
+recently used ones are evicted once the cache grows past its size cap, and
+the hit/miss counters live in a locked file next to the artifacts.
+
+Like ``sandbox``, this module does not touch Django.
+"""
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+STATS_FILE = "stats.json"
+ARTIFACT_SUFFIX = ".bin"
+
+
+def normalize_code(code: str) -> str:
+    """Drop the differences that cannot change the compiled program
+
+    Line endings, trailing spaces and trailing blank lines are ignored.
+    """
+    lines = code.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).rstrip("\n")
+
+
+def artifact_key(language: str, code: str) -> str:
+    return hashlib.sha256(f"{language}\0{normalize_code(code)}".encode()).hexdigest()
+
+
+class ArtifactCache:
+    """LRU cache of compiled artifacts in a directory, capped at ``max_bytes``"""
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, key + ARTIFACT_SUFFIX)
+
+    def get(self, language: str, code: str, destination: str) -> bool:
+        """Copy the cached artifact of a program to ``destination``
+
+        Returns:
+            bool: True on a cache hit
+        """
+        path = self.path(artifact_key(language, code))
+        try:
+            shutil.copy2(path, destination)
+            os.utime(path)  # Most recently used
+        except FileNotFoundError:  # Missing or evicted meanwhile
+            self.count("misses")
+            return False
+        self.count("hits")
+        return True
+
+    def put(self, language: str, code: str, artifact: str) -> None:
+        """Store the compiled artifact of a program"""
+        path = self.path(artifact_key(language, code))
+        descriptor, partial = tempfile.mkstemp(dir=self.root, suffix=".partial")
+        os.close(descriptor)
+        try:
+            shutil.copy2(artifact, partial)
+            os.replace(partial, path)
+        except OSError:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+        self.evict()
+
+    def entries(self) -> list[os.DirEntry]:
+        with os.scandir(self.root) as entries:
+            return [entry for entry in entries if entry.name.endswith(ARTIFACT_SUFFIX)]
+
+    def evict(self) -> None:
+        """Remove the least recently used artifacts above the size cap"""
+        sized = []
+        for entry in self.entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            sized.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in sized)
+        for _, size, path in sorted(sized):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:  # Evicted by another process
+                pass
+            total -= size
+
+    def update_stats(self, change=None) -> dict:
+        """Read the counters, applying ``change`` under the file lock"""
+        with open(os.path.join(self.root, STATS_FILE), "a+") as stats_file:
+            fcntl.flock(stats_file, fcntl.LOCK_EX)
+            stats_file.seek(0)
+            stats = json.loads(stats_file.read() or '{"hits": 0, "misses": 0}')
+            if change:
+                change(stats)
+                stats_file.seek(0)
+                stats_file.truncate()
+                stats_file.write(json.dumps(stats))
+        return stats
+
+    def count(self, counter: str) -> None:
+        def increment(stats):
+            stats[counter] += 1
+
+        self.update_stats(increment)
+
+    def stats(self) -> dict:
+        """Hit/miss counters and size of the cache"""
+        stats = self.update_stats()
+        lookups = stats["hits"] + stats["misses"]
+        sizes = []
+        for entry in self.entries():
+            try:
+                sizes.append(entry.stat().st_size)
+            except FileNotFoundError:
+                continue
+        return {
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+            "entries": len(sizes),
+            "bytes": sum(sizes),
+            "max_bytes": self.max_bytes,
+        }
+
+    def reset_stats(self) -> None:
+        def reset(stats):
+            stats.update(hits=0, misses=0)
+
+        self.update_stats(reset)
@@ -0,0 +1,49 @@
+"""Packed per-case results of a judged submission.
+
+The result of every test case is stored in the ``case_results`` column of the
+submission as fixed-size records, one per case run, in case order:
+
+    verdict (1 byte, index in ``CASE_VERDICTS``, RE if the judge gave another)
+    time    (4 bytes, milliseconds)
+    memory  (4 bytes, kilobytes)
+
+so a submission with 100 cases takes 900 bytes in its own row instead of 100
+rows in a results table. Cases skipped after the first failure have no
+record.
+"""
+import struct
+
+CASE_VERDICTS = ("AC", "WA", "TLE", "MLE", "OLE", "RE")
+RECORD = struct.Struct("<BII")
+MAX_FIELD = 2**32 - 1
+VERDICT_CODES = {verdict: code for code, verdict in enumerate(CASE_VERDICTS)}
+
+
+def pack_case_results(cases: list[dict]) -> bytes:
+    """Pack the cases of a judge answer (time in seconds, memory in KB)"""
+    return b"".join(
+        RECORD.pack(
+            VERDICT_CODES.get(case["verdict"], VERDICT_CODES["RE"]),
+            min(round(case["time"] * 1000), MAX_FIELD),
+            min(int(case["memory"]), MAX_FIELD),
+        )
+        for case in cases
+    )
+
+
+def unpack_case_results(data: bytes | memoryview | None) -> list[dict]:
+    """Cases packed by ``pack_case_results``, time back in seconds"""
+    if not data:
+        return []
+    return [
+        {"verdict": CASE_VERDICTS[verdict], "time": time / 1000, "memory": memory}
+        for verdict, time, memory in RECORD.iter_unpack(bytes(data))
+    ]
+
+
+def completion_rate(cases: list[dict], total_cases: int) -> float:
+    """Share of the cases of the problem that were accepted"""
+    if not total_cases:
+        return 0.0
+    accepted = sum(case["verdict"] == "AC" for case in cases)
+    return round(accepted / total_cases, 4)
@@ -0,0 +1,174 @@
+"""Content-addressed storage of the test case data.
+
+Inputs and outputs are stored zlib-compressed in ``CaseBlob`` under the
+sha256 of their content, so data repeated across cases or materials is
+stored once. Cases only point at their blobs and are created with a single
+bulk insert per problem.
+
+The local judge does not read the blobs for every submission: each distinct
+blob is written once, uncompressed, to ``IOC_CASE_CACHE_DIR`` and the
+sandbox feeds that file to the program as its standard input. The files are
+named by their digest and never change, so every process of the judge can
+share them.
+"""
+import hashlib
+import os
+import tempfile
+import zlib
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Max
+
+from ..models.case import Case
+from ..models.case_blob import CaseBlob
+from ..models.material_io_code import MaterialIoCode
+from .problem_sync import request_sync
+from .verdict_cache import invalidate_verdicts
+
+COMPRESSION_LEVEL = 6
+
+# Advisory lock taken shared by the uploads and exclusive by ``prune_blobs``,
+# so a blob is never deleted between its upload and the insert of its case
+CASE_BLOB_LOCK = 0xCA5E
+
+
+def blob_digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def save_blobs(contents: list[str]) -> list[str]:
+    """Store the contents that are not stored yet
+
+    Returns:
+        list[str]: digest of every content, in order
+    """
+    encoded = [content.encode() for content in contents]
+    digests = [blob_digest(content) for content in encoded]
+    stored = set(
+        CaseBlob.objects.filter(digest__in=digests).values_list("digest", flat=True)
+    )
+    missing = {
+        digest: content
+        for digest, content in zip(digests, encoded)
+        if digest not in stored
+    }
+    CaseBlob.objects.bulk_create(
+        [
+            CaseBlob(
+                digest=digest,
+                data=zlib.compress(content, COMPRESSION_LEVEL),
+                size=len(content),
+            )
+            for digest, content in missing.items()
+        ],
+        ignore_conflicts=True,  # Stored meanwhile by a concurrent upload
+    )
+    return digests
+
+
+def create_cases(
+    material_io_code_id: int,
+    inputs: list[str],
+    outputs: list[str],
+    id_cases: list[int] | None = None,
+) -> list[Case]:
+    """Create the cases of a problem, numbered in order after the cases it
+    already has, in one bulk insert
+
+    The problem is locked until the cases are inserted, so concurrent
+    uploads to it never get the same numbers. Bulk inserts send no signals,
+    so the stored verdicts of the problem are forgotten and its upload to the
+    judge is requested here (see ``ioc.signals``).
+
+    Args:
+        id_cases (list[int] | None): numbers of the cases, instead of the
+            next ones
+    """
+    with transaction.atomic():
+        list(
+            MaterialIoCode.objects.select_for_update()
+            .filter(id=material_io_code_id)
+            .values("id")
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock_shared(%s)", [CASE_BLOB_LOCK])
+        digests = save_blobs(list(inputs) + list(outputs))
+        input_digests, output_digests = digests[: len(inputs)], digests[len(inputs) :]
+        if id_cases is None:
+            last = Case.objects.filter(
+                material_io_code_id=material_io_code_id
+            ).aggregate(last=Max("id_case"))["last"]
+            first = 0 if last is None else last + 1
+            id_cases = range(first, first + len(inputs))
+        cases = Case.objects.bulk_create(
+            [
+                Case(
+                    id_case=number,
+                    input_blob_id=input_digest,
+                    output_blob_id=output_digest,
+                    material_io_code_id_id=material_io_code_id,
+                )
+                for number, input_digest, output_digest in zip(
+                    id_cases, input_digests, output_digests
+                )
+            ]
+        )
+        invalidate_verdicts(material_io_code_id)
+        request_sync(material_io_code_id)
+    return cases
+
+
+def blob_path(digest: str) -> str:
+    return os.path.join(settings.IOC_CASE_CACHE_DIR, digest[:2], digest)
+
+
+def blob_files(digests: list[str]) -> dict[str, str]:
+    """Files with the uncompressed content of some blobs
+
+    Blobs missing from the cache are read in one query and written to it.
+
+    Returns:
+        dict[str, str]: path of the file of every digest
+    """
+    paths = {digest: blob_path(digest) for digest in digests}
+    missing = [digest for digest, path in paths.items() if not os.path.exists(path)]
+    for blob in CaseBlob.objects.filter(digest__in=missing).iterator():
+        path = paths[blob.digest]
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(blob.content())
+        os.replace(temporary, path)  # Readers never see a partial file
+    return paths
+
+
+def case_files(problem_id: str) -> list[tuple[str, str]]:
+    """Input and expected output files of the cases of a problem, in order"""
+    digests = list(
+        Case.objects.filter(material_io_code_id__material_id=problem_id)
+        .order_by("id_case", "id")
+        .values_list("input_blob_id", "output_blob_id")
+    )
+    paths = blob_files([digest for pair in digests for digest in pair])
+    return [(paths[source], paths[expected]) for source, expected in digests]
+
+
+def prune_blobs() -> int:
+    """Delete the blobs no case uses anymore
+
+    Uploads in progress are waited for, as the blobs they found stored are
+    not used by their cases yet.
+
+    Returns:
+        int: number of blobs deleted
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [CASE_BLOB_LOCK])
+        deleted, _ = (
+            CaseBlob.objects.exclude(digest__in=Case.objects.values("input_blob_id"))
+            .exclude(digest__in=Case.objects.values("output_blob_id"))
+            .delete()
+        )
+    return deleted
@@ -0,0 +1,137 @@
+"""Batched dispatch of the judge queue.
+
+During bursts of submissions a worker claims several tasks at once, waiting a
+short window for the batch to fill, and sends them to the judge in a single
+call. The verdicts are then stored one by one, exactly as in the
+one-call-per-submission path of ``judge_queue``.
+"""
+import time
+
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.judge_task import JudgeTask
+from .judge_client import JudgeError
+from .judge_queue import (
+    apply_judge_response,
+    claim_tasks,
+    complete_task,
+    fail_task,
+    get_judge_backend,
+    judge_payload,
+)
+from .submission_events import publish_case
+from .verdict_cache import copy_verdict, find_verdict, remember_verdict
+
+
+def claim_batch(worker_id: str, size: int, window: float) -> list[JudgeTask]:
+    """Claim up to ``size`` tasks, waiting up to ``window`` seconds for them
+
+    The window only starts once a first task has been claimed, so an empty
+    queue is not waited on.
+    """
+    tasks = claim_tasks(worker_id, limit=size)
+    if not tasks:
+        return []
+
+    deadline = time.monotonic() + window
+    while len(tasks) < size and time.monotonic() < deadline:
+        time.sleep(min(0.01, window))
+        tasks += claim_tasks(worker_id, limit=size - len(tasks))
+    return tasks
+
+
+def judge_batch(submissions: list[IoCodeSubmission]):
+    """Method that sends a request to the judge to evaluate several submissions"""
+
+    payloads = [
+        judge_payload(submission, submission.material_id.materialiocode)
+        for submission in submissions
+    ]
+    by_id = {submission.submission_id: submission for submission in submissions}
+
+    def on_case(submission_id, index: int, case: dict) -> None:
+        publish_case(by_id[submission_id], index, case)
+
+    return get_judge_backend().judge_batch(payloads, on_case)
+
+
+def process_batch(tasks: list[JudgeTask]) -> None:
+    """Judge the submissions of claimed tasks in one call and store the verdicts"""
+
+    submissions = IoCodeSubmission.objects.select_related(
+        "material_id__materialiocode", "material_id__module_id", "user_id"
+    ).in_bulk([task.submission_id for task in tasks])
+
+    # Identical resubmissions are answered without the judge
+    pending = []
+    for task in tasks:
+        submission = submissions.get(task.submission_id)
+        memo = None
+        if submission is not None:
+            memo = find_verdict(submission, submission.material_id.materialiocode)
+        if memo is None:
+            pending.append(task)
+            continue
+        copy_verdict(memo, submission)
+        complete_task(task, submission)
+
+    tasks = pending
+    to_judge = [
+        submissions[task.submission_id]
+        for task in tasks
+        if task.submission_id in submissions
+    ]
+    if not to_judge:
+        for task in tasks:  # Submissions deleted while queued
+            fail_task(task, JudgeError("The submission does not exist"))
+        return
+
+    try:
+        response, status_code = judge_batch(to_judge)
+        if status_code != 201:
+            raise JudgeError(f"The judge answered with status {status_code}")
+        results = {result["submission_id"]: result for result in response["results"]}
+    except Exception as exc:  # Any failure must release the tasks for a retry
+        for task in tasks:
+            fail_task(task, exc)
+        return
+
+    for task in tasks:
+        submission = submissions.get(task.submission_id)
+        result = results.get(task.submission_id)
+        if submission is None or result is None:
+            fail_task(task, JudgeError("The judge did not answer this submission"))
+            continue
+
+        try:
+            apply_judge_response(submission, result)
+        except Exception as exc:
+            fail_task(task, exc)
+            continue
+        if complete_task(task, submission):
+            remember_verdict(submission, submission.material_id.materialiocode)
+
+
+def drain_queue_batched(
+    worker_id: str, size: int, window: float, max_tasks: int | None = None
+) -> int:
+    """Judge queued tasks in batches until the queue is empty
+
+    Args:
+        worker_id (str): identifier of the worker draining the queue
+        size (int): maximum number of submissions per judge call
+        window (float): seconds to wait for a batch to fill
+        max_tasks (int | None): stop after this many tasks
+
+    Returns:
+        int: number of tasks processed
+    """
+    processed = 0
+    while max_tasks is None or processed < max_tasks:
+        if max_tasks is not None:
+            size = min(size, max_tasks - processed)
+        tasks = claim_batch(worker_id, size, window)
+        if not tasks:
+            break
+        process_batch(tasks)
+        processed += len(tasks)
+    return processed
@@ -0,0 +1,277 @@
+"""Shared HTTP client for the judge.
+
+Every process keeps one pooled keep-alive session to the judge, with connect
+and read timeouts, bounded retries with jitter and a circuit breaker, so a
+slow or dead judge fails fast instead of pinning the workers that call it.
+"""
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from constants.ioc import URL_JUDGE, URL_JUDGE_BATCH, URL_PROBLEM
+
+
+class JudgeError(Exception):
+    """Raised when the judge could not give an answer."""
+
+
+class JudgeUnavailable(JudgeError):
+    """Raised when the judge is down or the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stop calling the judge after consecutive failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    every call fails immediately. Once ``reset_timeout`` seconds have passed
+    a single trial call is let through (half open): if it succeeds the
+    circuit closes again, otherwise it stays open for another period.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock=None):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock or time.monotonic
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.trial_running = False
+        self.lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Whether a call to the judge can be made now"""
+        with self.lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self.trial_running:
+                self.trial_running = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            self.trial_running = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+
+
+class EndpointStats:
+    """Latency counters of the calls made to one judge endpoint"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, seconds: float, error: bool) -> None:
+        with self.lock:
+            self.calls += 1
+            self.errors += int(error)
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "avg_ms": (
+                    round(self.total_seconds * 1000 / self.calls, 2)
+                    if self.calls
+                    else 0.0
+                ),
+                "max_ms": round(self.max_seconds * 1000, 2),
+            }
+
+
+class JudgeClient:
+    """Pooled keep-alive client for the judge endpoints"""
+
+    def __init__(
+        self,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 2,
+        backoff: float = 0.2,
+        pool_size: int = 10,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        judge_url: str = URL_JUDGE,
+        problem_url: str = URL_PROBLEM,
+        batch_url: str = URL_JUDGE_BATCH,
+    ):
+        self.judge_url = judge_url
+        self.batch_url = batch_url
+        self.problem_url = problem_url
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.stats: dict[str, EndpointStats] = {}
+        self.stats_lock = threading.Lock()
+
+        self.session = requests.Session()
+        # Retries are done by the client itself, with jitter and the breaker
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def endpoint_stats(self, url: str) -> EndpointStats:
+        endpoint = urlsplit(url).path or "/"
+        with self.stats_lock:
+            return self.stats.setdefault(endpoint, EndpointStats())
+
+    def retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, self.backoff * 2**attempt)
+
+    def post(self, url: str, payload) -> tuple[dict, int]:
+        """Post a JSON payload to the judge
+
+        Connection errors, timeouts and 5xx answers are retried up to
+        ``max_retries`` times. Other answers are returned as they are.
+
+        Args:
+            url (str): judge endpoint
+            payload: JSON serializable body
+
+        Returns:
+            tuple[dict, int]: JSON answer of the judge and its status code
+
+        Raises:
+            JudgeUnavailable: the circuit is open or every attempt failed
+        """
+        if not self.breaker.allow():
+            raise JudgeUnavailable("The judge circuit breaker is open")
+
+        stats = self.endpoint_stats(url)
+        error: Exception | None = None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay(attempt - 1))
+
+            start = time.perf_counter()
+            try:
+                response = self.session.post(url, json=payload, timeout=self.timeout)
+            except requests.RequestException as exc:
+                stats.record(time.perf_counter() - start, error=True)
+                error = exc
+                continue
+
+            failed = response.status_code >= 500
+            stats.record(time.perf_counter() - start, error=failed)
+            if failed:
+                error = JudgeError(f"The judge answered with {response.status_code}")
+                continue
+
+            self.breaker.record_success()
+            try:
+                return response.json(), response.status_code
+            except ValueError as exc:
+                raise JudgeError("The judge answer is not valid JSON") from exc
+
+        self.breaker.record_failure()
+        raise JudgeUnavailable(str(error)) from error
+
+    def judge(self, payload: dict, on_case=None) -> tuple[dict, int]:
+        """Send a submission to be judged"""
+        response, status_code = self.post(self.judge_url, payload)
+        if on_case is not None and status_code == 201:
+            replay_cases(response, on_case)
+        return response, status_code
+
+    def judge_batch(self, payloads: list[dict], on_case=None) -> tuple[dict, int]:
+        """Send several submissions to be judged in one call
+
+        The judge answers with ``{"results": [...]}``, one verdict per
+        submission identified by its ``submission_id``.
+        """
+        response, status_code = self.post(self.batch_url, {"submissions": payloads})
+        if on_case is not None and status_code == 201:
+            for result in response.get("results", []):
+                replay_cases(result, on_case)
+        return response, status_code
+
+    def sync_problem(self, payload: dict) -> tuple[dict, int]:
+        """Send the changed cases of a problem to the judge (see problem_sync)"""
+        return self.post(self.problem_url, payload)
+
+    def metrics(self) -> dict:
+        """Latency counters per endpoint and circuit breaker state"""
+        with self.stats_lock:
+            endpoints = dict(self.stats)
+        return {
+            "circuit": self.breaker.state,
+            "endpoints": {
+                endpoint: stats.snapshot() for endpoint, stats in endpoints.items()
+            },
+        }
+
+
+def replay_cases(response: dict, on_case) -> None:
+    """Hand the case results of an answer to ``on_case``
+
+    The judge server answers once the submission is judged, so its cases,
+    when it sends them, are handed over together.
+    """
+    if not isinstance(response, dict):
+        return
+    for index, case in enumerate(response.get("cases") or []):
+        on_case(response["submission_id"], index, case)
+
+
+_client: JudgeClient | None = None
+_client_pid: int | None = None
+_client_lock = threading.Lock()
+
+
+def get_judge_client() -> JudgeClient:
+    """Get the judge client of this process
+
+    The client is created once per process (a forked worker gets its own
+    session instead of sharing the sockets of its parent).
+    """
+    global _client, _client_pid
+
+    with _client_lock:
+        if _client is None or _client_pid != os.getpid():
+            _client = JudgeClient(
+                connect_timeout=settings.IOC_JUDGE_CONNECT_TIMEOUT,
+                read_timeout=settings.IOC_JUDGE_READ_TIMEOUT,
+                max_retries=settings.IOC_JUDGE_MAX_RETRIES,
+                pool_size=settings.IOC_JUDGE_POOL_SIZE,
+                failure_threshold=settings.IOC_JUDGE_BREAKER_THRESHOLD,
+                reset_timeout=settings.IOC_JUDGE_BREAKER_RESET_SECONDS,
+            )
+            _client_pid = os.getpid()
+        return _client
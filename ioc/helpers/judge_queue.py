@@ -0,0 +1,378 @@
+"""Durable judge queue for code submissions.
+
+Every submission is stored as a JudgeTask row when it is created, and judge
+workers (``python manage.py judge_worker``) claim the tasks with
+``SELECT ... FOR UPDATE SKIP LOCKED``, so several workers can drain the queue
+side by side while every task is judged by exactly one of them.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Exists, F, OuterRef, Q, Subquery
+from django.utils import timezone
+
+from constants.ioc import (
+    JUDGE_REJUDGE_MAX_RUNNING,
+    JUDGE_TASK_LEASE_SECONDS,
+    JUDGE_TASK_MAX_ATTEMPTS,
+    JUDGE_TASK_RETRY_DELAY_SECONDS,
+)
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.judge_task import JudgeTask
+from ..models.material_io_code import MaterialIoCode
+from ..models.problem_sync import ProblemSync
+from .case_results import completion_rate, pack_case_results
+from .judge_client import JudgeError, get_judge_client
+from .judge_scheduler import fair_share_time, submission_priority
+from .local_judge import get_local_judge
+from .rejudge import finish_rejudge_if_done
+from .scoreboard import record_contest_submission
+from .similarity import index_submission
+from .submission_events import publish_case
+from .submission_summary import update_submission_summary
+from .verdict_cache import copy_verdict, find_verdict, remember_verdict
+
+logger = logging.getLogger(__name__)
+
+VERDICT_FIELDS = [
+    "response_char",
+    "execution_time",
+    "execution_memory",
+    "completion_rate",
+    "case_results",
+]
+
+# Advisory lock serializing the claims of rejudge tasks, so the cap on running
+# rejudge tasks holds across workers
+REJUDGE_CLAIM_LOCK = 0x10C0
+
+
+def get_judge_backend():
+    """Judge that evaluates the submissions, chosen by ``IOC_JUDGE_BACKEND``
+
+    Both backends answer ``judge(payload)`` and ``judge_batch(payloads)``
+    the same way: "remote" sends them to the judge server and "local" runs
+    them on this machine against the ``Case`` table.
+    """
+    if settings.IOC_JUDGE_BACKEND == "local":
+        return get_local_judge()
+    return get_judge_client()
+
+
+def judge_payload(
+    codesubmission: IoCodeSubmission, material_ioc: MaterialIoCode
+) -> dict:
+    """Body of the judge request of a code submission"""
+
+    return {
+        "code": codesubmission.code,
+        "submission_id": codesubmission.submission_id,
+        "problem_id": str(codesubmission.material_id.id),
+        "time_limit": material_ioc.max_time,
+        "memory_limit": material_ioc.max_memory,
+        "language": codesubmission.language,
+        "stop_on_failure": material_ioc.stop_on_first_failure,
+    }
+
+
+def judge(codesubmission: IoCodeSubmission, material_ioc: MaterialIoCode):
+    """Method that sends a request to the judge to evaluate the code submission
+
+    The result of every case is published to the streams of the author as
+    soon as the judge gives it.
+    """
+
+    def on_case(submission_id, index: int, case: dict) -> None:
+        publish_case(codesubmission, index, case)
+
+    return get_judge_backend().judge(
+        judge_payload(codesubmission, material_ioc), on_case
+    )
+
+
+def apply_judge_response(submission: IoCodeSubmission, response: dict) -> None:
+    """Copy the verdict returned by the judge into the submission (not saved)"""
+
+    if not isinstance(response["verdict"], dict):
+        # The judge answers with a plain message when the code does not compile
+        # or the problem does not exist
+        submission.response_char = "C"
+        submission.execution_memory = 0
+        submission.execution_time = 0
+    else:
+        submission.response_char = response["verdict"]["verdict"][0]
+        submission.execution_memory = response["max_memory"]
+        submission.execution_time = response["max_time"]
+
+    cases = response.get("cases") if isinstance(response, dict) else None
+    if cases is None:
+        # Judges that do not detail the cases only tell whether all passed
+        submission.case_results = None
+        submission.completion_rate = 1.0 if submission.response_char == "A" else 0.0
+    else:
+        submission.case_results = pack_case_results(cases)
+        submission.completion_rate = completion_rate(
+            cases, response.get("total_cases", len(cases))
+        )
+
+
+def enqueue_submission(submission: IoCodeSubmission) -> JudgeTask:
+    """Put a submission in the judge queue
+
+    Args:
+        submission (IoCodeSubmission): submission waiting for its verdict
+
+    The task gets the priority class of the material and the fair-share
+    time of its author (see ``judge_scheduler``).
+
+    Returns:
+        JudgeTask: the pending task of the submission
+    """
+    now = timezone.now()
+    priority = submission_priority(submission)
+    return JudgeTask.objects.create(
+        submission=submission,
+        priority=priority,
+        queued_at=now,
+        fair_at=fair_share_time(submission.user_id_id, priority, now),
+    )
+
+
+def claim_tasks(worker_id: str, limit: int = 1) -> list[JudgeTask]:
+    """Claim up to ``limit`` tasks for a worker.
+
+    Pending tasks and running tasks whose lease expired (their worker died)
+    can be claimed. Rows locked by another worker are skipped, so concurrent
+    workers never get the same task. Live submissions are claimed first, exam
+    before practice and each class by fair-share time; rejudge tasks only
+    fill the remaining slots, up to
+    ``JUDGE_REJUDGE_MAX_RUNNING`` running at once. Submissions to a problem
+    whose cases are still being uploaded to the remote judge wait for the
+    upload (see ``problem_sync``), or they would be judged against the old
+    cases.
+
+    Args:
+        worker_id (str): identifier of the worker claiming the tasks
+        limit (int): maximum number of tasks to claim
+
+    Returns:
+        list[JudgeTask]: claimed tasks, already marked as running
+    """
+    now = timezone.now()
+    lease_expired = now - timedelta(seconds=JUDGE_TASK_LEASE_SECONDS)
+
+    claimable = Q(status=JudgeTask.PENDING, available_at__lte=now) | Q(
+        status=JudgeTask.RUNNING, claimed_at__lt=lease_expired
+    )
+    if settings.IOC_JUDGE_BACKEND != "local":
+        unsynced = ProblemSync.objects.filter(
+            material_io_code__material_id=OuterRef("submission__material_id")
+        ).exclude(status=ProblemSync.DONE)
+        claimable &= ~Exists(unsynced)
+
+    with transaction.atomic():
+        tasks = list(
+            JudgeTask.objects.select_for_update(skip_locked=True)
+            .filter(claimable, priority__lt=JudgeTask.PRIORITY_REJUDGE)
+            .order_by("priority", "fair_at", "id")[:limit]
+        )
+        if len(tasks) < limit:
+            tasks += _claim_rejudge_tasks(claimable, limit - len(tasks), lease_expired)
+        if not tasks:
+            return []
+
+        claimed = JudgeTask.objects.filter(id__in=[task.id for task in tasks])
+        claimed.update(
+            status=JudgeTask.RUNNING,
+            claimed_at=now,
+            claimed_by=worker_id,
+            attempts=F("attempts") + 1,
+            cases_version=Subquery(
+                MaterialIoCode.objects.filter(
+                    material_id__iocodesubmission__submission_id=OuterRef(
+                        "submission_id"
+                    )
+                ).values("cases_version")[:1]
+            ),
+        )
+        versions = dict(claimed.values_list("id", "cases_version"))
+
+    for task in tasks:
+        task.status = JudgeTask.RUNNING
+        task.claimed_at = now
+        task.claimed_by = worker_id
+        task.attempts += 1
+        task.cases_version = versions[task.id]
+
+    return tasks
+
+
+def _claim_rejudge_tasks(claimable: Q, limit: int, lease_expired) -> list[JudgeTask]:
+    """Rejudge tasks that fit under the cap of running rejudge tasks"""
+
+    rejudge_tasks = JudgeTask.objects.filter(
+        claimable, priority=JudgeTask.PRIORITY_REJUDGE
+    )
+    if not rejudge_tasks.exists():
+        return []  # Nothing to rejudge, no need to take the lock
+
+    with connection.cursor() as cursor:
+        # Held until the claim commits, so the running count below is exact
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [REJUDGE_CLAIM_LOCK])
+    running = JudgeTask.objects.filter(
+        status=JudgeTask.RUNNING,
+        priority=JudgeTask.PRIORITY_REJUDGE,
+        claimed_at__gte=lease_expired,
+    ).count()
+    slots = min(limit, JUDGE_REJUDGE_MAX_RUNNING - running)
+    if slots <= 0:
+        return []
+    return list(
+        rejudge_tasks.select_for_update(skip_locked=True).order_by("id")[:slots]
+    )
+
+
+def _owned(task: JudgeTask):
+    """Queryset matching the task only while the claim of this worker holds"""
+    return JudgeTask.objects.filter(
+        id=task.id,
+        status=JudgeTask.RUNNING,
+        claimed_by=task.claimed_by,
+        claimed_at=task.claimed_at,
+    )
+
+
+def complete_task(task: JudgeTask, submission: IoCodeSubmission) -> bool:
+    """Store the verdict of a judged submission and close its task.
+
+    The verdict is only written if the task is still claimed by the worker,
+    so a task reclaimed after its lease expired is never counted twice. If
+    the limits or the cases of the problem changed since the task was
+    claimed, the verdict is dropped and the task queued again.
+
+    Returns:
+        bool: True if the verdict was stored
+    """
+    with transaction.atomic():
+        # Locked, so a change of the cases waits until the verdict is stored
+        cases_version = (
+            MaterialIoCode.objects.select_for_update()
+            .filter(material_id=submission.material_id_id)
+            .values_list("cases_version", flat=True)
+            .first()
+        )
+        if cases_version != task.cases_version:
+            _owned(task).update(
+                status=JudgeTask.PENDING,
+                available_at=timezone.now(),
+                claimed_at=None,
+                claimed_by="",
+                cases_version=None,
+            )
+            task.status = JudgeTask.PENDING
+            return False
+
+        finished = _owned(task).update(
+            status=JudgeTask.DONE, finished_at=timezone.now(), last_error=""
+        )
+        if not finished:
+            return False
+
+        submission.save(update_fields=VERDICT_FIELDS)
+        index_submission(submission)
+        if task.rejudge_id is None:
+            # update submission summary for this user
+            update_submission_summary(
+                user=submission.user_id,
+                material=submission.material_id,
+                submission=submission,
+            )
+            record_contest_submission(submission)
+
+    task.status = JudgeTask.DONE
+    if task.rejudge_id is not None:
+        # Rejudged summaries are rebuilt at once after the last task
+        finish_rejudge_if_done(task.rejudge_id)
+    return True
+
+
+def fail_task(task: JudgeTask, error: Exception) -> None:
+    """Schedule a retry of a task, or mark it failed when out of attempts"""
+
+    logger.warning("Judge task %s failed: %s", task.id, error)
+
+    if task.attempts < JUDGE_TASK_MAX_ATTEMPTS:
+        delay = JUDGE_TASK_RETRY_DELAY_SECONDS * 2 ** (task.attempts - 1)
+        _owned(task).update(
+            status=JudgeTask.PENDING,
+            available_at=timezone.now() + timedelta(seconds=delay),
+            last_error=str(error),
+        )
+        task.status = JudgeTask.PENDING
+        return
+
+    with transaction.atomic():
+        failed = _owned(task).update(
+            status=JudgeTask.FAILED,
+            finished_at=timezone.now(),
+            last_error=str(error),
+        )
+        if failed:
+            # Let the student know the submission could not be judged, saved
+            # through the model so its streams get the final status
+            submission = IoCodeSubmission.objects.get(submission_id=task.submission_id)
+            submission.response_char = "E"
+            submission.save(update_fields=["response_char"])
+    task.status = JudgeTask.FAILED
+    if failed and task.rejudge_id is not None:
+        finish_rejudge_if_done(task.rejudge_id)
+
+
+def process_task(task: JudgeTask) -> None:
+    """Judge the submission of a claimed task and store its verdict"""
+
+    try:
+        submission = IoCodeSubmission.objects.select_related(
+            "material_id__materialiocode", "material_id__module_id", "user_id"
+        ).get(submission_id=task.submission_id)
+        material_ioc = submission.material_id.materialiocode
+
+        memo = find_verdict(submission, material_ioc)
+        if memo is not None:
+            # Identical resubmission, the judge already answered it
+            copy_verdict(memo, submission)
+        else:
+            response, status_code = judge(submission, material_ioc)
+            if status_code != 201:
+                raise JudgeError(f"The judge answered with status {status_code}")
+
+            apply_judge_response(submission, response)
+    except Exception as exc:  # Any failure must release the task for a retry
+        fail_task(task, exc)
+        return
+
+    if complete_task(task, submission) and memo is None:
+        remember_verdict(submission, material_ioc)
+
+
+def drain_queue(worker_id: str, max_tasks: int | None = None) -> int:
+    """Judge queued tasks until the queue is empty
+
+    Args:
+        worker_id (str): identifier of the worker draining the queue
+        max_tasks (int | None): stop after this many tasks
+
+    Returns:
+        int: number of tasks processed
+    """
+    processed = 0
+    while max_tasks is None or processed < max_tasks:
+        tasks = claim_tasks(worker_id)
+        if not tasks:
+            break
+        for task in tasks:
+            process_task(task)
+            processed += 1
+    return processed
@@ -0,0 +1,93 @@
+"""Scheduling policy of the judge queue.
+
+Every task gets a priority class (exam, practice or rejudge) and, within its
+class, a fair-share time: each task a user already has waiting pushes their
+next one ``JUDGE_FAIR_SHARE_SECONDS`` later. Workers claim by class, then by
+fair-share time, so a burst from one user is interleaved with the submissions
+of everyone else instead of holding the judge, and since the fair-share time
+never runs ahead of real time by more than the backlog, nobody starves.
+"""
+from datetime import timedelta
+
+from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, Max, Min
+from django.utils import timezone
+
+from constants.ioc import JUDGE_FAIR_SHARE_SECONDS, JUDGE_METRICS_WINDOW_SECONDS
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.judge_task import JudgeTask
+from ..models.material_io_code import MaterialIoCode
+
+UNFINISHED = [JudgeTask.PENDING, JudgeTask.RUNNING]
+
+
+def submission_priority(submission: IoCodeSubmission) -> int:
+    """Priority class of a new submission, from its material"""
+    is_exam = MaterialIoCode.objects.filter(
+        material_id=submission.material_id_id, is_exam=True
+    ).exists()
+    return JudgeTask.PRIORITY_EXAM if is_exam else JudgeTask.PRIORITY_PRACTICE
+
+
+def fair_share_time(user_id: int, priority: int, now):
+    """Fair-share time of a new task of a user in a priority class"""
+    last = JudgeTask.objects.filter(
+        submission__user_id=user_id, priority=priority, status__in=UNFINISHED
+    ).aggregate(last=Max("fair_at"))["last"]
+    if last is None:
+        return now
+    return max(now, last + timedelta(seconds=JUDGE_FAIR_SHARE_SECONDS))
+
+
+def queue_metrics() -> dict:
+    """Queue depth and wait times of every priority class
+
+    Returns:
+        dict: per class name, the ``pending`` and ``running`` task counts, the
+        wait of the oldest pending task and the average and maximum wait
+        (from entering the queue to being claimed) of the tasks finished in
+        the last ``JUDGE_METRICS_WINDOW_SECONDS``, all in seconds
+    """
+    now = timezone.now()
+    metrics = {
+        name: {
+            "pending": 0,
+            "running": 0,
+            "oldest_pending_wait": 0.0,
+            "avg_wait": None,
+            "max_wait": None,
+            "finished": 0,
+        }
+        for name in JudgeTask.PRIORITY_CLASSES.values()
+    }
+
+    depths = (
+        JudgeTask.objects.filter(status__in=UNFINISHED)
+        .values("priority", "status")
+        .annotate(count=Count("id"), oldest=Min("queued_at"))
+    )
+    for row in depths:
+        entry = metrics[JudgeTask.PRIORITY_CLASSES[row["priority"]]]
+        if row["status"] == JudgeTask.PENDING:
+            entry["pending"] = row["count"]
+            entry["oldest_pending_wait"] = round(
+                (now - row["oldest"]).total_seconds(), 3
+            )
+        else:
+            entry["running"] = row["count"]
+
+    wait = ExpressionWrapper(F("claimed_at") - F("queued_at"), DurationField())
+    waits = (
+        JudgeTask.objects.filter(
+            status__in=[JudgeTask.DONE, JudgeTask.FAILED],
+            finished_at__gte=now - timedelta(seconds=JUDGE_METRICS_WINDOW_SECONDS),
+        )
+        .values("priority")
+        .annotate(count=Count("id"), avg_wait=Avg(wait), max_wait=Max(wait))
+    )
+    for row in waits:
+        entry = metrics[JudgeTask.PRIORITY_CLASSES[row["priority"]]]
+        entry["finished"] = row["count"]
+        entry["avg_wait"] = round(row["avg_wait"].total_seconds(), 3)
+        entry["max_wait"] = round(row["max_wait"].total_seconds(), 3)
+
+    return metrics
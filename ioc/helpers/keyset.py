@@ -0,0 +1,68 @@
+"""Keyset paging: a page starts right after the last row of the previous one.
+
+Rows are read in a total order (ending in a unique field), and the cursor of
+the next page is the order key of the last row read. A page is then a range
+scan of an index in that order, however deep it is, instead of an OFFSET
+reading and dropping every row before it.
+"""
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    """Raised when a page cursor was not given by the server."""
+
+
+def encode_cursor(cursor: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> dict:
+    """Cursor of a page, checked to have a ``key`` of ``size`` values
+
+    Raises:
+        InvalidCursor: the cursor is malformed
+    """
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        key = decoded["key"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as exc:
+        raise InvalidCursor("The cursor is not valid") from exc
+    if not isinstance(key, list) or len(key) != size:
+        raise InvalidCursor("The cursor is not valid")
+    return decoded
+
+
+def page_limit(limit: str | None, default: int, maximum: int) -> int:
+    """Rows asked for a page, ``default`` if not given
+
+    Raises:
+        ValueError: the limit is not a number between 1 and ``maximum``
+    """
+    if limit is None:
+        return default
+    if not limit.isdigit() or not 1 <= int(limit) <= maximum:
+        raise ValueError(f"The limit must be between 1 and {maximum}")
+    return int(limit)
+
+
+def compare(order: tuple[str, ...], key: list, ahead: bool) -> Q:
+    """Rows ahead of (or after) a key in an order, as a filter
+
+    The first field is also bounded on its own (a row ahead is never behind
+    on it), so the filter reads a range of the index.
+    """
+    condition = None
+    bound = None
+    for field, value in reversed(list(zip(order, key))):
+        name = field.lstrip("-")
+        lookup = "gt" if field.startswith("-") == ahead else "lt"
+        step = Q(**{f"{name}__{lookup}": value})
+        if condition is not None:
+            step |= Q(**{name: value}) & condition
+        condition = step
+        bound = Q(**{f"{name}__{lookup}e": value})
+    return bound & condition
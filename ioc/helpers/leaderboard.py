@@ -0,0 +1,144 @@
+"""Leaderboards of the IOC materials and of the courses.
+
+Users rank by points, then by execution time and memory, lower first. Users
+with the same points, time and memory share their rank; their user id only
+orders them for paging. Both leaderboards are read from tables kept up to
+date as submissions are judged (the submission summaries and the course
+summaries, see ``submission_summary``), through an index in leaderboard
+order:
+
+- A page starts right after the last row of the previous page (see
+  ``keyset``), so every page is a short index range scan. The cursor also
+  carries the position and rank of that last row, so pages never count the
+  rows before them.
+- The rank of a user is one plus the rows strictly ahead of them, counted
+  over the range of the index before their row, without sorting the table.
+"""
+from django.db.models import F, Model
+
+from .keyset import InvalidCursor, compare, decode_cursor, encode_cursor
+from ..models.io_code_course_summary import IoCodeCourseSummary
+from ..models.io_code_submission_summary import IoCodeSubmissionSummary
+
+
+class Leaderboard:
+    """Ranking of the users of a material or a course
+
+    Args:
+        model: summary table the leaderboard is read from
+        group (str): field of the material or course ranked
+        order (tuple[str, ...]): ranking order, the user id last
+        columns (tuple[str, ...]): fields shown for every user
+    """
+
+    def __init__(
+        self,
+        model: type[Model],
+        group: str,
+        order: tuple[str, ...],
+        columns: tuple[str, ...],
+    ):
+        self.model = model
+        self.group = group
+        self.order = order
+        self.columns = columns
+        self.key_fields = [field.lstrip("-") for field in order]
+
+    def rows(self, group_id: int):
+        return (
+            self.model.objects.filter(**{self.group: group_id})
+            .order_by(*self.order)
+            .values(
+                "user_id",
+                *self.columns,
+                first_name=F("user__first_name"),
+                last_name=F("user__last_name"),
+            )
+        )
+
+    def page(
+        self, group_id: int, cursor: str | None, limit: int
+    ) -> tuple[list[dict], str | None]:
+        """A page of the leaderboard, with the rank of every user
+
+        Args:
+            group_id (int): material or course ranked
+            cursor (str | None): cursor of the page, None for the first one
+            limit (int): users in the page
+
+        Returns:
+            tuple[list[dict], str | None]: the ranked rows and the cursor of
+            the next page, None on the last one
+
+        Raises:
+            InvalidCursor: the cursor is malformed
+        """
+        rows = self.rows(group_id)
+        position, rank, previous = 0, 0, None
+        if cursor is not None:
+            decoded = decode_cursor(cursor, len(self.order))
+            if not (
+                isinstance(decoded.get("position"), int)
+                and isinstance(decoded.get("rank"), int)
+            ):
+                raise InvalidCursor("The cursor is not valid")
+            position, rank, previous = (
+                decoded["position"],
+                decoded["rank"],
+                decoded["key"],
+            )
+            rows = rows.filter(compare(self.order, previous, ahead=False))
+
+        rows = list(rows[: limit + 1])
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        for row in rows:
+            key = [row[field] for field in self.key_fields]
+            position += 1
+            # Ties share the rank, the user id is not part of the score
+            if previous is None or key[:-1] != previous[:-1]:
+                rank = position
+            row["rank"] = rank
+            previous = key
+
+        next_cursor = None
+        if has_next:
+            next_cursor = encode_cursor(
+                {"key": previous, "position": position, "rank": rank}
+            )
+        return rows, next_cursor
+
+    def rank(self, group_id: int, user_id: int) -> dict | None:
+        """Row and rank of a user, None if the user is not ranked"""
+        row = self.rows(group_id).filter(user_id=user_id).first()
+        if row is None:
+            return None
+
+        key = [row[field] for field in self.key_fields]
+        ahead = self.model.objects.filter(
+            compare(self.order[:-1], key[:-1], ahead=True), **{self.group: group_id}
+        ).count()
+        row["rank"] = ahead + 1
+        return row
+
+
+MATERIAL_LEADERBOARD = Leaderboard(
+    IoCodeSubmissionSummary,
+    "material_id",
+    ("-points", "min_execution_time", "min_execution_memory", "user_id"),
+    (
+        "points",
+        "attempts",
+        "hits",
+        "min_execution_time",
+        "min_execution_memory",
+        "max_completion_rate",
+    ),
+)
+
+COURSE_LEADERBOARD = Leaderboard(
+    IoCodeCourseSummary,
+    "course_id",
+    ("-points", "total_execution_time", "total_execution_memory", "user_id"),
+    ("points", "solved", "total_execution_time", "total_execution_memory"),
+)
@@ -0,0 +1,150 @@
+"""Judge backend that runs the submissions on this machine.
+
+The test cases are read from the ``Case`` table (as files, see ``case_store``)
+and every submission is run
+by a process of a local pool (see ``sandbox``), so no request leaves the box.
+Each process runs its programs isolated, as a user of its own counted from
+``IOC_SANDBOX_FIRST_UID``, with the caches of the judge out of their reach.
+It answers like the remote judge client, so both backends are
+interchangeable (``IOC_JUDGE_BACKEND`` setting).
+
+The pool processes report the result of every case on a shared queue while
+they judge; a thread of this process routes each report to the call judging
+that submission, which hands it to its ``on_case`` callback.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from .case_store import case_files
+from .sandbox import SANDBOX_UID, configure, run_submission, sandbox_available
+
+# Wait between checks of the pool while no case result arrives
+PROGRESS_POLL_SECONDS = 0.1
+
+
+class LocalJudge:
+    """Judge submissions in a pool of local processes"""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        cache_dir: str | None = None,
+        cache_max_bytes: int = 0,
+        first_uid: int = SANDBOX_UID,
+        hidden_dirs: tuple[str, ...] = (),
+    ):
+        # Spawned processes do not inherit the threads and sockets of Django
+        context = multiprocessing.get_context("spawn")
+        self.progress = context.Queue()
+        uid_slots = context.Value("i", 0)  # Next user taken by a pool process
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            mp_context=context,
+            initializer=configure,
+            initargs=(
+                cache_dir,
+                cache_max_bytes,
+                self.progress,
+                first_uid,
+                uid_slots,
+                hidden_dirs,
+            ),
+        )
+        self.listeners: dict[int, queue.Queue] = {}
+        self.listeners_lock = threading.Lock()
+        self.router = threading.Thread(target=self.route_progress, daemon=True)
+        self.router.start()
+
+    def route_progress(self) -> None:
+        """Hand the case reports of the pool to the calls waiting for them"""
+        for report in iter(self.progress.get, None):
+            with self.listeners_lock:
+                listener = self.listeners.get(report[0])
+            if listener is not None:
+                listener.put(report)
+
+    def judge(self, payload: dict, on_case=None) -> tuple[dict, int]:
+        """Judge one submission"""
+        response, status_code = self.judge_batch([payload], on_case)
+        return response["results"][0], status_code
+
+    def judge_batch(self, payloads: list[dict], on_case=None) -> tuple[dict, int]:
+        """Judge several submissions side by side
+
+        ``on_case(submission_id, index, case)`` is called in this thread with
+        the result of every case as soon as a pool process reports it.
+        """
+        cases = {
+            problem_id: case_files(problem_id)
+            for problem_id in {payload["problem_id"] for payload in payloads}
+        }
+        reports = queue.Queue()
+        running = {payload["submission_id"] for payload in payloads}
+        with self.listeners_lock:
+            self.listeners.update(dict.fromkeys(running, reports))
+        try:
+            futures = [
+                self.executor.submit(
+                    run_submission, payload, cases[payload["problem_id"]]
+                )
+                for payload in payloads
+            ]
+            while running:
+                try:
+                    submission_id, index, case = reports.get(
+                        timeout=PROGRESS_POLL_SECONDS
+                    )
+                except queue.Empty:
+                    if all(future.done() for future in futures):
+                        break  # A process died before its last report
+                    continue
+                if index is None:
+                    running.discard(submission_id)
+                elif on_case is not None:
+                    on_case(submission_id, index, case)
+            return {"results": [future.result() for future in futures]}, 201
+        finally:
+            with self.listeners_lock:
+                for payload in payloads:
+                    self.listeners.pop(payload["submission_id"], None)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown()
+        self.progress.put(None)  # Stops the router
+        self.router.join()
+
+
+_judge: LocalJudge | None = None
+_judge_pid: int | None = None
+_judge_lock = threading.Lock()
+
+
+def get_local_judge() -> LocalJudge:
+    """Get the local judge of this process
+
+    Raises:
+        ImproperlyConfigured: the programs cannot be isolated on this machine
+    """
+    global _judge, _judge_pid
+
+    with _judge_lock:
+        if _judge is None or _judge_pid != os.getpid():
+            if not sandbox_available():
+                raise ImproperlyConfigured(
+                    "The local judge runs as root with unshare and setpriv"
+                )
+            _judge = LocalJudge(
+                settings.IOC_LOCAL_JUDGE_WORKERS,
+                settings.IOC_ARTIFACT_CACHE_DIR,
+                settings.IOC_ARTIFACT_CACHE_MAX_BYTES,
+                settings.IOC_SANDBOX_FIRST_UID,
+                (settings.IOC_ARTIFACT_CACHE_DIR, settings.IOC_CASE_CACHE_DIR),
+            )
+            _judge_pid = os.getpid()
+        return _judge
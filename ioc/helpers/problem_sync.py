@@ -0,0 +1,244 @@
+"""Background upload of the cases of the problems to the judge server.
+
+The judge server keeps its own copy of the cases of every problem. Instead of
+sending all of them while the material is created, changing the cases of a
+problem marks its ``ProblemSync`` pending, and the judge workers upload them
+in the background, retrying with a growing delay while the judge fails. The
+submissions of a problem are not judged until its cases are uploaded.
+
+Every ``ProblemSync`` keeps the manifest of what the judge already has: the
+blob digests of the input and output of each case, by case number. Only the
+cases added or changed since the last upload are sent, with the numbers of
+the cases removed, so editing one case of a large problem sends one case.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from constants.ioc import (
+    JUDGE_TASK_LEASE_SECONDS,
+    PROBLEM_SYNC_MAX_ATTEMPTS,
+    PROBLEM_SYNC_MAX_RETRY_DELAY_SECONDS,
+    PROBLEM_SYNC_RETRY_DELAY_SECONDS,
+)
+from ..models.case import Case
+from ..models.case_blob import CaseBlob
+from ..models.problem_sync import ProblemSync
+from .judge_client import JudgeError, get_judge_client
+
+logger = logging.getLogger(__name__)
+
+
+def request_sync(material_io_code_id: int, create: bool = True) -> None:
+    """Mark the cases of a problem to be uploaded to the judge
+
+    A sync running right now is left running; it is done again once it ends
+    (see ``complete_sync``). The local judge reads the ``Case`` table itself,
+    so nothing is uploaded for it.
+
+    Args:
+        material_io_code_id (int): problem whose cases changed
+        create (bool): start tracking a problem never uploaded before
+    """
+    if settings.IOC_JUDGE_BACKEND == "local":
+        return
+
+    now = timezone.now()
+    updated = ProblemSync.objects.filter(
+        material_io_code_id=material_io_code_id
+    ).update(
+        status=models.Case(
+            models.When(status=ProblemSync.RUNNING, then=F("status")),
+            default=models.Value(ProblemSync.PENDING),
+        ),
+        requested_at=now,
+        attempts=0,
+        available_at=now,
+    )
+    if not updated and create:
+        ProblemSync.objects.get_or_create(material_io_code_id=material_io_code_id)
+
+
+def case_manifest(material_io_code_id: int) -> dict[str, list[str]]:
+    """Digests of the input and output of every case of a problem, by number"""
+    return {
+        str(number): [input_digest, output_digest]
+        for number, input_digest, output_digest in Case.objects.filter(
+            material_io_code_id=material_io_code_id
+        )
+        .order_by("id_case", "id")
+        .values_list("id_case", "input_blob_id", "output_blob_id")
+    }
+
+
+def manifest_diff(synced: dict, desired: dict) -> tuple[list[str], list[str]]:
+    """Cases added or changed, and cases removed, between two manifests"""
+    changed = [number for number, pair in desired.items() if synced.get(number) != pair]
+    removed = [number for number in synced if number not in desired]
+    return changed, removed
+
+
+def sync_payload(problem_id: str, synced: dict, desired: dict) -> dict:
+    """Body of the upload of the cases the judge is missing
+
+    The content of the changed cases is read in one query.
+    """
+    changed, removed = manifest_diff(synced, desired)
+    blobs = CaseBlob.objects.in_bulk(
+        {digest for number in changed for digest in desired[number]}
+    )
+    return {
+        "problem_id": problem_id,
+        "cases": [
+            {
+                "id_case": int(number),
+                "input": blobs[desired[number][0]].content().decode(),
+                "output": blobs[desired[number][1]].content().decode(),
+            }
+            for number in changed
+        ],
+        "removed": [int(number) for number in removed],
+        "total_cases": len(desired),
+    }
+
+
+def claim_syncs(worker_id: str, limit: int = 1) -> list[ProblemSync]:
+    """Claim up to ``limit`` pending or failed syncs for a worker
+
+    Like the judge tasks, running syncs whose lease expired can be claimed
+    again and rows locked by another worker are skipped.
+    """
+    now = timezone.now()
+    lease_expired = now - timedelta(seconds=JUDGE_TASK_LEASE_SECONDS)
+
+    claimable = Q(
+        status__in=[ProblemSync.PENDING, ProblemSync.FAILED], available_at__lte=now
+    ) | Q(status=ProblemSync.RUNNING, claimed_at__lt=lease_expired)
+
+    with transaction.atomic():
+        syncs = list(
+            ProblemSync.objects.select_for_update(skip_locked=True)
+            .select_related("material_io_code")
+            .filter(claimable)
+            .order_by("available_at", "id")[:limit]
+        )
+        if not syncs:
+            return []
+
+        ProblemSync.objects.filter(id__in=[sync.id for sync in syncs]).update(
+            status=ProblemSync.RUNNING,
+            claimed_at=now,
+            claimed_by=worker_id,
+            attempts=F("attempts") + 1,
+        )
+
+    for sync in syncs:
+        sync.status = ProblemSync.RUNNING
+        sync.claimed_at = now
+        sync.claimed_by = worker_id
+        sync.attempts += 1
+
+    return syncs
+
+
+def _owned(sync: ProblemSync):
+    """Queryset matching the sync only while the claim of this worker holds"""
+    return ProblemSync.objects.filter(
+        id=sync.id,
+        status=ProblemSync.RUNNING,
+        claimed_by=sync.claimed_by,
+        claimed_at=sync.claimed_at,
+    )
+
+
+def complete_sync(sync: ProblemSync, manifest: dict) -> bool:
+    """Store what the judge has now and close the sync
+
+    If the cases changed again while uploading, the sync goes back to
+    pending, so the newer cases are uploaded too.
+
+    Returns:
+        bool: True if the manifest was stored
+    """
+    return bool(
+        _owned(sync).update(
+            status=models.Case(
+                models.When(
+                    requested_at__gt=F("claimed_at"),
+                    then=models.Value(ProblemSync.PENDING),
+                ),
+                default=models.Value(ProblemSync.DONE),
+            ),
+            manifest=manifest,
+            attempts=0,
+            synced_at=timezone.now(),
+            last_error="",
+        )
+    )
+
+
+def fail_sync(sync: ProblemSync, error: Exception) -> None:
+    """Schedule a retry of a sync with a growing, capped delay
+
+    After ``PROBLEM_SYNC_MAX_ATTEMPTS`` the sync is marked failed, but it is
+    still retried: the submissions of the problem wait for it.
+    """
+
+    logger.warning("Problem sync %s failed: %s", sync.id, error)
+
+    delay = min(
+        PROBLEM_SYNC_RETRY_DELAY_SECONDS * 2 ** min(sync.attempts - 1, 32),
+        PROBLEM_SYNC_MAX_RETRY_DELAY_SECONDS,
+    )
+    status = (
+        ProblemSync.PENDING
+        if sync.attempts < PROBLEM_SYNC_MAX_ATTEMPTS
+        else ProblemSync.FAILED
+    )
+    _owned(sync).update(
+        status=status,
+        available_at=timezone.now() + timedelta(seconds=delay),
+        last_error=str(error),
+    )
+    sync.status = status
+
+
+def process_sync(sync: ProblemSync) -> None:
+    """Upload the cases of a claimed sync that the judge is missing"""
+
+    try:
+        desired = case_manifest(sync.material_io_code_id)
+        payload = sync_payload(
+            str(sync.material_io_code.material_id_id), sync.manifest, desired
+        )
+        # A problem is always created once, even without cases
+        if sync.synced_at is None or payload["cases"] or payload["removed"]:
+            _, status_code = get_judge_client().sync_problem(payload)
+            if status_code not in (200, 201):
+                raise JudgeError(f"The judge answered with status {status_code}")
+    except Exception as exc:  # Any failure must release the sync for a retry
+        fail_sync(sync, exc)
+        return
+
+    complete_sync(sync, desired)
+
+
+def drain_problem_syncs(worker_id: str, max_syncs: int | None = None) -> int:
+    """Upload pending problems until none is left
+
+    Returns:
+        int: number of syncs processed
+    """
+    processed = 0
+    while max_syncs is None or processed < max_syncs:
+        syncs = claim_syncs(worker_id)
+        if not syncs:
+            break
+        for sync in syncs:
+            process_sync(sync)
+            processed += 1
+    return processed
@@ -0,0 +1,126 @@
+"""Token buckets limiting how fast submissions are sent.
+
+Every submission takes a token from two buckets: the bucket of its user,
+which refills at ``SUBMISSION_USER_PER_MINUTE`` up to
+``SUBMISSION_USER_BURST`` tokens, and the bucket of its material, shared by
+all users, which refills at the rate of the material (or
+``SUBMISSION_MATERIAL_PER_MINUTE``). During a contest the users get a bucket
+of the contest, with its own rate, for its problems. A submission is
+refused without taking any token if either bucket is empty, with the time
+until both have a token again.
+
+Buckets live in the default cache, so every server process shares them:
+a bucket is the tokens left and the time they were counted, and a full
+bucket is the same as a missing one, so keys expire once refilled. A bucket
+is locked with ``cache.add`` (atomic on every backend) while it is read and
+written back; if the lock cannot be taken in ``RATE_LIMIT_LOCK_SECONDS``
+the submission is let through, a slow cache never blocks submissions.
+"""
+import math
+import time
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from constants.ioc import (
+    RATE_LIMIT_LOCK_SECONDS,
+    SUBMISSION_MATERIAL_BURST,
+    SUBMISSION_MATERIAL_PER_MINUTE,
+    SUBMISSION_USER_BURST,
+    SUBMISSION_USER_PER_MINUTE,
+)
+from ..models.contest import Contest
+from ..models.material_io_code import MaterialIoCode
+
+
+def bucket_key(scope: str) -> str:
+    return f"ioc:rate:{scope}"
+
+
+def _lock(key: str) -> bool:
+    """Lock a bucket, False if it stayed locked for too long"""
+    deadline = time.monotonic() + RATE_LIMIT_LOCK_SECONDS
+    # The lock expires on its own if its holder dies
+    while not cache.add(f"{key}:lock", True, RATE_LIMIT_LOCK_SECONDS):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def take_tokens(buckets: list[tuple[str, int, float]]) -> float:
+    """Take a token from every bucket, or from none if any is empty
+
+    Args:
+        buckets (list[tuple[str, int, float]]): key, burst and refill rate
+            per minute of every bucket
+
+    Returns:
+        float: 0 if the tokens were taken, otherwise the seconds until every
+        bucket has a token
+    """
+    keys = sorted(bucket_key(scope) for scope, _, _ in buckets)
+    locked = [key for key in keys if _lock(key)]
+    try:
+        now = time.time()
+        states = cache.get_many(keys)
+        levels, wait = {}, 0.0
+        for scope, burst, per_minute in buckets:
+            key = bucket_key(scope)
+            tokens, counted_at = states.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - counted_at) * per_minute / 60)
+            levels[key] = (tokens, burst, per_minute)
+            if tokens < 1:
+                wait = max(wait, (1 - tokens) * 60 / per_minute)
+        if wait:
+            return wait
+
+        for key, (tokens, burst, per_minute) in levels.items():
+            refilled_in = (burst - tokens + 1) * 60 / per_minute
+            cache.set(key, (tokens - 1, now), math.ceil(refilled_in))
+        return 0.0
+    finally:
+        cache.delete_many([f"{key}:lock" for key in locked])
+
+
+def submission_buckets(user_id: int, material_id: int) -> list[tuple[str, int, float]]:
+    """Buckets a submission of a user to a material takes a token from"""
+    rates = MaterialIoCode.objects.filter(material_id=material_id).values_list(
+        "submission_burst", "submissions_per_minute"
+    ).first() or (None, None)
+    material_bucket = (
+        f"material:{material_id}",
+        rates[0] or SUBMISSION_MATERIAL_BURST,
+        rates[1] or SUBMISSION_MATERIAL_PER_MINUTE,
+    )
+
+    now = timezone.now()
+    contest = (
+        Contest.objects.filter(materials=material_id, start_at__lte=now, end_at__gt=now)
+        .order_by("id")
+        .values_list("id", "submission_burst", "submissions_per_minute")
+        .first()
+    )
+    if contest is None:
+        user_bucket = (
+            f"user:{user_id}",
+            SUBMISSION_USER_BURST,
+            SUBMISSION_USER_PER_MINUTE,
+        )
+    else:
+        user_bucket = (
+            f"user:{user_id}:contest:{contest[0]}",
+            contest[1] or SUBMISSION_USER_BURST,
+            contest[2] or SUBMISSION_USER_PER_MINUTE,
+        )
+    return [user_bucket, material_bucket]
+
+
+def take_submission_token(user_id: int, material_id: int) -> float:
+    """Take the tokens of a submission of a user to an IOC material
+
+    Returns:
+        float: 0 if the submission can be sent, otherwise the seconds to
+        wait before sending it
+    """
+    return take_tokens(submission_buckets(user_id, material_id))
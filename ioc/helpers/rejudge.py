@@ -0,0 +1,141 @@
+"""Rejudge every submission of a material after its limits or cases changed.
+
+The judge tasks of the submissions are reopened with the rejudge priority, so
+the judge workers only take them when no live submission is waiting, and
+at most ``JUDGE_REJUDGE_MAX_RUNNING`` of them are judged at once. Rejudged
+verdicts do not touch the submission summaries one by one: once the last
+task finishes, the summaries of the material and its contest scores are
+rebuilt in bulk.
+"""
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+
+from courses.models.material import Material
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.judge_task import JudgeTask
+from ..models.rejudge import Rejudge
+from .scoreboard import rebuild_contest_scores
+from .submission_summary import rebuild_submission_summaries
+from .verdict_cache import invalidate_verdicts
+
+
+def start_rejudge(material: Material) -> Rejudge:
+    """Queue every submission of a material to be judged again
+
+    The memoized verdicts of the material are forgotten, so every program is
+    really judged again. A rejudge of the material that is still running is
+    cancelled, its remaining tasks move to the new one. Live submissions
+    still waiting for their first verdict are left alone, they will be judged
+    with the new limits anyway, and so are the tasks a worker is judging
+    right now: reopening them would demote live submissions to the rejudge
+    priority and judge them twice. Those tasks are queued again when they
+    finish if the limits or cases changed meanwhile (see
+    ``judge_queue.complete_task``); the running rejudge tasks join the new
+    rejudge, so it is not done before them.
+
+    Returns:
+        Rejudge: the new rejudge
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        Rejudge.objects.filter(material=material, status=Rejudge.RUNNING).update(
+            status=Rejudge.CANCELLED, finished_at=now
+        )
+        rejudge = Rejudge.objects.create(material=material)
+        invalidate_verdicts(material.materialiocode.id)
+
+        reopened = (
+            JudgeTask.objects.filter(submission__material_id=material)
+            .exclude(status=JudgeTask.RUNNING)
+            .exclude(status=JudgeTask.PENDING, priority__lt=JudgeTask.PRIORITY_REJUDGE)
+            .update(
+                status=JudgeTask.PENDING,
+                priority=JudgeTask.PRIORITY_REJUDGE,
+                rejudge=rejudge,
+                attempts=0,
+                available_at=now,
+                queued_at=now,
+                fair_at=now,
+                claimed_at=None,
+                claimed_by="",
+                finished_at=None,
+                last_error="",
+            )
+        )
+        joined = JudgeTask.objects.filter(
+            submission__material_id=material,
+            status=JudgeTask.RUNNING,
+            priority=JudgeTask.PRIORITY_REJUDGE,
+        ).update(rejudge=rejudge)
+        # Submissions judged before the judge queue existed have no task
+        created = JudgeTask.objects.bulk_create(
+            [
+                JudgeTask(
+                    submission_id=submission_id,
+                    priority=JudgeTask.PRIORITY_REJUDGE,
+                    rejudge=rejudge,
+                    available_at=now,
+                    queued_at=now,
+                    fair_at=now,
+                )
+                for submission_id in IoCodeSubmission.objects.filter(
+                    material_id=material, judge_task__isnull=True
+                ).values_list("submission_id", flat=True)
+            ]
+        )
+
+        rejudge.total = reopened + joined + len(created)
+        rejudge.save(update_fields=["total"])
+
+    finish_rejudge_if_done(rejudge.id)
+    return rejudge
+
+
+def finish_rejudge_if_done(rejudge_id: int) -> bool:
+    """Close a rejudge whose tasks all finished and rebuild its summaries
+
+    Called after every rejudge task ends; only the call that sees no task
+    left closes the rejudge, so the summaries are rebuilt once.
+
+    Returns:
+        bool: True if this call closed the rejudge
+    """
+    unfinished = JudgeTask.objects.filter(
+        rejudge=OuterRef("pk"), status__in=[JudgeTask.PENDING, JudgeTask.RUNNING]
+    )
+    with transaction.atomic():
+        closed = (
+            Rejudge.objects.filter(id=rejudge_id, status=Rejudge.RUNNING)
+            .exclude(Exists(unfinished))
+            .update(status=Rejudge.DONE, finished_at=timezone.now())
+        )
+        if closed:
+            material_id = Rejudge.objects.values_list("material_id", flat=True).get(
+                id=rejudge_id
+            )
+            rebuild_submission_summaries([material_id])
+            rebuild_contest_scores([material_id])
+    return bool(closed)
+
+
+def rejudge_progress(rejudge: Rejudge) -> dict:
+    """Progress of a rejudge, counted from the state of its tasks"""
+    counts = rejudge.tasks.aggregate(
+        pending=Count("id", filter=Q(status=JudgeTask.PENDING)),
+        running=Count("id", filter=Q(status=JudgeTask.RUNNING)),
+        done=Count("id", filter=Q(status=JudgeTask.DONE)),
+        failed=Count("id", filter=Q(status=JudgeTask.FAILED)),
+    )
+    finished = counts["done"] + counts["failed"]
+    return {
+        "rejudge_id": rejudge.id,
+        "material_id": rejudge.material_id,
+        "status": rejudge.status,
+        "total": rejudge.total,
+        **counts,
+        "progress": round(finished / rejudge.total, 4) if rejudge.total else 1.0,
+        "created_at": rejudge.created_at,
+        "finished_at": rejudge.finished_at,
+    }
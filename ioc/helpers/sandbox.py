@@ -0,0 +1,404 @@
+"""Run code submissions against test cases in a resource-limited subprocess.
+
+Compilers and programs run isolated from the judge (see ``jailed``): in their
+own network, PID, IPC and mount namespaces, with no network, a private
+``/proc`` and private temporary directories hiding the caches of the judge,
+as an unprivileged user of their own, with no capabilities and a minimal
+environment. Setting up the namespaces takes ``unshare`` and ``setpriv``
+(util-linux) and a judge running as root (see ``sandbox_available``).
+
+This module does not touch Django so it can be imported by the processes of
+the local judge pool. Limits follow ``MaterialIoCode``: ``time_limit`` is in
+milliseconds and ``memory_limit`` in megabytes. The answer has the shape of
+the remote judge answer, with the time in seconds and the memory in
+kilobytes.
+"""
+import math
+import os
+import resource
+import shlex
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+
+from .artifact_cache import ArtifactCache
+
+COMPILE_TIMEOUT_SECONDS = 30
+OUTPUT_LIMIT_BYTES = 64 * 1024 * 1024
+COMPILER_OUTPUT_LIMIT = 4000  # Characters of the compiler errors kept
+# Processes the user of a program may have, so it cannot fork without end
+PROCESS_LIMIT = 64
+# User (and group) the programs run as when the pool does not set one
+SANDBOX_UID = 65534
+# Size of the private temporary directories of a program
+SANDBOX_TMP_SIZE = "64m"
+
+# Environment of the compilers and programs, so submissions cannot read the
+# secrets of the worker (SECRET_KEY, database and cache URLs, API keys)
+SANDBOX_ENV = {"PATH": "/usr/local/bin:/usr/bin:/bin", "LANG": "C.UTF-8"}
+
+# Run as root in the new namespaces: mounts the private directories, binds the
+# work directory (the current one, hidden under the new /tmp) at /tmp/box and
+# runs the command there. The shell stays as the init of the PID namespace,
+# which ignores the signals a program sends itself, and exits with the status
+# of the command, 128 + the signal when it was killed.
+JAIL_SCRIPT = """set -e
+for dir in /tmp /var/tmp /dev/shm; do
+    if [ -d "$dir" ]; then
+        mount -t tmpfs -o size={tmp_size},mode=1777 tmpfs "$dir"
+    fi
+done
+for dir in {hidden}; do
+    if [ -d "$dir" ]; then mount -t tmpfs -o ro,size=4k tmpfs "$dir"; fi
+done
+mkdir /tmp/box
+mount --no-canonicalize --bind . /tmp/box
+cd /tmp/box
+set +e
+"$@"
+"""
+
+# Source file, compile command and run command of every supported language
+LANGUAGES = {
+    "py": {
+        "source": "main.py",
+        "compile": None,
+        "run": [sys.executable, "main.py"],
+    },
+    "c": {
+        "source": "main.c",
+        "compile": ["gcc", "-O2", "-std=c11", "-o", "main", "main.c", "-lm"],
+        "artifact": "main",
+        "run": ["./main"],
+    },
+    "cpp": {
+        "source": "main.cpp",
+        "compile": ["g++", "-O2", "-std=c++17", "-o", "main", "main.cpp"],
+        "artifact": "main",
+        "run": ["./main"],
+    },
+}
+
+VERDICTS = {
+    "AC": "Accepted",
+    "WA": "Wrong answer",
+    "TLE": "Time limit exceeded",
+    "MLE": "Memory limit exceeded",
+    "OLE": "Output limit exceeded",
+    "RE": "Runtime error",
+    "CE": "Compilation error",
+}
+
+# Messages of the runtimes when an allocation fails under the memory limit
+OUT_OF_MEMORY_MARKERS = (b"MemoryError", b"std::bad_alloc")
+
+# Cache of compiled programs of this process, set up by ``configure``
+artifact_cache: ArtifactCache | None = None
+# Queue receiving the result of every case as soon as it is known
+progress_queue = None
+# User the programs of this process run as, and directories hidden from them
+sandbox_uid = SANDBOX_UID
+hidden_dirs: tuple[str, ...] = ()
+
+
+def configure(
+    cache_dir: str | None,
+    cache_max_bytes: int,
+    progress=None,
+    first_uid: int = SANDBOX_UID,
+    uid_slots=None,
+    hidden: tuple[str, ...] = (),
+) -> None:
+    """Set up a process of the judge pool (no cache without ``cache_dir``)
+
+    Every process of the pool takes the next user from ``first_uid``, counted
+    by the shared ``uid_slots`` value, so the programs of two processes never
+    share a user nor its process limit.
+    """
+    global artifact_cache, progress_queue, sandbox_uid, hidden_dirs
+
+    artifact_cache = ArtifactCache(cache_dir, cache_max_bytes) if cache_dir else None
+    progress_queue = progress
+    slot = 0
+    if uid_slots is not None:
+        with uid_slots.get_lock():
+            slot = uid_slots.value
+            uid_slots.value += 1
+    sandbox_uid = first_uid + slot
+    hidden_dirs = tuple(hidden)
+
+
+def sandbox_available() -> bool:
+    """Whether programs can be isolated on this machine"""
+    return (
+        os.geteuid() == 0
+        and shutil.which("unshare") is not None
+        and shutil.which("setpriv") is not None
+    )
+
+
+def jailed(command: list[str]) -> list[str]:
+    """Command running ``command`` isolated from the judge, in the current
+    directory, as the user of this process (see ``JAIL_SCRIPT``)"""
+    script = JAIL_SCRIPT.format(
+        tmp_size=SANDBOX_TMP_SIZE,
+        hidden=" ".join(shlex.quote(path) for path in hidden_dirs),
+    )
+    return [
+        "unshare",
+        "--mount",
+        "--propagation=private",
+        "--net",
+        "--ipc",
+        "--uts",
+        "--pid",
+        "--fork",
+        "--kill-child",
+        "--mount-proc",
+        "--",
+        "sh",
+        "-c",
+        script,
+        "jail",
+        "setpriv",
+        f"--reuid={sandbox_uid}",
+        f"--regid={sandbox_uid}",
+        "--clear-groups",
+        "--no-new-privs",
+        "--inh-caps=-all",
+        "--bounding-set=-all",
+        "--",
+        *command,
+    ]
+
+
+def report(submission_id, index: int | None, case: dict | None) -> None:
+    """Send the result of a case, or the end of a submission (index None)"""
+    if progress_queue is not None:
+        progress_queue.put((submission_id, index, case))
+
+
+def verdict_response(
+    submission_id, verdict: str, max_time: float = 0, max_memory: int = 0, message=None
+) -> dict:
+    return {
+        "submission_id": submission_id,
+        "max_time": max_time,
+        "max_memory": max_memory,
+        "verdict": {"verdict": verdict, "message": message or VERDICTS[verdict]},
+    }
+
+
+def same_output(expected: str, output: str) -> bool:
+    """Compare outputs ignoring trailing spaces and trailing blank lines"""
+    expected_lines = [line.rstrip() for line in expected.rstrip().splitlines()]
+    output_lines = [line.rstrip() for line in output.rstrip().splitlines()]
+    return expected_lines == output_lines
+
+
+def compile_source(spec: dict, workdir: str) -> str | None:
+    """Compile the source in ``workdir``
+
+    Returns:
+        str | None: the compiler errors, or None if the compilation succeeded
+    """
+    try:
+        result = subprocess.run(
+            jailed(spec["compile"]),
+            cwd=workdir,
+            capture_output=True,
+            timeout=COMPILE_TIMEOUT_SECONDS,
+            env=SANDBOX_ENV,
+        )
+    except subprocess.TimeoutExpired:
+        return "Compilation timed out"
+    if result.returncode != 0:
+        return result.stderr.decode(errors="replace")[:COMPILER_OUTPUT_LIMIT]
+    return None
+
+
+def run_case(
+    command: list[str],
+    workdir: str,
+    input_path: str,
+    time_limit: int,
+    memory_limit: int,
+) -> dict:
+    """Run the program on one input file under the limits
+
+    Returns:
+        dict: ``verdict`` (None when the program finished normally), ``output``,
+        ``time`` in seconds and ``memory`` in kilobytes
+    """
+    cpu_seconds = math.ceil(time_limit / 1000) + 1
+    memory_bytes = memory_limit * 1024 * 1024
+
+    def limits():
+        os.setsid()
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+        resource.setrlimit(
+            resource.RLIMIT_FSIZE, (OUTPUT_LIMIT_BYTES, OUTPUT_LIMIT_BYTES)
+        )
+        resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+        resource.setrlimit(resource.RLIMIT_NPROC, (PROCESS_LIMIT, PROCESS_LIMIT))
+
+    output_path = os.path.join(workdir, "output.txt")
+    error_path = os.path.join(workdir, "error.txt")
+
+    with open(input_path, "rb") as stdin_file, open(
+        output_path, "wb"
+    ) as stdout_file, open(error_path, "wb") as stderr_file:
+        process = subprocess.Popen(
+            jailed(command),
+            cwd=workdir,
+            stdin=stdin_file,
+            stdout=stdout_file,
+            stderr=stderr_file,
+            env=SANDBOX_ENV,
+            preexec_fn=limits,
+        )
+
+    # Programs that sleep or block do not use CPU, so the wall clock is
+    # limited as well
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:  # It finished in the meantime
+            pass
+
+    timer = threading.Timer(3 * time_limit / 1000 + 1, kill)
+    timer.start()
+    try:
+        _, status, usage = os.wait4(process.pid, 0)
+    finally:
+        timer.cancel()
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    cpu_time = usage.ru_utime + usage.ru_stime
+    memory = usage.ru_maxrss
+    with open(output_path, "rb") as stdout_file:
+        output = stdout_file.read().decode(errors="replace")
+    with open(error_path, "rb") as stderr_file:
+        errors = stderr_file.read()
+
+    signum = None
+    if process.returncode < 0:  # The jail itself, killed by the timer
+        signum = -process.returncode
+    elif process.returncode > 128:  # The program, as told by the jail shell
+        signum = process.returncode - 128
+    verdict = None
+    if timed_out.is_set() or signum == signal.SIGXCPU or cpu_time * 1000 > time_limit:
+        verdict = "TLE"
+    elif signum == signal.SIGXFSZ:
+        verdict = "OLE"
+    elif memory * 1024 >= memory_bytes or (
+        process.returncode != 0
+        and any(marker in errors for marker in OUT_OF_MEMORY_MARKERS)
+    ):
+        verdict = "MLE"
+    elif process.returncode != 0:
+        verdict = "RE"
+
+    return {
+        "verdict": verdict,
+        "output": output,
+        "time": round(cpu_time, 3),
+        "memory": memory,
+    }
+
+
+def run_submission(payload: dict, cases: list[tuple[str, str]]) -> dict:
+    """Judge a submission against its test cases
+
+    Cases are run in order; with ``stop_on_failure`` in the payload judging
+    stops at the first failed case. The result of every case is reported as
+    soon as it is known (see ``report``).
+
+    Args:
+        payload (dict): judge request of the submission (see ``judge_payload``)
+        cases (list[tuple[str, str]]): input and expected output files of
+            every case
+
+    Returns:
+        dict: answer with the shape of the remote judge answer, plus the
+        ``cases`` run (verdict, time and memory of each) and ``total_cases``
+    """
+    try:
+        return judge_cases(payload, cases)
+    finally:
+        report(payload["submission_id"], None, None)
+
+
+def judge_cases(payload: dict, cases: list[tuple[str, str]]) -> dict:
+    submission_id = payload["submission_id"]
+    spec = LANGUAGES.get(payload["language"])
+    if spec is None:
+        return verdict_response(
+            submission_id, "CE", message=f"Unsupported language {payload['language']}"
+        )
+
+    workdir = tempfile.mkdtemp(prefix="judge-")
+    os.chown(workdir, sandbox_uid, sandbox_uid)  # Where the compiler writes
+    try:
+        with open(os.path.join(workdir, spec["source"]), "w") as source:
+            source.write(payload["code"])
+
+        if spec["compile"]:
+            language, code = payload["language"], payload["code"]
+            artifact = os.path.join(workdir, spec["artifact"])
+            if artifact_cache is None or not artifact_cache.get(
+                language, code, artifact
+            ):
+                errors = compile_source(spec, workdir)
+                if errors is not None:
+                    return verdict_response(submission_id, "CE", message=errors)
+                if artifact_cache is not None:
+                    artifact_cache.put(language, code, artifact)
+
+        verdict = "AC"
+        max_time = 0
+        max_memory = 0
+        results = []
+        for index, (input_path, expected_path) in enumerate(cases):
+            result = run_case(
+                spec["run"],
+                workdir,
+                input_path,
+                payload["time_limit"],
+                payload["memory_limit"],
+            )
+            max_time = max(max_time, result["time"])
+            max_memory = max(max_memory, result["memory"])
+
+            case_verdict = result["verdict"]
+            if case_verdict is None:
+                with open(expected_path, encoding="utf-8", errors="replace") as file:
+                    same = same_output(file.read(), result["output"])
+                case_verdict = "AC" if same else "WA"
+            case = {
+                "verdict": case_verdict,
+                "time": result["time"],
+                "memory": result["memory"],
+            }
+            results.append(case)
+            report(submission_id, index, case)
+
+            if case_verdict != "AC":
+                if verdict == "AC":  # The first failed case gives the verdict
+                    verdict = case_verdict
+                if payload.get("stop_on_failure"):
+                    break
+
+        response = verdict_response(submission_id, verdict, max_time, max_memory)
+        response["cases"] = results
+        response["total_cases"] = len(cases)
+        return response
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
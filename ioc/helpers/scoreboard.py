@@ -0,0 +1,330 @@
+"""Contest scoreboards, updated incrementally and served from the cache.
+
+Every judged submission sent inside the window of a contest is counted in
+the ``ContestScore`` of its author as soon as its summary is updated: one
+more attempt on the problem until it is solved, and once solved the minute
+of the accepted submission and the points of the summary. A problem adds
+to the penalty time its solve minute plus ``penalty_minutes`` per rejected
+attempt before it, and participants rank by points, then penalty time.
+
+The ranked scoreboard lives in the cache, together with its JSON body and
+an ETag, so reading it never touches the database. A judged submission
+moves the row of its author to its new place in the cached ranking (under
+an advisory lock, so concurrent workers never lose an update) instead of
+ranking every participant again; the scoreboard is only built from the
+scores when it is missing from the cache.
+
+Submissions sent during the freeze period update the real results, but the
+scoreboard keeps showing the results from before the freeze, with the new
+attempts as pending, until the contest ends.
+"""
+import bisect
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils import timezone
+
+from constants.ioc import SCOREBOARD_CACHE_SECONDS
+from ..models.archived_submission import ArchivedSubmission
+from ..models.contest import Contest
+from ..models.contest_score import ContestScore
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.io_code_submission_summary import IoCodeSubmissionSummary
+
+# Advisory lock namespace serializing the updates of the cached scoreboards
+SCOREBOARD_LOCK = 0x5C0B
+
+LIVE = "live"
+FROZEN = "frozen"
+FINAL = "final"
+
+
+def scoreboard_key(contest_id: int) -> str:
+    return f"ioc:contest:{contest_id}:scoreboard"
+
+
+def empty_result() -> dict:
+    """Result of a participant on a problem, as stored in ``ContestScore``"""
+    # pending: attempts sent during the freeze, only in the public results
+    return {"attempts": 0, "minute": None, "points": 0, "pending": 0}
+
+
+def count_attempt(problems: dict, material_id: int, minute, points) -> bool:
+    """Count an attempt on a problem not solved yet
+
+    Args:
+        problems (dict): results of a participant, by material id
+        material_id (int): problem of the attempt
+        minute: minute of the contest the problem was solved at, None if the
+            attempt was rejected
+        points: points of the solved problem
+
+    Returns:
+        bool: False if the problem was already solved
+    """
+    result = problems.setdefault(str(material_id), empty_result())
+    if result["minute"] is not None:
+        return False
+    result["attempts"] += 1
+    if minute is not None:
+        result["minute"] = minute
+        result["points"] = points
+    return True
+
+
+def count_submission(
+    score: ContestScore, contest: Contest, material_id: int, submitted, points
+) -> None:
+    """Count a judged submission in the real and the public results
+
+    Args:
+        points: points of the problem if the submission was accepted, None
+            otherwise
+    """
+    minute = None
+    if points is not None:
+        minute = int((submitted - contest.start_at).total_seconds() // 60)
+
+    counted = count_attempt(score.problems, material_id, minute, points)
+    if contest.freeze_at is None or submitted < contest.freeze_at:
+        count_attempt(score.public_problems, material_id, minute, points)
+    elif counted:
+        result = score.public_problems.setdefault(str(material_id), empty_result())
+        if result["minute"] is None:
+            result["pending"] += 1
+
+
+def record_contest_submission(submission: IoCodeSubmission) -> None:
+    """Count a judged submission in the contests running when it was sent
+
+    Called right after its summary is updated, in the same transaction. The
+    cached scoreboards are updated once the transaction commits.
+    """
+    submitted = submission.submission_date
+    contests = Contest.objects.filter(
+        materials=submission.material_id_id,
+        start_at__lte=submitted,
+        end_at__gt=submitted,
+    )
+    for contest in contests:
+        points = None
+        if submission.response_char == "A":
+            points = IoCodeSubmissionSummary.objects.values_list(
+                "points", flat=True
+            ).get(user_id=submission.user_id_id, material_id=submission.material_id_id)
+
+        score, _ = ContestScore.objects.select_for_update().get_or_create(
+            contest=contest, user_id=submission.user_id_id
+        )
+        count_submission(score, contest, submission.material_id_id, submitted, points)
+        score.save(update_fields=["problems", "public_problems", "updated_at"])
+
+        transaction.on_commit(
+            lambda contest=contest, user_id=submission.user_id_id: (
+                update_scoreboard_row(contest, user_id)
+            )
+        )
+
+
+def rebuild_contest_scores(material_ids: list[int]) -> None:
+    """Count again the submissions to some problems in their contests
+
+    Called after the submissions of the problems were judged again: their
+    results are replayed from the judged submissions sent in each window,
+    archived ones included.
+    """
+    contests = Contest.objects.filter(materials__in=material_ids).distinct()
+    for contest in contests:
+        with transaction.atomic():
+            scores = {
+                score.user_id: score
+                for score in ContestScore.objects.select_for_update().filter(
+                    contest=contest
+                )
+            }
+            for score in scores.values():
+                for material_id in material_ids:
+                    score.problems.pop(str(material_id), None)
+                    score.public_problems.pop(str(material_id), None)
+
+            summaries = IoCodeSubmissionSummary.objects.filter(
+                material_id__in=material_ids
+            ).values_list("user_id", "material_id", "points")
+            points = {
+                (user_id, material_id): value
+                for user_id, material_id, value in summaries
+            }
+            live, archived = (
+                model.objects.filter(
+                    material_id__in=material_ids,
+                    submission_date__gte=contest.start_at,
+                    submission_date__lt=contest.end_at,
+                    response_char__isnull=False,
+                )
+                .exclude(response_char="E")
+                .values_list(
+                    "submission_id",
+                    "user_id",
+                    "material_id",
+                    "response_char",
+                    "submission_date",
+                )
+                for model in (IoCodeSubmission, ArchivedSubmission)
+            )
+            submissions = live.union(archived, all=True).order_by("submission_id")
+            for _, user_id, material_id, response_char, submitted in submissions:
+                score = scores.setdefault(
+                    user_id, ContestScore(contest=contest, user_id=user_id)
+                )
+                count_submission(
+                    score,
+                    contest,
+                    material_id,
+                    submitted,
+                    points[user_id, material_id] if response_char == "A" else None,
+                )
+
+            ContestScore.objects.bulk_update(
+                [score for score in scores.values() if score.id],
+                ["problems", "public_problems"],
+            )
+            ContestScore.objects.bulk_create(
+                [score for score in scores.values() if not score.id]
+            )
+        transaction.on_commit(
+            lambda contest_id=contest.id: forget_scoreboard(contest_id)
+        )
+
+
+def scoreboard_state(freeze_at, end_at) -> str:
+    """Whether the scoreboard shows the live, the frozen or the final results"""
+    now = timezone.now()
+    if now >= end_at:
+        return FINAL
+    if freeze_at is not None and now >= freeze_at:
+        return FROZEN
+    return LIVE
+
+
+def scoreboard_row(score: ContestScore, contest: Contest, state: str) -> dict:
+    """Row of a participant: the real results once the contest ended,
+    the public ones before"""
+    problems = score.problems if state == FINAL else score.public_problems
+    solved = [result for result in problems.values() if result["minute"] is not None]
+    return {
+        "user_id": score.user_id,
+        "first_name": score.user.first_name,
+        "last_name": score.user.last_name,
+        "points": sum(result["points"] for result in solved),
+        "solved": len(solved),
+        "penalty": sum(
+            result["minute"] + contest.penalty_minutes * (result["attempts"] - 1)
+            for result in solved
+        ),
+        "problems": problems,
+    }
+
+
+def row_key(row: dict) -> tuple:
+    return (-row["points"], row["penalty"], row["user_id"])
+
+
+def store_scoreboard(contest: Contest, rows: list[dict], state: str) -> dict:
+    """Cache a ranked scoreboard with its JSON body and ETag"""
+    ranked = []
+    for position, row in enumerate(rows):
+        tied = position and row_key(rows[position - 1])[:2] == row_key(row)[:2]
+        ranked.append({"rank": ranked[-1]["rank"] if tied else position + 1, **row})
+
+    body = json.dumps(
+        {
+            "contest_id": contest.id,
+            "state": state,
+            "scoreboard": ranked,
+        },
+        cls=DjangoJSONEncoder,
+    ).encode()
+    board = {
+        "rows": rows,
+        "state": state,
+        # To tell when the state changes without reading the contest
+        "freeze_at": contest.freeze_at,
+        "end_at": contest.end_at,
+        "body": body,
+        "etag": f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+    }
+    cache.set(scoreboard_key(contest.id), board, SCOREBOARD_CACHE_SECONDS)
+    return board
+
+
+def _lock_scoreboard(contest_id: int) -> None:
+    """Lock the cached scoreboard of a contest until the transaction ends"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(%s, %s)", [SCOREBOARD_LOCK, contest_id]
+        )
+
+
+def _build_scoreboard(contest: Contest, state: str) -> dict:
+    scores = ContestScore.objects.filter(contest=contest).select_related("user")
+    rows = sorted(
+        (scoreboard_row(score, contest, state) for score in scores), key=row_key
+    )
+    return store_scoreboard(contest, rows, state)
+
+
+def update_scoreboard_row(contest: Contest, user_id: int) -> None:
+    """Move the row of a participant to its new place in the cached scoreboard
+
+    A missing scoreboard is left missing, it is built when next read.
+    """
+    with transaction.atomic():
+        _lock_scoreboard(contest.id)
+        board = cache.get(scoreboard_key(contest.id))
+        if board is None:
+            return
+
+        score = ContestScore.objects.select_related("user").get(
+            contest=contest, user_id=user_id
+        )
+        row = scoreboard_row(score, contest, board["state"])
+        rows = [other for other in board["rows"] if other["user_id"] != user_id]
+        bisect.insort(rows, row, key=row_key)
+        store_scoreboard(contest, rows, board["state"])
+
+
+def get_scoreboard(contest_id: int) -> dict:
+    """Cached scoreboard of a contest, built if missing
+
+    A cached scoreboard is served without reading the database. It is built
+    again once when it freezes and once when the contest ends, to show the
+    results of the freeze period.
+
+    Returns:
+        dict: the ranked rows, the JSON ``body`` and its ``etag``
+
+    Raises:
+        Contest.DoesNotExist: the scoreboard is not cached and there is no
+            contest with that id
+    """
+    board = cache.get(scoreboard_key(contest_id))
+    if board is not None and board["state"] == scoreboard_state(
+        board["freeze_at"], board["end_at"]
+    ):
+        return board
+
+    contest = Contest.objects.get(id=contest_id)
+    state = scoreboard_state(contest.freeze_at, contest.end_at)
+    with transaction.atomic():
+        _lock_scoreboard(contest.id)
+        board = cache.get(scoreboard_key(contest.id))  # Built while waiting
+        if board is not None and board["state"] == state:
+            return board
+        return _build_scoreboard(contest, state)
+
+
+def forget_scoreboard(contest_id: int) -> None:
+    cache.delete(scoreboard_key(contest_id))
@@ -0,0 +1,248 @@
+"""Similarity index of the accepted submissions, to flag copied solutions.
+
+The code of every accepted submission is reduced to tokens, with names,
+numbers and strings replaced by placeholders and comments dropped, so
+renaming variables or editing comments does not hide a copy. Runs of
+``SIMILARITY_SHINGLE_SIZE`` tokens (shingles) are hashed, and the MinHash
+signature keeps, for each of ``bands * rows`` hash functions, the least hash
+of the shingles: the fraction of equal minimums of two signatures estimates
+the Jaccard similarity of their shingle sets.
+
+Comparing every pair of signatures is still quadratic, so the signature is
+cut in ``SIMILARITY_BANDS`` bands and each band hashed into a bucket
+(locality-sensitive hashing). Two submissions are only compared if they
+share a bucket in some band, which is likely when they are similar and
+unlikely otherwise; with 32 bands of 4 rows, pairs at 0.8 similarity are
+found with a probability above 0.99 and pairs at 0.3 share a bucket with a
+probability under 0.25. Candidates are found with an indexed join of the
+bucket table, so the report reads the pairs that share buckets rather than
+every pair.
+
+A submission is indexed once it is judged, in the transaction of its
+verdict, and removed from the index if a rejudge rejects it.
+"""
+import hashlib
+import random
+import re
+from array import array
+
+from django.db import connection, transaction
+
+from constants.ioc import (
+    SIMILARITY_BAND_ROWS,
+    SIMILARITY_BANDS,
+    SIMILARITY_SHINGLE_SIZE,
+)
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.similarity_bucket import SimilarityBucket
+from ..models.similarity_signature import SimilaritySignature
+
+# Hash functions (a * x + b) mod PRIME, the same in every process
+PRIME = 2**61 - 1
+_generator = random.Random(0x51A1)
+HASHES = [
+    (_generator.randrange(1, PRIME), _generator.randrange(PRIME))
+    for _ in range(SIMILARITY_BANDS * SIMILARITY_BAND_ROWS)
+]
+
+# Comments of every language, and the preprocessor lines of C, dropped
+COMMENTS = {
+    "py": re.compile(r"#[^\n]*"),
+    "c": re.compile(r"//[^\n]*|/\*.*?\*/|#[^\n]*", re.S),
+}
+COMMENTS["cpp"] = COMMENTS["c"]
+
+TOKENS = re.compile(
+    r"""(?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')"""
+    r"|(?P<number>\d+(?:\.\d*)?)"
+    r"|(?P<name>[A-Za-z_]\w*)"
+    r"|(?P<symbol>\S)"
+)
+
+# Names kept as they are, everything else is a placeholder
+KEYWORDS = frozenset(
+    """
+    and as assert break case class continue def del do elif else except for
+    from global if import in is lambda not or pass print raise return switch
+    try while with yield int long float double char void struct const unsigned
+    bool auto using namespace std include cin cout endl printf scanf input
+    range len list dict set map vector string
+    """.split()
+)
+
+# Candidate pairs of a material: signatures of different users sharing a
+# bucket in some band
+CANDIDATES_SQL = """
+SELECT DISTINCT first.signature_id, second.signature_id
+FROM {table} AS first
+JOIN {table} AS second
+    ON second.material_id = first.material_id
+    AND second.band = first.band
+    AND second.bucket = first.bucket
+    AND second.user_id > first.user_id
+WHERE first.material_id = %s
+""".format(
+    table=SimilarityBucket._meta.db_table
+)
+
+
+def tokenize(code: str, language: str) -> list[str]:
+    """Tokens of the code, without comments and with names, numbers and
+    strings replaced by placeholders"""
+    comments = COMMENTS.get(language)
+    if comments is not None:
+        code = comments.sub(" ", code)
+
+    tokens = []
+    for match in TOKENS.finditer(code):
+        kind, token = match.lastgroup, match.group()
+        if kind == "string":
+            tokens.append('""')
+        elif kind == "number":
+            tokens.append("0")
+        elif kind == "name" and token not in KEYWORDS:
+            tokens.append("x")
+        else:
+            tokens.append(token)
+    return tokens
+
+
+def shingles(tokens: list[str]) -> set[int]:
+    """64 bit hashes of the runs of ``SIMILARITY_SHINGLE_SIZE`` tokens"""
+    size = min(SIMILARITY_SHINGLE_SIZE, len(tokens))
+    return {
+        int.from_bytes(
+            hashlib.blake2b(
+                "\0".join(tokens[start : start + size]).encode(), digest_size=8
+            ).digest(),
+            "big",
+        )
+        for start in range(len(tokens) - size + 1)
+    }
+
+
+def minhash(hashes: set[int]) -> array:
+    """MinHash signature of a set of shingle hashes"""
+    if not hashes:
+        return array("I", [0xFFFFFFFF] * len(HASHES))
+    return array(
+        "I",
+        (
+            min((a * value + b) % PRIME for value in hashes) & 0xFFFFFFFF
+            for a, b in HASHES
+        ),
+    )
+
+
+def band_buckets(signature: array) -> list[int]:
+    """Bucket of every band of a signature, as a signed 64 bit integer"""
+    return [
+        int.from_bytes(
+            hashlib.blake2b(
+                signature[band : band + SIMILARITY_BAND_ROWS].tobytes(), digest_size=8
+            ).digest(),
+            "big",
+            signed=True,
+        )
+        for band in range(0, len(signature), SIMILARITY_BAND_ROWS)
+    ]
+
+
+def similarity(first: bytes, second: bytes) -> float:
+    """Estimated Jaccard similarity of two packed signatures"""
+    first, second = array("I", bytes(first)), array("I", bytes(second))
+    return sum(x == y for x, y in zip(first, second)) / len(first)
+
+
+def index_submission(submission: IoCodeSubmission) -> None:
+    """Add a judged submission to the similarity index if it was accepted,
+    remove it otherwise"""
+    with transaction.atomic():
+        SimilaritySignature.objects.filter(submission=submission).delete()
+        if submission.response_char != "A":
+            return
+
+        signature = minhash(shingles(tokenize(submission.code, submission.language)))
+        indexed = SimilaritySignature.objects.create(
+            submission=submission,
+            material_id=submission.material_id_id,
+            user_id=submission.user_id_id,
+            signature=signature.tobytes(),
+        )
+        SimilarityBucket.objects.bulk_create(
+            SimilarityBucket(
+                signature=indexed,
+                material_id=submission.material_id_id,
+                user_id=submission.user_id_id,
+                band=band,
+                bucket=bucket,
+            )
+            for band, bucket in enumerate(band_buckets(signature))
+        )
+
+
+def index_material(material_id: int) -> int:
+    """Index again every accepted submission of a material
+
+    Returns:
+        int: number of submissions indexed
+    """
+    with transaction.atomic():
+        SimilaritySignature.objects.filter(material_id=material_id).delete()
+        submissions = IoCodeSubmission.objects.filter(
+            material_id=material_id, response_char="A"
+        ).only("submission_id", "material_id", "user_id", "code", "language")
+        indexed = 0
+        for submission in submissions.iterator():
+            index_submission(submission)
+            indexed += 1
+    return indexed
+
+
+def similarity_report(material_id: int, threshold: float) -> list[dict]:
+    """Pairs of users of a material with similar accepted submissions
+
+    Only the candidate pairs of the index are compared. Every pair of users
+    is reported once, with its most similar pair of submissions.
+
+    Returns:
+        list[dict]: the pairs at ``threshold`` similarity or more, most
+        similar first
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(CANDIDATES_SQL, [material_id])
+        candidates = cursor.fetchall()
+
+    ids = {submission_id for pair in candidates for submission_id in pair}
+    signatures = {
+        signature.submission_id: signature
+        for signature in SimilaritySignature.objects.filter(
+            submission_id__in=ids
+        ).select_related("user")
+    }
+
+    pairs = {}
+    for first_id, second_id in candidates:
+        first, second = signatures[first_id], signatures[second_id]
+        estimate = similarity(first.signature, second.signature)
+        users = (first.user_id, second.user_id)
+        if estimate >= threshold and estimate > pairs.get(users, (0,))[0]:
+            pairs[users] = (estimate, first, second)
+
+    report = [
+        {
+            "similarity": round(estimate, 3),
+            "submissions": [
+                {
+                    "submission_id": signature.submission_id,
+                    "user_id": signature.user_id,
+                    "first_name": signature.user.first_name,
+                    "last_name": signature.user.last_name,
+                }
+                for signature in (first, second)
+            ],
+        }
+        for estimate, first, second in pairs.values()
+    ]
+    report.sort(key=lambda pair: -pair["similarity"])
+    return report
@@ -0,0 +1,108 @@
+"""Local stub of the judge HTTP API, for tests and benchmarks.
+
+The stub answers every submission as accepted after an optional delay (per
+request, so a batch costs the same round trip as a single submission) and
+can be told to fail its next requests, which is enough to exercise the
+judge client without the real judge.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubJudgeHandler(BaseHTTPRequestHandler):
+    """Request handler of the stub judge"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, as the real judge
+    disable_nagle_algorithm = True  # Headers and body are written separately
+
+    def do_POST(self):
+        stub: StubJudge = self.server.stub
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"null")
+        status, body = stub.answer(self.path, payload)
+
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubJudge:
+    """Stub judge served on a random local port
+
+    Usage::
+
+        with StubJudge(latency=0.01) as stub:
+            client = JudgeClient(
+                judge_url=stub.url("/judge/end"),
+                batch_url=stub.url("/judge/batch"),
+            )
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.fail_next = 0
+        self.fail_status = 500
+        self.requests: list[tuple[str, object]] = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubJudgeHandler)
+        self.server.daemon_threads = True
+        self.server.stub = self
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+        stub = self
+        process_request = self.server.process_request
+
+        def count_connections(request, client_address):
+            with stub.lock:
+                stub.connections += 1
+            process_request(request, client_address)
+
+        self.server.process_request = count_connections
+
+    def __enter__(self) -> "StubJudge":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def url(self, path: str) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}{path}"
+
+    def judge_submission(self, payload: dict) -> dict:
+        """Verdict of the stub for one submission"""
+        return {
+            "submission_id": payload.get("submission_id"),
+            "max_memory": 1024,
+            "max_time": 0.01,
+            "verdict": {"message": "Accepted", "verdict": "AC"},
+        }
+
+    def answer(self, path: str, payload) -> tuple[int, object]:
+        with self.lock:
+            self.requests.append((path, payload))
+            failing = self.fail_next > 0
+            if failing:
+                self.fail_next -= 1
+
+        if self.latency:
+            time.sleep(self.latency)
+        if failing:
+            return self.fail_status, {"message": "Stub failure"}
+        if path.startswith("/problem"):
+            return 201, {"message": "Problem created"}
+        if path.startswith("/judge/batch"):
+            results = [self.judge_submission(item) for item in payload["submissions"]]
+            return 201, {"results": results}
+        return 201, self.judge_submission(payload)
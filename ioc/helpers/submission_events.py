@@ -0,0 +1,214 @@
+"""Publish/subscribe of the status changes of code submissions.
+
+Whenever the verdict fields of a submission are written, an event is
+published after the transaction commits (see ``ioc.signals``) and pushed to
+the open streams of its author. While a submission is judged, the result of
+each case is published as a "case" event as soon as the judge gives it.
+Streams are asyncio queues waiting on the event loop of the ASGI server, so an
+idle stream costs a coroutine and a queue, not a thread, and one process can
+hold thousands of them.
+
+The broker is chosen by ``IOC_EVENTS_BACKEND``: "local" only reaches the
+streams of the publishing process, "postgres" relays the events through
+``LISTEN/NOTIFY`` so verdicts given by judge workers in other processes reach
+every web process. Any other value is the dotted path of a ``Broker``
+subclass.
+"""
+import asyncio
+import json
+import logging
+import threading
+
+import psycopg2
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, connection, connections
+from django.utils.module_loading import import_string
+
+from constants.ioc import SUBMISSION_EVENTS_QUEUE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def submission_event(submission) -> dict:
+    """Event describing the current status of a submission"""
+    return {
+        "submission_id": submission.submission_id,
+        "material_id": submission.material_id_id,
+        "user_id": submission.user_id_id,
+        "response_char": submission.response_char,
+        "execution_time": submission.execution_time,
+        "execution_memory": submission.execution_memory,
+        "completion_rate": submission.completion_rate,
+        "language": submission.language,
+    }
+
+
+class Subscription:
+    """Events of one user, queued for one stream"""
+
+    def __init__(self, broker: "Broker", user_id: int):
+        self.broker = broker
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=SUBMISSION_EVENTS_QUEUE_SIZE)
+
+    def push(self, event: dict) -> None:
+        """Queue an event, on the loop of the stream"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A stream that stopped reading must not hold memory for ever
+            logger.warning("Dropped an event of a stalled stream of %s", self.user_id)
+
+    async def get(self) -> dict:
+        return await self.queue.get()
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class Broker:
+    """Delivers published events to the subscriptions of their user"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: dict[int, set[Subscription]] = {}
+
+    def publish(self, event: dict) -> None:
+        raise NotImplementedError
+
+    async def subscribe(self, user_id: int) -> Subscription:
+        subscription = Subscription(self, user_id)
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(subscription.user_id, None)
+
+    def subscribers(self) -> int:
+        with self._lock:
+            return sum(len(items) for items in self._subscriptions.values())
+
+    def deliver(self, event: dict) -> None:
+        """Hand an event to the subscriptions of its user, from any thread"""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event["user_id"], ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.push, event)
+            except RuntimeError:  # The loop of the stream is closed
+                self.unsubscribe(subscription)
+
+
+class LocalBroker(Broker):
+    """Broker reaching the streams of this process only"""
+
+    def publish(self, event: dict) -> None:
+        self.deliver(event)
+
+
+class PostgresBroker(Broker):
+    """Broker relaying the events of every process through LISTEN/NOTIFY
+
+    Each process keeps one listening connection, read by the event loop of
+    its streams, whatever the number of streams.
+    """
+
+    CHANNEL = "ioc_submission_events"
+
+    def __init__(self):
+        super().__init__()
+        self._listener = None
+        self._loop = None
+
+    def publish(self, event: dict) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, %s)",
+                [self.CHANNEL, json.dumps(event, cls=DjangoJSONEncoder)],
+            )
+
+    async def subscribe(self, user_id: int) -> Subscription:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._listener is None:
+            self._listen(loop)
+        return await super().subscribe(user_id)
+
+    def _listen(self, loop) -> None:
+        self._stop()
+        params = connections["default"].get_connection_params()
+        listener = psycopg2.connect(**params)
+        listener.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        with listener.cursor() as cursor:
+            cursor.execute(f"LISTEN {self.CHANNEL}")
+        loop.add_reader(listener.fileno(), self._read)
+        self._listener, self._loop = listener, loop
+
+    def _stop(self) -> None:
+        if self._listener is None:
+            return
+        if not self._loop.is_closed():
+            self._loop.remove_reader(self._listener.fileno())
+        self._listener.close()
+        self._listener = self._loop = None
+
+    def _read(self) -> None:
+        try:
+            self._listener.poll()
+        except psycopg2.Error:
+            logger.exception("Lost the submission events connection")
+            self._stop()  # The next subscription listens again
+            return
+        while self._listener.notifies:
+            notify = self._listener.notifies.pop(0)
+            self.deliver(json.loads(notify.payload))
+
+
+BROKERS = {
+    "local": "ioc.helpers.submission_events.LocalBroker",
+    "postgres": "ioc.helpers.submission_events.PostgresBroker",
+}
+_brokers: dict[str, Broker] = {}
+_brokers_lock = threading.Lock()
+
+
+def get_broker() -> Broker:
+    """Per-process broker chosen by ``IOC_EVENTS_BACKEND``"""
+    path = BROKERS.get(settings.IOC_EVENTS_BACKEND, settings.IOC_EVENTS_BACKEND)
+    with _brokers_lock:
+        if path not in _brokers:
+            _brokers[path] = import_string(path)()
+        return _brokers[path]
+
+
+def publish_case(submission, index: int, case: dict) -> None:
+    """Publish the result of one case of a submission being judged"""
+    event = {
+        "event": "case",
+        "submission_id": submission.submission_id,
+        "user_id": submission.user_id_id,
+        "case": index,
+        **case,
+    }
+    try:
+        get_broker().publish(event)
+    except DatabaseError:
+        logger.exception("Could not publish a case of %s", submission.submission_id)
+
+
+def publish_submission(submission) -> None:
+    """Publish the status of a submission to the streams of its author
+
+    A broker failure is logged, never raised: the verdict is already stored
+    and clients can still read it.
+    """
+    try:
+        get_broker().publish(submission_event(submission))
+    except DatabaseError:
+        logger.exception("Could not publish submission %s", submission.submission_id)
@@ -0,0 +1,121 @@
+"""Pages of the submission history, newest first.
+
+The history of a user on a material, and of every user for instructors, is
+read with keyset paging (see ``keyset``) over an index in history order that
+also holds the verdict columns, so a page without the code is answered from
+the index alone. The code, the largest column, is only read when asked.
+
+Archived submissions (see ``archive``) are part of the history: a page reads
+as many submissions from the archive, after the same cursor, and keeps the
+newest of both.
+"""
+from django.db.models import QuerySet
+from django.utils.dateparse import parse_datetime
+
+from .keyset import InvalidCursor, compare, decode_cursor, encode_cursor
+from ..models.io_code_submission import IoCodeSubmission
+
+HISTORY_ORDER = ("-submission_date", "-submission_id")
+
+# Columns of a page, the code is added when asked for
+HISTORY_FIELDS = (
+    "submission_id",
+    "user_id",
+    "material_id",
+    "submission_date",
+    "response_char",
+    "execution_time",
+    "execution_memory",
+    "completion_rate",
+    "language",
+)
+ARCHIVED_HISTORY_FIELDS = (
+    "submission_id",
+    "user",
+    "material",
+    "submission_date",
+    "response_char",
+    "execution_time",
+    "execution_memory",
+    "completion_rate",
+    "language",
+)
+
+
+def history_key(date, submission_id) -> list:
+    """Order key of a cursor, with its date parsed
+
+    Raises:
+        InvalidCursor: the key is not a date and a submission id
+    """
+    try:
+        parsed = parse_datetime(date)
+    except (TypeError, ValueError):
+        parsed = None
+    if parsed is None or not isinstance(submission_id, int):
+        raise InvalidCursor("The cursor is not valid")
+    return [parsed, submission_id]
+
+
+def history_rows(
+    submissions: QuerySet, fields: tuple, key: list | None, limit: int
+) -> list:
+    """The first ``limit`` submissions after the key, in history order"""
+    submissions = submissions.order_by(*HISTORY_ORDER).only(*fields)
+    if key is not None:
+        submissions = submissions.filter(compare(HISTORY_ORDER, key, ahead=False))
+    return list(submissions[:limit])
+
+
+def history_page(
+    submissions: QuerySet,
+    cursor: str | None,
+    limit: int,
+    with_code: bool = False,
+    archived: QuerySet | None = None,
+) -> tuple[list[IoCodeSubmission], str | None]:
+    """A page of submissions, newest first
+
+    Args:
+        submissions (QuerySet): submissions of the history
+        cursor (str | None): cursor of the page, None for the first one
+        limit (int): submissions in the page
+        with_code (bool): whether the code of the submissions is read
+        archived (QuerySet | None): archived submissions of the history
+
+    Returns:
+        tuple[list[IoCodeSubmission], str | None]: the submissions and the
+        cursor of the next page, None on the last one
+
+    Raises:
+        InvalidCursor: the cursor is malformed
+    """
+    code = ("code",) if with_code else ()
+    key = None
+    if cursor is not None:
+        key = history_key(*decode_cursor(cursor, len(HISTORY_ORDER))["key"])
+
+    page = history_rows(submissions, HISTORY_FIELDS + code, key, limit + 1)
+    if archived is not None:
+        page += [
+            submission.to_submission()
+            for submission in history_rows(
+                archived, ARCHIVED_HISTORY_FIELDS + code, key, limit + 1
+            )
+        ]
+        page.sort(
+            key=lambda submission: (
+                submission.submission_date,
+                submission.submission_id,
+            ),
+            reverse=True,
+        )
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        last = page[-1]
+        # isoformat keeps the microseconds, the JSON encoder drops them
+        date = last.submission_date.isoformat()
+        next_cursor = encode_cursor({"key": [date, last.submission_id]})
+    return page, next_cursor
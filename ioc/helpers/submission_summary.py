@@ -1,53 +1,239 @@
+from django.db import connection, transaction
+
 from accounts.models import User
-from courses.models import Material
-from ioc.models import IoCodeSubmissionSummary, IoCodeSubmission, MaterialIoCode
+from courses.models import Material, Module
+from ioc.models import (
+    ArchivedSubmission,
+    IoCodeCourseSummary,
+    IoCodeSubmissionSummary,
+    IoCodeSubmission,
+    MaterialIoCode,
+)
+
+# The row is inserted on the first attempt and updated in place afterwards,
+# all in one statement, so concurrent submissions of the same user never lose
+# an update. The Django ORM cannot express an ON CONFLICT update that reads the
+# current row, hence the raw SQL.
+#
+# On the first hit the points are the max points minus the penalty for each
+# previous attempt (at least the min points) and the execution time and
+# memory are reset to the accepted ones; later hits keep the minimums. Failed
+# attempts only count as attempts, and towards the best completion rate.
+UPSERT_SUMMARY_SQL = """
+INSERT INTO {table} AS summary (
+    user_id, material_id, attempts, hits, points,
+    min_execution_time, min_execution_memory, max_completion_rate
+)
+VALUES (
+    %(user)s, %(material)s, 1, %(hit)s, %(first_points)s, %(time)s, %(memory)s,
+    %(completion_rate)s
+)
+ON CONFLICT (user_id, material_id) DO UPDATE SET
+    attempts = summary.attempts + 1,
+    hits = summary.hits + EXCLUDED.hits,
+    points = CASE
+        WHEN EXCLUDED.hits = 1 AND summary.hits = 0 THEN GREATEST(
+            %(max_points)s - %(points_penalty)s * summary.attempts, %(min_points)s
+        )
+        ELSE summary.points
+    END,
+    min_execution_time = CASE
+        WHEN EXCLUDED.hits = 0 THEN summary.min_execution_time
+        WHEN summary.hits = 0 THEN EXCLUDED.min_execution_time
+        ELSE LEAST(summary.min_execution_time, EXCLUDED.min_execution_time)
+    END,
+    min_execution_memory = CASE
+        WHEN EXCLUDED.hits = 0 THEN summary.min_execution_memory
+        WHEN summary.hits = 0 THEN EXCLUDED.min_execution_memory
+        ELSE LEAST(summary.min_execution_memory, EXCLUDED.min_execution_memory)
+    END,
+    max_completion_rate = GREATEST(
+        summary.max_completion_rate, EXCLUDED.max_completion_rate
+    )
+""".format(
+    table=IoCodeSubmissionSummary._meta.db_table
+)
+
+# Recomputes the summaries of a set of materials from the submission history
+# with one grouped aggregation, giving the same values as replaying every
+# judged submission through UPSERT_SUMMARY_SQL in submission order. Pending
+# submissions and submissions the judge failed on (E) were never summarized.
+REBUILD_SUMMARIES_SQL = """
+WITH history AS (
+    SELECT
+        submission_id, user_id_id AS user_id, material_id_id AS material_id,
+        response_char, execution_time, execution_memory, completion_rate
+    FROM {submission_table}
+    WHERE material_id_id = ANY(%(materials)s)
+    UNION ALL
+    -- The old submissions moved to the archive (see archive)
+    SELECT
+        submission_id, user_id, material_id,
+        response_char, execution_time, execution_memory, completion_rate
+    FROM {archive_table}
+    WHERE material_id = ANY(%(materials)s)
+),
+counted AS (
+    SELECT
+        user_id,
+        material_id,
+        response_char = 'A' AS hit,
+        execution_time,
+        execution_memory,
+        COALESCE(completion_rate, 0) AS completion_rate,
+        ROW_NUMBER() OVER (
+            PARTITION BY user_id, material_id ORDER BY submission_id
+        ) - 1 AS position
+    FROM history
+    WHERE response_char IS NOT NULL
+        AND response_char <> 'E'
+),
+grouped AS (
+    SELECT
+        user_id,
+        material_id,
+        COUNT(*) AS attempts,
+        COUNT(*) FILTER (WHERE hit) AS hits,
+        MIN(position) FILTER (WHERE hit) AS first_hit,
+        MIN(execution_time) FILTER (WHERE hit) AS hit_time,
+        MIN(execution_memory) FILTER (WHERE hit) AS hit_memory,
+        (ARRAY_AGG(execution_time ORDER BY position))[1] AS first_time,
+        (ARRAY_AGG(execution_memory ORDER BY position))[1] AS first_memory,
+        MAX(completion_rate) AS max_completion_rate
+    FROM counted
+    GROUP BY user_id, material_id
+)
+INSERT INTO {table} (
+    user_id, material_id, attempts, hits, points,
+    min_execution_time, min_execution_memory, max_completion_rate
+)
+SELECT
+    grouped.user_id,
+    grouped.material_id,
+    grouped.attempts,
+    grouped.hits,
+    CASE
+        WHEN grouped.first_hit IS NULL THEN io_code.min_points
+        WHEN grouped.first_hit = 0 THEN io_code.max_points
+        ELSE GREATEST(
+            io_code.max_points - io_code.points_penalty * grouped.first_hit,
+            io_code.min_points
+        )
+    END,
+    COALESCE(grouped.hit_time, grouped.first_time, 0),
+    COALESCE(grouped.hit_memory, grouped.first_memory, 0),
+    grouped.max_completion_rate
+FROM grouped
+JOIN {io_code_table} AS io_code ON io_code.material_id_id = grouped.material_id
+""".format(
+    table=IoCodeSubmissionSummary._meta.db_table,
+    submission_table=IoCodeSubmission._meta.db_table,
+    archive_table=ArchivedSubmission._meta.db_table,
+    io_code_table=MaterialIoCode._meta.db_table,
+)
+
+
+# Adds up the summaries of users over the IOC materials of some courses, into
+# the course summaries the course leaderboards are read from.
+COURSE_SUMMARIES_SQL = """
+INSERT INTO {table} AS course_summary (
+    user_id, course_id, points, solved, total_execution_time,
+    total_execution_memory
+)
+SELECT
+    summary.user_id,
+    module.course_id_id,
+    SUM(summary.points),
+    COUNT(*) FILTER (WHERE summary.hits > 0),
+    SUM(summary.min_execution_time),
+    SUM(summary.min_execution_memory)
+FROM {summary_table} AS summary
+JOIN {material_table} AS material ON material.id = summary.material_id
+JOIN {module_table} AS module ON module.id = material.module_id_id
+WHERE module.course_id_id = ANY(%(courses)s)
+    AND (%(user)s::bigint IS NULL OR summary.user_id = %(user)s::bigint)
+GROUP BY summary.user_id, module.course_id_id
+ON CONFLICT (user_id, course_id) DO UPDATE SET
+    points = EXCLUDED.points,
+    solved = EXCLUDED.solved,
+    total_execution_time = EXCLUDED.total_execution_time,
+    total_execution_memory = EXCLUDED.total_execution_memory
+""".format(
+    table=IoCodeCourseSummary._meta.db_table,
+    summary_table=IoCodeSubmissionSummary._meta.db_table,
+    material_table=Material._meta.db_table,
+    module_table=Module._meta.db_table,
+)
+
+# Advisory lock namespace serializing the course summary updates of a user
+COURSE_SUMMARY_LOCK = 0xC5
 
 
 def update_submission_summary(user: User, material: Material, submission: IoCodeSubmission) -> None:
-    """Method that updates the submission summary of a user for a material"""
+    """Method that updates the submission summary of a user for a material
+
+    The summary is upserted with a single statement (see UPSERT_SUMMARY_SQL),
+    then the course summary of the user is added up again from it and the
+    other summaries of the user in the course.
+    """
 
-    summary: IoCodeSubmissionSummary = IoCodeSubmissionSummary.objects.filter(
-        user=user, material=material
-    ).first()
     io_code: MaterialIoCode = material.materialiocode
+    hit = submission.response_char == "A"
 
-    if summary:
-        if submission.response_char == "A" and (not summary.hits):
-            # First hit
-            summary.hits = 1
-            summary.points = (
-                    max(io_code.max_points - (io_code.points_penalty * summary.attempts),
-                        io_code.min_points)
-            )
-            summary.min_execution_time = submission.execution_time
-            summary.min_execution_memory = submission.execution_memory
-            summary.max_completion_rate = 0
-        elif submission.response_char == "A" and summary.hits:
-            # Second or more hit
-            summary.hits += 1
-            summary.min_execution_time = min(
-                summary.min_execution_time, submission.execution_time
-            )
-            summary.min_execution_memory = min(
-                summary.min_execution_memory, submission.execution_memory
-            )
-            summary.max_completion_rate = max(
-                summary.max_completion_rate, 0
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPSERT_SUMMARY_SQL,
+            {
+                "user": user.pk,
+                "material": material.pk,
+                "hit": int(hit),
+                "first_points": io_code.max_points if hit else io_code.min_points,
+                "time": submission.execution_time,
+                "memory": submission.execution_memory,
+                "completion_rate": submission.completion_rate or 0,
+                "max_points": io_code.max_points,
+                "points_penalty": io_code.points_penalty,
+                "min_points": io_code.min_points,
+            },
+        )
+        # Taken after the upsert, so the sum below sees the summaries other
+        # submissions of the user committed meanwhile
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(%s, %s)", [COURSE_SUMMARY_LOCK, user.pk]
+        )
+        cursor.execute(
+            COURSE_SUMMARIES_SQL,
+            {"courses": [material.module_id.course_id_id], "user": user.pk},
+        )
+
+
+def rebuild_submission_summaries(material_ids: list[int]) -> int:
+    """Method that recomputes the submission summaries of some materials
+
+    The old summaries, and the course summaries of their courses, are
+    replaced in one transaction. The summary table is locked against writes
+    meanwhile, so a submission judged during the rebuild is either part of
+    the history read or summarized after it, never both.
+
+    Returns:
+        int: number of summaries written
+    """
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE".format(
+                table=IoCodeSubmissionSummary._meta.db_table
             )
-        summary.attempts += 1
-        summary.save()
-    else:
-        # First attempt
-        summary = IoCodeSubmissionSummary(
-            user=user,
-            material=material,
-            hits=1 if submission.response_char == "A" else 0,
-            points=io_code.max_points
-            if submission.response_char == "A"
-            else io_code.min_points,
-            min_execution_time=submission.execution_time,
-            min_execution_memory=submission.execution_memory,
-            max_completion_rate=0,
         )
-        summary.save()
+        IoCodeSubmissionSummary.objects.filter(material_id__in=material_ids).delete()
+        cursor.execute(REBUILD_SUMMARIES_SQL, {"materials": list(material_ids)})
+        written = cursor.rowcount
 
+        courses = list(
+            Module.objects.filter(material__id__in=material_ids)
+            .values_list("course_id", flat=True)
+            .distinct()
+        )
+        IoCodeCourseSummary.objects.filter(course_id__in=courses).delete()
+        cursor.execute(COURSE_SUMMARIES_SQL, {"courses": courses, "user": None})
+        return written
@@ -0,0 +1,89 @@
+"""Verdict memoization for byte-identical resubmissions.
+
+The verdict of every judged program is kept in ``VerdictMemo`` under the key
+(material, language, sha256(code), cases version). A submission with the same
+key gets the stored verdict copied instead of being sent to the judge. The
+cases version of ``MaterialIoCode`` is bumped whenever its limits or its cases
+change (see ``ioc.signals``), which makes the stored verdicts unreachable.
+"""
+import hashlib
+
+from django.db.models import F
+
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.material_io_code import MaterialIoCode
+from ..models.problem_sync import ProblemSync
+from ..models.verdict_memo import VerdictMemo
+
+# Time limit verdicts depend on the load of the judge and internal errors are
+# not an answer, so they are judged again
+MEMOIZED_VERDICTS = {"A", "W", "M", "R", "O", "C"}
+
+
+def code_hash(code: str) -> str:
+    return hashlib.sha256(code.encode()).hexdigest()
+
+
+def find_verdict(
+    submission: IoCodeSubmission, material_ioc: MaterialIoCode
+) -> VerdictMemo | None:
+    """Stored verdict of an identical submission, if any"""
+    return VerdictMemo.objects.filter(
+        material_id=material_ioc.material_id_id,
+        language=submission.language,
+        code_hash=code_hash(submission.code),
+        cases_version=material_ioc.cases_version,
+    ).first()
+
+
+def copy_verdict(memo: VerdictMemo, submission: IoCodeSubmission) -> None:
+    """Copy a stored verdict into the submission (not saved)"""
+    submission.response_char = memo.response_char
+    submission.execution_time = memo.execution_time
+    submission.execution_memory = memo.execution_memory
+    submission.completion_rate = memo.completion_rate
+    submission.case_results = memo.case_results
+
+
+def remember_verdict(
+    submission: IoCodeSubmission, material_ioc: MaterialIoCode
+) -> None:
+    """Store the verdict of a judged submission
+
+    ``material_ioc`` must be the one read before judging, so a verdict judged
+    while the cases were changing is stored under the old version. Nothing
+    is stored while the judge may not have the current cases.
+    """
+    if submission.response_char not in MEMOIZED_VERDICTS:
+        return
+    if (
+        ProblemSync.objects.filter(material_io_code_id=material_ioc.id)
+        .exclude(status=ProblemSync.DONE)
+        .exists()
+    ):
+        return
+
+    VerdictMemo.objects.bulk_create(
+        [
+            VerdictMemo(
+                material_id=material_ioc.material_id_id,
+                language=submission.language,
+                code_hash=code_hash(submission.code),
+                cases_version=material_ioc.cases_version,
+                response_char=submission.response_char,
+                execution_time=submission.execution_time or 0,
+                execution_memory=submission.execution_memory or 0,
+                completion_rate=submission.completion_rate or 0,
+                case_results=submission.case_results,
+            )
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def invalidate_verdicts(material_ioc_id: int) -> None:
+    """Forget the stored verdicts of a problem after its cases or limits changed"""
+    MaterialIoCode.objects.filter(id=material_ioc_id).update(
+        cases_version=F("cases_version") + 1
+    )
+    VerdictMemo.objects.filter(material__materialiocode__id=material_ioc_id).delete()
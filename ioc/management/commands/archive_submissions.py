@@ -0,0 +1,49 @@
+"""Command that moves the old submissions to the archive"""
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from constants.ioc import ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_SIZE
+from ioc.helpers.archive import archive_batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Move the judged submissions older than some days, with their case "
+        "results, to the archive table with their code compressed. They are "
+        "still returned by their id and counted when summaries are rebuilt."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=ARCHIVE_AFTER_DAYS,
+            help="Archive the submissions older than this many days",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ARCHIVE_BATCH_SIZE,
+            help="Submissions moved per transaction",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < 0 or options["batch_size"] < 1:
+            raise CommandError("The days and the batch size must be positive")
+
+        before = timezone.now() - timedelta(days=options["days"])
+        start = time.perf_counter()
+        archived = 0
+        while moved := archive_batch(before, options["batch_size"]):
+            archived += moved
+            self.stdout.write(f"Archived {archived} submissions")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {archived} submissions sent before {before:%Y-%m-%d} "
+                f"in {time.perf_counter() - start:.1f}s"
+            )
+        )
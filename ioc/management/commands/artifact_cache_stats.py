@@ -0,0 +1,29 @@
+"""Command that shows the counters of the compiled-artifact cache"""
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ioc.helpers.artifact_cache import ArtifactCache
+
+
+class Command(BaseCommand):
+    help = "Show the hit/miss counters and size of the local judge artifact cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the hit/miss counters after showing them",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.IOC_ARTIFACT_CACHE_DIR:
+            raise CommandError("The artifact cache is disabled")
+
+        cache = ArtifactCache(
+            settings.IOC_ARTIFACT_CACHE_DIR, settings.IOC_ARTIFACT_CACHE_MAX_BYTES
+        )
+        self.stdout.write(json.dumps(cache.stats(), indent=2))
+        if options["reset"]:
+            cache.reset_stats()
@@ -0,0 +1,75 @@
+"""Command that compares single and batched judge dispatch against the stub"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from ioc.helpers.judge_client import JudgeClient
+from ioc.helpers.stub_judge import StubJudge
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the throughput of sending submissions to a local stub judge "
+        "one call per submission against batched calls."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--submissions",
+            type=int,
+            default=500,
+            help="Number of submissions to send in each mode",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=20,
+            help="Submissions per call in batched mode",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.02,
+            help="Seconds the stub judge takes to answer a call",
+        )
+
+    def handle(self, *args, **options):
+        count = options["submissions"]
+        batch_size = options["batch_size"]
+        payloads = [
+            {
+                "code": "print('Hello World')",
+                "submission_id": submission_id,
+                "problem_id": "1",
+                "time_limit": 1000,
+                "memory_limit": 1000,
+                "language": "py",
+            }
+            for submission_id in range(count)
+        ]
+
+        with StubJudge(latency=options["latency"]) as stub:
+            client = JudgeClient(
+                judge_url=stub.url("/judge/end"),
+                batch_url=stub.url("/judge/batch"),
+            )
+
+            start = time.perf_counter()
+            for payload in payloads:
+                client.judge(payload)
+            single = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for index in range(0, count, batch_size):
+                client.judge_batch(payloads[index : index + batch_size])
+            batched = time.perf_counter() - start
+
+        self.stdout.write(
+            f"single:  {count} submissions in {single:.2f}s "
+            f"({count / single:.1f}/s)"
+        )
+        self.stdout.write(
+            f"batched: {count} submissions in {batched:.2f}s "
+            f"({count / batched:.1f}/s, batches of {batch_size})"
+        )
+        self.stdout.write(f"speedup: {single / batched:.1f}x")
@@ -0,0 +1,53 @@
+"""Command that builds the similarity index of the accepted submissions"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ioc.helpers.similarity import index_material
+from ioc.models import MaterialIoCode
+
+
+class Command(BaseCommand):
+    help = (
+        "Index again the accepted submissions of some materials, a course or "
+        "everything for the similarity reports. New verdicts are indexed as "
+        "they are judged, this fills the index for older submissions."
+    )
+
+    def add_arguments(self, parser):
+        scope = parser.add_mutually_exclusive_group(required=True)
+        scope.add_argument(
+            "--material",
+            type=int,
+            nargs="+",
+            help="Ids of the materials to index",
+        )
+        scope.add_argument("--course", help="Alias of the course to index")
+        scope.add_argument("--all", action="store_true", help="Index every material")
+
+    def handle(self, *args, **options):
+        io_codes = MaterialIoCode.objects.all()
+        if options["material"]:
+            io_codes = io_codes.filter(material_id__in=options["material"])
+        elif options["course"]:
+            io_codes = io_codes.filter(
+                material_id__module_id__course_id__alias=options["course"]
+            )
+
+        material_ids = list(
+            io_codes.order_by("material_id").values_list("material_id", flat=True)
+        )
+        if not material_ids:
+            raise CommandError("No IOC material matches the given scope")
+
+        start = time.perf_counter()
+        indexed = 0
+        for material_id in material_ids:
+            indexed += index_material(material_id)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {indexed} submissions of {len(material_ids)} materials "
+                f"in {time.perf_counter() - start:.1f}s"
+            )
+        )
@@ -0,0 +1,16 @@
+"""Command that shows the depth and wait times of the judge queue"""
+import json
+
+from django.core.management.base import BaseCommand
+
+from ioc.helpers.judge_scheduler import queue_metrics
+
+
+class Command(BaseCommand):
+    help = (
+        "Show, for every priority class of the judge queue, the pending and "
+        "running tasks and the wait of the recently finished ones."
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write(json.dumps(queue_metrics(), indent=2))
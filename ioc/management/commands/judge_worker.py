@@ -0,0 +1,91 @@
+"""Command that runs a judge worker draining the judge queue"""
+import os
+import signal
+import socket
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from constants.ioc import (
+    JUDGE_BATCH_SIZE,
+    JUDGE_BATCH_WINDOW_SECONDS,
+    JUDGE_WORKER_POLL_SECONDS,
+)
+from ioc.helpers.judge_batch import drain_queue_batched
+from ioc.helpers.judge_queue import drain_queue
+from ioc.helpers.problem_sync import drain_problem_syncs
+
+
+class Command(BaseCommand):
+    help = (
+        "Upload the pending problems and judge the queued code submissions. "
+        "Several workers can run side by side, each task is claimed by "
+        "exactly one of them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the queue and exit instead of waiting for new tasks",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=JUDGE_WORKER_POLL_SECONDS,
+            help="Seconds to wait before polling an empty queue again",
+        )
+        parser.add_argument(
+            "--worker-id",
+            default=f"{socket.gethostname()}:{os.getpid()}",
+            help="Identifier stored in the tasks claimed by this worker",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=JUDGE_BATCH_SIZE,
+            help="Submissions sent to the judge per call (1 disables batching)",
+        )
+        parser.add_argument(
+            "--batch-window",
+            type=float,
+            default=JUDGE_BATCH_WINDOW_SECONDS,
+            help="Seconds to wait for a batch to fill before sending it",
+        )
+
+    def handle(self, *args, **options):
+        self.running = True
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        worker_id = options["worker_id"]
+        batch_size = options["batch_size"]
+        self.stdout.write(f"Judge worker {worker_id} started")
+
+        while self.running:
+            close_old_connections()
+            # Finish the task at hand before checking the stop flag again
+            # Problems first, the submissions to judge may need their cases
+            if drain_problem_syncs(worker_id, max_syncs=1):
+                continue
+            if batch_size > 1:
+                processed = drain_queue_batched(
+                    worker_id,
+                    batch_size,
+                    options["batch_window"],
+                    max_tasks=batch_size,
+                )
+            else:
+                processed = drain_queue(worker_id, max_tasks=1)
+            if processed:
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["poll_interval"])
+
+        self.stdout.write(f"Judge worker {worker_id} stopped")
+
+    def stop(self, signum, frame):
+        """Stop the worker after the task being judged"""
+        self.running = False
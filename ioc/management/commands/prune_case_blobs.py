@@ -0,0 +1,15 @@
+"""Command that deletes the test case blobs no case uses anymore"""
+from django.core.management.base import BaseCommand
+
+from ioc.helpers.case_store import prune_blobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the compressed test case data that no case points at anymore, "
+        "left behind by deleted cases and materials."
+    )
+
+    def handle(self, *args, **options):
+        deleted = prune_blobs()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} unused blobs"))
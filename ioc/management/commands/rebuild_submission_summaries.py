@@ -0,0 +1,66 @@
+"""Command that recomputes the submission summaries from the submission history"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ioc.helpers.submission_summary import rebuild_submission_summaries
+from ioc.models import MaterialIoCode
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the submission summaries of some materials, a course or "
+        "everything from the judged submissions, with the current points of "
+        "each material. Materials are rebuilt in chunks, each one swapped in "
+        "a single transaction."
+    )
+
+    def add_arguments(self, parser):
+        scope = parser.add_mutually_exclusive_group(required=True)
+        scope.add_argument(
+            "--material",
+            type=int,
+            nargs="+",
+            help="Ids of the materials to rebuild",
+        )
+        scope.add_argument("--course", help="Alias of the course to rebuild")
+        scope.add_argument("--all", action="store_true", help="Rebuild every summary")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=200,
+            help="Materials rebuilt per transaction",
+        )
+
+    def handle(self, *args, **options):
+        io_codes = MaterialIoCode.objects.all()
+        if options["material"]:
+            io_codes = io_codes.filter(material_id__in=options["material"])
+        elif options["course"]:
+            io_codes = io_codes.filter(
+                material_id__module_id__course_id__alias=options["course"]
+            )
+
+        material_ids = list(
+            io_codes.order_by("material_id").values_list("material_id", flat=True)
+        )
+        if not material_ids:
+            raise CommandError("No IOC material matches the given scope")
+
+        chunk_size = options["chunk_size"]
+        start = time.perf_counter()
+        written = 0
+        for index in range(0, len(material_ids), chunk_size):
+            chunk = material_ids[index : index + chunk_size]
+            written += rebuild_submission_summaries(chunk)
+            self.stdout.write(
+                f"Rebuilt {min(index + chunk_size, len(material_ids))}"
+                f"/{len(material_ids)} materials"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {written} summaries of {len(material_ids)} materials "
+                f"in {time.perf_counter() - start:.1f}s"
+            )
+        )
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.4 on 2026-10-18 19:29
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ioc', '0007_merge_20231029_1721'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JudgeTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(default='P', max_length=1)),
+                ('attempts', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('claimed_by', models.CharField(blank=True, max_length=100)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('submission', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='judge_task', to='ioc.iocodesubmission')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'available_at'], name='judge_task_claim_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='judgetask',
+            constraint=models.CheckConstraint(check=models.Q(('status__in', {'D', 'P', 'F', 'R'})), name='judge_task_status_check'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.4 on 2026-10-18 19:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0008_materialpdf"),
+        ("ioc", "0008_judgetask"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="materialiocode",
+            name="cases_version",
+            field=models.IntegerField(default=1),
+        ),
+        migrations.CreateModel(
+            name="VerdictMemo",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("language", models.CharField(max_length=10)),
+                ("code_hash", models.CharField(max_length=64)),
+                ("cases_version", models.IntegerField()),
+                ("response_char", models.CharField(max_length=1)),
+                ("execution_time", models.FloatField()),
+                ("execution_memory", models.IntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "material",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="verdict_memos",
+                        to="courses.material",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="verdictmemo",
+            constraint=models.UniqueConstraint(
+                fields=("material", "language", "code_hash", "cases_version"),
+                name="unique_verdict_memo",
+            ),
+        ),
+    ]
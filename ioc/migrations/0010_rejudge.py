@@ -0,0 +1,73 @@
+# Generated by Django 4.2.4 on 2026-10-18 19:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0008_materialpdf"),
+        ("ioc", "0009_verdictmemo"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Rejudge",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("status", models.CharField(default="R", max_length=1)),
+                ("total", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="judgetask",
+            name="priority",
+            field=models.SmallIntegerField(default=1),
+        ),
+        migrations.AddIndex(
+            model_name="judgetask",
+            index=models.Index(
+                condition=models.Q(("status", "P")),
+                fields=["priority", "id"],
+                name="judge_task_priority_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="rejudge",
+            name="material",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="rejudges",
+                to="courses.material",
+            ),
+        ),
+        migrations.AddField(
+            model_name="judgetask",
+            name="rejudge",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="tasks",
+                to="ioc.rejudge",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="rejudge",
+            constraint=models.CheckConstraint(
+                check=models.Q(("status__in", {"C", "R", "D"})),
+                name="rejudge_status_check",
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.4 on 2026-10-18 19:48
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ioc", "0010_rejudge"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="judgetask",
+            name="judge_task_priority_idx",
+        ),
+        migrations.AddField(
+            model_name="judgetask",
+            name="fair_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="judgetask",
+            name="queued_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="materialiocode",
+            name="is_exam",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="judgetask",
+            index=models.Index(
+                condition=models.Q(("status", "P")),
+                fields=["priority", "fair_at", "id"],
+                name="judge_task_priority_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.4 on 2026-10-18 19:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ioc", "0011_judge_priority_classes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="iocodesubmission",
+            name="case_results",
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="materialiocode",
+            name="stop_on_first_failure",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="verdictmemo",
+            name="case_results",
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name="verdictmemo",
+            name="completion_rate",
+            field=models.FloatField(default=0),
+        ),
+    ]
@@ -0,0 +1,137 @@
+# Generated by Django 4.2.4 on 2026-10-18 20:41
+
+import hashlib
+import zlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+CHUNK_SIZE = 500
+
+
+def move_case_data_to_blobs(apps, schema_editor):
+    """Store the text of every case as a shared, compressed blob"""
+    Case = apps.get_model("ioc", "Case")
+    CaseBlob = apps.get_model("ioc", "CaseBlob")
+
+    def digest_of(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    cases = Case.objects.order_by("id").only("id", "input", "output")
+    chunk = []
+    for case in cases.iterator(chunk_size=CHUNK_SIZE):
+        chunk.append(case)
+        if len(chunk) == CHUNK_SIZE:
+            _store_chunk(CaseBlob, Case, chunk, digest_of)
+            chunk = []
+    if chunk:
+        _store_chunk(CaseBlob, Case, chunk, digest_of)
+
+
+def _store_chunk(CaseBlob, Case, chunk, digest_of):
+    blobs = {}
+    for case in chunk:
+        source, expected = case.input.encode(), case.output.encode()
+        case.input_blob_id = digest_of(source)
+        case.output_blob_id = digest_of(expected)
+        blobs[case.input_blob_id] = source
+        blobs[case.output_blob_id] = expected
+    CaseBlob.objects.bulk_create(
+        [
+            CaseBlob(digest=digest, data=zlib.compress(content), size=len(content))
+            for digest, content in blobs.items()
+        ],
+        ignore_conflicts=True,
+    )
+    Case.objects.bulk_update(chunk, ["input_blob", "output_blob"])
+
+
+def restore_case_data(apps, schema_editor):
+    Case = apps.get_model("ioc", "Case")
+    CaseBlob = apps.get_model("ioc", "CaseBlob")
+
+    cases = Case.objects.order_by("id")
+    for case in cases.iterator(chunk_size=CHUNK_SIZE):
+        blobs = CaseBlob.objects.in_bulk([case.input_blob_id, case.output_blob_id])
+        case.input = zlib.decompress(bytes(blobs[case.input_blob_id].data)).decode()
+        case.output = zlib.decompress(bytes(blobs[case.output_blob_id].data)).decode()
+        case.save(update_fields=["input", "output"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ioc", "0012_case_results"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CaseBlob",
+            fields=[
+                (
+                    "digest",
+                    models.CharField(max_length=64, primary_key=True, serialize=False),
+                ),
+                ("data", models.BinaryField()),
+                ("size", models.BigIntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="case",
+            name="input_blob",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="ioc.caseblob",
+            ),
+        ),
+        migrations.AddField(
+            model_name="case",
+            name="output_blob",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="ioc.caseblob",
+            ),
+        ),
+        # A default lets the text columns be added back when unapplied
+        migrations.AlterField(
+            model_name="case",
+            name="input",
+            field=models.TextField(default=""),
+        ),
+        migrations.AlterField(
+            model_name="case",
+            name="output",
+            field=models.TextField(default=""),
+        ),
+        migrations.RunPython(move_case_data_to_blobs, restore_case_data),
+        migrations.RemoveField(
+            model_name="case",
+            name="input",
+        ),
+        migrations.RemoveField(
+            model_name="case",
+            name="output",
+        ),
+        migrations.AlterField(
+            model_name="case",
+            name="input_blob",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="ioc.caseblob",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="case",
+            name="output_blob",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="ioc.caseblob",
+            ),
+        ),
+    ]
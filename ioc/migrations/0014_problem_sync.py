@@ -0,0 +1,93 @@
+# Generated by Django 4.2.4 on 2026-10-18 20:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def record_uploaded_problems(apps, schema_editor):
+    """Problems created so far were uploaded whole with their material"""
+    Case = apps.get_model("ioc", "Case")
+    ProblemSync = apps.get_model("ioc", "ProblemSync")
+
+    manifests = {}
+    cases = Case.objects.order_by("id_case", "id").values_list(
+        "material_io_code_id", "id_case", "input_blob_id", "output_blob_id"
+    )
+    for problem, number, input_digest, output_digest in cases.iterator():
+        manifests.setdefault(problem, {})[str(number)] = [input_digest, output_digest]
+
+    now = django.utils.timezone.now()
+    ProblemSync.objects.bulk_create(
+        [
+            ProblemSync(
+                material_io_code_id=problem,
+                status="D",
+                manifest=manifest,
+                synced_at=now,
+            )
+            for problem, manifest in manifests.items()
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ioc", "0013_case_blobs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProblemSync",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("status", models.CharField(default="P", max_length=1)),
+                ("manifest", models.JSONField(default=dict)),
+                (
+                    "requested_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("attempts", models.IntegerField(default=0)),
+                (
+                    "available_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("claimed_at", models.DateTimeField(blank=True, null=True)),
+                ("claimed_by", models.CharField(blank=True, max_length=100)),
+                ("synced_at", models.DateTimeField(blank=True, null=True)),
+                ("last_error", models.TextField(blank=True)),
+                (
+                    "material_io_code",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="problem_sync",
+                        to="ioc.materialiocode",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["status", "available_at"], name="problem_sync_claim_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="problemsync",
+            constraint=models.CheckConstraint(
+                check=models.Q(("status__in", {"P", "R", "D", "F"})),
+                name="problem_sync_status_check",
+            ),
+        ),
+        migrations.RunPython(record_uploaded_problems, migrations.RunPython.noop),
+    ]
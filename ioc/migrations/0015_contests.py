@@ -0,0 +1,112 @@
+# Generated by Django 4.2.4 on 2026-10-18 20:10
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0008_materialpdf"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("ioc", "0014_problem_sync"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Contest",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                ("start_at", models.DateTimeField()),
+                ("end_at", models.DateTimeField()),
+                ("freeze_at", models.DateTimeField(blank=True, null=True)),
+                ("penalty_minutes", models.IntegerField(default=20)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="contests",
+                        to="courses.course",
+                    ),
+                ),
+                (
+                    "materials",
+                    models.ManyToManyField(
+                        related_name="contests", to="courses.material"
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ContestScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("problems", models.JSONField(default=dict)),
+                ("public_problems", models.JSONField(default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "contest",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="scores",
+                        to="ioc.contest",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="contest_scores",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="contestscore",
+            constraint=models.UniqueConstraint(
+                fields=("contest", "user"), name="unique_contest_score"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="contest",
+            constraint=models.CheckConstraint(
+                check=models.Q(("end_at__gt", models.F("start_at"))),
+                name="contest_window_check",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="contest",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    ("freeze_at__isnull", True),
+                    models.Q(
+                        ("freeze_at__gte", models.F("start_at")),
+                        ("freeze_at__lte", models.F("end_at")),
+                    ),
+                    _connector="OR",
+                ),
+                name="contest_freeze_check",
+            ),
+        ),
+    ]
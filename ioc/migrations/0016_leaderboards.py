@@ -0,0 +1,108 @@
+# Generated by Django 4.2.4 on 2026-10-18 20:13
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def add_up_course_summaries(apps, schema_editor):
+    """Course summaries of the users that already sent submissions"""
+    schema_editor.execute(
+        """
+        INSERT INTO ioc_iocodecoursesummary (
+            user_id, course_id, points, solved, total_execution_time,
+            total_execution_memory
+        )
+        SELECT
+            summary.user_id,
+            module.course_id_id,
+            SUM(summary.points),
+            COUNT(*) FILTER (WHERE summary.hits > 0),
+            SUM(summary.min_execution_time),
+            SUM(summary.min_execution_memory)
+        FROM ioc_iocodesubmissionsummary AS summary
+        JOIN courses_material AS material ON material.id = summary.material_id
+        JOIN courses_module AS module ON module.id = material.module_id_id
+        GROUP BY summary.user_id, module.course_id_id
+        """
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("courses", "0008_materialpdf"),
+        ("ioc", "0015_contests"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IoCodeCourseSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("points", models.IntegerField(default=0)),
+                ("solved", models.IntegerField(default=0)),
+                ("total_execution_time", models.FloatField(default=0)),
+                ("total_execution_memory", models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="iocodesubmissionsummary",
+            index=models.Index(
+                fields=[
+                    "material",
+                    "-points",
+                    "min_execution_time",
+                    "min_execution_memory",
+                    "user",
+                ],
+                name="summary_leaderboard_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="iocodecoursesummary",
+            name="course",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="io_code_summary",
+                to="courses.course",
+            ),
+        ),
+        migrations.AddField(
+            model_name="iocodecoursesummary",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="io_code_course_summary",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="iocodecoursesummary",
+            index=models.Index(
+                fields=[
+                    "course",
+                    "-points",
+                    "total_execution_time",
+                    "total_execution_memory",
+                    "user",
+                ],
+                name="course_summary_leaderboard_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="iocodecoursesummary",
+            constraint=models.UniqueConstraint(
+                fields=("user", "course"), name="unique_io_code_course_summary"
+            ),
+        ),
+        migrations.RunPython(add_up_course_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.4 on 2026-10-18 20:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ioc", "0016_leaderboards"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="iocodesubmission",
+            index=models.Index(
+                fields=["user_id", "material_id", "-submission_date", "-submission_id"],
+                include=(
+                    "response_char",
+                    "execution_time",
+                    "execution_memory",
+                    "completion_rate",
+                    "language",
+                ),
+                name="user_history_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="iocodesubmission",
+            index=models.Index(
+                fields=["material_id", "-submission_date", "-submission_id"],
+                include=(
+                    "user_id",
+                    "response_char",
+                    "execution_time",
+                    "execution_memory",
+                    "completion_rate",
+                    "language",
+                ),
+                name="material_history_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.4 on 2026-10-18 20:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ioc", "0018_similarity_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contest",
+            name="submission_burst",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="contest",
+            name="submissions_per_minute",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="materialiocode",
+            name="submission_burst",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="materialiocode",
+            name="submissions_per_minute",
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.4 on 2026-10-18 20:25
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0008_materialpdf"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("ioc", "0019_submission_rate_limits"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedSubmission",
+            fields=[
+                (
+                    "submission_id",
+                    models.BigIntegerField(primary_key=True, serialize=False),
+                ),
+                ("submission_date", models.DateTimeField()),
+                ("code", models.BinaryField()),
+                ("response_char", models.CharField(blank=True, null=True)),
+                ("execution_time", models.FloatField(blank=True, null=True)),
+                ("execution_memory", models.IntegerField(blank=True, null=True)),
+                ("completion_rate", models.FloatField(blank=True, null=True)),
+                ("case_results", models.BinaryField(blank=True, null=True)),
+                ("language", models.CharField(max_length=10)),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "material",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="courses.material",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.4 on 2026-10-18 21:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ioc", "0020_archived_submissions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="judgetask",
+            name="cases_version",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.4 on 2026-10-18 21:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ioc", "0021_judge_task_cases_version"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="archivedsubmission",
+            index=models.Index(
+                fields=["user", "material", "-submission_date", "-submission_id"],
+                name="archived_user_history_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedsubmission",
+            index=models.Index(
+                fields=["material", "-submission_date", "-submission_id"],
+                name="archived_material_history_idx",
+            ),
+        ),
+    ]
@@ -1,11 +1,33 @@
 from .io_code_submission import IoCodeSubmission
 from .material_io_code import MaterialIoCode
+from .case_blob import CaseBlob
 from .case import Case
 from .io_code_submission_summary import IoCodeSubmissionSummary
+from .io_code_course_summary import IoCodeCourseSummary
+from .rejudge import Rejudge
+from .judge_task import JudgeTask
+from .verdict_memo import VerdictMemo
+from .problem_sync import ProblemSync
+from .contest import Contest
+from .contest_score import ContestScore
+from .similarity_signature import SimilaritySignature
+from .similarity_bucket import SimilarityBucket
+from .archived_submission import ArchivedSubmission
 
 _ = [
     IoCodeSubmission,
     MaterialIoCode,
+    CaseBlob,
     Case,
-    IoCodeSubmissionSummary
+    IoCodeSubmissionSummary,
+    IoCodeCourseSummary,
+    Rejudge,
+    JudgeTask,
+    VerdictMemo,
+    ProblemSync,
+    Contest,
+    ContestScore,
+    SimilaritySignature,
+    SimilarityBucket,
+    ArchivedSubmission,
 ]
@@ -0,0 +1,68 @@
+"""Module for the ArchivedSubmission model."""
+import zlib
+
+from django.db import models
+
+from accounts.models.user import User
+from courses.models.material import Material
+from .io_code_submission import IoCodeSubmission
+
+
+class ArchivedSubmission(models.Model):
+    """Class that defines the model for the ArchivedSubmission table, which
+    keeps the old submissions moved out of the IoCodeSubmission table, with
+    their code compressed (see helpers.archive)."""
+
+    # Id the submission had, and keeps answering to
+    submission_id = models.BigIntegerField(primary_key=True)
+    material = models.ForeignKey(Material, on_delete=models.CASCADE)
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    submission_date = models.DateTimeField()
+    code = models.BinaryField()  # zlib-compressed
+    response_char = models.CharField(blank=True, null=True)
+    execution_time = models.FloatField(blank=True, null=True)
+    execution_memory = models.IntegerField(blank=True, null=True)
+    completion_rate = models.FloatField(blank=True, null=True)
+    case_results = models.BinaryField(blank=True, null=True)
+    language = models.CharField(max_length=10)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Class that adds indexes to the model."""
+
+        # History order, like the indexes of IoCodeSubmission
+        indexes = [
+            models.Index(
+                fields=["user", "material", "-submission_date", "-submission_id"],
+                name="archived_user_history_idx",
+            ),
+            models.Index(
+                fields=["material", "-submission_date", "-submission_id"],
+                name="archived_material_history_idx",
+            ),
+        ]
+
+    def to_submission(self) -> IoCodeSubmission:
+        """Method that returns the submission as it was before archiving it,
+        not saved. The code is left empty if it was not read."""
+        if "code" in self.get_deferred_fields():
+            code = ""
+        else:
+            code = zlib.decompress(bytes(self.code)).decode()
+        return IoCodeSubmission(
+            submission_id=self.submission_id,
+            material_id_id=self.material_id,
+            user_id_id=self.user_id,
+            submission_date=self.submission_date,
+            code=code,
+            response_char=self.response_char,
+            execution_time=self.execution_time,
+            execution_memory=self.execution_memory,
+            completion_rate=self.completion_rate,
+            case_results=self.case_results,
+            language=self.language,
+        )
+
+    def __str__(self) -> str:
+        """Method that returns a string representation of the model."""
+        return f"{self.submission_id}"
@@ -1,6 +1,7 @@
 """Module for the Case model"""
 
 from django.db import models
+from .case_blob import CaseBlob
 from .material_io_code import MaterialIoCode
 
 
@@ -16,8 +17,19 @@ class Case(models.Model):
         editable=False,
     )
     id_case = models.IntegerField(null=True)
-    input = models.TextField()
-    output = models.TextField()
+    # Content stored once per distinct data (see helpers.case_store)
+    input_blob = models.ForeignKey(CaseBlob, on_delete=models.PROTECT, related_name="+")
+    output_blob = models.ForeignKey(
+        CaseBlob, on_delete=models.PROTECT, related_name="+"
+    )
     material_io_code_id = models.ForeignKey(
         MaterialIoCode, on_delete=models.CASCADE, blank=False
     )
+
+    @property
+    def input(self) -> str:
+        return self.input_blob.content().decode()
+
+    @property
+    def output(self) -> str:
+        return self.output_blob.content().decode()
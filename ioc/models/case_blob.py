@@ -0,0 +1,24 @@
+"""Module for the CaseBlob model."""
+import zlib
+
+from django.db import models
+
+
+class CaseBlob(models.Model):
+    """Class that defines the model for the CaseBlob table, which keeps the
+    compressed content of test case inputs and outputs. Blobs are addressed by
+    the hash of their content, so identical data is stored once whatever the
+    number of cases and materials using it."""
+
+    digest = models.CharField(max_length=64, primary_key=True)  # sha256
+    data = models.BinaryField()  # zlib-compressed content
+    size = models.BigIntegerField()  # Bytes of the uncompressed content
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def content(self) -> bytes:
+        """Method that returns the uncompressed content of the blob."""
+        return zlib.decompress(bytes(self.data))
+
+    def __str__(self) -> str:
+        """Method that returns a string representation of the model."""
+        return self.digest
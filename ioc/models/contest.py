@@ -0,0 +1,56 @@
+"""Module for the Contest model."""
+from django.db import models
+
+from courses.models.course import Course
+from courses.models.material import Material
+
+
+class Contest(models.Model):
+    """Class that defines the model for the Contest table, which is a time
+    window over a set of IOC materials with its own scoreboard."""
+
+    id = models.BigAutoField(
+        auto_created=True,
+        primary_key=True,
+        serialize=False,
+        verbose_name="ID",
+        editable=False,
+    )
+    course = models.ForeignKey(
+        Course, on_delete=models.CASCADE, related_name="contests"
+    )
+    name = models.CharField(max_length=100)
+    materials = models.ManyToManyField(Material, related_name="contests")
+    start_at = models.DateTimeField()
+    end_at = models.DateTimeField()
+    # The scoreboard stops showing new results from here until the end
+    freeze_at = models.DateTimeField(null=True, blank=True)
+    # Penalty time added per rejected attempt of a solved problem
+    penalty_minutes = models.IntegerField(default=20)
+    # Submissions of each participant to the contest problems, per minute
+    # and at once (see helpers.rate_limit), None for the defaults
+    submissions_per_minute = models.FloatField(null=True, blank=True)
+    submission_burst = models.IntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Class that adds constraints to the model."""
+
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(end_at__gt=models.F("start_at")),
+                name="contest_window_check",
+            ),
+            models.CheckConstraint(
+                check=models.Q(freeze_at__isnull=True)
+                | models.Q(
+                    freeze_at__gte=models.F("start_at"),
+                    freeze_at__lte=models.F("end_at"),
+                ),
+                name="contest_freeze_check",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Method that returns a string representation of the model."""
+        return f"Contest {self.name} of {self.course_id}"
@@ -0,0 +1,42 @@
+"""Module for the ContestScore model."""
+from django.db import models
+
+from accounts.models.user import User
+from .contest import Contest
+
+
+class ContestScore(models.Model):
+    """Class that defines the model for the ContestScore table, which holds
+    the result of a participant on every problem of a contest."""
+
+    id = models.BigAutoField(
+        auto_created=True,
+        primary_key=True,
+        serialize=False,
+        verbose_name="ID",
+        editable=False,
+    )
+    contest = models.ForeignKey(
+        Contest, on_delete=models.CASCADE, related_name="scores"
+    )
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="contest_scores"
+    )
+    # Attempts, solve minute and points by material id (see helpers.scoreboard)
+    problems = models.JSONField(default=dict)
+    # The same results as shown while the scoreboard is frozen
+    public_problems = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Class that adds a constraint to the model."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["contest", "user"], name="unique_contest_score"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Method that returns a string representation of the model."""
+        return f"Score of {self.user_id} in contest {self.contest_id}"
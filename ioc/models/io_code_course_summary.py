@@ -0,0 +1,45 @@
+from django.db import models
+
+from courses.models.course import Course
+from accounts.models.user import User
+
+
+class IoCodeCourseSummary(models.Model):
+    """Class that defines the model for the IoCodeCourseSummary table, which
+    adds up the submission summaries of a user over the IOC materials of a
+    course, to rank the users of the course (see helpers.leaderboard)."""
+
+    course = models.ForeignKey(
+        Course, on_delete=models.CASCADE, related_name="io_code_summary"
+    )
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="io_code_course_summary"
+    )
+    points = models.IntegerField(default=0)
+    solved = models.IntegerField(default=0)
+    total_execution_time = models.FloatField(default=0)
+    total_execution_memory = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "course"],
+                name="unique_io_code_course_summary",
+            ),
+        ]
+        indexes = [
+            # Leaderboard order, so pages and ranks are read from the index
+            models.Index(
+                fields=[
+                    "course",
+                    "-points",
+                    "total_execution_time",
+                    "total_execution_memory",
+                    "user",
+                ],
+                name="course_summary_leaderboard_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user} in the course {self.course}"
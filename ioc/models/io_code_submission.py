@@ -3,6 +3,14 @@ from django.db import models
 from courses.models.material import Material
 from accounts.models.user import User
 
+HISTORY_COLUMNS = (
+    "response_char",
+    "execution_time",
+    "execution_memory",
+    "completion_rate",
+    "language",
+)
+
 
 class IoCodeSubmission(models.Model):
     """Class that defines the model for the IO Code Submission table,
@@ -24,6 +32,8 @@ class IoCodeSubmission(models.Model):
     execution_time = models.FloatField(blank=True, null=True)
     execution_memory = models.IntegerField(blank=True, null=True)
     completion_rate = models.FloatField(blank=True, null=True)
+    # Verdict, time and memory of every case run (see helpers.case_results)
+    case_results = models.BinaryField(blank=True, null=True)
     language = models.CharField(max_length=10, blank=False)
 
     class Meta:
@@ -38,6 +48,20 @@ class IoCodeSubmission(models.Model):
                 name="char_check",
             )
         ]
+        # History order, holding the verdict columns so pages without the
+        # code are read from the index alone (see helpers.submission_history)
+        indexes = [
+            models.Index(
+                fields=["user_id", "material_id", "-submission_date", "-submission_id"],
+                include=HISTORY_COLUMNS,
+                name="user_history_idx",
+            ),
+            models.Index(
+                fields=["material_id", "-submission_date", "-submission_id"],
+                include=("user_id",) + HISTORY_COLUMNS,
+                name="material_history_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         """Method that returns a string representation of the model."""
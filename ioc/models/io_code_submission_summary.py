@@ -27,6 +27,19 @@ class IoCodeSubmissionSummary(models.Model):
                 name="unique_io_code_submission_summary",
             ),
         ]
+        indexes = [
+            # Leaderboard order, so pages and ranks are read from the index
+            models.Index(
+                fields=[
+                    "material",
+                    "-points",
+                    "min_execution_time",
+                    "min_execution_memory",
+                    "user",
+                ],
+                name="summary_leaderboard_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user} has sent this code material: {self.material}"
@@ -0,0 +1,86 @@
+"""Module for the JudgeTask model."""
+from django.db import models
+from django.utils import timezone
+
+from .io_code_submission import IoCodeSubmission
+from .rejudge import Rejudge
+
+
+class JudgeTask(models.Model):
+    """Class that defines the model for the JudgeTask table, which is the
+    durable queue of submissions waiting to be judged by a judge worker."""
+
+    PENDING = "P"
+    RUNNING = "R"
+    DONE = "D"
+    FAILED = "F"
+
+    # Priority classes, lower priorities are judged first
+    PRIORITY_EXAM = 0
+    PRIORITY_PRACTICE = 1
+    PRIORITY_REJUDGE = 2
+    PRIORITY_CLASSES = {
+        PRIORITY_EXAM: "exam",
+        PRIORITY_PRACTICE: "practice",
+        PRIORITY_REJUDGE: "rejudge",
+    }
+
+    id = models.BigAutoField(
+        auto_created=True,
+        primary_key=True,
+        serialize=False,
+        verbose_name="ID",
+        editable=False,
+    )
+    submission = models.OneToOneField(
+        IoCodeSubmission, on_delete=models.CASCADE, related_name="judge_task"
+    )
+    status = models.CharField(max_length=1, default=PENDING)
+    priority = models.SmallIntegerField(default=PRIORITY_PRACTICE)
+    # Entered the queue (again, for a rejudge), to measure the wait
+    queued_at = models.DateTimeField(default=timezone.now)
+    # Fair-share order among the tasks of the same priority (see judge_scheduler)
+    fair_at = models.DateTimeField(default=timezone.now)
+    rejudge = models.ForeignKey(
+        Rejudge,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="tasks",
+    )
+    attempts = models.IntegerField(default=0)
+    # Cases version of the problem when the task was claimed, a verdict given
+    # under an older version is not stored (see judge_queue.complete_task)
+    cases_version = models.IntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    available_at = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    claimed_by = models.CharField(max_length=100, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        """Class that adds constraints and indexes to the model."""
+
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(status__in={"P", "R", "D", "F"}),
+                name="judge_task_status_check",
+            )
+        ]
+        indexes = [
+            # Workers only look for pending or expired running tasks
+            models.Index(
+                fields=["status", "available_at"], name="judge_task_claim_idx"
+            ),
+            # Pending tasks are claimed by priority, then fair share
+            models.Index(
+                fields=["priority", "fair_at", "id"],
+                name="judge_task_priority_idx",
+                condition=models.Q(status="P"),
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Method that returns a string representation of the model."""
+        return f"Judge task {self.id} ({self.status}) for {self.submission_id}"
@@ -18,6 +18,16 @@ class MaterialIoCode(models.Model):
     max_points = models.IntegerField(blank=False, null=False, default=0)
     min_points = models.IntegerField(blank=False, null=False, default=0)
     points_penalty = models.IntegerField(blank=False, null=False, default=0)
+    # Bumped whenever the cases or the limits change (see ioc.signals)
+    cases_version = models.IntegerField(blank=False, null=False, default=1)
+    # Submissions of exams are judged before practice ones
+    is_exam = models.BooleanField(blank=False, null=False, default=False)
+    # Stop judging a submission at its first failed case
+    stop_on_first_failure = models.BooleanField(blank=False, null=False, default=False)
+    # Submissions to the material by all users, per minute and at once
+    # (see helpers.rate_limit), None for the defaults
+    submissions_per_minute = models.FloatField(blank=True, null=True)
+    submission_burst = models.IntegerField(blank=True, null=True)
 
     def __str__(self):
         return f"{self.id}"
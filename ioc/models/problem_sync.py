@@ -0,0 +1,57 @@
+"""Module for the ProblemSync model."""
+from django.db import models
+from django.utils import timezone
+
+from .material_io_code import MaterialIoCode
+
+
+class ProblemSync(models.Model):
+    """Class that defines the model for the ProblemSync table, which tracks
+    the cases of a problem the judge server already has and the pending
+    upload of the ones it is missing."""
+
+    PENDING = "P"
+    RUNNING = "R"
+    DONE = "D"
+    FAILED = "F"
+
+    id = models.BigAutoField(
+        auto_created=True,
+        primary_key=True,
+        serialize=False,
+        verbose_name="ID",
+        editable=False,
+    )
+    material_io_code = models.OneToOneField(
+        MaterialIoCode, on_delete=models.CASCADE, related_name="problem_sync"
+    )
+    status = models.CharField(max_length=1, default=PENDING)
+    # Digests of the input and output of every case the judge has, by number
+    manifest = models.JSONField(default=dict)
+    # Cases changed at this time, a sync claimed before must run again
+    requested_at = models.DateTimeField(default=timezone.now)
+    attempts = models.IntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    claimed_by = models.CharField(max_length=100, blank=True)
+    synced_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        """Class that adds constraints and indexes to the model."""
+
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(status__in={"P", "R", "D", "F"}),
+                name="problem_sync_status_check",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["status", "available_at"], name="problem_sync_claim_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Method that returns a string representation of the model."""
+        return f"Problem sync {self.id} ({self.status}) of {self.material_io_code_id}"
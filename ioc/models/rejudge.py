@@ -0,0 +1,43 @@
+"""Module for the Rejudge model."""
+from django.db import models
+
+from courses.models.material import Material
+
+
+class Rejudge(models.Model):
+    """Class that defines the model for the Rejudge table, which tracks the
+    re-evaluation of every submission of a material after its limits or
+    cases changed."""
+
+    RUNNING = "R"
+    DONE = "D"
+    CANCELLED = "C"  # Replaced by a newer rejudge of the same material
+
+    id = models.BigAutoField(
+        auto_created=True,
+        primary_key=True,
+        serialize=False,
+        verbose_name="ID",
+        editable=False,
+    )
+    material = models.ForeignKey(
+        Material, on_delete=models.CASCADE, related_name="rejudges"
+    )
+    status = models.CharField(max_length=1, default=RUNNING)
+    total = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        """Class that adds a constraint to the model."""
+
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(status__in={"R", "D", "C"}),
+                name="rejudge_status_check",
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Method that returns a string representation of the model."""
+        return f"Rejudge {self.id} ({self.status}) of {self.material_id}"
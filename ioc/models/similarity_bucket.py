@@ -0,0 +1,32 @@
+"""Module for the SimilarityBucket model."""
+from django.db import models
+
+from accounts.models.user import User
+from courses.models.material import Material
+from .similarity_signature import SimilaritySignature
+
+
+class SimilarityBucket(models.Model):
+    """Class that defines the model for the SimilarityBucket table, which
+    keeps the bucket of every band of a signature. Submissions sharing a
+    bucket in any band of a material are the candidate similar pairs."""
+
+    signature = models.ForeignKey(
+        SimilaritySignature, on_delete=models.CASCADE, related_name="buckets"
+    )
+    # Material and user of the signature, so pairs are found on this table
+    material = models.ForeignKey(Material, on_delete=models.CASCADE)
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    band = models.SmallIntegerField()
+    bucket = models.BigIntegerField()  # Hash of the rows of the band
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["material", "band", "bucket"], name="similarity_bucket_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Method that returns a string representation of the model."""
+        return f"Band {self.band} of {self.signature_id}"
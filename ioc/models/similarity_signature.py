@@ -0,0 +1,26 @@
+"""Module for the SimilaritySignature model."""
+from django.db import models
+
+from accounts.models.user import User
+from courses.models.material import Material
+from .io_code_submission import IoCodeSubmission
+
+
+class SimilaritySignature(models.Model):
+    """Class that defines the model for the SimilaritySignature table, which
+    keeps the MinHash signature of the code of every accepted submission
+    (see helpers.similarity)."""
+
+    submission = models.OneToOneField(
+        IoCodeSubmission,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="similarity_signature",
+    )
+    material = models.ForeignKey(Material, on_delete=models.CASCADE)
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    signature = models.BinaryField()  # Packed unsigned 32 bit minimums
+
+    def __str__(self) -> str:
+        """Method that returns a string representation of the model."""
+        return f"Signature of {self.submission_id}"
@@ -0,0 +1,44 @@
+"""Module for the VerdictMemo model."""
+from django.db import models
+
+from courses.models.material import Material
+
+
+class VerdictMemo(models.Model):
+    """Class that defines the model for the VerdictMemo table, which keeps the
+    verdict of every distinct program judged for a material, so byte-identical
+    resubmissions are answered without calling the judge."""
+
+    id = models.BigAutoField(
+        auto_created=True,
+        primary_key=True,
+        serialize=False,
+        verbose_name="ID",
+        editable=False,
+    )
+    material = models.ForeignKey(
+        Material, on_delete=models.CASCADE, related_name="verdict_memos"
+    )
+    language = models.CharField(max_length=10)
+    code_hash = models.CharField(max_length=64)  # sha256 of the code
+    cases_version = models.IntegerField()
+    response_char = models.CharField(max_length=1)
+    execution_time = models.FloatField()
+    execution_memory = models.IntegerField()
+    completion_rate = models.FloatField(default=0)
+    case_results = models.BinaryField(null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Class that adds a constraint to the model."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["material", "language", "code_hash", "cases_version"],
+                name="unique_verdict_memo",
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Method that returns a string representation of the model."""
+        return f"{self.response_char} for {self.code_hash[:12]} on {self.material_id}"
@@ -0,0 +1,88 @@
+import coreapi
+import coreschema
+from rest_framework.schemas import AutoSchema
+
+create_contest_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "course",
+            required=True,
+            location="form",
+            type="integer",
+            schema=coreschema.Integer(description="Course's id of the contest"),
+        ),
+        coreapi.Field(
+            "name",
+            required=True,
+            location="form",
+            type="string",
+            schema=coreschema.String(description="Name of the contest"),
+        ),
+        coreapi.Field(
+            "materials",
+            required=True,
+            location="form",
+            type="array",
+            schema=coreschema.Array(
+                items=coreschema.Integer(),
+                description="Ids of the IOC materials of the contest",
+            ),
+        ),
+        coreapi.Field(
+            "start_at",
+            required=True,
+            location="form",
+            type="string",
+            schema=coreschema.String(description="Start of the contest"),
+        ),
+        coreapi.Field(
+            "end_at",
+            required=True,
+            location="form",
+            type="string",
+            schema=coreschema.String(description="End of the contest"),
+        ),
+        coreapi.Field(
+            "freeze_at",
+            required=False,
+            location="form",
+            type="string",
+            schema=coreschema.String(
+                description="The scoreboard stops changing from here until the end"
+            ),
+        ),
+        coreapi.Field(
+            "penalty_minutes",
+            required=False,
+            location="form",
+            type="integer",
+            schema=coreschema.Integer(
+                description="Penalty minutes per rejected attempt of a solved problem"
+            ),
+        ),
+    ]
+)
+
+get_contest_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "contest_id",
+            required=True,
+            location="path",
+            type="integer",
+            schema=coreschema.Integer(description="Contest's id to get"),
+        ),
+    ]
+)
+
+get_contest_scoreboard_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "contest_id",
+            required=True,
+            location="path",
+            type="integer",
+            schema=coreschema.Integer(description="Contest's id to get its scoreboard"),
+        ),
+    ]
+)
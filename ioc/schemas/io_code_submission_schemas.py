@@ -2,6 +2,30 @@ import coreapi
 import coreschema
 from rest_framework.schemas import AutoSchema
 
+history_fields = [
+    coreapi.Field(
+        "cursor",
+        required=False,
+        location="query",
+        type="string",
+        schema=coreschema.String(description="Cursor of the page, given with the previous page"),
+    ),
+    coreapi.Field(
+        "limit",
+        required=False,
+        location="query",
+        type="integer",
+        schema=coreschema.Integer(description="Submissions in the page"),
+    ),
+    coreapi.Field(
+        "with_code",
+        required=False,
+        location="query",
+        type="boolean",
+        schema=coreschema.Boolean(description="Whether the code of the submissions is returned"),
+    ),
+]
+
 get_io_code_all_submission_user_schema = AutoSchema(
     manual_fields=[
         coreapi.Field(
@@ -19,4 +43,18 @@ get_io_code_all_submission_user_schema = AutoSchema(
             schema=coreschema.Integer(description="Material's id to get its submissions"),
         ),
     ]
-)
\ No newline at end of file
+    + history_fields
+)
+
+get_io_code_all_submission_material_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "material_id",
+            required=True,
+            location="path",
+            type="integer",
+            schema=coreschema.Integer(description="Material's id to get its submissions"),
+        ),
+    ]
+    + history_fields
+)
@@ -0,0 +1,89 @@
+import coreapi
+import coreschema
+from rest_framework.schemas import AutoSchema
+
+get_material_leaderboard_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "material_id",
+            required=True,
+            location="path",
+            type="integer",
+            schema=coreschema.Integer(
+                description="Material's id to get its leaderboard"
+            ),
+        ),
+        coreapi.Field(
+            "cursor",
+            required=False,
+            location="query",
+            type="string",
+            schema=coreschema.String(
+                description="Cursor of the page, given with the previous page"
+            ),
+        ),
+        coreapi.Field(
+            "limit",
+            required=False,
+            location="query",
+            type="integer",
+            schema=coreschema.Integer(description="Users in the page"),
+        ),
+    ]
+)
+
+get_my_material_rank_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "material_id",
+            required=True,
+            location="path",
+            type="integer",
+            schema=coreschema.Integer(
+                description="Material's id to get the rank of the user in"
+            ),
+        ),
+    ]
+)
+
+get_course_leaderboard_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "course_id",
+            required=True,
+            location="path",
+            type="integer",
+            schema=coreschema.Integer(description="Course's id to get its leaderboard"),
+        ),
+        coreapi.Field(
+            "cursor",
+            required=False,
+            location="query",
+            type="string",
+            schema=coreschema.String(
+                description="Cursor of the page, given with the previous page"
+            ),
+        ),
+        coreapi.Field(
+            "limit",
+            required=False,
+            location="query",
+            type="integer",
+            schema=coreschema.Integer(description="Users in the page"),
+        ),
+    ]
+)
+
+get_my_course_rank_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "course_id",
+            required=True,
+            location="path",
+            type="integer",
+            schema=coreschema.Integer(
+                description="Course's id to get the rank of the user in"
+            ),
+        ),
+    ]
+)
@@ -0,0 +1,31 @@
+import coreapi
+import coreschema
+from rest_framework.schemas import AutoSchema
+
+create_rejudge_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "material_id",
+            required=True,
+            location="path",
+            type="integer",
+            schema=coreschema.Integer(
+                description="Material's id whose submissions are judged again"
+            ),
+        ),
+    ]
+)
+
+get_rejudge_progress_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "material_id",
+            required=True,
+            location="path",
+            type="integer",
+            schema=coreschema.Integer(
+                description="Material's id to get the progress of its last rejudge"
+            ),
+        ),
+    ]
+)
@@ -0,0 +1,24 @@
+import coreapi
+import coreschema
+from rest_framework.schemas import AutoSchema
+
+get_similarity_report_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            "material_id",
+            required=True,
+            location="path",
+            type="integer",
+            schema=coreschema.Integer(description="Material's id to get its report"),
+        ),
+        coreapi.Field(
+            "threshold",
+            required=False,
+            location="query",
+            type="number",
+            schema=coreschema.Number(
+                description="Least estimated similarity of the pairs reported"
+            ),
+        ),
+    ]
+)
@@ -1,18 +1,27 @@
 """Module for case serializer"""
 from rest_framework import serializers
 
+from ..helpers.case_store import create_cases
 from ..models.case import Case
 
 
 class CaseSerializer(serializers.ModelSerializer):
     """Class that defines the serializer for the Case model"""
 
+    input = serializers.CharField(allow_blank=True, trim_whitespace=False)
+    output = serializers.CharField(allow_blank=True, trim_whitespace=False)
+
     class Meta:
         model = Case
-        fields = "__all__"
+        fields = ("id", "id_case", "input", "output", "material_io_code_id")
 
     def create(self, validated_data):
-        """Method that creates a case"""
-        case = Case(**validated_data)
-        case.save()
+        """Method that creates a case, its data stored in shared blobs"""
+        id_case = validated_data.get("id_case")
+        [case] = create_cases(
+            validated_data["material_io_code_id"].id,
+            [validated_data["input"]],
+            [validated_data["output"]],
+            id_cases=None if id_case is None else [id_case],
+        )
         return case
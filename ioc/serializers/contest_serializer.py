@@ -0,0 +1,42 @@
+"""Module for contest serializer"""
+from rest_framework import serializers
+
+from ..models.contest import Contest
+
+
+class ContestSerializer(serializers.ModelSerializer):
+    """Class that defines the serializer for the Contest model"""
+
+    class Meta:
+        model = Contest
+        fields = "__all__"
+
+    def validate(self, data):
+        """
+        Verify the window of the contest and that its materials are IOC
+        materials of its course.
+        """
+        if data["end_at"] <= data["start_at"]:
+            raise serializers.ValidationError(
+                {"end_at": "The contest must end after it starts"}
+            )
+
+        freeze_at = data.get("freeze_at")
+        if freeze_at is not None and not (
+            data["start_at"] <= freeze_at <= data["end_at"]
+        ):
+            raise serializers.ValidationError(
+                {"freeze_at": "The scoreboard must freeze during the contest"}
+            )
+
+        for material in data["materials"]:
+            if material.material_type != "IOC":
+                raise serializers.ValidationError(
+                    {"materials": f"The material {material.id} is not an IOC material"}
+                )
+            if material.module_id.course_id_id != data["course"].id:
+                raise serializers.ValidationError(
+                    {"materials": f"The material {material.id} is not in the course"}
+                )
+
+        return data
@@ -1,30 +1,11 @@
 """Module for serializing IoCodeSubmission model"""
 
-import json
-import requests
+from django.db import transaction
 from rest_framework import serializers
 
-from constants.ioc import URL_JUDGE
-
 from ..models.io_code_submission import IoCodeSubmission
-from ..models.material_io_code import MaterialIoCode
-
-
-def judge(codesubmission, material_ioc):
-    """Method that sends a request to the judge to evaluate the code submission"""
-
-    data = {
-        "code": codesubmission.code,
-        "submission_id": codesubmission.submission_id,
-        "problem_id": str(codesubmission.material_id.id),
-        "time_limit": material_ioc.max_time,
-        "memory_limit": material_ioc.max_memory,
-        "language": codesubmission.language,
-    }
-    headers = {"Content-Type": "application/json"}
-    response = requests.post(URL_JUDGE, data=json.dumps(data), headers=headers)
-
-    return response.json(), response.status_code
+from ..helpers.case_results import unpack_case_results
+from ..helpers.judge_queue import enqueue_submission
 
 
 class IoCodeSubmissionSerializer(serializers.ModelSerializer):
@@ -36,48 +17,42 @@ class IoCodeSubmissionSerializer(serializers.ModelSerializer):
 
         model = IoCodeSubmission
         fields = "__all__"
+        # The verdict is written by the judge worker, never by the client
+        read_only_fields = (
+            "response_char",
+            "execution_time",
+            "execution_memory",
+            "completion_rate",
+            "case_results",
+        )
 
     def create(self, validated_data) -> IoCodeSubmission:
         """Method that creates a new IoCodeSubmission
-        instance whit the validated data"""
-
-        codesubmission = IoCodeSubmission(**validated_data)
-        codesubmission.save()
-        material_ioc = MaterialIoCode.objects.filter(
-            material_id=codesubmission.material_id.id
-        ).first()
+        instance whit the validated data and queues it for judging"""
 
-        response, status_code = judge(codesubmission, material_ioc)
-
-        if status_code == 201:
-            if (
-                response["verdict"]
-                == "Judge execution: code compilation or problem_id don't exist."
-            ):
-                codesubmission.response_char = "C"
-                codesubmission.execution_memory = 0
-                codesubmission.execution_time = 0
-                codesubmission.save()
-            else:
-                codesubmission.response_char = response["verdict"]["verdict"][0]
-                codesubmission.execution_memory = response["max_memory"]
-                codesubmission.execution_time = response["max_time"]
-                codesubmission.save()
+        with transaction.atomic():
+            codesubmission = IoCodeSubmission(**validated_data)
+            codesubmission.save()
+            enqueue_submission(codesubmission)
 
         return codesubmission
 
     def to_representation(self, instance):
         """Method that returns a representation of the model"""
         return {
+            "submission_id": instance.submission_id,
             "verdict": instance.response_char,
             "execution_time": instance.execution_time,
             "execution_memory": instance.execution_memory,
+            "completion_rate": instance.completion_rate,
+            "cases": unpack_case_results(instance.case_results),
         }
 
 
 class IoCodeSubmissionUserSerializer(serializers.ModelSerializer):
     """Class that serializes the IoCodeSubmission
-    model for get all submissions by user"""
+    model for get all submissions by user, with the code
+    only if the ``with_code`` context is set"""
 
     class Meta:
         """Class that defines the metadata for the serializer,
@@ -88,10 +63,16 @@ class IoCodeSubmissionUserSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         """Method that returns a representation of the model"""
-        return {
+        representation = {
+            "submission_id": instance.submission_id,
+            "user_id": instance.user_id_id,
+            "submission_date": instance.submission_date,
             "verdict": instance.response_char,
             "execution_time": instance.execution_time,
             "execution_memory": instance.execution_memory,
-            "code": instance.code,
+            "completion_rate": instance.completion_rate,
             "language": instance.language,
         }
+        if self.context.get("with_code"):
+            representation["code"] = instance.code
+        return representation
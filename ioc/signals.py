@@ -0,0 +1,82 @@
+"""Signal receivers of the ioc app"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from courses.helpers.content_cache import content_changed, material_course
+from .helpers.problem_sync import request_sync
+from .helpers.scoreboard import forget_scoreboard
+from .helpers.submission_events import publish_submission
+from .helpers.verdict_cache import invalidate_verdicts
+from .models.case import Case
+from .models.contest import Contest
+from .models.io_code_submission import IoCodeSubmission
+from .models.material_io_code import MaterialIoCode
+
+# Settings of a material the verdicts of its submissions depend on
+JUDGE_SETTINGS = ("max_time", "max_memory", "stop_on_first_failure")
+STATUS_FIELDS = {"response_char", "execution_time", "execution_memory"}
+
+
+@receiver(pre_save, sender=MaterialIoCode)
+def detect_settings_change(sender, instance: MaterialIoCode, **kwargs) -> None:
+    """Remember whether the save changes the settings the verdicts depend on"""
+    previous = (
+        MaterialIoCode.objects.filter(id=instance.id).values(*JUDGE_SETTINGS).first()
+        if instance.id
+        else None
+    )
+    instance._judge_settings_changed = previous is not None and any(
+        previous[field]
+        != sender._meta.get_field(field).to_python(getattr(instance, field))
+        for field in JUDGE_SETTINGS
+    )
+
+
+@receiver(post_save, sender=MaterialIoCode)
+def invalidate_on_settings_change(sender, instance: MaterialIoCode, **kwargs) -> None:
+    if getattr(instance, "_judge_settings_changed", False):
+        invalidate_verdicts(instance.id)
+        instance.refresh_from_db(fields=["cases_version"])
+
+
+@receiver(post_save, sender=MaterialIoCode)
+@receiver(post_delete, sender=MaterialIoCode)
+def material_io_code_changed(sender, instance: MaterialIoCode, **kwargs) -> None:
+    content_changed(material_course(instance.material_id_id))
+
+
+@receiver(post_save, sender=Case)
+@receiver(post_delete, sender=Case)
+def invalidate_on_case_change(sender, instance: Case, **kwargs) -> None:
+    invalidate_verdicts(instance.material_io_code_id_id)
+
+
+@receiver(post_save, sender=Case)
+def sync_on_case_save(sender, instance: Case, **kwargs) -> None:
+    request_sync(instance.material_io_code_id_id)
+
+
+@receiver(post_delete, sender=Case)
+def sync_on_case_delete(sender, instance: Case, **kwargs) -> None:
+    """Tell the judge about removed cases, if it got the problem before
+
+    A sync is never started here: the case may be deleted along with its
+    problem.
+    """
+    request_sync(instance.material_io_code_id_id, create=False)
+
+
+@receiver(post_save, sender=IoCodeSubmission)
+def publish_status_change(
+    sender, instance: IoCodeSubmission, created: bool, update_fields, **kwargs
+) -> None:
+    """Push new submissions and verdicts to the streams of their author"""
+    if created or update_fields is None or STATUS_FIELDS & set(update_fields):
+        transaction.on_commit(lambda: publish_submission(instance))
+
+
+@receiver(post_save, sender=Contest)
+def forget_scoreboard_on_change(sender, instance: Contest, **kwargs) -> None:
+    """The cached scoreboard keeps the window and penalty it was built with"""
+    transaction.on_commit(lambda: forget_scoreboard(instance.id))
@@ -0,0 +1,66 @@
+from .io_code_submission_test import (
+    CreateIoCodeSubmissionTestCase,
+    GetIoCodeSubmissionTestCase,
+    DeleteIoCodeSubmissionTestCase,
+    UpdateIoCodeSubmissionTestCase,
+)
+from .judge_queue_tests import JudgeQueueTestCase, ConcurrentJudgeWorkersTestCase
+from .judge_client_tests import JudgeClientTestCase, CircuitBreakerTestCase
+from .judge_batch_tests import JudgeBatchTestCase
+from .local_judge_tests import LocalJudgeTestCase
+from .artifact_cache_tests import ArtifactCacheTestCase
+from .verdict_cache_tests import VerdictCacheTestCase
+from .submission_summary_tests import (
+    SubmissionSummaryTestCase,
+    ConcurrentSubmissionSummaryTestCase,
+)
+from .rebuild_summaries_tests import RebuildSummariesTestCase
+from .rejudge_tests import RejudgeTestCase
+from .judge_scheduler_tests import JudgeSchedulerTestCase
+from .submission_stream_tests import (
+    BrokerTestCase,
+    PostgresBrokerTestCase,
+    SubmissionStreamTestCase,
+)
+from .case_results_tests import CaseResultsTestCase
+from .case_store_tests import CaseStoreTestCase, ConcurrentCaseUploadsTestCase
+from .problem_sync_tests import ProblemSyncTestCase
+from .contest_tests import ContestTestCase
+from .leaderboard_tests import LeaderboardTestCase
+from .submission_history_tests import SubmissionHistoryTestCase
+from .similarity_tests import SimilarityTestCase
+from .rate_limit_tests import RateLimitTestCase
+from .archive_tests import ArchiveTestCase
+
+_ = [
+    CreateIoCodeSubmissionTestCase,
+    GetIoCodeSubmissionTestCase,
+    DeleteIoCodeSubmissionTestCase,
+    UpdateIoCodeSubmissionTestCase,
+    JudgeQueueTestCase,
+    ConcurrentJudgeWorkersTestCase,
+    JudgeClientTestCase,
+    CircuitBreakerTestCase,
+    JudgeBatchTestCase,
+    LocalJudgeTestCase,
+    ArtifactCacheTestCase,
+    VerdictCacheTestCase,
+    SubmissionSummaryTestCase,
+    ConcurrentSubmissionSummaryTestCase,
+    RebuildSummariesTestCase,
+    RejudgeTestCase,
+    JudgeSchedulerTestCase,
+    SubmissionStreamTestCase,
+    BrokerTestCase,
+    PostgresBrokerTestCase,
+    CaseResultsTestCase,
+    CaseStoreTestCase,
+    ConcurrentCaseUploadsTestCase,
+    ProblemSyncTestCase,
+    ContestTestCase,
+    LeaderboardTestCase,
+    SubmissionHistoryTestCase,
+    SimilarityTestCase,
+    RateLimitTestCase,
+    ArchiveTestCase,
+]
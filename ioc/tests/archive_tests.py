@@ -0,0 +1,143 @@
+"""Module for testing the archive of old submissions."""
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..helpers.case_results import pack_case_results
+from ..helpers.scoreboard import rebuild_contest_scores
+from ..helpers.submission_summary import (
+    rebuild_submission_summaries,
+    update_submission_summary,
+)
+from ..models.archived_submission import ArchivedSubmission
+from ..models.contest import Contest
+from ..models.contest_score import ContestScore
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.io_code_submission_summary import IoCodeSubmissionSummary
+from ..models.judge_task import JudgeTask
+from .judge_queue_tests import create_ioc_material
+from .rebuild_summaries_tests import SUMMARY_FIELDS
+from .submission_summary_tests import create_user, judged_submission
+
+
+class ArchiveTestCase(TestCase):
+    """Class that tests moving old submissions out of the submission table."""
+
+    def setUp(self) -> None:
+        """Method that sets up old and recent submissions of a user."""
+        self.client = APIClient()
+        self.material = create_ioc_material()
+        self.user = create_user()
+        self.client.force_authenticate(self.user)
+
+        self.submissions = []
+        for response_char in "WRAWA":
+            submission = judged_submission(self.material, self.user, response_char)
+            update_submission_summary(self.user, self.material, submission)
+            self.submissions.append(submission)
+        IoCodeSubmission.objects.filter(
+            submission_id=self.submissions[0].submission_id
+        ).update(
+            case_results=pack_case_results(
+                [{"verdict": "AC", "time": 0.1, "memory": 10}]
+                + [{"verdict": "WA", "time": 0.2, "memory": 20}]
+            )
+        )
+        # Every submission but the last one is a year old
+        IoCodeSubmission.objects.exclude(
+            submission_id=self.submissions[-1].submission_id
+        ).update(submission_date=timezone.now() - timedelta(days=400))
+
+    def archive(self, *args) -> str:
+        out = StringIO()
+        call_command("archive_submissions", *args, stdout=out)
+        return out.getvalue()
+
+    def summaries(self) -> list[tuple]:
+        return list(IoCodeSubmissionSummary.objects.values_list(*SUMMARY_FIELDS))
+
+    def test_old_submissions_are_moved(self) -> None:
+        still_judging = self.submissions[3]
+        JudgeTask.objects.create(submission=still_judging, status=JudgeTask.RUNNING)
+        summaries = self.summaries()
+
+        output = self.archive("--days", "365", "--batch-size", "2")
+
+        self.assertIn("Archived 3 submissions", output)
+        self.assertEqual(
+            list(
+                IoCodeSubmission.objects.order_by("submission_id").values_list(
+                    "submission_id", flat=True
+                )
+            ),
+            [still_judging.submission_id, self.submissions[-1].submission_id],
+        )
+        self.assertEqual(ArchivedSubmission.objects.count(), 3)
+        self.assertEqual(self.summaries(), summaries)
+
+        # Summaries are rebuilt from the archive too
+        rebuild_submission_summaries([self.material.id])
+        self.assertEqual(self.summaries(), summaries)
+
+    def test_archived_submission_by_id(self) -> None:
+        """An archived submission reads the same, case results included."""
+        submission_id = self.submissions[0].submission_id
+        before = self.client.get(f"/iocode/submission/{submission_id}/").json()
+        self.assertEqual(len(before["cases"]), 2)
+
+        self.archive()
+
+        self.assertFalse(
+            IoCodeSubmission.objects.filter(submission_id=submission_id).exists()
+        )
+        response = self.client.get(f"/iocode/submission/{submission_id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), before)
+
+        archived = ArchivedSubmission.objects.get(submission_id=submission_id)
+        self.assertEqual(archived.to_submission().code, self.submissions[0].code)
+        response = self.client.get(f"/iocode/submission/{submission_id + 100}/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_history_reads_the_archive(self) -> None:
+        """Archived submissions stay in the history, in order and by pages."""
+        self.archive()
+        url = f"/iocode/submission/user/{self.user.id}/{self.material.id}/"
+
+        results, cursor = [], None
+        while True:
+            params = {"limit": 2, "with_code": "true"}
+            if cursor is not None:
+                params["cursor"] = cursor
+            body = self.client.get(url, params).json()
+            results += body["results"]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(
+            [row["submission_id"] for row in results],
+            [submission.submission_id for submission in reversed(self.submissions)],
+        )
+        self.assertEqual(results[-1]["code"], self.submissions[0].code)
+
+    def test_contest_scores_read_the_archive(self) -> None:
+        contest = Contest.objects.create(
+            course=self.material.module_id.course_id,
+            name="Old contest",
+            start_at=timezone.now() - timedelta(days=401),
+            end_at=timezone.now() - timedelta(days=399),
+        )
+        contest.materials.set([self.material])
+        rebuild_contest_scores([self.material.id])
+        problems = ContestScore.objects.get(contest=contest).problems
+
+        self.archive()
+        rebuild_contest_scores([self.material.id])
+
+        self.assertEqual(ContestScore.objects.get(contest=contest).problems, problems)
+        self.assertEqual(problems[str(self.material.id)]["attempts"], 3)
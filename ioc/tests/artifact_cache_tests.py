@@ -0,0 +1,90 @@
+"""Module for testing the compiled-artifact cache of the local judge."""
+import os
+import shutil
+import tempfile
+from unittest import skipUnless
+
+from django.test import SimpleTestCase
+
+from ..helpers import sandbox
+from ..helpers.artifact_cache import ArtifactCache, artifact_key
+
+C_HELLO = '#include <stdio.h>\nint main() { puts("hello"); }\n'
+
+
+class ArtifactCacheTestCase(SimpleTestCase):
+    """Class that tests storing, finding and evicting artifacts."""
+
+    def setUp(self) -> None:
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def artifact(self, size: int) -> str:
+        path = os.path.join(self.root, "artifact")
+        with open(path, "wb") as artifact:
+            artifact.write(b"x" * size)
+        return path
+
+    def test_key_ignores_whitespace_changes(self) -> None:
+        self.assertEqual(
+            artifact_key("c", "int main() {}\r\n\r\n"),
+            artifact_key("c", "int main() {}  "),
+        )
+        self.assertNotEqual(
+            artifact_key("c", "int main() {}"), artifact_key("cpp", "int main() {}")
+        )
+
+    def test_hits_and_misses(self) -> None:
+        cache = ArtifactCache(os.path.join(self.root, "cache"), max_bytes=1024)
+        destination = os.path.join(self.root, "main")
+
+        self.assertFalse(cache.get("c", "code", destination))
+        cache.put("c", "code", self.artifact(10))
+        self.assertTrue(cache.get("c", "code", destination))
+
+        with open(destination, "rb") as artifact:
+            self.assertEqual(artifact.read(), b"x" * 10)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache = ArtifactCache(os.path.join(self.root, "cache"), max_bytes=250)
+        destination = os.path.join(self.root, "main")
+
+        cache.put("c", "first", self.artifact(100))
+        cache.put("c", "second", self.artifact(100))
+        os.utime(cache.path(artifact_key("c", "first")), (0, 0))
+        os.utime(cache.path(artifact_key("c", "second")), (1, 1))
+        cache.get("c", "first", destination)  # first is now the most recent
+        cache.put("c", "third", self.artifact(100))
+
+        self.assertTrue(cache.get("c", "first", destination))
+        self.assertFalse(cache.get("c", "second", destination))
+        self.assertTrue(cache.get("c", "third", destination))
+        self.assertLessEqual(cache.stats()["bytes"], 250)
+
+    @skipUnless(shutil.which("gcc"), "gcc is not installed")
+    def test_resubmission_skips_compilation(self) -> None:
+        """The same program is only compiled once."""
+        sandbox.configure(os.path.join(self.root, "cache"), 1024 * 1024 * 1024)
+        self.addCleanup(sandbox.configure, None, 0)
+        payload = {
+            "submission_id": 1,
+            "code": C_HELLO,
+            "language": "c",
+            "time_limit": 1000,
+            "memory_limit": 300,
+        }
+
+        source, expected = self.artifact(0), os.path.join(self.root, "expected")
+        with open(expected, "w") as file:
+            file.write("hello")
+
+        for _ in range(2):
+            response = sandbox.run_submission(payload, [(source, expected)])
+            self.assertEqual(response["verdict"]["verdict"], "AC")
+
+        stats = sandbox.artifact_cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["entries"], 1)
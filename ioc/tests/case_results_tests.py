@@ -0,0 +1,77 @@
+"""Module for testing the packed per-case results."""
+from django.test import TestCase
+
+from ..helpers.case_results import (
+    RECORD,
+    completion_rate,
+    pack_case_results,
+    unpack_case_results,
+)
+from ..helpers.judge_queue import apply_judge_response
+from ..models.io_code_submission import IoCodeSubmission
+
+CASES = [
+    {"verdict": "AC", "time": 0.012, "memory": 8960},
+    {"verdict": "WA", "time": 0.3, "memory": 9100},
+    {"verdict": "TLE", "time": 1.0, "memory": 9000},
+]
+
+
+class CaseResultsTestCase(TestCase):
+    """Class that tests packing the cases and computing the completion rate."""
+
+    def test_round_trip(self) -> None:
+        packed = pack_case_results(CASES)
+
+        self.assertEqual(len(packed), RECORD.size * len(CASES))
+        self.assertEqual(unpack_case_results(packed), CASES)
+        self.assertEqual(unpack_case_results(None), [])
+
+    def test_unknown_verdict_is_runtime_error(self) -> None:
+        packed = pack_case_results([{"verdict": "SE", "time": 0.1, "memory": 10}])
+
+        self.assertEqual(
+            unpack_case_results(packed), [{"verdict": "RE", "time": 0.1, "memory": 10}]
+        )
+
+    def test_completion_rate_counts_skipped_cases(self) -> None:
+        """Cases not run after the first failure count as not passed."""
+        self.assertEqual(completion_rate(CASES[:2], 2), 0.5)
+        self.assertEqual(completion_rate(CASES[:2], 4), 0.25)
+        self.assertEqual(completion_rate([], 0), 0.0)
+
+    def test_apply_judge_response(self) -> None:
+        submission = IoCodeSubmission()
+
+        apply_judge_response(
+            submission,
+            {
+                "submission_id": 1,
+                "max_time": 1.0,
+                "max_memory": 9100,
+                "verdict": {"verdict": "WA", "message": "Wrong answer"},
+                "cases": CASES[:2],
+                "total_cases": 4,
+            },
+        )
+
+        self.assertEqual(submission.response_char, "W")
+        self.assertEqual(submission.completion_rate, 0.25)
+        self.assertEqual(unpack_case_results(submission.case_results), CASES[:2])
+
+    def test_judge_without_cases(self) -> None:
+        """An answer without cases only tells whether all of them passed."""
+        submission = IoCodeSubmission()
+
+        apply_judge_response(
+            submission,
+            {
+                "submission_id": 1,
+                "max_time": 0.03,
+                "max_memory": 8960,
+                "verdict": {"verdict": "AC", "message": "Accepted"},
+            },
+        )
+
+        self.assertEqual(submission.completion_rate, 1.0)
+        self.assertIsNone(submission.case_results)
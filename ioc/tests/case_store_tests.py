@@ -0,0 +1,163 @@
+"""Module for testing the content-addressed storage of test cases."""
+import os
+import tempfile
+import threading
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from courses.models.material import Material
+from ..helpers.case_store import case_files, create_cases, prune_blobs, save_blobs
+from ..models.case import Case
+from ..models.case_blob import CaseBlob
+from ..models.material_io_code import MaterialIoCode
+from .judge_queue_tests import create_ioc_material
+
+BIG_INPUT = "1 2 3 4 5\n" * 100_000
+
+
+class CaseStoreTestCase(TestCase):
+    """Class that tests storing, sharing and reading the case data."""
+
+    def setUp(self) -> None:
+        """Method that sets up two problems in the same module."""
+        self.material = create_ioc_material()
+        other = Material.objects.create(
+            module_id=self.material.module_id,
+            name="Other material",
+            material_type="IOC",
+            is_extra=False,
+        )
+        self.other_ioc = MaterialIoCode.objects.create(
+            material_id=other, max_time=1000, max_memory=1000, max_points=10
+        )
+        self.material_ioc = self.material.materialiocode
+
+    def test_cases_are_bulk_inserted(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            create_cases(self.material_ioc.id, ["1", "2", "3"], ["1", "4", "9"])
+
+        inserts = [
+            query
+            for query in queries
+            if query["sql"].startswith('INSERT INTO "ioc_case"')
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(
+            list(Case.objects.order_by("id_case").values_list("id_case", flat=True)),
+            [0, 1, 2],
+        )
+
+    def test_identical_data_is_stored_once(self) -> None:
+        """Repeated inputs and outputs, in one or many problems, share a blob."""
+        create_cases(self.material_ioc.id, [BIG_INPUT, "7"], ["15", "15"])
+        create_cases(self.other_ioc.id, [BIG_INPUT], ["15"])
+
+        self.assertEqual(Case.objects.count(), 3)
+        self.assertEqual(CaseBlob.objects.count(), 3)
+        blob = CaseBlob.objects.get(size=len(BIG_INPUT))
+        self.assertLess(len(blob.data), len(BIG_INPUT) / 50)
+
+    def test_case_reads_its_content(self) -> None:
+        [case] = create_cases(self.material_ioc.id, ["héllo\n"], ["wörld"])
+
+        case = Case.objects.select_related("input_blob", "output_blob").get(id=case.id)
+        self.assertEqual((case.input, case.output), ("héllo\n", "wörld"))
+
+    def test_case_files(self) -> None:
+        """The judge gets the uncompressed data as files, written once."""
+        create_cases(self.material_ioc.id, [BIG_INPUT, "1 2"], ["15", "3"])
+
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(IOC_CASE_CACHE_DIR=directory):
+                files = case_files(str(self.material.id))
+                with self.assertNumQueries(1):  # Only the cases, no blob
+                    self.assertEqual(case_files(str(self.material.id)), files)
+
+            [(source, expected), _] = files
+            with open(source) as file:
+                self.assertEqual(file.read(), BIG_INPUT)
+            with open(expected) as file:
+                self.assertEqual(file.read(), "15")
+            self.assertTrue(source.startswith(directory))
+            self.assertEqual(
+                os.path.basename(source), Case.objects.first().input_blob_id
+            )
+
+    def test_prune_unused_blobs(self) -> None:
+        create_cases(self.material_ioc.id, ["1", "2"], ["1", "4"])
+        [kept] = create_cases(self.other_ioc.id, ["1"], ["1"])
+        Case.objects.filter(material_io_code_id=self.material_ioc).delete()
+
+        out = StringIO()
+        call_command("prune_case_blobs", stdout=out)
+
+        self.assertIn("Deleted 2 unused blobs", out.getvalue())
+        self.assertEqual(
+            set(CaseBlob.objects.values_list("digest", flat=True)),
+            {kept.input_blob_id},
+        )
+
+
+class ConcurrentCaseUploadsTestCase(TransactionTestCase):
+    """Class that tests uploads and prunes of the case data at the same time."""
+
+    def setUp(self) -> None:
+        self.material_ioc = create_ioc_material().materialiocode
+
+    def test_concurrent_uploads_get_distinct_numbers(self) -> None:
+        barrier = threading.Barrier(4)
+
+        def upload(number: int) -> None:
+            barrier.wait()
+            create_cases(self.material_ioc.id, [str(number)] * 3, ["0"] * 3)
+            connection.close()
+
+        threads = [threading.Thread(target=upload, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            sorted(Case.objects.values_list("id_case", flat=True)), list(range(12))
+        )
+
+    def test_prune_waits_for_uploads(self) -> None:
+        """A blob found stored by an upload is not pruned before its case exists."""
+        [old] = create_cases(self.material_ioc.id, ["1"], ["1"])
+        Case.objects.filter(id=old.id).delete()
+        stored, release = threading.Event(), threading.Event()
+
+        def save_and_wait(contents: list[str]) -> list[str]:
+            digests = save_blobs(contents)
+            stored.set()
+            release.wait(5)
+            return digests
+
+        def upload() -> None:
+            with patch("ioc.helpers.case_store.save_blobs", save_and_wait):
+                create_cases(self.material_ioc.id, ["1"], ["1"])
+            connection.close()
+
+        def prune() -> None:
+            prune_blobs()
+            connection.close()
+
+        uploader = threading.Thread(target=upload)
+        uploader.start()
+        stored.wait(5)
+        pruner = threading.Thread(target=prune)
+        pruner.start()
+        pruner.join(0.5)
+        self.assertTrue(pruner.is_alive())
+
+        release.set()
+        uploader.join()
+        pruner.join()
+        self.assertEqual(Case.objects.count(), 1)
+        self.assertTrue(CaseBlob.objects.filter(digest=old.input_blob_id).exists())
@@ -0,0 +1,218 @@
+"""Module for testing the contests and their cached scoreboards."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from courses.models.instructor import Instructor
+from courses.models.material import Material
+from ..helpers import scoreboard
+from ..helpers.judge_queue import drain_queue, enqueue_submission
+from ..helpers.rejudge import start_rejudge
+from ..models.contest import Contest
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.material_io_code import MaterialIoCode
+from .judge_queue_tests import ACCEPTED, create_ioc_material
+from .rejudge_tests import WRONG
+from .submission_summary_tests import create_user
+
+
+class ContestTestCase(TestCase):
+    """Class that tests the incremental, cached scoreboard of a contest."""
+
+    def setUp(self) -> None:
+        """Method that sets up a running contest over two problems."""
+        cache.clear()
+        self.client = APIClient()
+        self.first = create_ioc_material()
+        second = Material.objects.create(
+            module_id=self.first.module_id,
+            name="Second problem",
+            material_type="IOC",
+            is_extra=False,
+        )
+        MaterialIoCode.objects.create(
+            material_id=second, max_time=1000, max_memory=1000, max_points=30
+        )
+        self.second = second
+        self.users = [create_user(number) for number in range(3)]
+        self.client.force_authenticate(self.users[0])
+
+        now = timezone.now()
+        self.contest = Contest.objects.create(
+            course=self.first.module_id.course_id,
+            name="Test contest",
+            start_at=now - timedelta(minutes=30),
+            end_at=now + timedelta(hours=1),
+            penalty_minutes=20,
+        )
+        self.contest.materials.set([self.first, self.second])
+
+    def submit(self, user, material, verdict=ACCEPTED) -> IoCodeSubmission:
+        # Distinct programs, so no verdict is taken from the verdict memo
+        code = f"print({IoCodeSubmission.objects.count()})"
+        submission = IoCodeSubmission.objects.create(
+            material_id=material, user_id=user, code=code, language="py"
+        )
+        enqueue_submission(submission)
+        with patch("ioc.helpers.judge_queue.judge", return_value=verdict):
+            with self.captureOnCommitCallbacks(execute=True):
+                drain_queue("test-worker")
+        return submission
+
+    def update_contest(self, **fields) -> None:
+        for field, value in fields.items():
+            setattr(self.contest, field, value)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.contest.save()
+
+    def scoreboard(self, **headers):
+        return self.client.get(
+            f"/contest/{self.contest.id}/scoreboard/", headers=headers
+        )
+
+    def ranking(self) -> list[tuple]:
+        return [
+            (row["rank"], row["user_id"], row["points"], row["penalty"])
+            for row in self.scoreboard().json()["scoreboard"]
+        ]
+
+    def test_ranking(self) -> None:
+        """Points first, then the solve minutes plus the rejected attempts."""
+        first, second, third = self.users
+        self.submit(first, self.first, WRONG)
+        self.submit(first, self.first)
+        self.submit(second, self.first)
+        self.submit(third, self.second)
+        self.submit(third, self.first, WRONG)
+
+        self.assertEqual(
+            self.ranking(),
+            [
+                (1, third.id, 30, 30),
+                (2, second.id, 10, 30),
+                (3, first.id, 10, 50),
+            ],
+        )
+        row = self.scoreboard().json()["scoreboard"][0]
+        self.assertEqual(
+            row["problems"][str(self.first.id)],
+            {"attempts": 1, "minute": None, "points": 0, "pending": 0},
+        )
+
+    def test_served_from_cache_with_etag(self) -> None:
+        self.submit(self.users[0], self.first)
+        response = self.scoreboard()
+        etag = response["ETag"]
+
+        with self.assertNumQueries(0):
+            cached = self.scoreboard()
+            not_modified = self.scoreboard(if_none_match=etag)
+
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b"")
+
+        self.submit(self.users[1], self.second)
+        self.assertEqual(self.scoreboard(if_none_match=etag).status_code, 200)
+
+    def test_judged_submission_moves_its_row(self) -> None:
+        """A new verdict updates the cached scoreboard without building it."""
+        first, second, _ = self.users
+        self.submit(first, self.first)
+        self.submit(second, self.first, WRONG)
+        self.scoreboard()
+
+        with patch.object(
+            scoreboard, "_build_scoreboard", wraps=scoreboard._build_scoreboard
+        ) as build:
+            self.submit(second, self.second)
+            ranking = self.ranking()
+
+        build.assert_not_called()
+        self.assertEqual([row[1] for row in ranking], [second.id, first.id])
+
+    def test_freeze(self) -> None:
+        """Results sent during the freeze are pending until the contest ends."""
+        first, second, _ = self.users
+        self.submit(first, self.first)
+        self.update_contest(freeze_at=timezone.now() - timedelta(seconds=1))
+        self.submit(second, self.first, WRONG)
+        self.submit(second, self.second)
+
+        body = self.scoreboard().json()
+        self.assertEqual(body["state"], scoreboard.FROZEN)
+        self.assertEqual(
+            [(row["user_id"], row["points"]) for row in body["scoreboard"]],
+            [(first.id, 10), (second.id, 0)],
+        )
+        self.assertEqual(
+            body["scoreboard"][1]["problems"][str(self.second.id)]["pending"], 1
+        )
+
+        self.update_contest(end_at=timezone.now() - timedelta(seconds=1))
+        body = self.scoreboard().json()
+        self.assertEqual(body["state"], scoreboard.FINAL)
+        self.assertEqual(
+            [(row["user_id"], row["points"]) for row in body["scoreboard"]],
+            [(second.id, 30), (first.id, 10)],
+        )
+
+    def test_rejudge_counts_again(self) -> None:
+        first, second, _ = self.users
+        self.submit(first, self.first)
+        self.submit(second, self.first, WRONG)
+        self.submit(second, self.first)
+        self.assertEqual(self.ranking()[0][1:], (first.id, 10, 30))
+
+        start_rejudge(self.first)
+        with patch(
+            "ioc.helpers.judge_queue.judge", side_effect=[WRONG, ACCEPTED, ACCEPTED]
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                drain_queue("test-worker")
+
+        self.assertEqual(
+            [row[1:] for row in self.ranking()],
+            [(second.id, 10, 30), (first.id, 0, 0)],
+        )
+
+    def test_submissions_outside_the_window_do_not_count(self) -> None:
+        self.update_contest(start_at=timezone.now() + timedelta(minutes=1))
+        self.submit(self.users[0], self.first)
+
+        self.assertEqual(self.ranking(), [])
+
+    def test_create_contest(self) -> None:
+        now = timezone.now()
+        data = {
+            "course": self.contest.course_id,
+            "name": "Final contest",
+            "materials": [self.first.id, self.second.id],
+            "start_at": now.isoformat(),
+            "end_at": (now + timedelta(hours=2)).isoformat(),
+            "freeze_at": (now + timedelta(hours=3)).isoformat(),
+        }
+
+        response = self.client.post("/contest/create/", data, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("freeze_at", response.json())
+
+        data["freeze_at"] = (now + timedelta(hours=1)).isoformat()
+        response = self.client.post("/contest/create/", data, format="json")
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Contest.objects.count(), 1)
+
+        Instructor.objects.create(
+            user_id=self.users[0], course_id=self.contest.course, instructor_type="T"
+        )
+        response = self.client.post("/contest/create/", data, format="json")
+        self.assertEqual(response.status_code, 201)
+
+        contest_id = response.json()["id"]
+        response = self.client.get(f"/contest/{contest_id}/")
+        self.assertEqual(response.json()["materials"], [self.first.id, self.second.id])
+        self.assertEqual(self.client.get("/contest/0/scoreboard/").status_code, 404)
@@ -11,6 +11,7 @@ from courses.models.module import Module
 from institutions.models.institution import Institution
 from ioc.models.material_io_code import MaterialIoCode
 from ..models.io_code_submission import IoCodeSubmission
+from ..helpers.judge_queue import drain_queue
 
 
 class CreateIoCodeSubmissionTestCase(TestCase):
@@ -168,7 +169,8 @@ class CreateIoCodeSubmissionTestCase(TestCase):
         response = self.client.post(
             "/iocode/submission/create/", self.io_code_submission_data, format="json"
         )
-        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.status_code, 202)
+        self.assertIsNone(response.json()["verdict"])
 
     def test_create_non_ioc_material(self) -> None:
         """Method that tests the creation of a IoCodeSubmission instance
@@ -229,7 +231,7 @@ class CreateIoCodeSubmissionTestCase(TestCase):
         self.assertEqual(response.status_code, 400)
 
     @patch(
-        "ioc.serializers.io_code_submission_serializer.judge",
+        "ioc.helpers.judge_queue.judge",
         return_value=(
             {
                 "max_memory": 8960,
@@ -250,13 +252,14 @@ class CreateIoCodeSubmissionTestCase(TestCase):
             self.io_code_submission_data,
             format="json",
         )
-        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.status_code, 202)
+        drain_queue("test-worker")
 
         submission = IoCodeSubmission.objects.latest("submission_date")
         self.assertEqual(submission.response_char, "A")
 
     @patch(
-        "ioc.serializers.io_code_submission_serializer.judge",
+        "ioc.helpers.judge_queue.judge",
         return_value=(
             {
                 "max_memory": 8960,
@@ -278,13 +281,14 @@ class CreateIoCodeSubmissionTestCase(TestCase):
             self.io_code_submission_data_wrong_answer,
             format="json",
         )
-        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.status_code, 202)
+        drain_queue("test-worker")
 
         submission = IoCodeSubmission.objects.latest("submission_date")
         self.assertEqual(submission.response_char, "W")
 
     @patch(
-        "ioc.serializers.io_code_submission_serializer.judge",
+        "ioc.helpers.judge_queue.judge",
         return_value=(
             {
                 "max_memory": 8832,
@@ -306,13 +310,14 @@ class CreateIoCodeSubmissionTestCase(TestCase):
             self.io_code_submission_data_time_exceed,
             format="json",
         )
-        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.status_code, 202)
+        drain_queue("test-worker")
 
         submission = IoCodeSubmission.objects.latest("submission_date")
         self.assertEqual(submission.response_char, "T")
 
     @patch(
-        "ioc.serializers.io_code_submission_serializer.judge",
+        "ioc.helpers.judge_queue.judge",
         return_value=(
             {
                 "max_memory": 7680,
@@ -334,13 +339,14 @@ class CreateIoCodeSubmissionTestCase(TestCase):
             self.io_code_submission_data_memeory_exceed,
             format="json",
         )
-        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.status_code, 202)
+        drain_queue("test-worker")
 
         submission = IoCodeSubmission.objects.latest("submission_date")
         self.assertEqual(submission.response_char, "M")
 
     @patch(
-        "ioc.serializers.io_code_submission_serializer.judge",
+        "ioc.helpers.judge_queue.judge",
         return_value=(
             {
                 "submission_id": 72,
@@ -360,7 +366,8 @@ class CreateIoCodeSubmissionTestCase(TestCase):
             self.io_code_submission_data_copilation_error,
             format="json",
         )
-        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.status_code, 202)
+        drain_queue("test-worker")
 
         submission = IoCodeSubmission.objects.latest("submission_date")
         self.assertEqual(submission.response_char, "C")
@@ -0,0 +1,111 @@
+"""Module for testing the batched dispatch of the judge queue."""
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from accounts.models.user import User
+from ..helpers.judge_batch import claim_batch, drain_queue_batched
+from ..helpers.judge_client import JudgeClient
+from ..helpers.judge_queue import enqueue_submission
+from ..helpers.stub_judge import StubJudge
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.io_code_submission_summary import IoCodeSubmissionSummary
+from ..models.judge_task import JudgeTask
+from .judge_queue_tests import ACCEPTED, create_ioc_material
+
+
+class JudgeBatchTestCase(TestCase):
+    """Class that tests judging queued submissions in batches."""
+
+    def setUp(self) -> None:
+        """Method that sets up the stub judge and the data to be used in the tests."""
+        self.stub = StubJudge().__enter__()
+        self.addCleanup(self.stub.__exit__)
+        client = JudgeClient(
+            backoff=0,
+            max_retries=0,
+            judge_url=self.stub.url("/judge/end"),
+            batch_url=self.stub.url("/judge/batch"),
+        )
+        patcher = patch(
+            "ioc.helpers.judge_batch.get_judge_backend", return_value=client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.material = create_ioc_material()
+        self.user = User.objects.create(
+            email="test@example.com",
+            password="JHuyfub434eknjbv",
+            last_name="test_last_name",
+            first_name="test_first_name",
+        )
+
+    def submit(self, count: int) -> list[IoCodeSubmission]:
+        submissions = []
+        for number in range(count):
+            submission = IoCodeSubmission.objects.create(
+                material_id=self.material,
+                user_id=self.user,
+                code=f"print({number})",  # Distinct programs, none is memoized
+                language="py",
+            )
+            enqueue_submission(submission)
+            submissions.append(submission)
+        return submissions
+
+    def test_batch_is_sent_in_one_call(self) -> None:
+        """Queued submissions are judged with a single judge call."""
+        self.submit(5)
+
+        self.assertEqual(drain_queue_batched("test-worker", size=10, window=0), 5)
+
+        self.assertEqual(len(self.stub.requests), 1)
+        path, payload = self.stub.requests[0]
+        self.assertEqual(path, "/judge/batch")
+        self.assertEqual(len(payload["submissions"]), 5)
+        self.assertFalse(IoCodeSubmission.objects.exclude(response_char="A").exists())
+        summary = IoCodeSubmissionSummary.objects.get(
+            user=self.user, material=self.material
+        )
+        self.assertEqual(summary.attempts, 5)
+        self.assertEqual(summary.hits, 5)
+
+    def test_batches_are_bounded(self) -> None:
+        """A burst larger than the batch size is split into several calls."""
+        self.submit(5)
+
+        drain_queue_batched("test-worker", size=2, window=0)
+
+        self.assertEqual(len(self.stub.requests), 3)
+        self.assertEqual(JudgeTask.objects.filter(status=JudgeTask.DONE).count(), 5)
+
+    def test_empty_queue_is_not_waited_on(self) -> None:
+        """The batch window only starts once a task has been claimed."""
+        self.assertEqual(claim_batch("test-worker", size=10, window=60), [])
+
+    def test_failed_call_releases_every_task(self) -> None:
+        """When the batch call fails every task is scheduled for a retry."""
+        self.submit(3)
+        self.stub.fail_next = 1
+
+        drain_queue_batched("test-worker", size=10, window=0)
+
+        self.assertEqual(JudgeTask.objects.filter(status=JudgeTask.PENDING).count(), 3)
+        self.assertFalse(IoCodeSubmissionSummary.objects.exists())
+
+    def test_missing_verdict_is_retried(self) -> None:
+        """A submission left out of the judge answer is retried alone."""
+        first, second = self.submit(2)
+        result = dict(ACCEPTED[0], submission_id=first.submission_id)
+
+        with patch(
+            "ioc.helpers.judge_batch.judge_batch",
+            return_value=({"results": [result]}, 201),
+        ):
+            drain_queue_batched("test-worker", size=10, window=0)
+
+        self.assertEqual(JudgeTask.objects.get(submission=first).status, JudgeTask.DONE)
+        self.assertEqual(
+            JudgeTask.objects.get(submission=second).status, JudgeTask.PENDING
+        )
@@ -0,0 +1,131 @@
+"""Module for testing the judge client against a local stub judge."""
+from django.test import SimpleTestCase
+
+from ..helpers.judge_client import CircuitBreaker, JudgeClient, JudgeUnavailable
+from ..helpers.stub_judge import StubJudge
+
+
+class FakeClock:
+    """Clock that only moves when told to"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class JudgeClientTestCase(SimpleTestCase):
+    """Class that tests the pooled judge client."""
+
+    def setUp(self) -> None:
+        self.stub = StubJudge().__enter__()
+        self.addCleanup(self.stub.__exit__)
+
+    def make_client(self, **kwargs) -> JudgeClient:
+        options = {
+            "connect_timeout": 1,
+            "read_timeout": 1,
+            "backoff": 0,
+            "judge_url": self.stub.url("/judge/end"),
+            "problem_url": self.stub.url("/problem"),
+        }
+        options.update(kwargs)
+        return JudgeClient(**options)
+
+    def test_judge_reuses_connection(self) -> None:
+        """Consecutive calls share one keep-alive connection."""
+        client = self.make_client()
+
+        for submission_id in range(5):
+            response, status_code = client.judge({"submission_id": submission_id})
+            self.assertEqual(status_code, 201)
+            self.assertEqual(response["submission_id"], submission_id)
+
+        self.assertEqual(self.stub.connections, 1)
+
+    def test_server_errors_are_retried(self) -> None:
+        """A 5xx answer is retried until the judge answers."""
+        client = self.make_client(max_retries=2)
+        self.stub.fail_next = 2
+
+        _, status_code = client.judge({"submission_id": 1})
+
+        self.assertEqual(status_code, 201)
+        self.assertEqual(len(self.stub.requests), 3)
+
+    def test_retries_are_bounded(self) -> None:
+        """The client gives up after its retries."""
+        client = self.make_client(max_retries=1)
+        self.stub.fail_next = 10
+
+        with self.assertRaises(JudgeUnavailable):
+            client.judge({"submission_id": 1})
+        self.assertEqual(len(self.stub.requests), 2)
+
+    def test_read_timeout(self) -> None:
+        """A slow judge fails with a timeout instead of hanging."""
+        client = self.make_client(read_timeout=0.05, max_retries=0)
+        self.stub.latency = 0.5
+
+        with self.assertRaises(JudgeUnavailable):
+            client.judge({"submission_id": 1})
+
+    def test_circuit_opens_after_failures(self) -> None:
+        """An open circuit fails fast without calling the judge."""
+        client = self.make_client(max_retries=0, failure_threshold=2)
+        self.stub.fail_next = 2
+
+        for _ in range(2):
+            with self.assertRaises(JudgeUnavailable):
+                client.judge({"submission_id": 1})
+        with self.assertRaises(JudgeUnavailable):
+            client.judge({"submission_id": 1})
+
+        self.assertEqual(len(self.stub.requests), 2)
+        self.assertEqual(client.metrics()["circuit"], CircuitBreaker.OPEN)
+
+    def test_latency_counters(self) -> None:
+        """Calls are counted per endpoint."""
+        client = self.make_client(max_retries=0)
+        client.judge({"submission_id": 1})
+        client.sync_problem({"problem_id": "1"})
+        self.stub.fail_next = 1
+        with self.assertRaises(JudgeUnavailable):
+            client.judge({"submission_id": 2})
+
+        endpoints = client.metrics()["endpoints"]
+        self.assertEqual(endpoints["/judge/end"]["calls"], 2)
+        self.assertEqual(endpoints["/judge/end"]["errors"], 1)
+        self.assertEqual(endpoints["/problem"]["calls"], 1)
+
+
+class CircuitBreakerTestCase(SimpleTestCase):
+    """Class that tests the transitions of the circuit breaker."""
+
+    def test_half_open_allows_one_trial(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+
+        clock.now = 10
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_failed_trial_reopens(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        clock.now = 10
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        clock.now = 15
+        self.assertFalse(breaker.allow())
@@ -0,0 +1,247 @@
+"""Module for testing the judge queue and its workers."""
+import threading
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models.user import User
+from courses.models.course import Course
+from courses.models.material import Material
+from courses.models.module import Module
+from institutions.models.institution import Institution
+from constants.ioc import JUDGE_TASK_MAX_ATTEMPTS
+from ..helpers.judge_queue import (
+    claim_tasks,
+    drain_queue,
+    enqueue_submission,
+    process_task,
+)
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.io_code_submission_summary import IoCodeSubmissionSummary
+from ..models.judge_task import JudgeTask
+from ..models.material_io_code import MaterialIoCode
+
+ACCEPTED = (
+    {
+        "max_memory": 8960,
+        "max_time": 0.03,
+        "submission_id": 1,
+        "verdict": {"message": "Accepted", "verdict": "AC"},
+    },
+    201,
+)
+
+
+def create_ioc_material() -> Material:
+    """Create an IOC material inside a new course"""
+    institution = Institution.objects.create(
+        name="Test Institution",
+        alias="TestInstitution",
+        description="This is a test institution",
+    )
+    course = Course.objects.create(
+        name="Test Course",
+        alias="TestCourse",
+        description="This is a test course",
+        institution=institution,
+    )
+    module = Module.objects.create(course_id=course, name="Test module")
+    material = Material.objects.create(
+        module_id=module,
+        name="Test material",
+        material_type="IOC",
+        is_extra=False,
+    )
+    MaterialIoCode.objects.create(
+        material_id=material, max_time=1000, max_memory=1000, max_points=10
+    )
+    return material
+
+
+class JudgeQueueTestCase(TestCase):
+    """Class that tests queueing and judging code submissions."""
+
+    def setUp(self) -> None:
+        """Method that sets up the client and the data to be used in the tests."""
+        self.client = APIClient()
+        self.material = create_ioc_material()
+        self.user = User.objects.create(
+            email="test@example.com",
+            password="JHuyfub434eknjbv",
+            last_name="test_last_name",
+            first_name="test_first_name",
+        )
+        self.client.force_authenticate(self.user)
+        self.submission_data = {
+            "material_id": self.material.id,
+            "user_id": self.user.id,
+            "code": "print('Hello World')",
+            "language": "py",
+        }
+
+    def submit(self) -> IoCodeSubmission:
+        """Create a queued submission without going through the API"""
+        submission = IoCodeSubmission.objects.create(
+            material_id=self.material,
+            user_id=self.user,
+            code="print('Hello World')",
+            language="py",
+        )
+        enqueue_submission(submission)
+        return submission
+
+    def test_create_returns_pending_verdict(self) -> None:
+        """The submission is accepted without waiting for the judge."""
+        with patch("ioc.helpers.judge_queue.judge") as mock_judge:
+            response = self.client.post(
+                "/iocode/submission/create/", self.submission_data, format="json"
+            )
+            mock_judge.assert_not_called()
+
+        self.assertEqual(response.status_code, 202)
+        self.assertIsNone(response.json()["verdict"])
+        submission = IoCodeSubmission.objects.get(
+            submission_id=response.json()["submission_id"]
+        )
+        self.assertEqual(submission.judge_task.status, JudgeTask.PENDING)
+        self.assertFalse(IoCodeSubmissionSummary.objects.exists())
+
+    @patch("ioc.helpers.judge_queue.judge", return_value=ACCEPTED)
+    def test_worker_writes_verdict_and_summary(self, mock_judge) -> None:
+        """The worker stores the verdict and updates the submission summary."""
+        submission = self.submit()
+
+        self.assertEqual(drain_queue("test-worker"), 1)
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.response_char, "A")
+        self.assertEqual(submission.execution_memory, 8960)
+        self.assertEqual(submission.judge_task.status, JudgeTask.DONE)
+        summary = IoCodeSubmissionSummary.objects.get(
+            user=self.user, material=self.material
+        )
+        self.assertEqual(summary.hits, 1)
+        self.assertEqual(summary.points, 10)
+
+    def test_task_is_claimed_once(self) -> None:
+        """A claimed task is not given to another worker."""
+        self.submit()
+
+        self.assertEqual(len(claim_tasks("worker-1")), 1)
+        self.assertEqual(claim_tasks("worker-2"), [])
+
+    @patch("ioc.helpers.judge_queue.judge", return_value=ACCEPTED)
+    def test_expired_lease_is_reclaimed(self, mock_judge) -> None:
+        """A task whose worker died is judged by another worker."""
+        submission = self.submit()
+        claim_tasks("dead-worker")
+        JudgeTask.objects.filter(submission=submission).update(
+            claimed_at=timezone.now() - timedelta(hours=1)
+        )
+
+        self.assertEqual(drain_queue("test-worker"), 1)
+        submission.refresh_from_db()
+        self.assertEqual(submission.response_char, "A")
+        self.assertEqual(submission.judge_task.claimed_by, "test-worker")
+
+    @patch("ioc.helpers.judge_queue.judge", return_value=ACCEPTED)
+    def test_stale_worker_does_not_count_twice(self, mock_judge) -> None:
+        """A worker that lost its claim does not write the verdict."""
+        submission = self.submit()
+        [stale_task] = claim_tasks("slow-worker")
+        JudgeTask.objects.filter(id=stale_task.id).update(
+            claimed_at=timezone.now() - timedelta(hours=1)
+        )
+        drain_queue("test-worker")
+
+        process_task(stale_task)
+        summary = IoCodeSubmissionSummary.objects.get(
+            user=self.user, material=self.material
+        )
+        self.assertEqual(summary.attempts, 1)
+        task = JudgeTask.objects.get(submission=submission)
+        self.assertEqual(task.claimed_by, "test-worker")
+
+    @patch("ioc.helpers.judge_queue.judge", return_value=({}, 500))
+    def test_judge_failure_is_retried(self, mock_judge) -> None:
+        """A failed judge call is retried later and finally marked failed."""
+        submission = self.submit()
+
+        drain_queue("test-worker")
+        task = JudgeTask.objects.get(submission=submission)
+        self.assertEqual(task.status, JudgeTask.PENDING)
+        self.assertGreater(task.available_at, timezone.now())
+        self.assertIn("500", task.last_error)
+
+        JudgeTask.objects.filter(id=task.id).update(
+            attempts=JUDGE_TASK_MAX_ATTEMPTS - 1, available_at=timezone.now()
+        )
+        drain_queue("test-worker")
+
+        task.refresh_from_db()
+        submission.refresh_from_db()
+        self.assertEqual(task.status, JudgeTask.FAILED)
+        self.assertEqual(submission.response_char, "E")
+
+    @patch("ioc.signals.publish_submission")
+    @patch("ioc.helpers.judge_queue.judge", return_value=({}, 500))
+    def test_failed_task_is_published(self, mock_judge, mock_publish) -> None:
+        """The streams of the author learn that the submission failed."""
+        submission = self.submit()
+        JudgeTask.objects.filter(submission=submission).update(
+            attempts=JUDGE_TASK_MAX_ATTEMPTS - 1
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            drain_queue("test-worker")
+
+        [published] = [call.args[0] for call in mock_publish.call_args_list]
+        self.assertEqual(published.submission_id, submission.submission_id)
+        self.assertEqual(published.response_char, "E")
+
+
+class ConcurrentJudgeWorkersTestCase(TransactionTestCase):
+    """Class that tests several workers claiming tasks at the same time."""
+
+    def test_workers_claim_disjoint_tasks(self) -> None:
+        """Every task is claimed by exactly one of the concurrent workers."""
+        material = create_ioc_material()
+        user = User.objects.create(
+            email="test@example.com",
+            password="JHuyfub434eknjbv",
+            last_name="test_last_name",
+            first_name="test_first_name",
+        )
+        for _ in range(20):
+            enqueue_submission(
+                IoCodeSubmission.objects.create(
+                    material_id=material, user_id=user, code="pass", language="py"
+                )
+            )
+
+        claimed: dict[str, list[int]] = {}
+        barrier = threading.Barrier(4)
+
+        def worker(worker_id: str) -> None:
+            barrier.wait()
+            ids: list[int] = []
+            while tasks := claim_tasks(worker_id, limit=2):
+                ids.extend(task.id for task in tasks)
+            claimed[worker_id] = ids
+            connection.close()
+
+        threads = [
+            threading.Thread(target=worker, args=(f"worker-{n}",)) for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        all_ids = [task_id for ids in claimed.values() for task_id in ids]
+        self.assertEqual(len(all_ids), 20)
+        self.assertEqual(len(set(all_ids)), 20)
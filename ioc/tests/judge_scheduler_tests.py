@@ -0,0 +1,126 @@
+"""Module for testing the priority classes and fair share of the judge queue."""
+import json
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from courses.models.material import Material
+from ..helpers.judge_queue import claim_tasks, complete_task, enqueue_submission
+from ..helpers.judge_scheduler import queue_metrics
+from ..helpers.rejudge import start_rejudge
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.judge_task import JudgeTask
+from ..models.material_io_code import MaterialIoCode
+from .judge_queue_tests import create_ioc_material
+from .submission_summary_tests import create_user
+
+
+class JudgeSchedulerTestCase(TestCase):
+    """Class that tests the order in which the judge workers claim tasks."""
+
+    def setUp(self) -> None:
+        """Method that sets up a practice and an exam material."""
+        self.practice = create_ioc_material()
+        self.exam = Material.objects.create(
+            module_id=self.practice.module_id,
+            name="Exam material",
+            material_type="IOC",
+            is_extra=False,
+        )
+        MaterialIoCode.objects.create(
+            material_id=self.exam,
+            max_time=1000,
+            max_memory=1000,
+            max_points=10,
+            is_exam=True,
+        )
+        self.users = [create_user(number) for number in range(3)]
+
+    def submit(self, material: Material, user, count: int = 1) -> list[JudgeTask]:
+        return [
+            enqueue_submission(
+                IoCodeSubmission.objects.create(
+                    material_id=material,
+                    user_id=user,
+                    code=f"print({number})",
+                    language="py",
+                )
+            )
+            for number in range(count)
+        ]
+
+    def finish(self, task: JudgeTask) -> None:
+        submission = task.submission
+        submission.response_char = "A"
+        submission.execution_time = 0.1
+        submission.execution_memory = 100
+        complete_task(task, submission)
+
+    def claim_order(self) -> list[int]:
+        return [task.id for task in claim_tasks("test-worker", limit=100)]
+
+    def test_exam_before_practice(self) -> None:
+        practice = self.submit(self.practice, self.users[0])
+        exam = self.submit(self.exam, self.users[1])
+
+        self.assertEqual(exam[0].priority, JudgeTask.PRIORITY_EXAM)
+        self.assertEqual(practice[0].priority, JudgeTask.PRIORITY_PRACTICE)
+        self.assertEqual(self.claim_order(), [exam[0].id, practice[0].id])
+
+    def test_burst_does_not_starve_other_users(self) -> None:
+        """A user sending many submissions waits behind a single one of others."""
+        burst = self.submit(self.practice, self.users[0], count=5)
+        other = self.submit(self.practice, self.users[1])
+
+        order = self.claim_order()
+
+        self.assertLess(order.index(other[0].id), order.index(burst[2].id))
+        self.assertEqual(order[:2], [burst[0].id, other[0].id])
+
+    def test_fair_share_resets_when_idle(self) -> None:
+        [first] = self.submit(self.practice, self.users[0])
+        [task] = claim_tasks("test-worker")
+        self.finish(task)
+
+        [second] = self.submit(self.practice, self.users[0])
+
+        self.assertLessEqual(second.fair_at, timezone.now())
+        self.assertGreaterEqual(second.fair_at, first.fair_at)
+
+    def test_rejudge_after_live_classes(self) -> None:
+        self.submit(self.practice, self.users[0])
+        [task] = claim_tasks("test-worker")
+        self.finish(task)
+        start_rejudge(self.practice)
+        exam = self.submit(self.exam, self.users[1])
+        practice = self.submit(self.practice, self.users[2])
+
+        order = self.claim_order()
+
+        self.assertEqual(order[:2], [exam[0].id, practice[0].id])
+        rejudged = JudgeTask.objects.get(id=order[2])
+        self.assertEqual(rejudged.priority, JudgeTask.PRIORITY_REJUDGE)
+
+    def test_metrics_per_class(self) -> None:
+        self.submit(self.exam, self.users[0], count=2)
+        self.submit(self.practice, self.users[1], count=3)
+        JudgeTask.objects.update(queued_at=timezone.now() - timedelta(seconds=30))
+        [task] = claim_tasks("test-worker")
+        self.finish(task)
+
+        metrics = queue_metrics()
+
+        self.assertEqual(metrics["exam"]["pending"], 1)
+        self.assertEqual(metrics["exam"]["finished"], 1)
+        self.assertGreaterEqual(metrics["exam"]["avg_wait"], 30)
+        self.assertEqual(metrics["practice"]["pending"], 3)
+        self.assertGreaterEqual(metrics["practice"]["oldest_pending_wait"], 30)
+        self.assertIsNone(metrics["practice"]["avg_wait"])
+        self.assertEqual(metrics["rejudge"]["pending"], 0)
+
+        out = StringIO()
+        call_command("judge_queue_metrics", stdout=out)
+        self.assertEqual(json.loads(out.getvalue())["practice"]["pending"], 3)
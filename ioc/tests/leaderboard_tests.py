@@ -0,0 +1,135 @@
+"""Module for testing the material and course leaderboards."""
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from courses.models.material import Material
+from ..helpers.leaderboard import COURSE_LEADERBOARD, MATERIAL_LEADERBOARD
+from ..helpers.submission_summary import (
+    rebuild_submission_summaries,
+    update_submission_summary,
+)
+from ..models.io_code_course_summary import IoCodeCourseSummary
+from ..models.material_io_code import MaterialIoCode
+from .judge_queue_tests import create_ioc_material
+from .submission_summary_tests import create_user, judged_submission
+
+
+class LeaderboardTestCase(TestCase):
+    """Class that tests ranking, paging and the rank of a user."""
+
+    def setUp(self) -> None:
+        """Method that sets up two problems of a course and some users."""
+        self.client = APIClient()
+        self.first = create_ioc_material()
+        self.second = Material.objects.create(
+            module_id=self.first.module_id,
+            name="Second problem",
+            material_type="IOC",
+            is_extra=False,
+        )
+        MaterialIoCode.objects.create(
+            material_id=self.second, max_time=1000, max_memory=1000, max_points=30
+        )
+        self.course_id = self.first.module_id.course_id_id
+        self.users = [create_user(number) for number in range(5)]
+        self.client.force_authenticate(self.users[0])
+
+    def summarize(self, user, material, response_char="A", time=0.5) -> None:
+        submission = judged_submission(material, user, response_char, time=time)
+        update_submission_summary(user, material, submission)
+
+    def ranking(self, leaderboard, group_id) -> list[tuple]:
+        rows, _ = leaderboard.page(group_id, None, 100)
+        return [(row["rank"], row["user_id"]) for row in rows]
+
+    def test_ranking_with_ties(self) -> None:
+        """Equal points, time and memory share a rank; the next rank skips."""
+        first, second, third, fourth, _ = self.users
+        self.summarize(first, self.first, time=0.9)
+        self.summarize(second, self.first, time=0.2)
+        self.summarize(third, self.first, time=0.2)
+        self.summarize(fourth, self.first, "W")
+
+        self.assertEqual(
+            self.ranking(MATERIAL_LEADERBOARD, self.first.id),
+            [(1, second.id), (1, third.id), (3, first.id), (4, fourth.id)],
+        )
+
+    def test_pages_cover_the_leaderboard(self) -> None:
+        for number, user in enumerate(self.users):
+            self.summarize(user, self.first, time=number % 2)
+        expected = self.ranking(MATERIAL_LEADERBOARD, self.first.id)
+
+        seen, cursor = [], None
+        while True:
+            response = self.client.get(
+                f"/iocode/leaderboard/material/{self.first.id}/",
+                {"limit": 2, **({"cursor": cursor} if cursor else {})},
+            )
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            self.assertLessEqual(len(body["results"]), 2)
+            seen += [(row["rank"], row["user_id"]) for row in body["results"]]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, expected)
+        self.assertEqual([rank for rank, _ in seen], [1, 1, 1, 4, 4])
+
+    def test_my_rank(self) -> None:
+        first, second, third, _, _ = self.users
+        self.summarize(first, self.first, time=0.7)
+        self.summarize(second, self.first, time=0.2)
+        self.summarize(third, self.first, time=0.7)
+
+        response = self.client.get(f"/iocode/leaderboard/material/{self.first.id}/me/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["rank"], 2)
+        self.assertEqual(response.json()["points"], 10)
+        self.assertEqual(MATERIAL_LEADERBOARD.rank(self.first.id, third.id)["rank"], 2)
+
+        self.client.force_authenticate(self.users[4])
+        response = self.client.get(f"/iocode/leaderboard/course/{self.course_id}/me/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_course_summaries(self) -> None:
+        """Course summaries add up the problems as they are judged and rebuilt."""
+        first, second, _, _, _ = self.users
+        self.summarize(first, self.first, time=0.5)
+        self.summarize(first, self.second, "W")
+        self.summarize(second, self.second, time=0.25)
+
+        summary = IoCodeCourseSummary.objects.get(user=first, course_id=self.course_id)
+        self.assertEqual((summary.points, summary.solved), (10, 1))
+        self.assertEqual(
+            self.ranking(COURSE_LEADERBOARD, self.course_id),
+            [(1, second.id), (2, first.id)],
+        )
+
+        self.summarize(first, self.second, time=0.5)
+        self.assertEqual(
+            self.ranking(COURSE_LEADERBOARD, self.course_id),
+            [(1, first.id), (2, second.id)],
+        )
+        before = list(
+            IoCodeCourseSummary.objects.order_by("user_id").values(
+                "user_id", "points", "solved", "total_execution_time"
+            )
+        )
+
+        rebuild_submission_summaries([self.first.id, self.second.id])
+        after = list(
+            IoCodeCourseSummary.objects.order_by("user_id").values(
+                "user_id", "points", "solved", "total_execution_time"
+            )
+        )
+        self.assertEqual(after, before)
+
+    def test_invalid_requests(self) -> None:
+        url = f"/iocode/leaderboard/material/{self.first.id}/"
+
+        self.assertEqual(self.client.get(url, {"cursor": "nope"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"limit": 0}).status_code, 400)
+        response = self.client.get("/iocode/leaderboard/course/0/")
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,174 @@
+"""Module for testing the local judge backend."""
+import os
+import shutil
+import socket
+import uuid
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+
+from accounts.models.user import User
+from ..helpers.case_results import unpack_case_results
+from ..helpers.case_store import create_cases
+from ..helpers.judge_queue import drain_queue, enqueue_submission
+from ..helpers.local_judge import get_local_judge
+from ..models.io_code_submission import IoCodeSubmission
+from .judge_queue_tests import create_ioc_material
+
+C_SUM = """
+#include <stdio.h>
+int main() { int a, b; scanf("%d %d", &a, &b); printf("%d\\n", a + b); }
+"""
+
+# Prints the sum of the input when none of the escapes works, what leaked if any
+ESCAPES = """
+import os, socket
+a, b = map(int, input().split())
+leaks = []
+for pid in filter(str.isdigit, os.listdir("/proc")):
+    try:
+        if b"SECRET_KEY" in open(f"/proc/{{pid}}/environ", "rb").read():
+            leaks.append("environ of " + pid)
+    except OSError:
+        pass
+for cache in {caches!r}:
+    if os.path.isdir(cache) and os.listdir(cache):
+        leaks.append(cache)
+try:
+    open({marker!r}, "w").close()
+except OSError:
+    pass
+try:
+    socket.create_connection(("127.0.0.1", {port}), timeout=1)
+    leaks.append("network")
+except OSError:
+    pass
+print(leaks or a + b)
+"""
+
+
+@override_settings(IOC_JUDGE_BACKEND="local", IOC_LOCAL_JUDGE_WORKERS=2)
+class LocalJudgeTestCase(TestCase):
+    """Class that tests judging submissions against the Case table locally."""
+
+    def setUp(self) -> None:
+        """Method that sets up a problem that adds two numbers."""
+        self.material = create_ioc_material()
+        material_ioc = self.material.materialiocode
+        material_ioc.max_time = 500
+        material_ioc.max_memory = 300
+        material_ioc.save()
+        create_cases(material_ioc.id, ["1 2", "5 5"], ["3", "10"])
+        self.user = User.objects.create(
+            email="test@example.com",
+            password="JHuyfub434eknjbv",
+            last_name="test_last_name",
+            first_name="test_first_name",
+        )
+
+    def judge(self, code: str, language: str = "py") -> IoCodeSubmission:
+        submission = IoCodeSubmission.objects.create(
+            material_id=self.material, user_id=self.user, code=code, language=language
+        )
+        enqueue_submission(submission)
+        drain_queue("test-worker")
+        submission.refresh_from_db()
+        return submission
+
+    def test_accepted(self) -> None:
+        submission = self.judge("print(sum(map(int, input().split())))")
+
+        self.assertEqual(submission.response_char, "A")
+        self.assertGreater(submission.execution_memory, 0)
+
+    def test_wrong_answer(self) -> None:
+        submission = self.judge("print(3)")
+
+        self.assertEqual(submission.response_char, "W")
+
+    def test_runtime_error(self) -> None:
+        submission = self.judge("raise SystemExit(1)")
+
+        self.assertEqual(submission.response_char, "R")
+
+    def test_time_limit(self) -> None:
+        submission = self.judge("while True: pass")
+
+        self.assertEqual(submission.response_char, "T")
+
+    def test_memory_limit(self) -> None:
+        submission = self.judge("data = bytearray(1024 * 1024 * 1024)")
+
+        self.assertEqual(submission.response_char, "M")
+
+    def test_environment_is_hidden(self) -> None:
+        """Submissions cannot read the secrets in the environment of the worker."""
+        submission = self.judge(
+            "import os\n"
+            "a, b = map(int, input().split())\n"
+            "print(os.environ.get('SECRET_KEY', a + b))"
+        )
+
+        self.assertEqual(submission.response_char, "A")
+
+    def test_program_is_isolated(self) -> None:
+        """Programs see neither the processes, files nor network of the judge."""
+        marker = f"/tmp/judge-escape-{uuid.uuid4().hex}"
+        caches = [settings.IOC_CASE_CACHE_DIR, settings.IOC_ARTIFACT_CACHE_DIR]
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            port = server.getsockname()[1]
+            submission = self.judge(
+                ESCAPES.format(caches=caches, marker=marker, port=port)
+            )
+
+        self.assertEqual(submission.response_char, "A")
+        self.assertFalse(os.path.exists(marker))
+
+    @patch("ioc.helpers.local_judge._judge", None)
+    @patch("ioc.helpers.local_judge.sandbox_available", return_value=False)
+    def test_no_judge_without_sandbox(self, mock_available) -> None:
+        with self.assertRaises(ImproperlyConfigured):
+            get_local_judge()
+
+    def test_case_results(self) -> None:
+        """Every case is judged and recorded, the first failure gives the verdict."""
+        submission = self.judge("print(3)")
+
+        verdicts = [
+            case["verdict"] for case in unpack_case_results(submission.case_results)
+        ]
+        self.assertEqual(verdicts, ["AC", "WA"])
+        self.assertEqual(submission.completion_rate, 0.5)
+
+    def test_stop_on_first_failure(self) -> None:
+        material_ioc = self.material.materialiocode
+        material_ioc.stop_on_first_failure = True
+        material_ioc.save()
+
+        submission = self.judge("print(10)")
+
+        self.assertEqual(submission.response_char, "W")
+        verdicts = [
+            case["verdict"] for case in unpack_case_results(submission.case_results)
+        ]
+        self.assertEqual(verdicts, ["WA"])
+        self.assertEqual(submission.completion_rate, 0.0)
+
+    @patch("ioc.helpers.judge_queue.publish_case")
+    def test_cases_are_published_while_judging(self, mock_publish) -> None:
+        submission = self.judge("print(sum(map(int, input().split())))")
+
+        published = [
+            (call.args[1], call.args[2]["verdict"])
+            for call in mock_publish.call_args_list
+        ]
+        self.assertEqual(published, [(0, "AC"), (1, "AC")])
+        self.assertEqual(mock_publish.call_args.args[0], submission)
+
+    @skipUnless(shutil.which("gcc"), "gcc is not installed")
+    def test_compiled_language(self) -> None:
+        self.assertEqual(self.judge(C_SUM, language="c").response_char, "A")
+        self.assertEqual(self.judge("int main() {", language="c").response_char, "C")
@@ -0,0 +1,209 @@
+"""Module for testing the background upload of the problems to the judge."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models.user import User
+from constants.ioc import (
+    PROBLEM_SYNC_MAX_ATTEMPTS,
+    PROBLEM_SYNC_MAX_RETRY_DELAY_SECONDS,
+)
+from ..helpers.case_store import create_cases
+from ..helpers.judge_queue import claim_tasks, enqueue_submission
+from ..helpers.judge_client import JudgeClient
+from ..helpers.problem_sync import claim_syncs, drain_problem_syncs, process_sync
+from ..helpers.stub_judge import StubJudge
+from ..helpers.verdict_cache import remember_verdict
+from ..models.case import Case
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.problem_sync import ProblemSync
+from ..models.verdict_memo import VerdictMemo
+from .judge_queue_tests import create_ioc_material
+
+
+class ProblemSyncTestCase(TestCase):
+    """Class that tests uploading only the changed cases, in the background."""
+
+    def setUp(self) -> None:
+        """Method that sets up a problem and a stub judge to upload it to."""
+        self.material = create_ioc_material()
+        self.material_ioc = self.material.materialiocode
+        self.stub = StubJudge().__enter__()
+        self.addCleanup(self.stub.__exit__)
+        client = JudgeClient(
+            connect_timeout=1,
+            failure_threshold=PROBLEM_SYNC_MAX_ATTEMPTS + 1,
+            read_timeout=1,
+            backoff=0,
+            max_retries=0,
+            problem_url=self.stub.url("/problem"),
+        )
+        patcher = patch(
+            "ioc.helpers.problem_sync.get_judge_client", return_value=client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def uploads(self) -> list[dict]:
+        return [payload for path, payload in self.stub.requests if path == "/problem"]
+
+    def sync(self) -> ProblemSync:
+        drain_problem_syncs("test-worker")
+        return ProblemSync.objects.get(material_io_code=self.material_ioc)
+
+    def test_material_creation_does_not_wait_for_the_judge(self) -> None:
+        user = User.objects.create(email="test@example.com", password="x")
+        client = APIClient()
+        client.force_authenticate(user)
+
+        response = client.post(
+            "/material/create/",
+            {
+                "module_id": self.material.module_id.id,
+                "name": "Sum",
+                "material_type": "IOC",
+                "input": ["1 2", "3 4"],
+                "output": ["3", "7"],
+                "points": [1, 1],
+                "is_extra": False,
+                "max_memory": 300,
+                "max_time": 1,
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(self.stub.requests, [])
+        sync = ProblemSync.objects.get(material_io_code__material_id__name="Sum")
+        self.assertEqual(sync.status, ProblemSync.PENDING)
+
+    def test_only_changed_cases_are_sent(self) -> None:
+        create_cases(self.material_ioc.id, ["1 2", "3 4"], ["3", "7"])
+        sync = self.sync()
+
+        self.assertEqual(sync.status, ProblemSync.DONE)
+        [first] = self.uploads()
+        self.assertEqual(first["problem_id"], str(self.material.id))
+        self.assertEqual(
+            first["cases"],
+            [
+                {"id_case": 0, "input": "1 2", "output": "3"},
+                {"id_case": 1, "input": "3 4", "output": "7"},
+            ],
+        )
+
+        # Nothing changed, nothing is sent
+        create_cases(self.material_ioc.id, [], [])
+        self.assertEqual(self.sync().status, ProblemSync.DONE)
+        self.assertEqual(len(self.uploads()), 1)
+
+        Case.objects.get(id_case=0).delete()
+        [added] = create_cases(self.material_ioc.id, ["0"], ["8"])
+        case = Case.objects.get(id_case=1)
+        case.output_blob = added.output_blob
+        case.save()
+        self.sync()
+
+        last = self.uploads()[-1]
+        self.assertEqual(
+            last["cases"],
+            [
+                {"id_case": 1, "input": "3 4", "output": "8"},
+                {"id_case": 2, "input": "0", "output": "8"},
+            ],
+        )
+        self.assertEqual((last["removed"], last["total_cases"]), ([0], 2))
+
+    def test_failed_uploads_are_retried(self) -> None:
+        create_cases(self.material_ioc.id, ["1 2"], ["3"])
+        self.stub.fail_next = PROBLEM_SYNC_MAX_ATTEMPTS
+
+        for attempt in range(1, PROBLEM_SYNC_MAX_ATTEMPTS + 1):
+            ProblemSync.objects.update(available_at=timezone.now())
+            sync = self.sync()
+            self.assertEqual(sync.attempts, attempt)
+        self.assertEqual(sync.status, ProblemSync.FAILED)
+        self.assertIn("500", sync.last_error)
+        self.assertLessEqual(
+            sync.available_at,
+            timezone.now() + timedelta(seconds=PROBLEM_SYNC_MAX_RETRY_DELAY_SECONDS),
+        )
+
+        # A failed sync is still retried
+        ProblemSync.objects.update(available_at=timezone.now())
+        self.assertEqual(self.sync().status, ProblemSync.DONE)
+
+        # Changing the cases again starts over
+        self.stub.fail_next = 1
+        create_cases(self.material_ioc.id, ["4 4"], ["8"])
+        self.assertEqual(self.sync().status, ProblemSync.PENDING)
+        ProblemSync.objects.update(available_at=timezone.now())
+        create_cases(self.material_ioc.id, ["5 5"], ["10"])
+        sync = self.sync()
+        self.assertEqual(sync.status, ProblemSync.DONE)
+        self.assertEqual(len(self.uploads()[-1]["cases"]), 2)
+
+    def test_retry_waits(self) -> None:
+        create_cases(self.material_ioc.id, ["1 2"], ["3"])
+        self.stub.fail_next = 1
+
+        sync = self.sync()
+
+        self.assertEqual(sync.status, ProblemSync.PENDING)
+        self.assertGreater(sync.available_at, timezone.now() + timedelta(seconds=5))
+        self.assertEqual(claim_syncs("test-worker"), [])
+
+    def test_change_while_uploading_syncs_again(self) -> None:
+        create_cases(self.material_ioc.id, ["1 2"], ["3"])
+        [sync] = claim_syncs("test-worker")
+        create_cases(self.material_ioc.id, ["5 5"], ["10"])
+        ProblemSync.objects.update(requested_at=sync.claimed_at + timedelta(seconds=1))
+
+        process_sync(sync)
+
+        self.assertEqual(
+            ProblemSync.objects.get(id=sync.id).status, ProblemSync.PENDING
+        )
+        self.assertEqual(self.sync().status, ProblemSync.DONE)
+
+    def test_submissions_wait_for_the_upload(self) -> None:
+        """Submissions are not judged against cases the judge does not have yet."""
+        create_cases(self.material_ioc.id, ["1 2"], ["3"])
+        user = User.objects.create(email="test@example.com", password="x")
+        submission = IoCodeSubmission.objects.create(
+            material_id=self.material, user_id=user, code="print(3)", language="py"
+        )
+        enqueue_submission(submission)
+
+        self.assertEqual(claim_tasks("test-worker"), [])
+        [sync] = claim_syncs("test-worker")
+        self.assertEqual(claim_tasks("test-worker"), [])
+
+        process_sync(sync)
+        [task] = claim_tasks("test-worker")
+        self.assertEqual(task.submission_id, submission.submission_id)
+
+    def test_failed_upload_holds_submissions(self) -> None:
+        """Submissions wait for a failed upload, and no verdict is memoized."""
+        create_cases(self.material_ioc.id, ["1 2"], ["3"])
+        ProblemSync.objects.update(status=ProblemSync.FAILED)
+        user = User.objects.create(email="test@example.com", password="x")
+        submission = IoCodeSubmission.objects.create(
+            material_id=self.material,
+            user_id=user,
+            code="print(3)",
+            language="py",
+            response_char="A",
+        )
+        enqueue_submission(submission)
+
+        self.assertEqual(claim_tasks("test-worker"), [])
+        remember_verdict(submission, self.material_ioc)
+        self.assertFalse(VerdictMemo.objects.exists())
+
+        ProblemSync.objects.update(status=ProblemSync.DONE)
+        remember_verdict(submission, self.material_ioc)
+        self.assertTrue(VerdictMemo.objects.exists())
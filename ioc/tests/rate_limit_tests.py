@@ -0,0 +1,99 @@
+"""Module for testing the rate limits of the submissions."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..helpers import rate_limit
+from ..models.contest import Contest
+from .judge_queue_tests import create_ioc_material
+from .submission_summary_tests import create_user
+
+
+class RateLimitTestCase(TestCase):
+    """Class that tests the user, material and contest token buckets."""
+
+    def setUp(self) -> None:
+        """Method that sets up a material and a fixed clock."""
+        cache.clear()
+        self.client = APIClient()
+        self.material = create_ioc_material()
+        self.users = [create_user(number) for number in range(2)]
+        self.now = 1_000_000.0
+        clock = patch.object(rate_limit.time, "time", side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def submit(self, user):
+        self.client.force_authenticate(user)
+        return self.client.post(
+            "/iocode/submission/create/",
+            {
+                "material_id": self.material.id,
+                "user_id": user.id,
+                "code": "print(1)",
+                "language": "py",
+            },
+            format="json",
+        )
+
+    def test_user_burst_then_refill(self) -> None:
+        """A user sends a burst, then waits for the bucket to refill."""
+        user = self.users[0]
+        for _ in range(rate_limit.SUBMISSION_USER_BURST):
+            self.assertEqual(self.submit(user).status_code, 202)
+
+        response = self.submit(user)
+        self.assertEqual(response.status_code, 429)
+        seconds = 60 / rate_limit.SUBMISSION_USER_PER_MINUTE
+        self.assertEqual(response["Retry-After"], str(int(seconds)))
+        # Other users have their own bucket
+        self.assertEqual(self.submit(self.users[1]).status_code, 202)
+
+        self.now += seconds
+        self.assertEqual(self.submit(user).status_code, 202)
+        self.assertEqual(self.submit(user).status_code, 429)
+
+    def test_material_bucket_is_shared(self) -> None:
+        io_code = self.material.materialiocode
+        io_code.submission_burst = 3
+        io_code.submissions_per_minute = 1
+        io_code.save()
+
+        first, second = self.users
+        self.assertEqual(self.submit(first).status_code, 202)
+        self.assertEqual(self.submit(second).status_code, 202)
+        self.assertEqual(self.submit(first).status_code, 202)
+
+        response = self.submit(second)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "60")
+
+    def test_contest_rate(self) -> None:
+        """During a contest the users get the bucket of the contest."""
+        contest = Contest.objects.create(
+            course=self.material.module_id.course_id,
+            name="Test contest",
+            start_at=timezone.now() - timedelta(minutes=1),
+            end_at=timezone.now() + timedelta(hours=1),
+            submission_burst=1,
+            submissions_per_minute=2,
+        )
+        contest.materials.set([self.material])
+
+        user = self.users[0]
+        self.assertEqual(self.submit(user).status_code, 202)
+        response = self.submit(user)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "30")
+
+    def test_refused_submissions_take_no_token(self) -> None:
+        """A submission refused by one bucket leaves the other one alone."""
+        buckets = [("first", 1, 1.0), ("second", 2, 1.0)]
+        self.assertEqual(rate_limit.take_tokens(buckets), 0)
+        self.assertEqual(rate_limit.take_tokens(buckets), 60)
+
+        self.assertEqual(rate_limit.take_tokens([("second", 2, 1.0)]), 0)
@@ -0,0 +1,123 @@
+"""Module for testing the rebuild of submission summaries."""
+import random
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from courses.models.material import Material
+from ..helpers.submission_summary import update_submission_summary
+from ..models.io_code_submission_summary import IoCodeSubmissionSummary
+from ..models.material_io_code import MaterialIoCode
+from .judge_queue_tests import create_ioc_material
+from .submission_summary_tests import create_user, judged_submission
+
+SUMMARY_FIELDS = (
+    "user_id",
+    "material_id",
+    "attempts",
+    "hits",
+    "points",
+    "min_execution_time",
+    "min_execution_memory",
+    "max_completion_rate",
+)
+
+
+class RebuildSummariesTestCase(TestCase):
+    """Class that tests recomputing summaries from the submission history."""
+
+    def setUp(self) -> None:
+        """Method that replays a random history through the live summary path."""
+        self.material = create_ioc_material()
+        io_code = self.material.materialiocode
+        io_code.max_points = 100
+        io_code.min_points = 10
+        io_code.points_penalty = 15
+        io_code.save()
+        self.users = [create_user(number) for number in range(6)]
+
+        generator = random.Random(8)
+        for _ in range(60):
+            user = generator.choice(self.users)
+            response_char = generator.choice("AAWWRTC")
+            submission = judged_submission(
+                self.material,
+                user,
+                response_char,
+                time=generator.randint(1, 100) / 100,
+                memory=generator.randint(100, 900),
+                completion_rate=(
+                    1.0 if response_char == "A" else generator.randint(0, 4) / 5
+                ),
+            )
+            update_submission_summary(user, self.material, submission)
+
+        # Pending and failed submissions were never summarized
+        judged_submission(self.material, self.users[0], None, time=None, memory=None)
+        judged_submission(self.material, self.users[0], "E", time=None, memory=None)
+
+    def summaries(self) -> list[tuple]:
+        return list(
+            IoCodeSubmissionSummary.objects.order_by("user_id").values_list(
+                *SUMMARY_FIELDS
+            )
+        )
+
+    def rebuild(self, *args) -> str:
+        out = StringIO()
+        call_command("rebuild_submission_summaries", *args, stdout=out)
+        return out.getvalue()
+
+    def test_rebuild_matches_replay(self) -> None:
+        """The rebuilt summaries equal the ones kept by the live path."""
+        expected = self.summaries()
+        IoCodeSubmissionSummary.objects.update(attempts=0, hits=0, points=0)
+        IoCodeSubmissionSummary.objects.filter(user=self.users[0]).delete()
+
+        self.rebuild("--all")
+
+        self.assertEqual(self.summaries(), expected)
+
+    def test_rebuild_applies_new_penalty(self) -> None:
+        io_code = self.material.materialiocode
+        io_code.points_penalty = 0
+        io_code.save()
+
+        self.rebuild("--course", "TestCourse")
+
+        points = set(
+            IoCodeSubmissionSummary.objects.filter(hits__gt=0).values_list(
+                "points", flat=True
+            )
+        )
+        self.assertEqual(points, {100})
+
+    def test_rebuild_is_scoped(self) -> None:
+        other = Material.objects.create(
+            module_id=self.material.module_id,
+            name="Other material",
+            material_type="IOC",
+            is_extra=False,
+        )
+        MaterialIoCode.objects.create(
+            material_id=other, max_time=1000, max_memory=1000, max_points=10
+        )
+        summary = IoCodeSubmissionSummary.objects.create(
+            user=self.users[0],
+            material=other,
+            attempts=5,
+            hits=0,
+            points=0,
+            min_execution_time=0,
+            min_execution_memory=0,
+            max_completion_rate=0,
+        )
+
+        self.rebuild("--material", str(self.material.id), "--chunk-size", "1")
+
+        self.assertTrue(IoCodeSubmissionSummary.objects.filter(id=summary.id).exists())
+
+    def test_unknown_scope(self) -> None:
+        with self.assertRaises(CommandError):
+            self.rebuild("--course", "Missing")
@@ -0,0 +1,247 @@
+"""Module for testing the rejudge of IOC materials."""
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models.user import User
+from courses.models.instructor import Instructor
+from constants.ioc import JUDGE_REJUDGE_MAX_RUNNING
+from ..helpers.judge_queue import (
+    claim_tasks,
+    drain_queue,
+    enqueue_submission,
+    process_task,
+)
+from ..helpers.rejudge import start_rejudge
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.io_code_submission_summary import IoCodeSubmissionSummary
+from ..models.judge_task import JudgeTask
+from ..models.rejudge import Rejudge
+from .judge_queue_tests import ACCEPTED, create_ioc_material
+
+WRONG = (
+    {
+        "max_memory": 8960,
+        "max_time": 0.03,
+        "submission_id": 1,
+        "verdict": {"message": "Wrong answer", "verdict": "WA"},
+    },
+    201,
+)
+
+
+@patch("ioc.helpers.judge_queue.judge", return_value=ACCEPTED)
+class RejudgeTestCase(TestCase):
+    """Class that tests rejudging the submissions of a material."""
+
+    def setUp(self) -> None:
+        """Method that sets up the client and the data to be used in the tests."""
+        self.client = APIClient()
+        self.material = create_ioc_material()
+        self.user = User.objects.create(
+            email="test@example.com",
+            password="JHuyfub434eknjbv",
+            last_name="test_last_name",
+            first_name="test_first_name",
+        )
+        self.client.force_authenticate(self.user)
+
+    def submit(self, count: int, judged: bool = True) -> list[IoCodeSubmission]:
+        submissions = []
+        for number in range(count):
+            submission = IoCodeSubmission.objects.create(
+                material_id=self.material,
+                user_id=self.user,
+                code=f"print({number})",
+                language="py",
+            )
+            enqueue_submission(submission)
+            submissions.append(submission)
+        if judged:
+            drain_queue("test-worker")
+        return submissions
+
+    def test_start_reopens_judged_submissions(self, mock_judge) -> None:
+        """Judged submissions are queued again, waiting live ones are left alone."""
+        self.submit(3)
+        IoCodeSubmission.objects.create(  # Judged before the judge queue existed
+            material_id=self.material,
+            user_id=self.user,
+            code="print('old')",
+            language="py",
+            response_char="A",
+            execution_time=0.1,
+            execution_memory=100,
+        )
+        [waiting] = self.submit(1, judged=False)
+
+        rejudge = start_rejudge(self.material)
+
+        self.assertEqual(rejudge.total, 4)
+        self.assertEqual(rejudge.tasks.filter(status=JudgeTask.PENDING).count(), 4)
+        waiting_task = JudgeTask.objects.get(submission=waiting)
+        self.assertEqual(waiting_task.priority, JudgeTask.PRIORITY_PRACTICE)
+        self.assertIsNone(waiting_task.rejudge_id)
+
+    def test_running_tasks_are_left_alone(self, mock_judge) -> None:
+        """A task being judged is not reopened, nor demoted to the rejudge priority."""
+        self.submit(1)
+        [live] = self.submit(1, judged=False)
+        [running] = claim_tasks("test-worker")
+
+        rejudge = start_rejudge(self.material)
+
+        self.assertEqual(rejudge.total, 1)
+        running.refresh_from_db()
+        self.assertEqual(running.submission_id, live.submission_id)
+        self.assertEqual(running.status, JudgeTask.RUNNING)
+        self.assertEqual(running.priority, JudgeTask.PRIORITY_PRACTICE)
+        self.assertIsNone(running.rejudge_id)
+
+    def test_verdict_of_old_limits_is_judged_again(self, mock_judge) -> None:
+        """A task judged while the limits changed is queued again, not stored."""
+        [live] = self.submit(1, judged=False)
+        [running] = claim_tasks("test-worker")
+        start_rejudge(self.material)
+
+        process_task(running)
+
+        running.refresh_from_db()
+        self.assertEqual(running.status, JudgeTask.PENDING)
+        live.refresh_from_db()
+        self.assertIsNone(live.response_char)
+        self.assertEqual(drain_queue("test-worker"), 1)
+        live.refresh_from_db()
+        self.assertEqual(live.response_char, "A")
+
+    def test_running_rejudge_tasks_join_new_rejudge(self, mock_judge) -> None:
+        """A new rejudge is not done before the tasks of the old one being judged."""
+        self.submit(1)
+        first = start_rejudge(self.material)
+        [running] = claim_tasks("test-worker")
+
+        second = start_rejudge(self.material)
+
+        self.assertEqual(second.total, 1)
+        process_task(running)
+        second.refresh_from_db()
+        self.assertEqual(second.status, Rejudge.RUNNING)
+        drain_queue("test-worker")
+        second.refresh_from_db()
+        self.assertEqual(second.status, Rejudge.DONE)
+        self.assertEqual(first.tasks.count(), 0)
+
+    def test_live_submissions_first(self, mock_judge) -> None:
+        self.submit(2)
+        start_rejudge(self.material)
+        [live] = self.submit(1, judged=False)
+
+        [task] = claim_tasks("test-worker")
+
+        self.assertEqual(task.submission_id, live.submission_id)
+
+    def test_running_rejudge_tasks_are_capped(self, mock_judge) -> None:
+        self.submit(JUDGE_REJUDGE_MAX_RUNNING + 3)
+        start_rejudge(self.material)
+
+        claimed = claim_tasks("worker-1", limit=10)
+        self.assertEqual(len(claimed), JUDGE_REJUDGE_MAX_RUNNING)
+        self.assertEqual(claim_tasks("worker-2", limit=10), [])
+
+    def test_summaries_are_rebuilt_at_the_end(self, mock_judge) -> None:
+        """Rejudged verdicts replace the old ones without counting new attempts."""
+        self.submit(3)
+        rejudge = start_rejudge(self.material)
+        mock_judge.return_value = WRONG
+
+        drain_queue("test-worker")
+
+        rejudge.refresh_from_db()
+        self.assertEqual(rejudge.status, Rejudge.DONE)
+        self.assertFalse(IoCodeSubmission.objects.exclude(response_char="W").exists())
+        summary = IoCodeSubmissionSummary.objects.get(
+            user=self.user, material=self.material
+        )
+        self.assertEqual((summary.attempts, summary.hits), (3, 0))
+
+    def test_new_rejudge_cancels_running_one(self, mock_judge) -> None:
+        self.submit(2)
+        first = start_rejudge(self.material)
+        second = start_rejudge(self.material)
+
+        first.refresh_from_db()
+        self.assertEqual(first.status, Rejudge.CANCELLED)
+        self.assertEqual(second.tasks.count(), 2)
+
+    def test_limit_update_starts_rejudge(self, mock_judge) -> None:
+        self.submit(2)
+        Instructor.objects.create(
+            user_id=self.user,
+            course_id=self.material.module_id.course_id,
+            instructor_type="T",
+        )
+
+        response = self.client.patch(
+            f"/material/iocode/update/{self.material.id}/",
+            {"max_time": 2000},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(f"/iocode/rejudge/{self.material.id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total"], 2)
+        self.assertEqual(response.json()["pending"], 2)
+
+    def test_same_limits_do_not_rejudge(self, mock_judge) -> None:
+        self.submit(1)
+
+        self.client.patch(
+            f"/material/iocode/update/{self.material.id}/",
+            {"max_time": "1000"},
+            format="json",
+        )
+
+        self.assertFalse(Rejudge.objects.exists())
+
+    def test_create_rejudge_endpoint(self, mock_judge) -> None:
+        self.submit(2)
+        Instructor.objects.create(
+            user_id=self.user,
+            course_id=self.material.module_id.course_id,
+            instructor_type="T",
+        )
+
+        response = self.client.post(f"/iocode/rejudge/create/{self.material.id}/")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["status"], Rejudge.RUNNING)
+
+        drain_queue("test-worker")
+        response = self.client.get(f"/iocode/rejudge/{self.material.id}/")
+        self.assertEqual(response.json()["status"], Rejudge.DONE)
+        self.assertEqual(response.json()["progress"], 1.0)
+
+    def test_create_rejudge_forbidden(self, mock_judge) -> None:
+        """Only the instructors of the course can rejudge its materials."""
+        self.submit(1)
+
+        response = self.client.post(f"/iocode/rejudge/create/{self.material.id}/")
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Rejudge.objects.exists())
+
+    def test_rejudge_progress_forbidden(self, mock_judge) -> None:
+        """Only the instructors of the course can follow its rejudges."""
+        self.submit(1)
+        start_rejudge(self.material)
+
+        response = self.client.get(f"/iocode/rejudge/{self.material.id}/")
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_rejudge_not_found(self, mock_judge) -> None:
+        response = self.client.get(f"/iocode/rejudge/{self.material.id}/")
+        self.assertEqual(response.status_code, 404)
+        response = self.client.post("/iocode/rejudge/create/0/")
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,149 @@
+"""Module for testing the similarity index of the accepted submissions."""
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from courses.models.instructor import Instructor
+from ..helpers import similarity
+from ..helpers.judge_queue import drain_queue, enqueue_submission
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.similarity_signature import SimilaritySignature
+from .judge_queue_tests import ACCEPTED, create_ioc_material
+from .rejudge_tests import WRONG
+from .submission_summary_tests import create_user
+
+ORIGINAL = """
+def solve(numbers):
+    # Adds up the even numbers
+    total = 0
+    for number in numbers:
+        if number % 2 == 0:
+            total += number
+    return total
+
+values = list(map(int, input().split()))
+print(solve(values))
+"""
+
+# The original with other names, numbers and comments
+COPY = """
+def f(xs):
+    s = 0  # accumulator
+    for x in xs:
+        if x % 2 == 0:
+            s += x
+    return s
+
+a = list(map(int, input().split()))
+print(f(a))
+"""
+
+OTHERS = [
+    "print(sum(int(x) for x in input().split() if int(x) % 2 == 0))",
+    "import sys\ndata = sys.stdin.read().split()\nprint(len(data))",
+    "n = int(input())\nwhile n > 1:\n    n = n // 2 if n % 2 == 0 else 3 * n + 1\n"
+    "    print(n)",
+    "words = input().split()\nwords.sort(key=len)\nfor w in words:\n    print(w)",
+    "a, b = map(int, input().split())\nprint(max(a, b) - min(a, b))",
+    "s = input()\nprint(s == s[::-1])",
+]
+
+
+class SimilarityTestCase(TestCase):
+    """Class that tests indexing submissions and reporting similar pairs."""
+
+    def setUp(self) -> None:
+        """Method that sets up a material and an instructor of its course."""
+        self.client = APIClient()
+        self.material = create_ioc_material()
+        self.users = [create_user(number) for number in range(len(OTHERS) + 2)]
+        self.instructor = create_user(100)
+        Instructor.objects.create(
+            user_id=self.instructor,
+            course_id=self.material.module_id.course_id,
+            instructor_type="T",
+        )
+        self.client.force_authenticate(self.instructor)
+
+    def submit(self, user, code: str, verdict=ACCEPTED) -> IoCodeSubmission:
+        submission = IoCodeSubmission.objects.create(
+            material_id=self.material, user_id=user, code=code, language="py"
+        )
+        enqueue_submission(submission)
+        with patch("ioc.helpers.judge_queue.judge", return_value=verdict):
+            drain_queue("test-worker")
+        return submission
+
+    def report(self, **params):
+        return self.client.get(
+            f"/iocode/similarity/material/{self.material.id}/", params
+        )
+
+    def test_tokens_ignore_names_and_comments(self) -> None:
+        self.assertEqual(
+            similarity.tokenize(ORIGINAL, "py"), similarity.tokenize(COPY, "py")
+        )
+        self.assertEqual(
+            similarity.tokenize("int a = 1; // one\n/* two */", "c"),
+            similarity.tokenize("int b = 2;", "c"),
+        )
+
+    def test_copies_are_reported(self) -> None:
+        """Only the pair of copies is reported, comparing only candidates."""
+        first, second, *others = self.users
+        original = self.submit(first, ORIGINAL)
+        copy = self.submit(second, COPY)
+        for user, code in zip(others, OTHERS):
+            self.submit(user, code)
+
+        with patch.object(
+            similarity, "similarity", wraps=similarity.similarity
+        ) as compared:
+            response = self.report()
+
+        self.assertEqual(response.status_code, 200)
+        pairs = response.json()["pairs"]
+        self.assertEqual(len(pairs), 1)
+        self.assertEqual(pairs[0]["similarity"], 1.0)
+        self.assertEqual(
+            [row["submission_id"] for row in pairs[0]["submissions"]],
+            [original.submission_id, copy.submission_id],
+        )
+        # Far fewer than the 28 pairs of 8 submissions
+        self.assertLess(compared.call_count, 5)
+
+    def test_only_accepted_submissions_are_indexed(self) -> None:
+        submission = self.submit(self.users[0], ORIGINAL)
+        self.submit(self.users[1], COPY, WRONG)
+        self.assertEqual(
+            list(SimilaritySignature.objects.values_list("submission_id", flat=True)),
+            [submission.submission_id],
+        )
+        self.assertEqual(submission.similarity_signature.buckets.count(), 32)
+
+        submission.response_char = "W"
+        similarity.index_submission(submission)
+        self.assertFalse(SimilaritySignature.objects.exists())
+
+        # The verdict was not saved, the command indexes the submission again
+        call_command(
+            "index_similarity", "--material", self.material.id, stdout=StringIO()
+        )
+        self.assertTrue(SimilaritySignature.objects.filter(submission=submission))
+
+    def test_same_user_is_not_reported(self) -> None:
+        self.submit(self.users[0], ORIGINAL)
+        self.submit(self.users[0], COPY)
+
+        self.assertEqual(self.report().json()["pairs"], [])
+
+    def test_report_permissions(self) -> None:
+        self.assertEqual(self.report(threshold=2).status_code, 400)
+
+        self.client.force_authenticate(self.users[0])
+        self.assertEqual(self.report().status_code, 403)
+        response = self.client.get("/iocode/similarity/material/0/")
+        self.assertEqual(response.status_code, 404)
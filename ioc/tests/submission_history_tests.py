@@ -0,0 +1,99 @@
+"""Module for testing the paged submission history."""
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from courses.models.instructor import Instructor
+from ..models.io_code_submission import IoCodeSubmission
+from .judge_queue_tests import create_ioc_material
+from .submission_summary_tests import create_user
+
+
+class SubmissionHistoryTestCase(TestCase):
+    """Class that tests the keyset pages of the submission history."""
+
+    def setUp(self) -> None:
+        """Method that sets up the history of two users on a material."""
+        self.client = APIClient()
+        self.material = create_ioc_material()
+        self.user, self.other = create_user(0), create_user(1)
+        self.submissions = [
+            IoCodeSubmission.objects.create(
+                material_id=self.material,
+                user_id=self.user if number % 3 else self.other,
+                code=f"print({number})",
+                language="py",
+                response_char="W",
+            )
+            for number in range(9)
+        ]
+        self.client.force_authenticate(self.user)
+
+    def read_all(self, url: str, **params) -> list[dict]:
+        results, cursor = [], None
+        while True:
+            if cursor is not None:
+                params["cursor"] = cursor
+            response = self.client.get(url, {"limit": 2, **params})
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            self.assertLessEqual(len(body["results"]), 2)
+            results += body["results"]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                return results
+
+    def test_user_history_newest_first(self) -> None:
+        url = f"/iocode/submission/user/{self.user.id}/{self.material.id}/"
+
+        results = self.read_all(url)
+        expected = [
+            submission.submission_id
+            for submission in reversed(self.submissions)
+            if submission.user_id == self.user
+        ]
+        self.assertEqual([row["submission_id"] for row in results], expected)
+        self.assertNotIn("code", results[0])
+
+        results = self.read_all(url, with_code="true")
+        self.assertEqual(results[-1]["code"], "print(1)")
+
+    def test_code_is_not_read_unless_asked(self) -> None:
+        url = f"/iocode/submission/user/{self.user.id}/{self.material.id}/"
+        code_column = f'"{IoCodeSubmission._meta.db_table}"."code"'
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        self.assertFalse(any(code_column in query["sql"] for query in queries))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url, {"with_code": "1"})
+        self.assertTrue(any(code_column in query["sql"] for query in queries))
+
+    def test_material_history_for_instructors(self) -> None:
+        url = f"/iocode/submission/material/{self.material.id}/"
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        Instructor.objects.create(
+            user_id=self.user,
+            course_id=self.material.module_id.course_id,
+            instructor_type="T",
+        )
+        results = self.read_all(url)
+        self.assertEqual(
+            [row["submission_id"] for row in results],
+            [submission.submission_id for submission in reversed(self.submissions)],
+        )
+        self.assertEqual(results[-1]["user_id"], self.other.id)
+        self.assertEqual(
+            self.client.get("/iocode/submission/material/0/").status_code, 404
+        )
+
+    def test_invalid_requests(self) -> None:
+        url = f"/iocode/submission/user/{self.user.id}/{self.material.id}/"
+
+        self.assertEqual(self.client.get(url, {"cursor": "nope"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"limit": "many"}).status_code, 400)
+        response = self.client.get(f"/iocode/submission/user/{self.user.id}/0/")
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,163 @@
+"""Module for testing the streams of submission status changes."""
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase, TransactionTestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from ..helpers.submission_events import LocalBroker, PostgresBroker, get_broker
+from ..models.io_code_submission import IoCodeSubmission
+from .judge_queue_tests import create_ioc_material
+from .submission_summary_tests import create_user
+
+STREAM_URL = "/iocode/submission/stream/"
+
+
+def create_active_user(number: int):
+    """User whose access token is accepted, inactive users are rejected"""
+    user = create_user(number)
+    user.is_active = True
+    user.save(update_fields=["is_active"])
+    return user
+
+
+def parse_events(chunk: bytes) -> list[dict]:
+    return [
+        json.loads(line[len("data: ") :])
+        for line in chunk.decode().splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+@override_settings(IOC_EVENTS_BACKEND="local")
+class SubmissionStreamTestCase(TestCase):
+    """Class that tests the server-sent events of a user's submissions."""
+
+    def setUp(self) -> None:
+        """Method that sets up a material, a user and their token."""
+        self.material = create_ioc_material()
+        self.user = create_active_user(0)
+        self.headers = {"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+        self.submission = IoCodeSubmission.objects.create(
+            material_id=self.material,
+            user_id=self.user,
+            code="print(1)",
+            language="py",
+        )
+
+    def give_verdict(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.submission.response_char = "A"
+            self.submission.execution_time = 0.1
+            self.submission.execution_memory = 100
+            self.submission.save(
+                update_fields=["response_char", "execution_time", "execution_memory"]
+            )
+
+    async def next_events(self, stream) -> list[dict]:
+        """Events of the next chunk of the stream that has any"""
+        while True:
+            events = parse_events(await asyncio.wait_for(anext(stream), timeout=5))
+            if events:
+                return events
+
+    async def test_stream_pushes_verdict(self) -> None:
+        """The pending status is sent first, then the verdict ends the stream."""
+        response = await self.async_client.get(
+            STREAM_URL,
+            {"submission_id": self.submission.submission_id},
+            headers=self.headers,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+
+        [pending] = await self.next_events(stream)
+        self.assertIsNone(pending["response_char"])
+
+        await sync_to_async(self.give_verdict)()
+        [judged] = await self.next_events(stream)
+        self.assertEqual(judged["submission_id"], self.submission.submission_id)
+        self.assertEqual(judged["response_char"], "A")
+
+        with self.assertRaises(StopAsyncIteration):
+            await anext(stream)
+        self.assertEqual(get_broker().subscribers(), 0)
+
+    async def test_judged_submission_ends_at_once(self) -> None:
+        await sync_to_async(self.give_verdict)()
+
+        response = await self.async_client.get(
+            STREAM_URL,
+            {"submission_id": self.submission.submission_id},
+            headers=self.headers,
+        )
+
+        chunks = [chunk async for chunk in response.streaming_content]
+        [event] = parse_events(b"".join(chunks))
+        self.assertEqual(event["response_char"], "A")
+
+    async def test_requires_token(self) -> None:
+        response = await self.async_client.get(STREAM_URL)
+        self.assertEqual(response.status_code, 401)
+
+        response = await self.async_client.get(
+            STREAM_URL, headers={"Authorization": "Bearer not-a-token"}
+        )
+        self.assertEqual(response.status_code, 401)
+
+    async def test_submission_of_other_user(self) -> None:
+        other = await sync_to_async(create_active_user)(1)
+        headers = {"Authorization": f"Bearer {AccessToken.for_user(other)}"}
+
+        response = await self.async_client.get(
+            STREAM_URL,
+            {"submission_id": self.submission.submission_id},
+            headers=headers,
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(get_broker().subscribers(), 0)
+
+
+class BrokerTestCase(TestCase):
+    """Class that tests the delivery of events to many idle subscriptions."""
+
+    async def test_thousands_of_idle_subscriptions(self) -> None:
+        broker = LocalBroker()
+        subscriptions = [
+            await broker.subscribe(user_id % 500) for user_id in range(5000)
+        ]
+
+        await sync_to_async(broker.publish)({"user_id": 7, "submission_id": 1})
+        await asyncio.sleep(0)
+
+        received = [
+            subscription
+            for subscription in subscriptions
+            if not subscription.queue.empty()
+        ]
+        self.assertEqual(len(received), 10)
+        self.assertTrue(all(subscription.user_id == 7 for subscription in received))
+
+        for subscription in subscriptions:
+            subscription.close()
+        self.assertEqual(broker.subscribers(), 0)
+
+
+class PostgresBrokerTestCase(TransactionTestCase):
+    """Class that tests relaying events through LISTEN/NOTIFY."""
+
+    async def test_committed_event_reaches_listener(self) -> None:
+        broker = PostgresBroker()
+        subscription = await broker.subscribe(3)
+        try:
+            await sync_to_async(broker.publish)({"user_id": 3, "submission_id": 9})
+
+            event = await asyncio.wait_for(subscription.get(), timeout=5)
+
+            self.assertEqual(event, {"user_id": 3, "submission_id": 9})
+        finally:
+            subscription.close()
+            broker._stop()
@@ -0,0 +1,154 @@
+"""Module for testing the submission summary upsert."""
+import threading
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models.user import User
+from ..helpers.submission_summary import update_submission_summary
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.io_code_submission_summary import IoCodeSubmissionSummary
+from .judge_queue_tests import create_ioc_material
+
+
+def create_user(number: int = 0) -> User:
+    return User.objects.create(
+        email=f"test{number}@example.com",
+        password="JHuyfub434eknjbv",
+        last_name="test_last_name",
+        first_name="test_first_name",
+    )
+
+
+def judged_submission(
+    material, user, response_char, time=0.5, memory=1000, completion_rate=None
+):
+    return IoCodeSubmission.objects.create(
+        material_id=material,
+        user_id=user,
+        code="print('Hello World')",
+        language="py",
+        response_char=response_char,
+        execution_time=time,
+        execution_memory=memory,
+        completion_rate=completion_rate,
+    )
+
+
+class SubmissionSummaryTestCase(TestCase):
+    """Class that tests the values kept in the submission summary."""
+
+    def setUp(self) -> None:
+        """Method that sets up a material with a penalty per attempt."""
+        self.material = create_ioc_material()
+        io_code = self.material.materialiocode
+        io_code.max_points = 10
+        io_code.min_points = 4
+        io_code.points_penalty = 2
+        io_code.save()
+        self.user = create_user()
+
+    def summarize(self, response_char, time=0.5, memory=1000, completion_rate=None):
+        submission = judged_submission(
+            self.material, self.user, response_char, time, memory, completion_rate
+        )
+        update_submission_summary(self.user, self.material, submission)
+        return IoCodeSubmissionSummary.objects.get(
+            user=self.user, material=self.material
+        )
+
+    def test_first_attempt_accepted(self) -> None:
+        summary = self.summarize("A")
+
+        self.assertEqual((summary.attempts, summary.hits, summary.points), (1, 1, 10))
+
+    def test_penalty_on_first_hit(self) -> None:
+        """The first hit loses the penalty of every previous attempt."""
+        self.summarize("W")
+        summary = self.summarize("W")
+        self.assertEqual((summary.attempts, summary.hits, summary.points), (2, 0, 4))
+
+        summary = self.summarize("A", time=0.9, memory=3000)
+        self.assertEqual((summary.attempts, summary.hits, summary.points), (3, 1, 6))
+        self.assertEqual(summary.min_execution_time, 0.9)
+        self.assertEqual(summary.min_execution_memory, 3000)
+
+    def test_points_are_at_least_min_points(self) -> None:
+        for _ in range(5):
+            self.summarize("W")
+
+        self.assertEqual(self.summarize("A").points, 4)
+
+    def test_later_hits_keep_minimums(self) -> None:
+        self.summarize("A", time=0.9, memory=3000)
+        self.summarize("A", time=0.4, memory=5000)
+        summary = self.summarize("W", time=0.1, memory=10)
+
+        self.assertEqual((summary.attempts, summary.hits, summary.points), (3, 2, 10))
+        self.assertEqual(summary.min_execution_time, 0.4)
+        self.assertEqual(summary.min_execution_memory, 3000)
+
+    def test_best_completion_rate(self) -> None:
+        """Failed attempts count towards the best share of passed cases."""
+        self.assertEqual(
+            self.summarize("W", completion_rate=0.5).max_completion_rate, 0.5
+        )
+        self.assertEqual(
+            self.summarize("W", completion_rate=0.25).max_completion_rate, 0.5
+        )
+        self.assertEqual(
+            self.summarize("A", completion_rate=1.0).max_completion_rate, 1.0
+        )
+
+    def test_fixed_queries(self) -> None:
+        """The upsert is one round trip once the limits are loaded, then the
+        course summary is locked and added up again in two more."""
+        submission = judged_submission(self.material, self.user, "A")
+        # Already loaded by the judge workers
+        self.material.materialiocode
+        self.material.module_id
+
+        with CaptureQueriesContext(connection) as queries:
+            update_submission_summary(self.user, self.material, submission)
+        self.assertEqual(len(queries), 3)
+
+
+class ConcurrentSubmissionSummaryTestCase(TransactionTestCase):
+    """Class that tests the summary under parallel submissions."""
+
+    def test_parallel_submissions_are_all_counted(self) -> None:
+        """No attempt or hit is lost when submissions are summarized at once."""
+        material = create_ioc_material()
+        users = [create_user(number) for number in range(3)]
+        verdicts = ["W", "A", "W", "A", "A", "W", "A", "W"] * 3
+        submissions = [
+            (user, judged_submission(material, user, verdict))
+            for user in users
+            for verdict in verdicts
+        ]
+        errors = []
+        barrier = threading.Barrier(len(submissions))
+
+        def summarize(user, submission) -> None:
+            try:
+                barrier.wait()
+                update_submission_summary(user, material, submission)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=summarize, args=pair) for pair in submissions
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        for user in users:
+            summary = IoCodeSubmissionSummary.objects.get(user=user, material=material)
+            self.assertEqual(summary.attempts, len(verdicts))
+            self.assertEqual(summary.hits, verdicts.count("A"))
@@ -0,0 +1,137 @@
+"""Module for testing the verdict memoization of identical resubmissions."""
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from accounts.models.user import User
+from ..helpers.case_store import create_cases
+from ..helpers.judge_batch import drain_queue_batched
+from ..helpers.judge_queue import drain_queue, enqueue_submission
+from ..models.io_code_submission import IoCodeSubmission
+from ..models.io_code_submission_summary import IoCodeSubmissionSummary
+from ..models.problem_sync import ProblemSync
+from ..models.verdict_memo import VerdictMemo
+from .judge_queue_tests import ACCEPTED, create_ioc_material
+
+TIME_LIMIT = (
+    {
+        "max_memory": 8960,
+        "max_time": 1.2,
+        "submission_id": 1,
+        "verdict": {"message": "Time limit exceeded", "verdict": "TLE"},
+    },
+    201,
+)
+
+
+@patch("ioc.helpers.judge_queue.judge", return_value=ACCEPTED)
+class VerdictCacheTestCase(TestCase):
+    """Class that tests reusing the verdict of identical submissions."""
+
+    def setUp(self) -> None:
+        """Method that sets up the data to be used in the tests."""
+        self.material = create_ioc_material()
+        self.user = User.objects.create(
+            email="test@example.com",
+            password="JHuyfub434eknjbv",
+            last_name="test_last_name",
+            first_name="test_first_name",
+        )
+
+    def judge(self, code: str = "print('Hello World')") -> IoCodeSubmission:
+        submission = IoCodeSubmission.objects.create(
+            material_id=self.material, user_id=self.user, code=code, language="py"
+        )
+        enqueue_submission(submission)
+        # The judge got the changed cases, judging does not wait for them
+        ProblemSync.objects.update(status=ProblemSync.DONE)
+        drain_queue("test-worker")
+        submission.refresh_from_db()
+        return submission
+
+    def test_identical_resubmission_skips_judge(self, mock_judge) -> None:
+        """The verdict, time and memory are copied from the first submission."""
+        self.judge()
+        submission = self.judge()
+
+        self.assertEqual(mock_judge.call_count, 1)
+        self.assertEqual(submission.response_char, "A")
+        self.assertEqual(submission.execution_memory, 8960)
+        summary = IoCodeSubmissionSummary.objects.get(
+            user=self.user, material=self.material
+        )
+        self.assertEqual(summary.attempts, 2)
+
+    def test_different_code_is_judged(self, mock_judge) -> None:
+        self.judge()
+        self.judge("print('Hello World') ")
+
+        self.assertEqual(mock_judge.call_count, 2)
+
+    def test_time_limit_is_not_memoized(self, mock_judge) -> None:
+        mock_judge.return_value = TIME_LIMIT
+        self.judge()
+        self.judge()
+
+        self.assertEqual(mock_judge.call_count, 2)
+        self.assertFalse(VerdictMemo.objects.exists())
+
+    def test_limit_change_invalidates(self, mock_judge) -> None:
+        """Changing max_time or max_memory forgets the stored verdicts."""
+        self.judge()
+        material_ioc = self.material.materialiocode
+        material_ioc.max_time = 2000
+        material_ioc.save()
+
+        self.assertEqual(material_ioc.cases_version, 2)
+        self.assertFalse(VerdictMemo.objects.exists())
+        self.judge()
+        self.assertEqual(mock_judge.call_count, 2)
+
+    def test_stop_on_first_failure_change_invalidates(self, mock_judge) -> None:
+        """The cases run, so the stored completion rates, depend on the setting."""
+        self.judge()
+        material_ioc = self.material.materialiocode
+        material_ioc.stop_on_first_failure = True
+        material_ioc.save()
+
+        self.assertEqual(material_ioc.cases_version, 2)
+        self.assertFalse(VerdictMemo.objects.exists())
+
+    def test_other_changes_keep_verdicts(self, mock_judge) -> None:
+        self.judge()
+        material_ioc = self.material.materialiocode
+        material_ioc.max_points = 20
+        material_ioc.save()
+
+        self.judge()
+        self.assertEqual(mock_judge.call_count, 1)
+
+    def test_case_change_invalidates(self, mock_judge) -> None:
+        """Adding, editing or removing a case forgets the stored verdicts."""
+        self.judge()
+        [case] = create_cases(self.material.materialiocode.id, ["1"], ["1"])
+        self.judge()
+        case.delete()
+        self.judge()
+
+        self.assertEqual(mock_judge.call_count, 3)
+        self.material.materialiocode.refresh_from_db()
+        self.assertEqual(self.material.materialiocode.cases_version, 3)
+
+    def test_batch_path_uses_memo(self, mock_judge) -> None:
+        self.judge()
+        submission = IoCodeSubmission.objects.create(
+            material_id=self.material,
+            user_id=self.user,
+            code="print('Hello World')",
+            language="py",
+        )
+        enqueue_submission(submission)
+
+        with patch("ioc.helpers.judge_batch.judge_batch") as mock_batch:
+            drain_queue_batched("test-worker", size=10, window=0)
+            mock_batch.assert_not_called()
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.response_char, "A")
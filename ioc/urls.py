@@ -4,6 +4,11 @@ from .views import (
     material_io_code_views,
     io_code_submission_views,
     io_code_submission_summary_views,
+    rejudge_views,
+    submission_stream_views,
+    contest_views,
+    leaderboard_views,
+    similarity_views,
 )
 
 
@@ -55,7 +60,17 @@ io_code_submission_urls = [
         "iocode/submission/user/<int:user_id>/<int:material_id>/",
         io_code_submission_views.get_io_code_all_submission_user,
         name="get_io_code_all_submission_user",
-    )
+    ),
+    path(
+        "iocode/submission/material/<int:material_id>/",
+        io_code_submission_views.get_io_code_all_submission_material,
+        name="get_io_code_all_submission_material",
+    ),
+    path(
+        "iocode/submission/stream/",
+        submission_stream_views.stream_io_code_submissions,
+        name="stream_io_code_submissions",
+    ),
 ]
 
 io_code_submission_summary_urls = [
@@ -65,4 +80,70 @@ io_code_submission_summary_urls = [
         name="get_summary_by_user",
     )
 ]
-urlpatterns = material_io_code_urls + io_code_submission_urls + io_code_submission_summary_urls
+rejudge_urls = [
+    path(
+        "iocode/rejudge/create/<int:material_id>/",
+        rejudge_views.create_rejudge,
+        name="create_rejudge",
+    ),
+    path(
+        "iocode/rejudge/<int:material_id>/",
+        rejudge_views.get_rejudge_progress,
+        name="get_rejudge_progress",
+    ),
+]
+contest_urls = [
+    path(
+        "contest/create/",
+        contest_views.create_contest,
+        name="create_contest",
+    ),
+    path(
+        "contest/<int:contest_id>/",
+        contest_views.get_contest,
+        name="get_contest",
+    ),
+    path(
+        "contest/<int:contest_id>/scoreboard/",
+        contest_views.get_contest_scoreboard,
+        name="get_contest_scoreboard",
+    ),
+]
+leaderboard_urls = [
+    path(
+        "iocode/leaderboard/material/<int:material_id>/",
+        leaderboard_views.get_material_leaderboard,
+        name="get_material_leaderboard",
+    ),
+    path(
+        "iocode/leaderboard/material/<int:material_id>/me/",
+        leaderboard_views.get_my_material_rank,
+        name="get_my_material_rank",
+    ),
+    path(
+        "iocode/leaderboard/course/<int:course_id>/",
+        leaderboard_views.get_course_leaderboard,
+        name="get_course_leaderboard",
+    ),
+    path(
+        "iocode/leaderboard/course/<int:course_id>/me/",
+        leaderboard_views.get_my_course_rank,
+        name="get_my_course_rank",
+    ),
+]
+similarity_urls = [
+    path(
+        "iocode/similarity/material/<int:material_id>/",
+        similarity_views.get_similarity_report,
+        name="get_similarity_report",
+    ),
+]
+urlpatterns = (
+    material_io_code_urls
+    + io_code_submission_urls
+    + io_code_submission_summary_urls
+    + rejudge_urls
+    + contest_urls
+    + leaderboard_urls
+    + similarity_urls
+)
@@ -0,0 +1,113 @@
+"""Module for views of the contests over IOC materials."""
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response
+from rest_framework import serializers, status
+from rest_framework.decorators import api_view, permission_classes, schema
+from rest_framework.permissions import IsAuthenticated
+
+from ..helpers.scoreboard import get_scoreboard
+from ..models.contest import Contest
+from ..schemas import contest_schemas as schemas
+from ..serializers.contest_serializer import ContestSerializer
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.create_contest_schema)
+def create_contest(request) -> JsonResponse:
+    """
+    Create a contest over some IOC materials of a course
+
+    Args:
+        request: http request with the contest data
+
+    Returns:
+        response (JsonResponse): HTTP response in JSON format with the
+        created contest, 400 if the data is not valid, 403 if the user is not
+        an instructor of the course of the contest and of its materials.
+    """
+    serializer = ContestSerializer(data=request.data)
+    try:
+        serializer.is_valid(raise_exception=True)
+    except serializers.ValidationError as exc:
+        return JsonResponse(
+            data=exc.detail, status=status.HTTP_400_BAD_REQUEST, safe=False
+        )
+
+    course_ids = {serializer.validated_data["course"].id} | {
+        material.module_id.course_id_id
+        for material in serializer.validated_data["materials"]
+    }
+    if not (
+        request.user.is_staff
+        or all(request.user.is_instructor(course_id) for course_id in course_ids)
+    ):
+        return JsonResponse(
+            {"message": "You are not an instructor of this course"},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+
+    serializer.save()
+    response = serializer.data
+    response["message"] = "Contest created successfully"
+    return JsonResponse(response, status=status.HTTP_201_CREATED)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.get_contest_schema)
+def get_contest(request, contest_id: int) -> JsonResponse:
+    """
+    Get a contest
+
+    Args:
+        request: http request
+        contest_id (int): contest's id to get
+
+    Returns:
+        response (JsonResponse): HTTP response in JSON format with the
+        contest, 404 if it does not exist.
+    """
+    try:
+        contest = Contest.objects.get(id=contest_id)
+    except Contest.DoesNotExist:
+        return JsonResponse(
+            {"message": "There is not a contest with that id"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    return JsonResponse(ContestSerializer(contest).data, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.get_contest_scoreboard_schema)
+def get_contest_scoreboard(request, contest_id: int) -> HttpResponse:
+    """
+    Get the ranked scoreboard of a contest
+
+    The scoreboard is served from the cache, with an ETag: a request whose
+    If-None-Match holds the ETag of the current scoreboard gets a 304
+    without body.
+
+    Args:
+        request: http request
+        contest_id (int): contest's id to get its scoreboard
+
+    Returns:
+        response (HttpResponse): HTTP response in JSON format with the rank,
+        points, penalty time and problem results of every participant, 404
+        if the contest does not exist.
+    """
+    try:
+        board = get_scoreboard(contest_id)
+    except Contest.DoesNotExist:
+        return JsonResponse(
+            {"message": "There is not a contest with that id"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    response = HttpResponse(board["body"], content_type="application/json")
+    response["ETag"] = board["etag"]
+    response["Cache-Control"] = "no-cache"  # Always revalidate with the ETag
+    return get_conditional_response(request, etag=board["etag"], response=response)
@@ -1,20 +1,26 @@
 """Module for views of IoCodeSubmission model."""
+import math
+
 from django.http import JsonResponse
 from rest_framework.decorators import api_view, permission_classes, schema
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from ..helpers.submission_summary import update_submission_summary
 from ..serializers.io_code_submission_serializer import (
     IoCodeSubmissionSerializer,
     IoCodeSubmissionUserSerializer,
 )
+from ..helpers.archive import get_submission
+from ..helpers.keyset import page_limit
+from ..helpers.rate_limit import take_submission_token
+from ..helpers.submission_history import history_page
+from ..models.archived_submission import ArchivedSubmission
 from ..models.io_code_submission import IoCodeSubmission
 from ..schemas import io_code_submission_schemas as schemas
+from constants.ioc import SUBMISSION_MAX_PAGE_SIZE, SUBMISSION_PAGE_SIZE
 from courses.models.material import Material
 from courses.serializers.material_serializer import MaterialSerializer
 
 
-
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def create_io_code_submission(request) -> JsonResponse:
@@ -27,45 +33,51 @@ def create_io_code_submission(request) -> JsonResponse:
     Returns:
         response (JsonResponse): HTTP response in JSON format.
         If the material exists and its material_type
-        is 'ioc', returns 201 created. Otherwise, throws 400 bad request. 
+        is 'ioc', returns 202 accepted with a pending verdict, the judge
+        worker writes the verdict later. 429 too many requests, with the
+        seconds to wait in Retry-After, if the user or the material sent too
+        many submissions lately. Otherwise, throws 400 bad request.
     """
     try:
-        material_id = request.data['material_id']
+        material_id = request.data["material_id"]
         material = Material.objects.get(id=material_id)
         material = MaterialSerializer(material)
     except KeyError:
         return JsonResponse(
             {"message": "No key material_id in request"},
-            status=status.HTTP_400_BAD_REQUEST
+            status=status.HTTP_400_BAD_REQUEST,
         )
     except Material.DoesNotExist:
         return JsonResponse(
             {"message": "No material found related to given material_id"},
-            status=status.HTTP_400_BAD_REQUEST
+            status=status.HTTP_400_BAD_REQUEST,
         )
 
-    if material.data['material_type'] != 'IOC':
+    if material.data["material_type"] != "IOC":
         return JsonResponse(
-            {"message": f"Material type is not IOC"},
-            status=status.HTTP_400_BAD_REQUEST
+            {"message": f"Material type is not IOC"}, status=status.HTTP_400_BAD_REQUEST
         )
     serializer = IoCodeSubmissionSerializer(data=request.data)
     if serializer.is_valid():
-        submission: IoCodeSubmission = serializer.save()
-        # update submission summary for this user
-        update_submission_summary(
-            user=submission.user_id,
-            material=submission.material_id,
-            submission=submission,
-        )
+        retry_after = take_submission_token(request.user.id, material.data["id"])
+        if retry_after:
+            response = JsonResponse(
+                {
+                    "message": "Too many submissions, try again later",
+                    "retry_after": math.ceil(retry_after),
+                },
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
+            response["Retry-After"] = str(math.ceil(retry_after))
+            return response
+
+        # The submission is queued, judge workers give its verdict
+        serializer.save()
         return JsonResponse(
             serializer.data,
-            status=status.HTTP_201_CREATED,
+            status=status.HTTP_202_ACCEPTED,
         )
-    return JsonResponse(
-        serializer.errors, status=status.HTTP_400_BAD_REQUEST
-    )
-   
+    return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 @api_view(["GET"])
@@ -85,7 +97,8 @@ def get_io_code_submission(request, submission_id: int) -> JsonResponse:
     """
 
     try:
-        io_code_submission = IoCodeSubmission.objects.get(submission_id=submission_id)
+        # Old submissions are read from the archive
+        io_code_submission = get_submission(submission_id)
         io_code_submission = IoCodeSubmissionSerializer(io_code_submission)
         return JsonResponse(
             io_code_submission.data, safe=False, status=status.HTTP_200_OK
@@ -172,6 +185,29 @@ def update_io_code_submission(request, submission_id: int) -> JsonResponse:
     )
 
 
+def submission_history(request, submissions, archived) -> JsonResponse:
+    """Page of submissions, archived ones included, asked by the ``cursor``,
+    ``limit`` and ``with_code`` params"""
+    with_code = request.GET.get("with_code", "").lower() in ("1", "true")
+    try:
+        limit = page_limit(
+            request.GET.get("limit"), SUBMISSION_PAGE_SIZE, SUBMISSION_MAX_PAGE_SIZE
+        )
+        page, next_cursor = history_page(
+            submissions, request.GET.get("cursor"), limit, with_code, archived
+        )
+    except ValueError as exc:
+        return JsonResponse({"message": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+    serializer = IoCodeSubmissionUserSerializer(
+        page, many=True, context={"with_code": with_code}
+    )
+    return JsonResponse(
+        {"results": serializer.data, "next_cursor": next_cursor},
+        status=status.HTTP_200_OK,
+    )
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 @schema(schemas.get_io_code_all_submission_user_schema)
@@ -179,28 +215,75 @@ def get_io_code_all_submission_user(
     request, user_id: int, material_id: int
 ) -> JsonResponse:
     """
-    Get all code submissions submitted by a user for a specific io_code
+    Get the code submissions submitted by a user for a specific io_code,
+    newest first, a page at a time
 
     Args:
-        request: http request
+        request: http request, with the optional cursor, limit and with_code
+            params
         user_id: User's id to get his/her submissions
         material_id: Material's id to get its submissions
 
     Returns:
-        Json response with the fields of the serialized code submission if the user
-        making
-        the request is Authenticated, else throws 401 Unauthorized status
+        Json response with a page of the serialized code submissions, without
+        their code unless with_code is set, and the cursor of the next page.
+        404 if the user has no submissions for that io_code, 400 if the cursor
+        or the limit are not valid.
     """
     submissions = IoCodeSubmission.objects.filter(
         user_id_id=user_id, material_id_id=material_id
     )
+    archived = ArchivedSubmission.objects.filter(
+        user_id=user_id, material_id=material_id
+    )
 
-    if not submissions:
+    if not (submissions.exists() or archived.exists()):
         return JsonResponse(
             {"message": "There are not submissions by that user for that io_code"},
             status=status.HTTP_404_NOT_FOUND,
         )
 
-    serializer = IoCodeSubmissionUserSerializer(submissions, many=True)
+    return submission_history(request, submissions, archived)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.get_io_code_all_submission_material_schema)
+def get_io_code_all_submission_material(request, material_id: int) -> JsonResponse:
+    """
+    Get the code submissions of every user for a specific io_code, newest
+    first, a page at a time. Only for the instructors of its course.
+
+    Args:
+        request: http request, with the optional cursor, limit and with_code
+            params
+        material_id: Material's id to get its submissions
+
+    Returns:
+        Json response with a page of the serialized code submissions, without
+        their code unless with_code is set, and the cursor of the next page.
+        404 if the material is not an io_code, 403 if the user is not an
+        instructor of its course.
+    """
+    try:
+        material = Material.objects.select_related("module_id").get(
+            id=material_id, material_type="IOC"
+        )
+    except Material.DoesNotExist:
+        return JsonResponse(
+            {"message": "There is not an io_code with that id"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    if not (
+        request.user.is_staff
+        or request.user.is_instructor(material.module_id.course_id_id)
+    ):
+        return JsonResponse(
+            {"message": "You are not an instructor of this course"},
+            status=status.HTTP_403_FORBIDDEN,
+        )
 
-    return JsonResponse(serializer.data, safe=False, status=status.HTTP_200_OK)
+    submissions = IoCodeSubmission.objects.filter(material_id=material)
+    archived = ArchivedSubmission.objects.filter(material=material)
+    return submission_history(request, submissions, archived)
@@ -0,0 +1,126 @@
+"""Module for views of the leaderboards of IOC materials and courses."""
+from django.http import JsonResponse
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes, schema
+from rest_framework.permissions import IsAuthenticated
+
+from constants.ioc import LEADERBOARD_MAX_PAGE_SIZE, LEADERBOARD_PAGE_SIZE
+from courses.models.course import Course
+from ..helpers.keyset import InvalidCursor, page_limit
+from ..helpers.leaderboard import COURSE_LEADERBOARD, MATERIAL_LEADERBOARD, Leaderboard
+from ..models.material_io_code import MaterialIoCode
+from ..schemas import leaderboard_schemas as schemas
+
+
+def leaderboard_page(request, leaderboard: Leaderboard, group_id: int) -> JsonResponse:
+    """Page of a leaderboard asked by the ``cursor`` and ``limit`` params"""
+    try:
+        limit = page_limit(
+            request.GET.get("limit"), LEADERBOARD_PAGE_SIZE, LEADERBOARD_MAX_PAGE_SIZE
+        )
+    except ValueError as exc:
+        return JsonResponse({"message": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        rows, next_cursor = leaderboard.page(group_id, request.GET.get("cursor"), limit)
+    except InvalidCursor as exc:
+        return JsonResponse({"message": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+    return JsonResponse(
+        {"results": rows, "next_cursor": next_cursor}, status=status.HTTP_200_OK
+    )
+
+
+def leaderboard_rank(request, leaderboard: Leaderboard, group_id: int) -> JsonResponse:
+    """Rank of the user of the request in a leaderboard"""
+    row = leaderboard.rank(group_id, request.user.id)
+    if row is None:
+        return JsonResponse(
+            {"message": "You have not sent submissions yet"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+    return JsonResponse(row, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.get_material_leaderboard_schema)
+def get_material_leaderboard(request, material_id: int) -> JsonResponse:
+    """
+    Get a page of the leaderboard of an IOC material
+
+    Args:
+        request: http request, with the optional cursor and limit params
+        material_id (int): material's id to get its leaderboard
+
+    Returns:
+        response (JsonResponse): HTTP response in JSON format with the ranked
+        users of the page and the cursor of the next page, 404 if the
+        material is not an IOC material.
+    """
+    if not MaterialIoCode.objects.filter(material_id=material_id).exists():
+        return JsonResponse(
+            {"message": "There is not a material with that id"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+    return leaderboard_page(request, MATERIAL_LEADERBOARD, material_id)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.get_my_material_rank_schema)
+def get_my_material_rank(request, material_id: int) -> JsonResponse:
+    """
+    Get the rank of the user in the leaderboard of an IOC material
+
+    Args:
+        request: http request
+        material_id (int): material's id to get the rank in
+
+    Returns:
+        response (JsonResponse): HTTP response in JSON format with the rank
+        and results of the user, 404 if the user has no submissions to it.
+    """
+    return leaderboard_rank(request, MATERIAL_LEADERBOARD, material_id)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.get_course_leaderboard_schema)
+def get_course_leaderboard(request, course_id: int) -> JsonResponse:
+    """
+    Get a page of the leaderboard of a course, over its IOC materials
+
+    Args:
+        request: http request, with the optional cursor and limit params
+        course_id (int): course's id to get its leaderboard
+
+    Returns:
+        response (JsonResponse): HTTP response in JSON format with the ranked
+        users of the page and the cursor of the next page, 404 if the course
+        does not exist.
+    """
+    if not Course.objects.filter(id=course_id).exists():
+        return JsonResponse(
+            {"message": "There is not a course with that id"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+    return leaderboard_page(request, COURSE_LEADERBOARD, course_id)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.get_my_course_rank_schema)
+def get_my_course_rank(request, course_id: int) -> JsonResponse:
+    """
+    Get the rank of the user in the leaderboard of a course
+
+    Args:
+        request: http request
+        course_id (int): course's id to get the rank in
+
+    Returns:
+        response (JsonResponse): HTTP response in JSON format with the rank
+        and results of the user, 404 if the user has no submissions to it.
+    """
+    return leaderboard_rank(request, COURSE_LEADERBOARD, course_id)
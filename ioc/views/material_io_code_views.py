@@ -1,10 +1,11 @@
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
-
+from courses.helpers.content_cache import cached_response
 from ..models.material_io_code import MaterialIoCode
+from ..helpers.rejudge import start_rejudge
 
 
 from ..serializers.material_io_code_serializer import (
@@ -36,7 +37,7 @@ def create_material_io_code(request) -> JsonResponse:
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 # @schema(schemas.get_material_io_code_schema)
-def get_material_io_code(request, material_id: int) -> JsonResponse:
+def get_material_io_code(request, material_id: int) -> HttpResponse:
     """
     Get material by its id
 
@@ -49,10 +50,15 @@ def get_material_io_code(request, material_id: int) -> JsonResponse:
         the request is Authenticated, else throws 401 Unauthorized status
     """
 
+    def load():
+        materialIoCode = MaterialIoCode.objects.select_related(
+            "material_id__module_id"
+        ).get(material_id=material_id)
+        course_id = materialIoCode.material_id.module_id.course_id_id
+        return course_id, MaterialGetIoCodeSerializer(materialIoCode).data
+
     try:
-        materialIoCode = MaterialIoCode.objects.get(material_id=material_id)
-        materialIoCode = MaterialGetIoCodeSerializer(materialIoCode)
-        return JsonResponse(materialIoCode.data, safe=False, status=status.HTTP_200_OK)
+        return cached_response(request, "material_io_code", material_id, load)
     except MaterialIoCode.DoesNotExist:
         return JsonResponse(
             {"message": "There is not a Io_Code with that id"},
@@ -99,8 +105,27 @@ def update_material_io_code(request, material_id: int) -> JsonResponse:
                 status=status.HTTP_400_BAD_REQUEST)
         material.max_memory = request.data["max_memory"]
         
+    if "is_exam" in request.data:
+        if not isinstance(request.data["is_exam"], bool):
+            return JsonResponse(
+                {"message": "Value Error in is_exam"},
+                status=status.HTTP_400_BAD_REQUEST)
+        material.is_exam = request.data["is_exam"]
+
+    if "stop_on_first_failure" in request.data:
+        if not isinstance(request.data["stop_on_first_failure"], bool):
+            return JsonResponse(
+                {"message": "Value Error in stop_on_first_failure"},
+                status=status.HTTP_400_BAD_REQUEST)
+        material.stop_on_first_failure = request.data["stop_on_first_failure"]
+
     
+    cases_version = material.cases_version
     material.save()
+    if material.cases_version != cases_version:
+        # The limits or the judging mode changed, existing verdicts were given
+        # under the old ones
+        start_rejudge(material.material_id)
     serializer = MaterialIoCodeSerializer(material)
 
     return JsonResponse(serializer.data, status=status.HTTP_200_OK)
@@ -0,0 +1,92 @@
+"""Module for views of the rejudge of IOC materials."""
+from django.http import JsonResponse
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes, schema
+from rest_framework.permissions import IsAuthenticated
+
+from ..helpers.rejudge import rejudge_progress, start_rejudge
+from ..models.material_io_code import MaterialIoCode
+from ..models.rejudge import Rejudge
+from ..schemas import rejudge_schemas as schemas
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.create_rejudge_schema)
+def create_rejudge(request, material_id: int) -> JsonResponse:
+    """
+    Judge again every submission of an IOC material
+
+    Args:
+        request: http request
+        material_id (int): material's id whose submissions are judged again
+
+    Returns:
+        response (JsonResponse): HTTP response in JSON format with the
+        progress of the rejudge, 202 accepted as the judge workers run it
+        in the background. 404 if the material is not an IOC material, 403 if
+        the user is not an instructor of its course.
+    """
+    try:
+        material_io_code = MaterialIoCode.objects.select_related(
+            "material_id__module_id"
+        ).get(material_id=material_id)
+    except MaterialIoCode.DoesNotExist:
+        return JsonResponse(
+            {"message": "There is not a material with that id"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    material = material_io_code.material_id
+    if not (
+        request.user.is_staff
+        or request.user.is_instructor(material.module_id.course_id_id)
+    ):
+        return JsonResponse(
+            {"message": "You are not an instructor of this course"},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+
+    rejudge = start_rejudge(material)
+    rejudge.refresh_from_db()
+    return JsonResponse(rejudge_progress(rejudge), status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.get_rejudge_progress_schema)
+def get_rejudge_progress(request, material_id: int) -> JsonResponse:
+    """
+    Get the progress of the last rejudge of a material
+
+    Args:
+        request: http request
+        material_id (int): material's id to get the progress of its last rejudge
+
+    Returns:
+        response (JsonResponse): HTTP response in JSON format with the task
+        counts of the rejudge, 404 if the material was never rejudged, 403 if
+        the user is not an instructor of its course.
+    """
+    rejudge = (
+        Rejudge.objects.select_related("material__module_id")
+        .filter(material_id=material_id)
+        .order_by("-id")
+        .first()
+    )
+    if rejudge is None:
+        return JsonResponse(
+            {"message": "The material has not been rejudged"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    if not (
+        request.user.is_staff
+        or request.user.is_instructor(rejudge.material.module_id.course_id_id)
+    ):
+        return JsonResponse(
+            {"message": "You are not an instructor of this course"},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+
+    return JsonResponse(rejudge_progress(rejudge), status=status.HTTP_200_OK)
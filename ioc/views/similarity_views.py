@@ -0,0 +1,67 @@
+"""Module for views of the similarity reports of IOC materials."""
+from django.http import JsonResponse
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes, schema
+from rest_framework.permissions import IsAuthenticated
+
+from constants.ioc import SIMILARITY_THRESHOLD
+from courses.models.material import Material
+from ..helpers.similarity import similarity_report
+from ..schemas import similarity_schemas as schemas
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@schema(schemas.get_similarity_report_schema)
+def get_similarity_report(request, material_id: int) -> JsonResponse:
+    """
+    Get the pairs of users with similar accepted submissions to an IOC
+    material. Only for the instructors of its course.
+
+    Args:
+        request: http request, with the optional threshold param
+        material_id (int): material's id to get its report
+
+    Returns:
+        response (JsonResponse): HTTP response in JSON format with the pairs
+        of users at the threshold similarity or more, most similar first.
+        404 if the material is not an IOC material, 403 if the user is not an
+        instructor of its course, 400 if the threshold is not valid.
+    """
+    try:
+        material = Material.objects.select_related("module_id").get(
+            id=material_id, material_type="IOC"
+        )
+    except Material.DoesNotExist:
+        return JsonResponse(
+            {"message": "There is not an IOC material with that id"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    if not (
+        request.user.is_staff
+        or request.user.is_instructor(material.module_id.course_id_id)
+    ):
+        return JsonResponse(
+            {"message": "You are not an instructor of this course"},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+
+    try:
+        threshold = float(request.GET.get("threshold", SIMILARITY_THRESHOLD))
+    except ValueError:
+        threshold = -1
+    if not 0 <= threshold <= 1:
+        return JsonResponse(
+            {"message": "The threshold must be between 0 and 1"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    return JsonResponse(
+        {
+            "material_id": material.id,
+            "threshold": threshold,
+            "pairs": similarity_report(material.id, threshold),
+        },
+        status=status.HTTP_200_OK,
+    )
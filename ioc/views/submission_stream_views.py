@@ -0,0 +1,127 @@
+"""Module for the streams of the status changes of code submissions.
+
+The stream is an async view, so under ASGI an open stream waits on the event
+loop instead of holding a worker thread. DRF views are sync, so the JWT of
+the request is checked here with the authentication class of the API.
+"""
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from constants.ioc import (
+    SUBMISSION_STREAM_HEARTBEAT_SECONDS,
+    SUBMISSION_STREAM_MAX_SECONDS,
+    SUBMISSION_STREAM_RETRY_MS,
+)
+from ..helpers.submission_events import get_broker, submission_event
+from ..models.io_code_submission import IoCodeSubmission
+
+
+def authenticate(request):
+    """User of the JWT of the request, None if it has no valid one"""
+    try:
+        result = JWTAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+def format_event(event: dict) -> str:
+    name = event.get("event", "submission")
+    return f"event: {name}\ndata: {json.dumps(event, cls=DjangoJSONEncoder)}\n\n"
+
+
+async def event_stream(subscription, snapshot: dict | None):
+    """Server-sent events of a subscription
+
+    With a snapshot (a single submission is followed), the stream ends once
+    the submission has a verdict. Every stream ends after
+    ``SUBMISSION_STREAM_MAX_SECONDS``; clients reconnect on their own.
+    """
+    deadline = time.monotonic() + SUBMISSION_STREAM_MAX_SECONDS
+    try:
+        yield f"retry: {SUBMISSION_STREAM_RETRY_MS}\n\n"
+        if snapshot is not None:
+            yield format_event(snapshot)
+            if snapshot["response_char"] is not None:
+                return
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(),
+                    timeout=min(SUBMISSION_STREAM_HEARTBEAT_SECONDS, remaining),
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if (
+                snapshot is not None
+                and event["submission_id"] != snapshot["submission_id"]
+            ):
+                continue
+            yield format_event(event)
+            if snapshot is not None and event.get("response_char") is not None:
+                return
+    finally:
+        subscription.close()
+
+
+async def stream_io_code_submissions(request):
+    """
+    Stream the status changes of the code submissions of the user
+
+    Args:
+        request: http request with a JWT, and optionally a submission_id
+        query parameter to follow a single submission of the user
+
+    Returns:
+        response (StreamingHttpResponse): text/event-stream with a
+        "submission" event every time a submission of the user is created or
+        gets its verdict, and a "case" event with the result of every case
+        while it is judged. Following a single submission, its current status
+        is sent first and the stream ends with its verdict. 401 without a
+        valid token, 404 if the submission is not one of the user.
+    """
+    if request.method != "GET":
+        return JsonResponse(
+            {"message": f'Method "{request.method}" not allowed.'},
+            status=status.HTTP_405_METHOD_NOT_ALLOWED,
+        )
+    user = await sync_to_async(authenticate)(request)
+    if user is None:
+        return JsonResponse(
+            {"message": "Authentication credentials were not provided"},
+            status=status.HTTP_401_UNAUTHORIZED,
+        )
+
+    # Subscribe before reading the snapshot, so no verdict falls in between
+    subscription = await get_broker().subscribe(user.id)
+    snapshot = None
+    submission_id = request.GET.get("submission_id")
+    if submission_id is not None:
+        try:
+            submission = await IoCodeSubmission.objects.aget(
+                submission_id=int(submission_id), user_id=user
+            )
+        except (ValueError, IoCodeSubmission.DoesNotExist):
+            subscription.close()
+            return JsonResponse(
+                {"message": "There is not a code submission with that id"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        snapshot = submission_event(submission)
+
+    response = StreamingHttpResponse(
+        event_stream(subscription, snapshot), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # Do not let a proxy buffer the events
+    return response
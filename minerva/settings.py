@@ -12,10 +12,12 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 # TODO: Add CORS permissions in production
 
 import os
+import tempfile
 from pathlib import Path
 from datetime import timedelta
 import dj_database_url
 import environ
+from django.core.exceptions import ImproperlyConfigured
 
 # Initialise environment variables
 env = environ.Env()
@@ -61,6 +63,8 @@ MIDDLEWARE = [
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    # ETag of every GET response, and 304 to the requests that already have it
+    "django.middleware.http.ConditionalGetMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -146,6 +150,26 @@ DATABASES = {
     )
 }
 
+# Cache (contest scoreboards, course content versions, submission rate
+# limits). The web and judge processes must all see the same one, so outside
+# DEBUG it defaults to the database cache, whose table is created by
+# "python manage.py createcachetable" (see build.sh). CACHE_URL may point to
+# redis or memcached instead, with their client installed. The in-memory
+# cache is per process and only fits development and the tests
+CACHES = {
+    "default": env.cache_url(
+        "CACHE_URL",
+        default="locmemcache://" if DEBUG else "dbcache://minerva_cache",
+    )
+}
+if not DEBUG and CACHES["default"]["BACKEND"] in (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+):
+    raise ImproperlyConfigured(
+        "CACHE_URL must point to a cache shared by every process"
+    )
+
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS: list[dict[str, str]] = [
@@ -222,6 +246,48 @@ SUPPORT_EMAIL = os.environ.get("SUPPORT_EMAIL")
 RESEND_API_KEY = os.environ.get("RESEND_API_KEY")
 RESEND_DOMAIN = os.environ.get("RESEND_DOMAIN")
 
+# Judge client configuration (timeouts in seconds)
+IOC_JUDGE_CONNECT_TIMEOUT = env.float("IOC_JUDGE_CONNECT_TIMEOUT", default=3.0)
+IOC_JUDGE_READ_TIMEOUT = env.float("IOC_JUDGE_READ_TIMEOUT", default=30.0)
+IOC_JUDGE_MAX_RETRIES = env.int("IOC_JUDGE_MAX_RETRIES", default=2)
+IOC_JUDGE_POOL_SIZE = env.int("IOC_JUDGE_POOL_SIZE", default=10)
+IOC_JUDGE_BREAKER_THRESHOLD = env.int("IOC_JUDGE_BREAKER_THRESHOLD", default=5)
+IOC_JUDGE_BREAKER_RESET_SECONDS = env.float(
+    "IOC_JUDGE_BREAKER_RESET_SECONDS", default=30.0
+)
+
+# Judge backend: "remote" (judge server) or "local" (process pool on this box)
+IOC_JUDGE_BACKEND = env.str("IOC_JUDGE_BACKEND", default="remote")
+# Processes of the local judge pool (0 uses one per CPU)
+IOC_LOCAL_JUDGE_WORKERS = env.int("IOC_LOCAL_JUDGE_WORKERS", default=0)
+# The programs of the pool process n run as the user (and group) this + n,
+# with no account nor files of their own
+IOC_SANDBOX_FIRST_UID = env.int("IOC_SANDBOX_FIRST_UID", default=60000)
+# Compiled programs of the local judge (an empty directory disables the cache)
+IOC_ARTIFACT_CACHE_DIR = env.str(
+    "IOC_ARTIFACT_CACHE_DIR",
+    default=os.path.join(tempfile.gettempdir(), "minerva-judge-artifacts"),
+)
+IOC_ARTIFACT_CACHE_MAX_BYTES = env.int(
+    "IOC_ARTIFACT_CACHE_MAX_BYTES", default=512 * 1024 * 1024
+)
+# Uncompressed test case files read by the local judge
+IOC_CASE_CACHE_DIR = env.str(
+    "IOC_CASE_CACHE_DIR",
+    default=os.path.join(tempfile.gettempdir(), "minerva-judge-cases"),
+)
+# Broker of the submission status streams: "postgres" (LISTEN/NOTIFY, across
+# processes), "local" (this process only) or the dotted path of a Broker
+IOC_EVENTS_BACKEND = env.str("IOC_EVENTS_BACKEND", default="postgres")
+
+# Cache of the course content read by the detail views: the dotted path of
+# the backend keeping the entries (LRUBackend, in the process, or
+# SharedBackend, in the cache above) and the most entries LRUBackend keeps
+CONTENT_CACHE_BACKEND = env.str(
+    "CONTENT_CACHE_BACKEND", default="courses.helpers.content_cache.LRUBackend"
+)
+CONTENT_CACHE_MAX_ENTRIES = env.int("CONTENT_CACHE_MAX_ENTRIES", default=10000)
+
 # CORS configuration (Change this in production)
 CORS_ALLOW_ALL_ORIGINS = True
 
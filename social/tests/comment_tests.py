@@ -156,6 +156,14 @@ class GetCommentTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(Comment.objects.last().content, "Test comment")
 
+    def test_get_comment_not_modified(self):
+        response = self.client.get(f"/comment/{self.comment.id}/")
+        response = self.client.get(
+            f"/comment/{self.comment.id}/",
+            headers={"if-none-match": response["ETag"]},
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
 
 class GetCommentRepliesTestCase(TestCase):
     def setUp(self):